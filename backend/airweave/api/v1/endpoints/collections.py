@@ -22,6 +22,8 @@ from airweave.core.source_connection_service import source_connection_service
 from airweave.core.source_connection_service_helpers import source_connection_helpers
 from airweave.core.sync_service import sync_service
 from airweave.core.temporal_service import temporal_service
+from airweave.core.timestamp_stats_service import timestamp_stats_service
+from airweave.search.cache import search_cache
 
 router = TrailingSlashRouter()
 
@@ -165,6 +167,10 @@ async def delete(
         ctx.logger.error(f"Error deleting Qdrant collection: {str(e)}")
         # Continue with deletion even if Qdrant deletion fails
 
+    await timestamp_stats_service.delete(db_obj.id)
+    # Cached search responses must not outlive the collection's data
+    await search_cache.invalidate_collection(db_obj.id)
+
     # Delete the collection - CASCADE will handle all child objects
     return await crud.collection.remove(db, id=db_obj.id, ctx=ctx)
 
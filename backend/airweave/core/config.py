@@ -24,6 +24,13 @@ class Settings(BaseSettings):
         ENCRYPTION_KEY (str): The encryption key.
         STATE_SECRET (str): The HMAC secret for OAuth state token signing.
         CODE_SUMMARIZER_ENABLED (bool): Whether the code summarizer is enabled.
+        CODE_SUMMARIZER_MAX_CONCURRENT (int): Max concurrent code summary requests per worker
+        CODE_SUMMARIZER_TOKENS_PER_MINUTE (int): Prompt and summary tokens all workers may spend
+            on code summaries per minute; 0 disables the limit
+        CODE_SUMMARIZER_CACHE_TTL_S (int): Seconds code summaries stay cached by content hash;
+            0 disables the cache
+        CODE_SUMMARIZER_PACK_MAX_TOKENS (int): Code files of at most this many tokens are
+            summarized several per request; 0 disables packing
         DEBUG (bool): Whether debug mode is enabled.
         LOG_LEVEL (str): The logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         POSTGRES_HOST (str): The PostgreSQL server hostname.
@@ -35,6 +42,8 @@ class Settings(BaseSettings):
         RUN_ALEMBIC_MIGRATIONS (bool): Whether to run the alembic migrations.
         RUN_DB_SYNC (bool): Whether to run the system sync to process sources,
             destinations, and entity types.
+        RUN_DB_SYNC_ONLY_ON_CHANGE (bool): Skip the system sync when the platform package
+            fingerprint matches the one stored by the last successful sync.
         REDIS_HOST (str): The Redis server hostname.
         REDIS_PORT (int): The Redis server port.
         REDIS_PASSWORD (Optional[str]): The Redis password (if authentication is enabled).
@@ -52,9 +61,47 @@ class Settings(BaseSettings):
         TEMPORAL_ENABLED (bool): Whether Temporal is enabled.
         SYNC_MAX_WORKERS (int): The maximum number of workers for sync tasks.
         SYNC_THREAD_POOL_SIZE (int): The size of the thread pool for sync tasks.
+        SYNC_PROCESS_POOL_SIZE (int): Worker processes for the CPU-bound sync stages (file
+            transforms and sparse embeddings); 0 runs them in the sync's event loop.
+        SYNC_ADAPTIVE_BATCHING (bool): Tune the micro-batch size and in-flight batch count of
+            batched syncs at runtime instead of using fixed values
+        SYNC_ADAPTIVE_MIN_BATCH_SIZE (int): Lower bound of the adaptive batch size
+        SYNC_ADAPTIVE_MAX_BATCH_SIZE (int): Upper bound of the adaptive batch size
+        SYNC_ADAPTIVE_TARGET_BATCH_LATENCY_S (float): Batch latency the controller steers to
+        SYNC_ADAPTIVE_DB_WAIT_THRESHOLD_S (float): Mean DB connection wait treated as pressure
+        SYNC_ADAPTIVE_MEMORY_HIGH_WATER (float): Memory fraction above which batches shrink
+        SYNC_STREAM_MEMORY_BUDGET_MB (int): Entity bytes (in memory and in temp files) that
+            all sync streams of a worker may buffer before sources are paused; 0 disables
+        SYNC_CHECKPOINT_INTERVAL_S (int): Seconds between mid-sync checkpoints of sources that
+            can resume an interrupted sync; 0 disables checkpoints and resuming
+        SYNC_METADATA_CHANGE_DETECTION (bool): Compare provider file metadata (checksum, eTag,
+            revision, size and modified time) with the last sync before downloading a file
+        SOURCE_RATE_LIMIT_REDIS_ENABLED (bool): Share source API rate limits between workers via
+            Redis; when disabled each worker limits its own requests
+        SEMANTIC_CHUNKER_BACKEND (str): How semantic chunking finds topic boundaries:
+            "texttiling" (lexical, no model; default), "local" (CPU sentence model, downloaded
+            on first use) or "openai" (remote embeddings)
+        SEMANTIC_CHUNKER_LOCAL_MODEL (str): fastembed model of the "local" semantic chunker
+        STREAMING_CHUNKER_MIN_SIZE_MB (int): Text files (markdown, TXT, CSV, JSON, XML) at least
+            this large are read and chunked in windows instead of as a whole; 0 disables
         WEB_FETCHER_MAX_CONCURRENT (int): Max concurrent web scraping requests
         OPENAI_MAX_CONCURRENT (int): Max concurrent OpenAI API requests
         CTTI_MAX_CONCURRENT (int): Max concurrent CTTI (ClinicalTrials.gov) requests
+        QDRANT_QUANTIZATION (str): Dense vector quantization: "none", "scalar" or "binary"
+        QDRANT_ON_DISK_VECTORS (bool): Keep original dense vectors on disk instead of RAM
+        QDRANT_QUANTIZATION_RESCORE (bool): Rescore quantized candidates with original vectors
+        QDRANT_QUANTIZATION_OVERSAMPLING (float): Candidate oversampling factor for rescoring
+        QDRANT_MIGRATE_STORAGE_ON_SETUP (bool): Apply the storage settings above to existing
+            shared collections when they are set up
+        QDRANT_PREFETCH_MULTIPLIER (int): Hybrid prefetch candidates per requested result
+        QDRANT_PREFETCH_MIN (int): Minimum hybrid prefetch size
+        QDRANT_PREFETCH_MAX (int): Ceiling for hybrid prefetch size
+        QDRANT_DENSE_SCORE_THRESHOLD (Optional[float]): Minimum cosine similarity for dense
+            candidates (None disables the cut)
+        SEARCH_CACHE_ENABLED (bool): Whether search responses and artifacts are cached.
+        SEARCH_CACHE_TTL_SECONDS (int): Time-to-live of cached search entries.
+        SEARCH_CACHE_MAX_ENTRIES (int): Max entries in the in-process search cache.
+        SEARCH_CACHE_REDIS_ENABLED (bool): Whether cached entries are also shared via Redis.
         STRIPE_DEVELOPER_MONTHLY: str = ""
         STRIPE_PRO_MONTHLY: str = ""
         STRIPE_TEAM_MONTHLY: str = ""
@@ -90,6 +137,10 @@ class Settings(BaseSettings):
     STATE_SECRET: str
 
     CODE_SUMMARIZER_ENABLED: bool = False
+    CODE_SUMMARIZER_MAX_CONCURRENT: int = 8
+    CODE_SUMMARIZER_TOKENS_PER_MINUTE: int = 200_000
+    CODE_SUMMARIZER_CACHE_TTL_S: int = 30 * 24 * 3600
+    CODE_SUMMARIZER_PACK_MAX_TOKENS: int = 1000
 
     # Debug configuration
     DEBUG: bool = False
@@ -107,6 +158,7 @@ class Settings(BaseSettings):
 
     RUN_ALEMBIC_MIGRATIONS: bool = True
     RUN_DB_SYNC: bool = True
+    RUN_DB_SYNC_ONLY_ON_CHANGE: bool = True
 
     # Redis configuration
     REDIS_HOST: str = "localhost"
@@ -162,10 +214,43 @@ class Settings(BaseSettings):
     # Sync configuration
     SYNC_MAX_WORKERS: int = 100
     SYNC_THREAD_POOL_SIZE: int = 100
+    SYNC_PROCESS_POOL_SIZE: int = 0
+    SYNC_ADAPTIVE_BATCHING: bool = True
+    SYNC_ADAPTIVE_MIN_BATCH_SIZE: int = 4
+    SYNC_ADAPTIVE_MAX_BATCH_SIZE: int = 512
+    SYNC_ADAPTIVE_TARGET_BATCH_LATENCY_S: float = 10.0
+    SYNC_ADAPTIVE_DB_WAIT_THRESHOLD_S: float = 0.25
+    SYNC_ADAPTIVE_MEMORY_HIGH_WATER: float = 0.8
+    SYNC_STREAM_MEMORY_BUDGET_MB: int = 1024
+    SYNC_CHECKPOINT_INTERVAL_S: int = 300
+    SYNC_METADATA_CHANGE_DETECTION: bool = True
+    SOURCE_RATE_LIMIT_REDIS_ENABLED: bool = True
+    SEMANTIC_CHUNKER_BACKEND: str = "texttiling"
+    SEMANTIC_CHUNKER_LOCAL_MODEL: str = "BAAI/bge-small-en-v1.5"
+    STREAMING_CHUNKER_MIN_SIZE_MB: int = 16
     WEB_FETCHER_MAX_CONCURRENT: int = 10  # Max concurrent web scraping requests
     OPENAI_MAX_CONCURRENT: int = 20  # Max concurrent OpenAI API requests
     CTTI_MAX_CONCURRENT: int = 3  # Max concurrent CTTI (ClinicalTrials.gov) requests
 
+    # Qdrant vector storage (shared collections)
+    QDRANT_QUANTIZATION: str = "none"
+    QDRANT_ON_DISK_VECTORS: bool = False
+    QDRANT_QUANTIZATION_RESCORE: bool = True
+    QDRANT_QUANTIZATION_OVERSAMPLING: float = 2.0
+    QDRANT_MIGRATE_STORAGE_ON_SETUP: bool = False
+
+    # Qdrant hybrid search candidate pool
+    QDRANT_PREFETCH_MULTIPLIER: int = 10
+    QDRANT_PREFETCH_MIN: int = 100
+    QDRANT_PREFETCH_MAX: int = 10000
+    QDRANT_DENSE_SCORE_THRESHOLD: Optional[float] = None
+
+    # Search cache configuration
+    SEARCH_CACHE_ENABLED: bool = True
+    SEARCH_CACHE_TTL_SECONDS: int = 300
+    SEARCH_CACHE_MAX_ENTRIES: int = 1024
+    SEARCH_CACHE_REDIS_ENABLED: bool = False
+
     # Custom deployment URLs - these are used to override the default URLs to allow
     # for custom domains in custom deployments
     API_FULL_URL: Optional[str] = None
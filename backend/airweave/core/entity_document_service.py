@@ -0,0 +1,130 @@
+"""Service for the full-document side store of lean payload collections.
+
+Collections in ``PayloadMode.LEAN`` keep only search fields in Qdrant. The complete payload
+of every chunk is stored in the ``entity_document`` table, keyed by the Qdrant point id, and
+loaded for the results a search actually returns. Writes and deletes mirror the Qdrant
+destination so both stores describe the same set of points.
+"""
+
+from typing import Any, Dict, Iterable, List
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from airweave.core.datetime_utils import utc_now_naive
+from airweave.db.session import get_db_context
+from airweave.models.entity_document import EntityDocument
+
+# asyncpg caps a statement at 32767 bind parameters; each row binds 10
+_UPSERT_CHUNK_SIZE = 1000
+
+
+class EntityDocumentService:
+    """Store, load and delete full entity documents."""
+
+    async def upsert(self, collection_id: UUID, documents: List[Dict[str, Any]]) -> None:
+        """Insert or replace documents.
+
+        Args:
+            collection_id: Collection the documents belong to
+            documents: Rows with point_id, sync_id, db_entity_id, entity_id,
+                parent_entity_id and document keys
+        """
+        if not documents:
+            return
+
+        now = utc_now_naive()
+        rows = [
+            {
+                **doc,
+                "collection_id": collection_id,
+                "created_at": now,
+                "modified_at": now,
+            }
+            for doc in documents
+        ]
+
+        async with get_db_context() as db:
+            for start in range(0, len(rows), _UPSERT_CHUNK_SIZE):
+                stmt = insert(EntityDocument).values(rows[start : start + _UPSERT_CHUNK_SIZE])
+                stmt = stmt.on_conflict_do_update(
+                    constraint="uq_entity_document_collection_point",
+                    set_={
+                        "sync_id": stmt.excluded.sync_id,
+                        "db_entity_id": stmt.excluded.db_entity_id,
+                        "entity_id": stmt.excluded.entity_id,
+                        "parent_entity_id": stmt.excluded.parent_entity_id,
+                        "document": stmt.excluded.document,
+                        "modified_at": stmt.excluded.modified_at,
+                    },
+                )
+                await db.execute(stmt)
+            await db.commit()
+
+    async def get_documents(
+        self, collection_id: UUID, point_ids: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load documents by Qdrant point id.
+
+        Returns:
+            Mapping of point id (string) to document; missing points are omitted
+        """
+        ids = [UUID(str(pid)) for pid in point_ids]
+        if not ids:
+            return {}
+
+        async with get_db_context() as db:
+            result = await db.execute(
+                select(EntityDocument.point_id, EntityDocument.document).where(
+                    EntityDocument.collection_id == collection_id,
+                    EntityDocument.point_id.in_(ids),
+                )
+            )
+            return {str(point_id): document for point_id, document in result.all()}
+
+    async def delete_by_db_entity_id(self, collection_id: UUID, db_entity_id: UUID) -> None:
+        """Delete all chunk documents of a DB entity."""
+        await self._delete(
+            EntityDocument.collection_id == collection_id,
+            EntityDocument.db_entity_id == db_entity_id,
+        )
+
+    async def delete_by_sync_id(self, collection_id: UUID, sync_id: UUID) -> None:
+        """Delete all documents written by a sync."""
+        await self._delete(
+            EntityDocument.collection_id == collection_id,
+            EntityDocument.sync_id == sync_id,
+        )
+
+    async def delete_by_entity_ids(
+        self, collection_id: UUID, sync_id: UUID, entity_ids: List[str]
+    ) -> None:
+        """Delete documents of specific chunk entity ids within a sync."""
+        if not entity_ids:
+            return
+        await self._delete(
+            EntityDocument.collection_id == collection_id,
+            EntityDocument.sync_id == sync_id,
+            EntityDocument.entity_id.in_(entity_ids),
+        )
+
+    async def delete_by_parent_ids(
+        self, collection_id: UUID, sync_id: UUID, parent_ids: List[str]
+    ) -> None:
+        """Delete documents of all chunks of the given parents within a sync."""
+        if not parent_ids:
+            return
+        await self._delete(
+            EntityDocument.collection_id == collection_id,
+            EntityDocument.sync_id == sync_id,
+            EntityDocument.parent_entity_id.in_([str(pid) for pid in parent_ids]),
+        )
+
+    async def _delete(self, *conditions) -> None:
+        async with get_db_context() as db:
+            await db.execute(delete(EntityDocument).where(*conditions))
+            await db.commit()
+
+
+entity_document_service = EntityDocumentService()
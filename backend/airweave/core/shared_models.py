@@ -59,6 +59,13 @@ class CollectionStatus(str, Enum):
     ERROR = "ERROR"
 
 
+class PayloadMode(str, Enum):
+    """How much of each entity a collection stores in the vector database payload."""
+
+    FULL = "full"  # The complete entity document
+    LEAN = "lean"  # Search fields only; full documents live in the entity_document table
+
+
 class ActionType(str, Enum):
     """Action type enum."""
 
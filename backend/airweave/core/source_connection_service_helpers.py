@@ -47,6 +47,7 @@ from airweave.schemas.source_connection import (
     AuthenticationMethod,
     SourceConnectionJob,
 )
+from airweave.search.cache import search_cache
 
 
 class SourceConnectionHelpers:
@@ -875,6 +876,7 @@ class SourceConnectionHelpers:
         self, db: AsyncSession, source_conn: Any, ctx: ApiContext
     ) -> None:
         """Clean up data in destinations."""
+        collection = None
         try:
             collection = await crud.collection.get_by_readable_id(
                 db, readable_id=source_conn.readable_collection_id, ctx=ctx
@@ -892,6 +894,10 @@ class SourceConnectionHelpers:
         except Exception as e:
             ctx.logger.error(f"Error cleaning up destination data: {e}")
 
+        # Cached search responses may still hold the deleted data, also after a partial delete
+        if collection:
+            await search_cache.invalidate_collection(collection.id)
+
     async def cleanup_temporal_schedules(
         self, sync_id: UUID, db: AsyncSession, ctx: ApiContext
     ) -> None:
@@ -128,6 +128,78 @@ class SyncCursorService:
             logger.error(f"Failed to update cursor data for sync {sync_id}: {e}")
             return None
 
+    async def get_checkpoint(
+        self, db: AsyncSession, sync_id: UUID, ctx: ApiContext
+    ) -> Optional[dict]:
+        """Get the mid-sync checkpoint of a sync.
+
+        Args:
+            db: Database session
+            sync_id: The sync ID
+            ctx: API context
+
+        Returns:
+            Checkpoint data, None if the last run completed or never checkpointed
+        """
+        try:
+            cursor = await crud.sync_cursor.get_by_sync_id(db, sync_id=sync_id, ctx=ctx)
+            return cursor.checkpoint_data if cursor else None
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoint for sync {sync_id}: {e}")
+            return None
+
+    async def save_checkpoint(
+        self,
+        db: AsyncSession,
+        sync_id: UUID,
+        checkpoint_data: dict,
+        ctx: ApiContext,
+    ) -> bool:
+        """Store a mid-sync checkpoint.
+
+        Callers must only pass checkpoints whose entities are durably written to all
+        destinations, since a resumed sync will not produce them again.
+
+        Args:
+            db: Database session
+            sync_id: The sync ID
+            checkpoint_data: Source position and processed watermark
+            ctx: API context
+
+        Returns:
+            True if the checkpoint was stored, False otherwise
+        """
+        try:
+            await crud.sync_cursor.update_checkpoint(
+                db, sync_id=sync_id, checkpoint_data=checkpoint_data, ctx=ctx
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save checkpoint for sync {sync_id}: {e}")
+            return False
+
+    async def clear_checkpoint(self, db: AsyncSession, sync_id: UUID, ctx: ApiContext) -> bool:
+        """Clear the mid-sync checkpoint after a sync completed.
+
+        Args:
+            db: Database session
+            sync_id: The sync ID
+            ctx: API context
+
+        Returns:
+            True if the checkpoint was cleared or did not exist, False otherwise
+        """
+        try:
+            cursor = await crud.sync_cursor.get_by_sync_id(db, sync_id=sync_id, ctx=ctx)
+            if cursor and cursor.checkpoint_data is not None:
+                await crud.sync_cursor.update_checkpoint(
+                    db, sync_id=sync_id, checkpoint_data=None, ctx=ctx
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to clear checkpoint for sync {sync_id}: {e}")
+            return False
+
     async def delete_cursor(
         self,
         db: AsyncSession,
@@ -0,0 +1,126 @@
+"""Service for per-collection timestamp range statistics.
+
+Temporal relevance needs the oldest and newest ``airweave_updated_at`` of a collection.
+Instead of scrolling Qdrant on every search, the range is kept in Redis:
+
+- ``<prefix>:{collection_id}:min`` / ``:max`` are sorted sets whose members are scopes
+  (``__all__`` for the whole collection, or a source short name) and whose scores are epoch
+  seconds. ``ZADD LT`` / ``ZADD GT`` make every update an atomic min/max merge, so concurrent
+  syncs into the same collection never lose a bound.
+- ``<prefix>:{collection_id}:seeded`` is a set of scopes whose range was initialised from a
+  full scan of the existing data. Syncs only widen ranges, so a scope is trusted only once it
+  has been seeded; until then readers fall back to scanning (and seed it).
+
+Ranges are an envelope: deleting the oldest or newest entity does not shrink them.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+
+COLLECTION_SCOPE = "__all__"
+
+
+class TimestampStatsService:
+    """Maintain min/max entity timestamps per collection and per source."""
+
+    KEY_PREFIX = "collection_timestamp_stats"
+
+    def _keys(self, collection_id: UUID) -> Tuple[str, str, str]:
+        base = f"{self.KEY_PREFIX}:{collection_id}"
+        return f"{base}:min", f"{base}:max", f"{base}:seeded"
+
+    @staticmethod
+    def _to_epoch(value: datetime) -> float:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
+    async def record(
+        self, collection_id: UUID, timestamps_by_source: Dict[str, Iterable[datetime]]
+    ) -> None:
+        """Widen the collection and source ranges with newly written timestamps.
+
+        Args:
+            collection_id: Collection the entities were written to
+            timestamps_by_source: Source short name to timestamps of written entities
+        """
+        mins: Dict[str, float] = {}
+        maxs: Dict[str, float] = {}
+        for source, timestamps in timestamps_by_source.items():
+            epochs = [self._to_epoch(ts) for ts in timestamps if ts is not None]
+            if not epochs:
+                continue
+            mins[source] = min(epochs)
+            maxs[source] = max(epochs)
+
+        if not mins:
+            return
+
+        mins[COLLECTION_SCOPE] = min(mins.values())
+        maxs[COLLECTION_SCOPE] = max(maxs.values())
+
+        min_key, max_key, _ = self._keys(collection_id)
+        try:
+            async with redis_client.client.pipeline(transaction=False) as pipe:
+                pipe.zadd(min_key, mins, lt=True)
+                pipe.zadd(max_key, maxs, gt=True)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to record timestamp stats for collection {collection_id}: {e}")
+
+    async def seed(
+        self,
+        collection_id: UUID,
+        oldest: datetime,
+        newest: datetime,
+        source: Optional[str] = None,
+    ) -> None:
+        """Initialise a scope's range from a full scan and mark it trusted."""
+        scope = source or COLLECTION_SCOPE
+        min_key, max_key, seeded_key = self._keys(collection_id)
+        try:
+            async with redis_client.client.pipeline(transaction=False) as pipe:
+                pipe.zadd(min_key, {scope: self._to_epoch(oldest)}, lt=True)
+                pipe.zadd(max_key, {scope: self._to_epoch(newest)}, gt=True)
+                pipe.sadd(seeded_key, scope)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to seed timestamp stats for collection {collection_id}: {e}")
+
+    async def get_range(
+        self, collection_id: UUID, source: Optional[str] = None
+    ) -> Optional[Tuple[datetime, datetime]]:
+        """Get the (oldest, newest) range of a scope, or None if it is not trusted yet."""
+        scope = source or COLLECTION_SCOPE
+        min_key, max_key, seeded_key = self._keys(collection_id)
+        try:
+            async with redis_client.client.pipeline(transaction=False) as pipe:
+                pipe.sismember(seeded_key, scope)
+                pipe.zscore(min_key, scope)
+                pipe.zscore(max_key, scope)
+                seeded, oldest, newest = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Failed to read timestamp stats for collection {collection_id}: {e}")
+            return None
+
+        if not seeded or oldest is None or newest is None:
+            return None
+
+        return (
+            datetime.fromtimestamp(float(oldest), tz=timezone.utc),
+            datetime.fromtimestamp(float(newest), tz=timezone.utc),
+        )
+
+    async def delete(self, collection_id: UUID) -> None:
+        """Drop all statistics of a collection."""
+        try:
+            await redis_client.client.delete(*self._keys(collection_id))
+        except Exception as e:
+            logger.warning(f"Failed to delete timestamp stats for collection {collection_id}: {e}")
+
+
+timestamp_stats_service = TimestampStatsService()
@@ -77,6 +77,7 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
                 "sync_job_id": stmt.excluded.sync_job_id,
                 "entity_definition_id": stmt.excluded.entity_definition_id,
                 "hash": stmt.excluded.hash,
+                "metadata_fingerprint": stmt.excluded.metadata_fingerprint,
                 "modified_at": stmt.excluded.modified_at,
             },
         ).returning(Entity)
@@ -202,6 +203,7 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
                 "sync_job_id": stmt.excluded.sync_job_id,
                 "entity_definition_id": stmt.excluded.entity_definition_id,
                 "hash": stmt.excluded.hash,
+                "metadata_fingerprint": stmt.excluded.metadata_fingerprint,
                 "modified_at": stmt.excluded.modified_at,
                 # Keep the original organization_id to prevent cross-org updates
                 # organization_id is not updated on conflict
@@ -223,24 +225,66 @@ class CRUDEntity(CRUDBaseOrganization[Entity, EntityCreate, EntityUpdate]):
         self,
         db: AsyncSession,
         *,
-        rows: list[tuple[UUID, str]],
+        rows: list[tuple[UUID, str, Optional[str]]],
     ) -> None:
-        """Bulk update the 'hash' field for many entities.
+        """Bulk update the 'hash' and 'metadata_fingerprint' fields for many entities.
 
         Args:
             db: The async database session.
-            rows: list of tuples (entity_db_id, new_hash)
+            rows: list of tuples (entity_db_id, new_hash, new_metadata_fingerprint)
         """
         if not rows:
             return
-        for entity_db_id, new_hash in rows:
+        for entity_db_id, new_hash, new_fingerprint in rows:
             stmt = (
                 update(Entity)
                 .where(Entity.id == entity_db_id)
-                .values(hash=new_hash, modified_at=datetime.now(timezone.utc).replace(tzinfo=None))
+                .values(
+                    hash=new_hash,
+                    metadata_fingerprint=new_fingerprint,
+                    modified_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                )
             )
             await db.execute(stmt)
 
+    async def bulk_update_metadata_fingerprint(
+        self,
+        db: AsyncSession,
+        *,
+        rows: list[tuple[UUID, str]],
+    ) -> None:
+        """Bulk update the 'metadata_fingerprint' field for many entities in one statement.
+
+        Args:
+            db: The async database session.
+            rows: list of tuples (entity_db_id, new_metadata_fingerprint)
+        """
+        if not rows:
+            return
+        await db.execute(
+            update(Entity),
+            [
+                {"id": entity_db_id, "metadata_fingerprint": fingerprint}
+                for entity_db_id, fingerprint in rows
+            ],
+        )
+
+    async def get_metadata_fingerprints(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+    ) -> dict[str, str]:
+        """Get the stored metadata fingerprints of a sync's entities, by entity_id.
+
+        Entities without a fingerprint are left out.
+        """
+        stmt = select(Entity.entity_id, Entity.metadata_fingerprint).where(
+            Entity.sync_id == sync_id, Entity.metadata_fingerprint.is_not(None)
+        )
+        result = await db.execute(stmt)
+        return dict(result.tuples().all())
+
     async def update_job_id(
         self,
         db: AsyncSession,
@@ -1,5 +1,6 @@
 """CRUD operations for sync cursor."""
 
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
@@ -97,6 +98,43 @@ class CRUDSyncCursor(
 
         return None
 
+    async def update_checkpoint(
+        self,
+        db: AsyncSession,
+        *,
+        sync_id: UUID,
+        checkpoint_data: Optional[dict],
+        ctx: ApiContext,
+    ) -> models.SyncCursor:
+        """Store or clear the mid-sync checkpoint of a sync.
+
+        Creates an empty cursor if the sync has none yet, so a first sync can checkpoint too.
+
+        Args:
+            db: Database session
+            sync_id: The sync ID
+            checkpoint_data: Checkpoint to store, or None to clear it
+            ctx: API context
+
+        Returns:
+            Updated sync cursor
+        """
+        cursor = await self.get_by_sync_id(db, sync_id=sync_id, ctx=ctx)
+        if not cursor:
+            cursor = await self.create(
+                db, obj_in=schemas.SyncCursorCreate(sync_id=sync_id, cursor_data={}), ctx=ctx
+            )
+
+        return await self.update(
+            db,
+            db_obj=cursor,
+            obj_in={
+                "checkpoint_data": checkpoint_data,
+                "checkpointed_at": datetime.now(timezone.utc) if checkpoint_data else None,
+            },
+            ctx=ctx,
+        )
+
     async def delete_by_sync_id(self, db: AsyncSession, *, sync_id: UUID, ctx: ApiContext) -> bool:
         """Delete sync cursor by sync ID.
 
@@ -12,12 +12,14 @@ from .embedding_model import EmbeddingModel
 from .entity import Entity
 from .entity_count import EntityCount
 from .entity_definition import EntityDefinition
+from .entity_document import EntityDocument
 from .entity_relation import EntityRelation
 from .feature_flag import FeatureFlag
 from .integration_credential import IntegrationCredential
 from .organization import Organization
 from .organization_billing import OrganizationBilling
 from .pg_field_catalog import PgFieldCatalogColumn, PgFieldCatalogTable
+from .platform_sync_state import PlatformSyncState
 from .redirect_session import RedirectSession
 from .search_query import SearchQuery
 from .source import Source
@@ -45,6 +47,7 @@ __all__ = [
     "Destination",
     "EmbeddingModel",
     "EntityDefinition",
+    "EntityDocument",
     "EntityRelation",
     "FeatureFlag",
     "IntegrationCredential",
@@ -52,6 +55,7 @@ __all__ = [
     "OrganizationBilling",
     "PgFieldCatalogColumn",
     "PgFieldCatalogTable",
+    "PlatformSyncState",
     "RedirectSession",
     "SearchQuery",
     "Source",
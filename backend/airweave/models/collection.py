@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, List
 from sqlalchemy import String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from airweave.core.shared_models import PayloadMode
 from airweave.models._base import OrganizationBase, UserMixin
 
 if TYPE_CHECKING:
@@ -19,6 +20,12 @@ class Collection(OrganizationBase, UserMixin):
 
     name: Mapped[str] = mapped_column(String, nullable=False)
     readable_id: Mapped[str] = mapped_column(String, nullable=False, unique=True)
+    payload_mode: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default=PayloadMode.FULL.value,
+        server_default=PayloadMode.FULL.value,
+    )
     # Status is now ephemeral - removed from database model
 
     # Relationships
@@ -34,6 +34,12 @@ class Entity(OrganizationBase):
         comment="Entity definition this entity belongs to",
     )
     hash: Mapped[str] = mapped_column(String, nullable=False)
+    metadata_fingerprint: Mapped[Optional[str]] = mapped_column(
+        String,
+        nullable=True,
+        comment="Fingerprint of the provider metadata (checksum, eTag, revision, size and "
+        "modified time) of a file entity",
+    )
 
     # Add back references
     sync_job: Mapped["SyncJob"] = relationship(
@@ -0,0 +1,42 @@
+"""Entity document model."""
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airweave.models._base import Base
+
+
+class EntityDocument(Base):
+    """Full stored document of a chunk whose vector-database payload is lean.
+
+    Collections in lean payload mode only keep search fields in Qdrant; the complete
+    payload is stored here, keyed by the Qdrant point id, and loaded for returned results.
+    """
+
+    __tablename__ = "entity_document"
+
+    collection_id: Mapped[UUID] = mapped_column(
+        ForeignKey("collection.id", ondelete="CASCADE", name="fk_entity_document_collection_id"),
+        nullable=False,
+    )
+    sync_id: Mapped[UUID] = mapped_column(
+        ForeignKey("sync.id", ondelete="CASCADE", name="fk_entity_document_sync_id"),
+        nullable=False,
+    )
+    point_id: Mapped[UUID] = mapped_column(nullable=False)
+    db_entity_id: Mapped[UUID] = mapped_column(nullable=False)
+    entity_id: Mapped[str] = mapped_column(String, nullable=False)
+    parent_entity_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    document: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("collection_id", "point_id", name="uq_entity_document_collection_point"),
+        Index("idx_entity_document_sync_id", "sync_id"),
+        Index("idx_entity_document_db_entity_id", "db_entity_id"),
+        Index("idx_entity_document_sync_id_parent_entity_id", "sync_id", "parent_entity_id"),
+        Index("idx_entity_document_sync_id_entity_id", "sync_id", "entity_id"),
+    )
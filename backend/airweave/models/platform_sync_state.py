@@ -0,0 +1,19 @@
+"""Platform sync state model."""
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from airweave.models._base import Base
+
+
+class PlatformSyncState(Base):
+    """Fingerprint of the platform code last synced into the definition tables.
+
+    One row per synced component group. Replicas compare the stored fingerprint with the
+    fingerprint of their own platform package and skip the platform sync when they match.
+    """
+
+    __tablename__ = "platform_sync_state"
+
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
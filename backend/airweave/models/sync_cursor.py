@@ -32,6 +32,13 @@ class SyncCursor(OrganizationBase):
     # Cursor field name (e.g., 'last_repository_pushed_at' for GitHub)
     cursor_field: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
+    # Mid-sync checkpoint of a running sync (source position and processed watermark),
+    # cleared when the sync completes
+    checkpoint_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    checkpointed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
     # Timestamp for tracking cursor updates
     last_updated: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc)
@@ -49,6 +49,14 @@ class BitbucketConfig(SourceConfig):
             "If empty, includes all text files."
         ),
     )
+    archive_mode: bool = Field(
+        default=False,
+        title="Archive Mode",
+        description=(
+            "Download the branch as a single archive instead of requesting every directory and "
+            "file separately (recommended for large repositories)"
+        ),
+    )
 
     @validator("file_extensions", pre=True)
     def parse_file_extensions(cls, value):
@@ -114,6 +122,14 @@ class GitHubConfig(SourceConfig):
             "If empty, uses the default branch."
         ),
     )
+    archive_mode: bool = Field(
+        default=False,
+        title="Archive Mode",
+        description=(
+            "Download the branch as a single archive instead of requesting every directory and "
+            "file separately (recommended for large repositories)"
+        ),
+    )
 
     @field_validator("repo_name")
     @classmethod
@@ -154,6 +170,14 @@ class GitLabConfig(SourceConfig):
             "Specific branch to sync (e.g., 'main', 'master'). If empty, uses the default branch."
         ),
     )
+    archive_mode: bool = Field(
+        default=False,
+        title="Archive Mode",
+        description=(
+            "Download the branch as a single archive instead of requesting every directory and "
+            "file separately (recommended for large repositories)"
+        ),
+    )
 
 
 class GmailConfig(SourceConfig):
@@ -5,20 +5,28 @@ import importlib
 import inspect
 import os
 import re
-from typing import Callable, Dict, Type, Union
+from typing import Callable, Dict, Optional, Type, Union
 from uuid import UUID
 
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import get_type_hints
 
 from airweave import crud, schemas
+from airweave.core.config import settings
+from airweave.core.datetime_utils import utc_now_naive
 from airweave.core.logging import logger
 from airweave.models.entity_definition import EntityType
+from airweave.models.platform_sync_state import PlatformSyncState
 from airweave.platform.auth_providers._base import BaseAuthProvider
 from airweave.platform.destinations._base import BaseDestination
 from airweave.platform.embedding_models._base import BaseEmbeddingModel
+from airweave.platform.manifest import compute_platform_fingerprint
 from airweave.platform.sources._base import BaseSource
 
+PLATFORM_SYNC_STATE_NAME = "platform_components"
+
 sync_logger = logger.with_prefix("Platform sync: ").with_context(component="platform_sync")
 
 
@@ -721,17 +729,56 @@ async def _sync_transformers(
     sync_logger.info(f"Synced {len(transformer_definitions)} transformers to database.")
 
 
-async def sync_platform_components(platform_dir: str, db: AsyncSession) -> None:
+async def _get_synced_fingerprint(db: AsyncSession) -> Optional[str]:
+    """Get the platform fingerprint stored by the last successful sync."""
+    result = await db.execute(
+        select(PlatformSyncState.fingerprint).where(
+            PlatformSyncState.name == PLATFORM_SYNC_STATE_NAME
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def _store_synced_fingerprint(db: AsyncSession, fingerprint: str) -> None:
+    """Record the platform fingerprint of a successful sync."""
+    now = utc_now_naive()
+    stmt = insert(PlatformSyncState).values(
+        name=PLATFORM_SYNC_STATE_NAME, fingerprint=fingerprint, created_at=now, modified_at=now
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PlatformSyncState.name],
+        set_={"fingerprint": fingerprint, "modified_at": now},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+
+async def sync_platform_components(
+    platform_dir: str, db: AsyncSession, force: bool = False
+) -> None:
     """Sync all platform components with the database.
 
+    The sync imports every platform module and upserts every definition row, so it is
+    skipped when the platform package is unchanged since the last successful sync
+    (unless RUN_DB_SYNC_ONLY_ON_CHANGE is disabled or ``force`` is set).
+
     Args:
         platform_dir (str): Directory containing platform components
         db (AsyncSession): Database session
+        force (bool): Sync even if the platform fingerprint is unchanged
 
     Raises:
         Exception: If any part of the sync process fails, with detailed error messages to help
         diagnose the issue
     """
+    fingerprint = compute_platform_fingerprint(platform_dir)
+    if settings.RUN_DB_SYNC_ONLY_ON_CHANGE and not force:
+        if await _get_synced_fingerprint(db) == fingerprint:
+            sync_logger.info(
+                f"Platform components unchanged (fingerprint {fingerprint[:12]}), skipping sync."
+            )
+            return
+
     sync_logger.info("Starting platform components sync...")
 
     try:
@@ -753,6 +800,7 @@ async def sync_platform_components(platform_dir: str, db: AsyncSession) -> None:
         await _sync_destinations(db, components["destinations"])
         await _sync_auth_providers(db, components["auth_providers"])
         await _sync_transformers(db, components["transformers"], module_entity_map)
+        await _store_synced_fingerprint(db, fingerprint)
 
         sync_logger.info("Platform components sync completed successfully.")
     except ImportError as e:
@@ -57,6 +57,13 @@ class BaseDestination(ABC):
         """Bulk insert entities into the destination."""
         pass
 
+    async def flush(self) -> None:
+        """Wait until every write issued so far is durable in the destination.
+
+        Destinations that write asynchronously override this; the default is a no-op.
+        """
+        return None
+
     @abstractmethod
     async def delete(self, db_entity_id: UUID) -> None:
         """Delete a single entity from the destination."""
@@ -5,9 +5,18 @@ All collections now use shared physical collections in Qdrant:
 - 1536-dim vectors → airweave_shared_text_embedding_3_small (OpenAI)
 
 Tenant isolation is achieved via airweave_collection_id payload filtering.
+
+Vector storage of the shared collections (quantization, on-disk originals) is configured
+here as well, so new collections are created with it and existing ones can be migrated.
 """
 
+from typing import Optional
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models as rest
+
 from airweave.core.config import settings
+from airweave.core.logging import logger
 
 
 def get_default_vector_size() -> int:
@@ -41,3 +50,87 @@ def get_physical_collection_name(vector_size: int | None = None) -> str:
         if vector_size == 1536
         else "airweave_shared_minilm_l6_v2"
     )
+
+
+def get_quantization_config(mode: Optional[str] = None) -> Optional[rest.QuantizationConfig]:
+    """Get the quantization config for dense vectors.
+
+    Args:
+        mode: "none", "scalar" (int8) or "binary". Defaults to QDRANT_QUANTIZATION.
+
+    Returns:
+        Quantization config, or None if quantization is disabled
+    """
+    mode = (mode or settings.QDRANT_QUANTIZATION).lower()
+    if mode == "scalar":
+        return rest.ScalarQuantization(
+            scalar=rest.ScalarQuantizationConfig(
+                type=rest.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            )
+        )
+    if mode == "binary":
+        return rest.BinaryQuantization(binary=rest.BinaryQuantizationConfig(always_ram=True))
+    if mode != "none":
+        raise ValueError(f"Unknown Qdrant quantization mode: {mode}")
+    return None
+
+
+def get_dense_search_params(mode: Optional[str] = None) -> Optional[rest.SearchParams]:
+    """Get search params for dense queries (rescoring + oversampling for quantized vectors).
+
+    Returns:
+        Search params, or None if quantization is disabled
+    """
+    if get_quantization_config(mode) is None:
+        return None
+    return rest.SearchParams(
+        quantization=rest.QuantizationSearchParams(
+            rescore=settings.QDRANT_QUANTIZATION_RESCORE,
+            oversampling=settings.QDRANT_QUANTIZATION_OVERSAMPLING,
+        )
+    )
+
+
+async def migrate_collection_storage(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    vector_name: str,
+    quantization: Optional[str] = None,
+    on_disk: Optional[bool] = None,
+) -> bool:
+    """Bring an existing shared collection in line with the configured vector storage.
+
+    Qdrant applies the change in place and rebuilds quantized vectors in the background
+    optimizer, so the collection stays searchable during the migration.
+
+    Args:
+        client: Connected Qdrant client
+        collection_name: Physical collection name
+        vector_name: Name of the dense vector
+        quantization: Target quantization mode. Defaults to QDRANT_QUANTIZATION.
+        on_disk: Whether original vectors live on disk. Defaults to QDRANT_ON_DISK_VECTORS.
+
+    Returns:
+        True if the collection was updated, False if it already matched
+    """
+    on_disk = settings.QDRANT_ON_DISK_VECTORS if on_disk is None else on_disk
+    desired_quantization = get_quantization_config(quantization)
+
+    info = await client.get_collection(collection_name)
+    vectors = info.config.params.vectors
+    dense_params = vectors.get(vector_name) if isinstance(vectors, dict) else vectors
+
+    update: dict = {}
+    if info.config.quantization_config != desired_quantization:
+        update["quantization_config"] = desired_quantization or rest.Disabled.DISABLED
+    if dense_params is not None and bool(dense_params.on_disk) != on_disk:
+        update["vectors_config"] = {vector_name: rest.VectorParamsDiff(on_disk=on_disk)}
+
+    if not update:
+        return False
+
+    logger.info(f"Migrating vector storage of {collection_name}: {sorted(update)}")
+    await client.update_collection(collection_name=collection_name, **update)
+    return True
@@ -10,7 +10,7 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING, Literal, Optional
+from typing import TYPE_CHECKING, ClassVar, Literal, Optional
 from uuid import UUID
 
 # Prefer SparseTextEmbedding (newer fastembed), fallback to SparseEmbedding (older)
@@ -32,26 +32,61 @@ from qdrant_client.http import models as rest
 from qdrant_client.local.local_collection import DEFAULT_VECTOR_NAME
 
 from airweave.core.config import settings
+from airweave.core.entity_document_service import entity_document_service
 from airweave.core.logging import ContextualLogger
 from airweave.core.logging import logger as default_logger
+from airweave.core.shared_models import PayloadMode
 from airweave.platform.configs.auth import QdrantAuthConfig
 from airweave.platform.decorators import destination
 from airweave.platform.destinations._base import VectorDBDestination
 from airweave.platform.destinations.collection_strategy import (
     get_default_vector_size,
+    get_dense_search_params,
     get_physical_collection_name,
+    get_quantization_config,
+    migrate_collection_storage,
 )
 from airweave.platform.entities._base import ChunkEntity
+from airweave.platform.sync.async_helpers import run_in_thread_pool
 
 if TYPE_CHECKING:
     from airweave.search.operations.temporal_relevance import DecayConfig
 
 KEYWORD_VECTOR_NAME = "bm25"
 
+# Lean payloads: fields always kept in Qdrant (besides short scalar fields used by filters)
+LEAN_PAYLOAD_FIELDS = {
+    "entity_id",
+    "parent_entity_id",
+    "name",
+    "breadcrumbs",
+    "embeddable_text",
+    "airweave_collection_id",
+}
+LEAN_SYSTEM_METADATA_FIELDS = {
+    "db_entity_id",
+    "sync_id",
+    "sync_job_id",
+    "source_name",
+    "entity_type",
+    "airweave_created_at",
+    "airweave_updated_at",
+}
+LEAN_MAX_SCALAR_CHARS = 256
+
 
 @destination("Qdrant", "qdrant", config_class=QdrantAuthConfig, supports_vector=True)
 class QdrantDestination(VectorDBDestination):
-    """Qdrant destination with multi-tenant support and legacy compatibility."""
+    """Qdrant destination with multi-tenant support and legacy compatibility.
+
+    Bulk inserts build points in a worker thread and upsert them with ``wait=True``; the
+    sync's concurrent batches each await their own upsert. ``bulk_insert`` returns once its
+    points are applied, so callers can record a batch as written (e.g. commit its hashes)
+    right after it, and its errors surface on it.
+    """
+
+    # Physical collections known to exist, keyed by (Qdrant location, collection name)
+    _ready_collections: ClassVar[set[tuple[str, str]]] = set()
 
     def __init__(self):
         """Initialize defaults and placeholders for connection and collection state."""
@@ -68,6 +103,7 @@ class QdrantDestination(VectorDBDestination):
         self.api_key: str | None = None
         self.client: AsyncQdrantClient | None = None
         self.vector_size: int = 384  # Default dense vector size
+        self.payload_mode: PayloadMode = PayloadMode.FULL
 
     # ----------------------------------------------------------------------------------
     # Lifecycle / connection
@@ -79,6 +115,7 @@ class QdrantDestination(VectorDBDestination):
         organization_id: Optional[UUID] = None,
         vector_size: Optional[int] = None,
         logger: Optional[ContextualLogger] = None,
+        payload_mode: PayloadMode | str = PayloadMode.FULL,
     ) -> "QdrantDestination":
         """Create and return a connected destination.
 
@@ -89,6 +126,8 @@ class QdrantDestination(VectorDBDestination):
                          - 1536 if OpenAI API key is set (text-embedding-3-small)
                          - 384 otherwise (MiniLM-L6-v2)
             logger: Logger instance
+            payload_mode: Payload mode of the collection. In lean mode only search fields
+                          are stored in Qdrant and full documents go to the side store.
 
         Returns:
             Configured QdrantDestination instance with multi-tenant shared collection
@@ -101,6 +140,7 @@ class QdrantDestination(VectorDBDestination):
         instance.set_logger(logger or default_logger)
         instance.collection_id = collection_id
         instance.organization_id = organization_id
+        instance.payload_mode = PayloadMode(payload_mode)
         instance.vector_size = vector_size if vector_size is not None else get_default_vector_size()
 
         # Map to physical shared collection
@@ -181,12 +221,29 @@ class QdrantDestination(VectorDBDestination):
             self.logger.error(f"Error checking if collection exists: {e}")
             raise
 
+    def _readiness_key(self) -> tuple[str, str]:
+        return (self.url or settings.qdrant_url, self.collection_name)
+
+    async def _ensure_collection_ready(self) -> None:
+        """Make sure the physical collection exists, checking Qdrant once per process."""
+        if self._readiness_key() in self._ready_collections:
+            return
+
+        if not await self.collection_exists(self.collection_name):
+            self.logger.error(
+                f"[Qdrant] Collection {self.collection_name} does NOT exist! "
+                f"collection_id={self.collection_id}. Creating it now..."
+            )
+            await self.setup_collection(self.vector_size)
+        self._ready_collections.add(self._readiness_key())
+
     async def setup_collection(self, vector_size: int | None = None) -> None:
         """Set up physical Qdrant collection with multi-tenant support.
 
         Implements Qdrant's multi-tenancy recommendations:
         - payload_m=16, m=0 for per-tenant HNSW indexes
         - Tenant keyword index with is_tenant=true for co-location
+        - Dense vector quantization / on-disk originals as configured in collection_strategy
 
         See: https://qdrant.tech/documentation/guides/multiple-partitions/
 
@@ -207,6 +264,10 @@ class QdrantDestination(VectorDBDestination):
         try:
             if await self.collection_exists(self.collection_name):
                 self.logger.debug(f"Collection {self.collection_name} already exists.")
+                if settings.QDRANT_MIGRATE_STORAGE_ON_SETUP:
+                    await migrate_collection_storage(
+                        self.client, self.collection_name, DEFAULT_VECTOR_NAME
+                    )
                 return
 
             self.logger.info(f"Creating physical collection {self.collection_name}...")
@@ -225,6 +286,7 @@ class QdrantDestination(VectorDBDestination):
                     DEFAULT_VECTOR_NAME: rest.VectorParams(
                         size=self.vector_size,
                         distance=rest.Distance.COSINE,
+                        on_disk=settings.QDRANT_ON_DISK_VECTORS,
                     ),
                 },
                 sparse_vectors_config={
@@ -237,6 +299,7 @@ class QdrantDestination(VectorDBDestination):
                     indexing_threshold=20000,
                     max_segment_size=200000,  # Smaller segments for better filtering
                 ),
+                quantization_config=get_quantization_config(),
                 on_disk_payload=True,
             )
 
@@ -317,6 +380,11 @@ class QdrantDestination(VectorDBDestination):
     # ----------------------------------------------------------------------------------
     async def insert(self, entity: ChunkEntity) -> None:
         """Upsert a single chunk entity into Qdrant."""
+        if self.payload_mode == PayloadMode.LEAN:
+            # Lean points need their side-store document; reuse the batch path
+            await self.bulk_insert([entity])
+            return
+
         await self.ensure_client_readiness()
 
         data_object = entity.to_storage_dict()
@@ -469,9 +537,67 @@ class QdrantDestination(VectorDBDestination):
             await self._upsert_points_with_fallback(left, min_batch=min_batch)
             await self._upsert_points_with_fallback(right, min_batch=min_batch)
 
+    def _build_point_structs(
+        self, entities: list[ChunkEntity]
+    ) -> tuple[list[rest.PointStruct], list[dict]]:
+        """Build point structs for a batch (runs in a worker thread).
+
+        Returns:
+            The points, and in lean payload mode the side-store documents for them
+        """
+        points = [self._build_point_struct(e) for e in entities]
+        if self.payload_mode != PayloadMode.LEAN:
+            return points, []
+
+        documents: list[dict] = []
+        for entity, point in zip(entities, points, strict=True):
+            metadata = entity.airweave_system_metadata
+            documents.append(
+                {
+                    "point_id": UUID(str(point.id)),
+                    "sync_id": metadata.sync_id,
+                    "db_entity_id": metadata.db_entity_id,
+                    "entity_id": entity.entity_id,
+                    "parent_entity_id": getattr(entity, "parent_entity_id", None),
+                    "document": point.payload,
+                }
+            )
+            point.payload = self._to_lean_payload(point.payload)
+        return points, documents
+
+    @staticmethod
+    def _to_lean_payload(payload: dict) -> dict:
+        """Reduce a full payload to what search needs in Qdrant.
+
+        Keeps ids, the embeddable text, timestamps and short scalar fields (so interpreted
+        and user filters keep working); drops long text and JSON-serialized nested fields.
+        """
+        lean: dict = {}
+        for key, value in payload.items():
+            if key == "airweave_system_metadata":
+                continue
+            if key in LEAN_PAYLOAD_FIELDS or isinstance(value, (bool, int, float)):
+                lean[key] = value
+            elif (
+                isinstance(value, str)
+                and len(value) <= LEAN_MAX_SCALAR_CHARS
+                and not value.startswith(("{", "["))
+            ):
+                lean[key] = value
+
+        metadata = payload.get("airweave_system_metadata")
+        if isinstance(metadata, dict):
+            lean["airweave_system_metadata"] = {
+                k: v for k, v in metadata.items() if k in LEAN_SYSTEM_METADATA_FIELDS
+            }
+        return lean
+
     # ----------------------------------------------------------------------------------
     async def bulk_insert(self, entities: list[ChunkEntity]) -> None:
-        """Upsert multiple chunk entities with fallback halving on write timeouts."""
+        """Upsert multiple chunk entities with fallback halving on write timeouts.
+
+        Returns once Qdrant applied the points, and raises if they could not be written.
+        """
         if not entities:
             return
 
@@ -483,22 +609,25 @@ class QdrantDestination(VectorDBDestination):
             f"collection_id={self.collection_id}, vector_size={self.vector_size}"
         )
 
-        # Verify collection exists
-        if not await self.collection_exists(self.collection_name):
-            self.logger.error(
-                f"[Qdrant] Collection {self.collection_name} does NOT exist! "
-                f"collection_id={self.collection_id}. Creating it now..."
-            )
-            await self.setup_collection(self.vector_size)
+        await self._ensure_collection_ready()
 
-        point_structs = [self._build_point_struct(e) for e in entities]
+        point_structs, documents = await run_in_thread_pool(self._build_point_structs, entities)
 
         if not point_structs:
             self.logger.warning("No valid entities to insert")
             return
 
-        # Try once with the whole payload; fall back to halving on failure
-        await self._upsert_points_with_fallback(point_structs, min_batch=50)
+        # Documents must exist before their lean points become searchable
+        if documents:
+            await entity_document_service.upsert(self.collection_id, documents)
+
+        try:
+            await self._upsert_points_with_fallback(point_structs, min_batch=50)
+        except Exception as e:
+            if "not found" in str(e).lower():
+                # The collection may have been dropped; re-check it on the next insert
+                self._ready_collections.discard(self._readiness_key())
+            raise
 
     # ----------------------------------------------------------------------------------
     # Deletes (by parent/sync/etc.)
@@ -525,6 +654,8 @@ class QdrantDestination(VectorDBDestination):
             ),
             wait=True,
         )
+        if self.payload_mode == PayloadMode.LEAN:
+            await entity_document_service.delete_by_db_entity_id(self.collection_id, db_entity_id)
 
     async def delete_by_sync_id(self, sync_id: UUID) -> None:
         """Delete all points that have the provided sync job id."""
@@ -548,6 +679,8 @@ class QdrantDestination(VectorDBDestination):
             ),
             wait=True,
         )
+        if self.payload_mode == PayloadMode.LEAN:
+            await entity_document_service.delete_by_sync_id(self.collection_id, sync_id)
 
     async def bulk_delete(self, entity_ids: list[str], sync_id: UUID) -> None:
         """Delete specific entity ids that belong to a particular sync job."""
@@ -574,6 +707,10 @@ class QdrantDestination(VectorDBDestination):
             ),
             wait=True,
         )
+        if self.payload_mode == PayloadMode.LEAN:
+            await entity_document_service.delete_by_entity_ids(
+                self.collection_id, sync_id, entity_ids
+            )
 
     async def bulk_delete_by_parent_id(self, parent_id: str, sync_id: UUID | str) -> None:
         """Delete all points for a given parent (db entity) id and sync id."""
@@ -602,6 +739,10 @@ class QdrantDestination(VectorDBDestination):
             ),
             wait=True,
         )
+        if self.payload_mode == PayloadMode.LEAN:
+            await entity_document_service.delete_by_parent_ids(
+                self.collection_id, UUID(str(sync_id)), [parent_id]
+            )
 
     async def bulk_delete_by_parent_ids(self, parent_ids: list[str], sync_id: UUID) -> None:
         """Delete all points whose parent id is in the provided list and match sync id."""
@@ -631,6 +772,10 @@ class QdrantDestination(VectorDBDestination):
             ),
             wait=True,
         )
+        if self.payload_mode == PayloadMode.LEAN:
+            await entity_document_service.delete_by_parent_ids(
+                self.collection_id, sync_id, parent_ids
+            )
 
     # ----------------------------------------------------------------------------------
     # Query building (legacy-compatible sparse semantics)
@@ -708,15 +853,28 @@ class QdrantDestination(VectorDBDestination):
         sparse_vector: SparseEmbedding | dict | None,
         search_method: Literal["hybrid", "neural", "keyword"],
         decay_config: Optional[DecayConfig] = None,
+        filtered_count: Optional[int] = None,
     ) -> rest.QueryRequest:
-        """Create a single QueryRequest consistent with the old method."""
+        """Create a single QueryRequest consistent with the old method.
+
+        ``filtered_count`` is the estimated number of points matching the search filter;
+        it caps hybrid prefetches for selective filters.
+        """
         query_request_params: dict = {}
 
+        # Rescoring + oversampling when dense vectors are quantized
+        dense_search_params = get_dense_search_params()
+        dense_extra: dict = {"params": dense_search_params} if dense_search_params else {}
+        # Early cut of weak dense candidates (cosine similarity)
+        if settings.QDRANT_DENSE_SCORE_THRESHOLD is not None:
+            dense_extra["score_threshold"] = settings.QDRANT_DENSE_SCORE_THRESHOLD
+
         if search_method == "neural":
             neural_params = {
                 "query": query_vector,
                 "using": DEFAULT_VECTOR_NAME,
                 "limit": limit,
+                **dense_extra,
             }
             query_request_params = self._prepare_index_search_request(
                 neural_params, decay_config, limit=limit
@@ -744,17 +902,15 @@ class QdrantDestination(VectorDBDestination):
                 sparse_vector.as_object() if hasattr(sparse_vector, "as_object") else sparse_vector
             )
 
-            prefetch_limit = 10000
-            if decay_config is not None:
-                try:
-                    weight = max(0.0, min(1.0, float(getattr(decay_config, "weight", 0.0) or 0.0)))
-                    if weight > 0.3:
-                        prefetch_limit = int(10000 * (1 + weight))
-                except Exception:
-                    pass
+            prefetch_limit = self._compute_prefetch_limit(limit, decay_config, filtered_count)
 
             prefetch_params = [
-                {"query": query_vector, "using": DEFAULT_VECTOR_NAME, "limit": prefetch_limit},
+                {
+                    "query": query_vector,
+                    "using": DEFAULT_VECTOR_NAME,
+                    "limit": prefetch_limit,
+                    **dense_extra,
+                },
                 {
                     "query": rest.SparseVector(**obj),
                     "using": KEYWORD_VECTOR_NAME,
@@ -784,6 +940,48 @@ class QdrantDestination(VectorDBDestination):
 
         return rest.QueryRequest(**query_request_params)
 
+    @staticmethod
+    def _compute_prefetch_limit(
+        limit: int,
+        decay_config: Optional[DecayConfig] = None,
+        filtered_count: Optional[int] = None,
+    ) -> int:
+        """Size hybrid prefetches from the requested limit.
+
+        RRF only needs a candidate pool a constant factor deeper than the final result
+        count. Callers that rerank already request a larger limit, so reranking widens the
+        pool too. Strong recency decay reorders the fused pool, so it gets a deeper one, and
+        a selective filter caps the pool at the number of points that can match.
+        """
+        prefetch_limit = max(
+            limit * settings.QDRANT_PREFETCH_MULTIPLIER, settings.QDRANT_PREFETCH_MIN
+        )
+
+        if decay_config is not None:
+            try:
+                weight = max(0.0, min(1.0, float(getattr(decay_config, "weight", 0.0) or 0.0)))
+                if weight > 0.3:
+                    prefetch_limit = int(prefetch_limit * (1 + weight))
+            except Exception:
+                pass
+
+        if filtered_count is not None:
+            # Approximate counts can be low; keep some headroom
+            prefetch_limit = min(prefetch_limit, 2 * filtered_count)
+
+        return max(limit, min(prefetch_limit, settings.QDRANT_PREFETCH_MAX))
+
+    async def _estimate_filtered_count(self, query_filter: rest.Filter) -> Optional[int]:
+        """Estimate how many points match a filter (cheap, index-based cardinality)."""
+        try:
+            result = await self.client.count(
+                collection_name=self.collection_name, count_filter=query_filter, exact=False
+            )
+            return result.count
+        except Exception as e:
+            self.logger.debug(f"[Qdrant] Could not estimate filter cardinality: {e}")
+            return None
+
     def _validate_bulk_search_inputs(
         self,
         query_vectors: list[list[float]],
@@ -813,15 +1011,9 @@ class QdrantDestination(VectorDBDestination):
     ) -> list[rest.QueryRequest]:
         """Create per-query request objects with automatic tenant filtering."""
         requests: list[rest.QueryRequest] = []
+        filtered_counts: dict[str, Optional[int]] = {}
         for i, qv in enumerate(query_vectors):
             sv = sparse_vectors[i] if sparse_vectors else None
-            req = await self._prepare_query_request(
-                query_vector=qv,
-                limit=limit,
-                sparse_vector=sv,
-                search_method=search_method,
-                decay_config=decay_config,
-            )
 
             # CRITICAL: Auto-inject tenant filter for multi-tenant isolation
             # This ensures searches only return results from the correct collection
@@ -839,13 +1031,31 @@ class QdrantDestination(VectorDBDestination):
                 user_filter = rest.Filter.model_validate(filter_conditions[i])
                 # Combine must conditions (tenant filter + user filters)
                 combined_must = tenant_filter.must + (user_filter.must or [])
-                req.filter = rest.Filter(
+                query_filter = rest.Filter(
                     must=combined_must,
                     should=user_filter.should,
                     must_not=user_filter.must_not,
                 )
             else:
-                req.filter = tenant_filter
+                query_filter = tenant_filter
+
+            # Only hybrid search prefetches; estimate each distinct filter once
+            filtered_count = None
+            if search_method == "hybrid":
+                filter_key = query_filter.model_dump_json()
+                if filter_key not in filtered_counts:
+                    filtered_counts[filter_key] = await self._estimate_filtered_count(query_filter)
+                filtered_count = filtered_counts[filter_key]
+
+            req = await self._prepare_query_request(
+                query_vector=qv,
+                limit=limit,
+                sparse_vector=sv,
+                search_method=search_method,
+                decay_config=decay_config,
+                filtered_count=filtered_count,
+            )
+            req.filter = query_filter
 
             if offset and offset > 0:
                 req.offset = offset
@@ -986,6 +1196,142 @@ class QdrantDestination(VectorDBDestination):
             self.logger.error(f"Error performing batch search with Qdrant: {e}")
             raise
 
+    async def fused_search(
+        self,
+        query_vectors: list[list[float]],
+        limit: int,
+        offset: int = 0,
+        hydrate_limit: Optional[int] = None,
+        filter: dict | None = None,
+        sparse_vectors: list[SparseEmbedding] | list[dict] | None = None,
+        search_method: Literal["hybrid", "neural", "keyword"] = "hybrid",
+        decay_config: Optional[DecayConfig] = None,
+        fusion: Literal["rrf", "dbsf"] = "rrf",
+    ) -> list[dict]:
+        """Search several query variations and fuse their rankings inside Qdrant.
+
+        Each query becomes one prefetch (with its own hybrid/decay pipeline) and the
+        prefetches are fused with RRF or DBSF, so deduplication and ordering happen in
+        Qdrant. Candidates are fetched as IDs and scores only; payloads are hydrated in a
+        single retrieve call for the requested window.
+
+        Args:
+            query_vectors: Dense query vectors (may be empty for keyword search)
+            limit: Number of fused results to return, counted from ``offset``
+            offset: Number of fused results to skip
+            hydrate_limit: Number of returned results to load payloads for
+                (defaults to all returned results)
+            filter: Optional user filter applied to every query
+            sparse_vectors: Sparse query vectors, aligned with ``query_vectors``
+            search_method: Retrieval strategy for each query
+            decay_config: Optional recency decay applied per query before fusion
+            fusion: Fusion method ("rrf" or "dbsf")
+
+        Returns:
+            Fused results as {"id", "score", "payload"} dicts in ranking order
+        """
+        await self.ensure_client_readiness()
+
+        num_queries = len(query_vectors or sparse_vectors or [])
+        if num_queries == 0:
+            return []
+        if not query_vectors:
+            query_vectors = [None] * num_queries
+
+        self._validate_bulk_search_inputs(query_vectors, None, sparse_vectors)
+
+        if search_method != "neural":
+            vector_config_names = await self.get_vector_config_names()
+            if KEYWORD_VECTOR_NAME not in vector_config_names:
+                self.logger.warning(
+                    f"{KEYWORD_VECTOR_NAME} index could not be found in "
+                    f"collection {self.collection_name}. Using neural search instead."
+                )
+                search_method = "neural"
+
+        candidate_limit = offset + limit
+        query_filter = self._build_tenant_filter(filter)
+        filtered_count = (
+            await self._estimate_filtered_count(query_filter) if search_method == "hybrid" else None
+        )
+
+        prefetches: list[rest.Prefetch] = []
+        for i, qv in enumerate(query_vectors):
+            sv = sparse_vectors[i] if sparse_vectors else None
+            req = await self._prepare_query_request(
+                query_vector=qv,
+                limit=candidate_limit,
+                sparse_vector=sv,
+                search_method=search_method,
+                decay_config=decay_config,
+                filtered_count=filtered_count,
+            )
+            prefetches.append(
+                rest.Prefetch(
+                    prefetch=req.prefetch,
+                    query=req.query,
+                    using=req.using,
+                    filter=query_filter,
+                    params=req.params,
+                    score_threshold=req.score_threshold,
+                    limit=req.limit,
+                )
+            )
+
+        fusion_method = rest.Fusion.DBSF if fusion == "dbsf" else rest.Fusion.RRF
+        self.logger.info(
+            f"[Qdrant] Executing fused {search_method.upper()} search: "
+            f"queries={num_queries}, fusion={fusion}, limit={limit}, offset={offset}"
+        )
+
+        try:
+            response = await self.client.query_points(
+                collection_name=self.collection_name,
+                prefetch=prefetches,
+                query=rest.FusionQuery(fusion=fusion_method),
+                query_filter=query_filter,
+                limit=limit,
+                offset=offset,
+                with_payload=False,
+                with_vectors=False,
+            )
+        except Exception as e:
+            self.logger.error(f"Error performing fused search with Qdrant: {e}")
+            raise
+
+        scored = [{"id": point.id, "score": point.score} for point in response.points]
+        to_hydrate = scored if hydrate_limit is None else scored[:hydrate_limit]
+        if not to_hydrate:
+            return scored
+
+        records = await self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=[r["id"] for r in to_hydrate],
+            with_payload=True,
+            with_vectors=False,
+        )
+        payload_by_id = {str(record.id): record.payload for record in records}
+        for result in to_hydrate:
+            result["payload"] = payload_by_id.get(str(result["id"]), {})
+
+        return scored
+
+    def _build_tenant_filter(self, user_filter: dict | None) -> rest.Filter:
+        """Combine the tenant condition with an optional user filter."""
+        tenant_condition = rest.FieldCondition(
+            key="airweave_collection_id",
+            match=rest.MatchValue(value=str(self.collection_id)),
+        )
+        if not user_filter:
+            return rest.Filter(must=[tenant_condition])
+
+        parsed = rest.Filter.model_validate(user_filter)
+        return rest.Filter(
+            must=[tenant_condition] + list(parsed.must or []),
+            should=parsed.should,
+            must_not=parsed.must_not,
+        )
+
     # ----------------------------------------------------------------------------------
     # Introspection
     # ----------------------------------------------------------------------------------
@@ -1,15 +1,17 @@
 """Simplified OpenAI text2vec model for embedding using official OpenAI client."""
 
 import asyncio
+import time
 from typing import List, Optional
 
 from aiolimiter import AsyncLimiter
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, RateLimitError
 from tiktoken import get_encoding
 
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import embedding_model
+from airweave.platform.sync.adaptive_batching import report_rate_limit
 
 from ._base import BaseEmbeddingModel
 
@@ -19,6 +21,9 @@ _openai_semaphore: Optional[asyncio.Semaphore] = None
 # One limiter for the whole process – 5M TPM, 0.5M TP10s gives big smoothing buffer
 _tpm_limiter: AsyncLimiter | None = None
 
+# Waiting longer than this on the token bucket is reported as rate-limit feedback
+_TPM_WAIT_FEEDBACK_S = 1.0
+
 
 @embedding_model(
     "OpenAI Text2Vec Simple",
@@ -82,12 +87,20 @@ class OpenAIText2Vec(BaseEmbeddingModel):
         # taken – no explicit release is required because the limiter refunds capacity
         # automatically over ``time_period`` seconds.
 
+        wait_started = time.monotonic()
         await _tpm_limiter.acquire(needed)
+        if time.monotonic() - wait_started > _TPM_WAIT_FEEDBACK_S:
+            report_rate_limit()
 
         async with _openai_semaphore:
-            return await self._client.embeddings.create(
-                input=batch, model=model, encoding_format=encoding_format
-            )
+            try:
+                return await self._client.embeddings.create(
+                    input=batch, model=model, encoding_format=encoding_format
+                )
+            except RateLimitError:
+                # The client already retried with backoff; let the sync slow down
+                report_rate_limit()
+                raise
 
     async def embed(
         self,
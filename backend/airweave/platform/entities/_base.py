@@ -725,6 +725,9 @@ class PolymorphicEntity(ChunkEntity):
 # Registry to track which FileEntity subclasses have had their models created
 _file_entity_models_created = set()
 
+# Unified chunk model per FileEntity subclass, so every file of a type shares one class
+_unified_chunk_models: Dict[type, type] = {}
+
 
 class FileSystemMetadata(AirweaveSystemMetadata):
     """System metadata specific to file entities.
@@ -739,6 +742,9 @@ class FileSystemMetadata(AirweaveSystemMetadata):
         None, description="Temporary local path if file is downloaded"
     )
     checksum: Optional[str] = Field(None, description="File checksum/hash if available")
+    metadata_fingerprint: Optional[str] = Field(
+        None, description="Fingerprint of the provider metadata, for change detection"
+    )
     total_size: Optional[int] = Field(None, description="Total size of the file in bytes")
 
     # Storage fields - set by storage manager
@@ -918,7 +924,13 @@ class FileEntity(BaseEntity):
         ChunkEntity and includes:
         - All fields from the FileEntity subclass (full file metadata)
         - Standard chunk fields used for search (`md_*`, `metadata`, `md_position`)
+
+        The model is created once per subclass and reused for every file of that type.
         """
+        cached = _unified_chunk_models.get(cls)
+        if cached is not None:
+            return cached
+
         # Get the class name prefix (e.g., "AsanaFile" from "AsanaFileEntity")
         class_name_prefix = cls.__name__.replace("Entity", "")
 
@@ -975,6 +987,7 @@ class FileEntity(BaseEntity):
         module = sys.modules[cls.__module__]
         setattr(module, unified_chunk_model.__name__, unified_chunk_model)
 
+        _unified_chunk_models[cls] = unified_chunk_model
         return unified_chunk_model
 
 
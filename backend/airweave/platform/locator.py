@@ -1,19 +1,39 @@
-"""Resource locator for platform resources."""
+"""Resource locator for platform resources.
+
+Component modules are imported on first use. The registry manifest (see
+``airweave.platform.manifest``) tells the locator which module implements a short name,
+so resolving one component never imports the rest of the platform package.
+"""
 
 import importlib
-from typing import Callable, Type
+from typing import TYPE_CHECKING, Any, Callable, Type
+
+from airweave.platform.manifest import get_manifest, get_manifest_entry
 
-from airweave import schemas
-from airweave.platform.auth_providers._base import BaseAuthProvider
-from airweave.platform.configs._base import BaseConfig
-from airweave.platform.destinations._base import BaseDestination
-from airweave.platform.embedding_models._base import BaseEmbeddingModel
-from airweave.platform.entities._base import BaseEntity
-from airweave.platform.sources._base import BaseSource
+if TYPE_CHECKING:
+    from airweave import schemas
+    from airweave.platform.auth_providers._base import BaseAuthProvider
+    from airweave.platform.configs._base import BaseConfig
+    from airweave.platform.destinations._base import BaseDestination
+    from airweave.platform.embedding_models._base import BaseEmbeddingModel
+    from airweave.platform.entities._base import BaseEntity
+    from airweave.platform.sources._base import BaseSource
 
 PLATFORM_PATH = "airweave.platform"
 
 
+def _import_component(section: str, short_name: str, class_name: str) -> Any:
+    """Import a component class by short name.
+
+    Falls back to the ``<section>.<short_name>`` module naming convention for components
+    the manifest does not know.
+    """
+    entry = get_manifest_entry(section, short_name)
+    module_name = entry["module"] if entry else f"{PLATFORM_PATH}.{section}.{short_name}"
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
 class ResourceLocator:
     """Resource locator for platform resources.
 
@@ -27,7 +47,7 @@ class ResourceLocator:
     """
 
     @staticmethod
-    def get_embedding_model(model: schemas.EmbeddingModel) -> Type[BaseEmbeddingModel]:
+    def get_embedding_model(model: "schemas.EmbeddingModel") -> Type["BaseEmbeddingModel"]:
         """Get the embedding model class.
 
         Args:
@@ -36,11 +56,10 @@ class ResourceLocator:
         Returns:
             Type[BaseEmbeddingModel]: Instantiated embedding model
         """
-        module = importlib.import_module(f"{PLATFORM_PATH}.embedding_models.{model.short_name}")
-        return getattr(module, model.class_name)
+        return _import_component("embedding_models", model.short_name, model.class_name)
 
     @staticmethod
-    def get_source(source: schemas.Source) -> Type[BaseSource]:
+    def get_source(source: "schemas.Source") -> Type["BaseSource"]:
         """Get the source class.
 
         Args:
@@ -49,11 +68,10 @@ class ResourceLocator:
         Returns:
             Type[BaseSource]: Source class
         """
-        module = importlib.import_module(f"{PLATFORM_PATH}.sources.{source.short_name}")
-        return getattr(module, source.class_name)
+        return _import_component("sources", source.short_name, source.class_name)
 
     @staticmethod
-    def get_destination(destination: schemas.Destination) -> Type[BaseDestination]:
+    def get_destination(destination: "schemas.Destination") -> Type["BaseDestination"]:
         """Get the destination class.
 
         Args:
@@ -62,11 +80,10 @@ class ResourceLocator:
         Returns:
             Type[BaseDestination]: Destination class
         """
-        module = importlib.import_module(f"{PLATFORM_PATH}.destinations.{destination.short_name}")
-        return getattr(module, destination.class_name)
+        return _import_component("destinations", destination.short_name, destination.class_name)
 
     @staticmethod
-    def get_auth_provider(auth_provider: schemas.AuthProvider) -> Type[BaseAuthProvider]:
+    def get_auth_provider(auth_provider: "schemas.AuthProvider") -> Type["BaseAuthProvider"]:
         """Get the auth provider class.
 
         Args:
@@ -75,13 +92,12 @@ class ResourceLocator:
         Returns:
             Type[BaseAuthProvider]: Auth provider class
         """
-        module = importlib.import_module(
-            f"{PLATFORM_PATH}.auth_providers.{auth_provider.short_name}"
+        return _import_component(
+            "auth_providers", auth_provider.short_name, auth_provider.class_name
         )
-        return getattr(module, auth_provider.class_name)
 
     @staticmethod
-    def get_auth_config(auth_config_class: str) -> Type[BaseConfig]:
+    def get_auth_config(auth_config_class: str) -> Type["BaseConfig"]:
         """Get the auth config class.
 
         Args:
@@ -95,7 +111,7 @@ class ResourceLocator:
         return auth_config_class
 
     @staticmethod
-    def get_config(config_class: str) -> Type[BaseConfig]:
+    def get_config(config_class: str) -> Type["BaseConfig"]:
         """Get the config class.
 
         Args:
@@ -109,7 +125,7 @@ class ResourceLocator:
         return config_class
 
     @staticmethod
-    def get_transformer(transformer: schemas.Transformer) -> Callable:
+    def get_transformer(transformer: "schemas.Transformer") -> Callable:
         """Get the transformer function.
 
         Args:
@@ -122,7 +138,7 @@ class ResourceLocator:
         return getattr(module, transformer.method_name)
 
     @staticmethod
-    def get_entity_definition(entity_definition: schemas.EntityDefinition) -> Type[BaseEntity]:
+    def get_entity_definition(entity_definition: "schemas.EntityDefinition") -> Type["BaseEntity"]:
         """Get the entity definition class.
 
         Args:
@@ -137,27 +153,19 @@ class ResourceLocator:
         return getattr(module, entity_definition.class_name)
 
     @staticmethod
-    def get_available_auth_provider_classes() -> list[Type[BaseAuthProvider]]:
+    def get_available_auth_provider_classes() -> list[Type["BaseAuthProvider"]]:
         """Get all available auth provider classes.
 
-        Attempts to import each known auth provider and returns only those
-        that are available. This allows graceful handling of optional providers.
+        Imports each auth provider listed in the registry manifest.
 
         Returns:
             List of available auth provider classes
         """
         auth_provider_classes = []
 
-        # List of known auth providers with their module and class names
-        known_providers = [
-            ("pipedream", "PipedreamAuthProvider"),
-            ("composio", "ComposioAuthProvider"),
-        ]
-
-        for short_name, class_name in known_providers:
-            module = importlib.import_module(f"{PLATFORM_PATH}.auth_providers.{short_name}")
-            provider_class = getattr(module, class_name)
-            auth_provider_classes.append(provider_class)
+        for entry in get_manifest()["auth_providers"].values():
+            module = importlib.import_module(entry["module"])
+            auth_provider_classes.append(getattr(module, entry["attribute"]))
 
         return auth_provider_classes
 
@@ -0,0 +1,187 @@
+"""Static registry manifest of platform components.
+
+The manifest maps the short name of every source, destination, embedding model and auth
+provider, and the function name of every transformer, to the module and attribute that
+implement it. It is built by parsing the platform modules with ``ast`` instead of importing
+them, so ``ResourceLocator`` can resolve components without importing the whole platform
+package and only imports a component's module when it is first used.
+
+The manifest carries a fingerprint of the platform package contents. The platform sync
+stores the fingerprint of its last successful run in the database and is skipped when a
+replica starts with identical platform code.
+
+The manifest can be precomputed at build time:
+
+    python -m airweave.platform.manifest
+
+which writes ``registry_manifest.json`` next to this module. A precomputed manifest whose
+fingerprint does not match the code on disk is ignored and rebuilt in memory. The module
+only depends on the standard library so it can run during an image build, before any
+settings are available.
+"""
+
+import ast
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+PLATFORM_DIR = Path(__file__).resolve().parent
+PLATFORM_PACKAGE = "airweave.platform"
+MANIFEST_PATH = PLATFORM_DIR / "registry_manifest.json"
+
+# Files whose contents define the synced platform components
+_FINGERPRINT_SUFFIXES = (".py", ".yaml", ".yml")
+
+# Decorator name -> manifest section; short_name is the second positional argument
+_DECORATOR_SECTIONS = {
+    "source": "sources",
+    "destination": "destinations",
+    "embedding_model": "embedding_models",
+    "auth_provider": "auth_providers",
+}
+
+ManifestEntry = Dict[str, str]
+Manifest = Dict[str, object]
+
+
+def _iter_platform_files(platform_dir: Path, suffixes: tuple[str, ...]):
+    """Yield platform files in a stable order."""
+    for root, dirs, files in os.walk(platform_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for filename in sorted(files):
+            if filename.endswith(suffixes):
+                yield Path(root) / filename
+
+
+def compute_platform_fingerprint(platform_dir: Path | str = PLATFORM_DIR) -> str:
+    """Compute a content fingerprint of the platform package.
+
+    Args:
+        platform_dir: Root of the platform package
+
+    Returns:
+        Hex SHA-256 over the relative path and contents of every platform source file
+    """
+    platform_dir = Path(platform_dir)
+    digest = hashlib.sha256()
+    for path in _iter_platform_files(platform_dir, _FINGERPRINT_SUFFIXES):
+        digest.update(path.relative_to(platform_dir).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _decorator_name(node: ast.expr) -> Optional[str]:
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _short_name_argument(call: ast.Call) -> Optional[str]:
+    for keyword in call.keywords:
+        if keyword.arg == "short_name" and isinstance(keyword.value, ast.Constant):
+            return keyword.value.value
+    if len(call.args) >= 2 and isinstance(call.args[1], ast.Constant):
+        return call.args[1].value
+    return None
+
+
+def _scan_module(tree: ast.Module, module_name: str, manifest: Manifest) -> None:
+    for node in tree.body:
+        for decorator in getattr(node, "decorator_list", []):
+            name = _decorator_name(decorator)
+            if isinstance(node, ast.ClassDef) and name in _DECORATOR_SECTIONS:
+                short_name = (
+                    _short_name_argument(decorator) if isinstance(decorator, ast.Call) else None
+                )
+                if short_name:
+                    manifest[_DECORATOR_SECTIONS[name]][short_name] = {
+                        "module": module_name,
+                        "attribute": node.name,
+                    }
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and (
+                name == "transformer"
+            ):
+                manifest["transformers"][node.name] = {
+                    "module": module_name,
+                    "attribute": node.name,
+                }
+
+
+def build_manifest(platform_dir: Path | str = PLATFORM_DIR) -> Manifest:
+    """Build the manifest by parsing (not importing) the platform modules.
+
+    Args:
+        platform_dir: Root of the platform package
+
+    Returns:
+        Manifest with the fingerprint and one section per component type
+    """
+    platform_dir = Path(platform_dir)
+    manifest: Manifest = {
+        "fingerprint": compute_platform_fingerprint(platform_dir),
+        "transformers": {},
+        **{section: {} for section in _DECORATOR_SECTIONS.values()},
+    }
+
+    for path in _iter_platform_files(platform_dir, (".py",)):
+        relative = path.relative_to(platform_dir)
+        # Mirror db_sync: only modules in subpackages, skipping private modules
+        if len(relative.parts) < 2 or path.name.startswith("_"):
+            continue
+        module_name = ".".join((PLATFORM_PACKAGE, *relative.with_suffix("").parts))
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+        _scan_module(tree, module_name, manifest)
+
+    return manifest
+
+
+def write_manifest(path: Path | str = MANIFEST_PATH) -> Manifest:
+    """Build the manifest and write it as JSON."""
+    manifest = build_manifest()
+    Path(path).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def get_platform_fingerprint() -> str:
+    """Fingerprint of the platform package, computed once per process."""
+    return compute_platform_fingerprint()
+
+
+@lru_cache(maxsize=1)
+def get_manifest() -> Manifest:
+    """Get the manifest, preferring an up-to-date precomputed file.
+
+    Built once per process; the platform code does not change while a process runs.
+    """
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text())
+    except (OSError, ValueError):
+        manifest = None
+    if manifest and manifest.get("fingerprint") == get_platform_fingerprint():
+        return manifest
+    return build_manifest()
+
+
+def get_manifest_entry(section: str, name: str) -> Optional[ManifestEntry]:
+    """Get the module and attribute of a component, if the manifest knows it."""
+    return get_manifest().get(section, {}).get(name)
+
+
+if __name__ == "__main__":
+    written = write_manifest()
+    counts = ", ".join(
+        f"{len(entries)} {section}"
+        for section, entries in sorted(written.items())
+        if isinstance(entries, dict)
+    )
+    print(f"Wrote {MANIFEST_PATH} ({counts})")
@@ -0,0 +1,202 @@
+"""Distributed rate limiting for source API calls.
+
+Source rate limits apply per provider account (a Notion integration, a Google tenant), not
+per sync. Several syncs of the same account, running in several workers, therefore share one
+limiter state in Redis, keyed by (provider, tenant). The limiter is a token bucket in its
+GCRA form: the bucket is a single timestamp, the theoretical arrival time (TAT) of the next
+request. Each acquire reserves a slot and returns how long the caller must wait for it, so
+every caller needs a single round trip and waiters are served in order.
+
+A 429 response feeds back into the bucket: ``penalize`` pushes the TAT past the provider's
+``Retry-After``, so every sync of the account pauses instead of each one discovering the
+limit with its own failed request.
+
+When Redis is unavailable the limiter keeps working with process-local state shared by all
+limiters of the same key in the worker.
+"""
+
+import asyncio
+import hashlib
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+from redis.exceptions import WatchError
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+
+# Retry-After used when a 429 response does not carry one
+DEFAULT_RETRY_AFTER_S = 5.0
+# Upper bound on a single Retry-After, protects against bogus headers
+MAX_RETRY_AFTER_S = 300.0
+
+# Process-local TATs, used while Redis is unavailable
+_local_tats: Dict[str, float] = {}
+
+
+def tenant_key(*parts: Any) -> str:
+    """Build an opaque tenant key from identifying values, e.g. an access token.
+
+    The values are hashed so credentials never end up in Redis keys.
+    """
+    raw = "|".join(str(part) for part in parts if part is not None)
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait according to a response's ``Retry-After`` header, if it has one."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_S)
+
+
+class SourceRateLimiter:
+    """Token bucket shared by all syncs calling one provider account."""
+
+    KEY_PREFIX = "source_rate_limit"
+
+    def __init__(
+        self,
+        provider: str,
+        tenant: str,
+        requests: int,
+        period: float,
+        burst: Optional[int] = None,
+        redis: Optional[Any] = None,
+        sleep: Callable[[float], Any] = asyncio.sleep,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            provider: Provider the limit belongs to, e.g. the source short name
+            tenant: Account the limit applies to, see ``tenant_key``
+            requests: Requests allowed per period
+            period: Period in seconds
+            burst: Requests allowed back to back after an idle period (default: ``requests``)
+            redis: Redis client, defaults to the shared client when the Redis tier is enabled
+            sleep: Sleep function, injectable for tests
+            clock: Clock of the process-local state, injectable for tests
+        """
+        self.provider = provider
+        self.key = f"{self.KEY_PREFIX}:{provider}:{tenant}"
+        self.interval = period / requests
+        self.tolerance = ((burst or requests) - 1) * self.interval
+        self._redis = redis
+        self._sleep = sleep
+        self._clock = clock
+        self._redis_failed = False
+
+        self.acquired = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.penalties = 0
+
+    @property
+    def redis(self) -> Optional[Any]:
+        """Redis client holding the shared state, None for process-local state."""
+        if self._redis is not None:
+            return self._redis
+        if settings.SOURCE_RATE_LIMIT_REDIS_ENABLED:
+            return redis_client.client
+        return None
+
+    @property
+    def _ttl_ms(self) -> int:
+        # Idle buckets expire once they are full again
+        return int((self.tolerance + self.interval + MAX_RETRY_AFTER_S) * 1000)
+
+    async def _update_tat(self, update: Callable[[float, float], float]) -> float:
+        """Atomically replace the TAT by ``update(tat, now)``; returns ``now``.
+
+        The stored TAT is read with WATCH and written in MULTI, so concurrent updates from
+        other workers are retried instead of lost.
+        """
+        client = None if self._redis_failed else self.redis
+        if client is not None:
+            try:
+                async with client.pipeline(transaction=True) as pipe:
+                    while True:
+                        try:
+                            await pipe.watch(self.key)
+                            seconds, micros = await pipe.time()
+                            now = seconds + micros / 1_000_000
+                            stored = await pipe.get(self.key)
+                            tat = update(float(stored) if stored else now, now)
+                            pipe.multi()
+                            pipe.set(self.key, repr(tat), px=self._ttl_ms)
+                            await pipe.execute()
+                            return now
+                        except WatchError:
+                            continue
+            except Exception as e:
+                # Fall back to process-local limiting rather than failing the sync
+                self._redis_failed = True
+                logger.warning(f"Rate limiter Redis unavailable for {self.key}, using local: {e}")
+
+        now = self._clock()
+        _local_tats[self.key] = update(_local_tats.get(self.key, now), now)
+        return now
+
+    async def acquire(self, cost: int = 1) -> float:
+        """Wait for a request slot.
+
+        Args:
+            cost: Slots the request takes, e.g. its tokens when the limit is a token budget
+
+        Returns:
+            Seconds waited
+        """
+        reserved: Dict[str, float] = {}
+
+        def reserve(tat: float, now: float) -> float:
+            start = max(tat, now)
+            reserved["wait"] = max(0.0, start + (cost - 1) * self.interval - self.tolerance - now)
+            return start + cost * self.interval
+
+        await self._update_tat(reserve)
+        wait = reserved["wait"]
+        self.acquired += 1
+        if wait > 0:
+            self.waits += 1
+            self.wait_seconds += wait
+            await self._sleep(wait)
+        return wait
+
+    async def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Pause every caller of this provider account after a 429 response.
+
+        Args:
+            retry_after: Seconds from the provider's ``Retry-After`` header, if any
+        """
+        delay = DEFAULT_RETRY_AFTER_S if retry_after is None else retry_after
+        self.penalties += 1
+        # Requests may start again at now + delay; the TAT may run ahead by the tolerance
+        await self._update_tat(lambda tat, now: max(tat, now + delay + self.tolerance))
+        logger.debug(f"Rate limited by {self.provider}, pausing {self.key} for {delay:.1f}s")
+
+    async def feedback(self, response: httpx.Response) -> None:
+        """Apply a response's rate-limit signal (429 with optional ``Retry-After``)."""
+        if response.status_code == 429:
+            await self.penalize(parse_retry_after(response))
+
+    def metrics(self) -> Dict[str, Any]:
+        """Requests admitted, waits and 429 penalties seen by this limiter."""
+        return {
+            "acquired": self.acquired,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "penalties": self.penalties,
+            "shared": not self._redis_failed and self.redis is not None,
+        }
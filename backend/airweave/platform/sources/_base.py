@@ -10,11 +10,13 @@ from typing import (
     Any,
     AsyncGenerator,
     AsyncIterable,
+    Awaitable,
     Callable,
     ClassVar,
     Dict,
     Iterable,
     Optional,
+    TypeVar,
     Union,
 )
 
@@ -24,8 +26,11 @@ from pydantic import BaseModel
 from airweave.core.logging import logger
 from airweave.platform.entities._base import ChunkEntity, FileEntity
 from airweave.platform.file_handling.file_manager import file_manager
+from airweave.platform.rate_limiter import SourceRateLimiter, tenant_key
 from airweave.schemas.source_connection import AuthenticationMethod, OAuthType
 
+T = TypeVar("T")
+
 
 class BaseSource:
     """Base class for all sources."""
@@ -122,6 +127,74 @@ class BaseSource:
             async with httpx.AsyncClient(**kwargs) as client:
                 yield client
 
+    def configure_rate_limit(
+        self,
+        requests: int,
+        period: float,
+        tenant: Optional[str] = None,
+        burst: Optional[int] = None,
+    ) -> None:
+        """Limit this source's API calls with a rate limit shared by all syncs of the account.
+
+        Args:
+            requests: Requests allowed per period
+            period: Period in seconds
+            tenant: Account the provider limits, see ``rate_limiter.tenant_key``; defaults to
+                the access token, as most providers limit per token or per integration
+            burst: Requests allowed back to back after an idle period (default: ``requests``)
+        """
+        if tenant is None:
+            tenant = tenant_key(getattr(self, "access_token", None) or id(self))
+        self._rate_limiter = SourceRateLimiter(
+            provider=getattr(self, "_short_name", self.__class__.__name__),
+            tenant=tenant,
+            requests=requests,
+            period=period,
+            burst=burst,
+        )
+
+    @property
+    def rate_limiter(self) -> Optional[SourceRateLimiter]:
+        """Get the shared rate limiter of this source, if configured."""
+        return getattr(self, "_rate_limiter", None)
+
+    async def rate_limited(self, request: Callable[[], Awaitable[T]]) -> T:
+        """Run an API request under the source's shared rate limit.
+
+        Waits for a request slot first. A 429 response, returned or raised as
+        ``HTTPStatusError``, pauses every sync of the account for its ``Retry-After``.
+        Retrying is left to the caller (e.g. tenacity around ``_get_with_auth``).
+
+        Usage:
+            response = await self.rate_limited(lambda: client.get(url, headers=headers))
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await request()
+
+        await limiter.acquire()
+        try:
+            result = await request()
+        except httpx.HTTPStatusError as e:
+            await limiter.feedback(e.response)
+            raise
+        if isinstance(result, httpx.Response):
+            await limiter.feedback(result)
+        return result
+
+    def set_file_change_gate(self, gate) -> None:
+        """Set the gate that skips downloading files unchanged since the last sync.
+
+        Args:
+            gate: FileChangeGate of the current sync
+        """
+        self._file_change_gate = gate
+
+    @property
+    def file_change_gate(self):
+        """Get the file change gate for this source."""
+        return getattr(self, "_file_change_gate", None)
+
     def set_cursor(self, cursor) -> None:
         """Set the cursor for this source.
 
@@ -217,6 +290,35 @@ class BaseSource:
         # Sources with specific requirements should override this
         pass
 
+    @classmethod
+    def supports_checkpoints(cls) -> bool:
+        """Check if this source can resume an interrupted sync from a checkpoint."""
+        return cls.get_checkpoint_state is not BaseSource.get_checkpoint_state
+
+    def get_checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        """Get the position of the entity stream, for resuming an interrupted sync.
+
+        Sources opt in to mid-sync checkpoints by overriding this method and
+        ``resume_from_checkpoint``. The sync calls it between two entities, while
+        ``generate_entities`` is suspended. The returned state must be JSON serializable and
+        describe a position from which resuming yields every entity not yielded so far;
+        yielding some entities again is fine, they are recognized by their hash.
+
+        Returns:
+            Checkpoint state, or None if the source does not support checkpoints
+        """
+        return None
+
+    def resume_from_checkpoint(self, state: Dict[str, Any]) -> None:
+        """Continue from a checkpoint taken by ``get_checkpoint_state`` in an earlier run.
+
+        Called before ``generate_entities`` starts.
+
+        Args:
+            state: State returned by ``get_checkpoint_state``
+        """
+        pass
+
     async def get_access_token(self) -> Optional[str]:
         """Get a valid access token using the token manager.
 
@@ -276,6 +378,11 @@ class BaseSource:
         Returns:
             The processed entity if it should be included, None if it should be skipped
         """
+        # Unchanged since the last sync according to the provider's metadata: keep, don't download
+        if self.file_change_gate and await self.file_change_gate.is_unchanged(file_entity):
+            self.logger.debug(f"Skipping download of unchanged file {file_entity.name}")
+            return file_entity
+
         # Use entity download_url if not explicitly provided
         url = download_url or file_entity.download_url
         if not url:
@@ -20,9 +20,11 @@ from airweave.platform.entities.bitbucket import (
 )
 from airweave.platform.sources._base import BaseSource
 from airweave.platform.utils.file_extensions import (
+    MAX_TEXT_DETECTION_SIZE,
     get_language_for_extension,
     is_text_file,
 )
+from airweave.platform.utils.repo_archive import ArchiveEntry, DirectoryBreadcrumbs, stream_archive
 from airweave.schemas.source_connection import AuthenticationMethod
 
 
@@ -46,6 +48,7 @@ class BitbucketSource(BaseSource):
     """
 
     BASE_URL = "https://api.bitbucket.org/2.0"
+    WEB_URL = "https://bitbucket.org"
 
     @classmethod
     async def create(
@@ -69,6 +72,7 @@ class BitbucketSource(BaseSource):
 
         instance.branch = config.get("branch", "") if config else ""
         instance.file_extensions = config.get("file_extensions", []) if config else []
+        instance.archive_mode = bool(config.get("archive_mode", False)) if config else False
 
         return instance
 
@@ -291,6 +295,13 @@ class BitbucketSource(BaseSource):
             entity_id=repo_entity.entity_id, name=repo_entity.name, type="repository"
         )
 
+        if getattr(self, "archive_mode", False):
+            async for entity in self._traverse_archive(
+                client, workspace_slug, repo_slug, [repo_breadcrumb], branch
+            ):
+                yield entity
+            return
+
         # Track processed paths to avoid duplicates
         processed_paths = set()
 
@@ -300,6 +311,94 @@ class BitbucketSource(BaseSource):
         ):
             yield entity
 
+    async def _traverse_archive(
+        self,
+        client: httpx.AsyncClient,
+        workspace_slug: str,
+        repo_slug: str,
+        breadcrumbs: List[Breadcrumb],
+        branch: str,
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Traverse repository contents from a single archive of the branch.
+
+        Args:
+            client: HTTP client
+            workspace_slug: Workspace slug
+            repo_slug: Repository slug
+            breadcrumbs: Breadcrumbs of the repository root
+            branch: Branch name
+
+        Yields:
+            Directory and file entities
+        """
+        url = f"{self.WEB_URL}/{workspace_slug}/{repo_slug}/get/{branch}.tar.gz"
+        directories = DirectoryBreadcrumbs(breadcrumbs, f"{workspace_slug}/{repo_slug}")
+
+        async for entry in stream_archive(
+            client, url, MAX_TEXT_DETECTION_SIZE, auth=self._get_auth()
+        ):
+            if entry.is_dir:
+                yield BitbucketDirectoryEntity(
+                    entity_id=f"{workspace_slug}/{repo_slug}/{entry.path}",
+                    source_name="bitbucket",
+                    path=entry.path,
+                    repo_slug=repo_slug,
+                    repo_full_name=f"{workspace_slug}/{repo_slug}",
+                    workspace_slug=workspace_slug,
+                    content=f"Directory: {entry.path}",
+                    breadcrumbs=directories.for_path(entry.path),
+                    url=f"{self.WEB_URL}/{workspace_slug}/{repo_slug}/src/{branch}/{entry.path}",
+                )
+            elif entry.data is not None and self._should_include_file(entry.path):
+                file_entity = self._create_archive_file_entity(
+                    entry, workspace_slug, repo_slug, directories.for_path(entry.path), branch
+                )
+                if file_entity:
+                    yield file_entity
+
+    def _create_archive_file_entity(
+        self,
+        entry: ArchiveEntry,
+        workspace_slug: str,
+        repo_slug: str,
+        breadcrumbs: List[Breadcrumb],
+        branch: str,
+    ) -> Optional[BitbucketCodeFileEntity]:
+        """Create a file entity from an archive entry, like _process_file does from the API.
+
+        The archive does not carry per-file commits, so the file id is the git blob SHA and
+        the commit is the one the archive was made from.
+
+        Returns:
+            The file entity, or None if the file is not a text file
+        """
+        if not is_text_file(entry.path, entry.size, entry.data[:1024]):
+            return None
+
+        content_text = entry.data.decode("utf-8", errors="replace")
+        return BitbucketCodeFileEntity(
+            entity_id=f"{workspace_slug}/{repo_slug}/{entry.path}",
+            source_name="bitbucket",
+            file_id=entry.blob_sha,
+            name=Path(entry.path).name,
+            mime_type=mimetypes.guess_type(entry.path)[0] or "text/plain",
+            size=entry.size,
+            path=entry.path,
+            repo_slug=repo_slug,
+            repo_full_name=f"{workspace_slug}/{repo_slug}",
+            workspace_slug=workspace_slug,
+            commit_hash=entry.commit_id,
+            breadcrumbs=breadcrumbs,
+            url=f"{self.WEB_URL}/{workspace_slug}/{repo_slug}/src/{branch}/{entry.path}",
+            language=self._detect_language_from_extension(entry.path),
+            line_count=content_text.count("\n") + 1 if content_text else 0,
+            path_in_repo=entry.path,
+            content=content_text,
+            repo_name=repo_slug,
+            repo_owner=workspace_slug,
+            last_modified=entry.modified_at,
+        )
+
     async def _traverse_directory(
         self,
         client: httpx.AsyncClient,
@@ -5,6 +5,7 @@ import mimetypes
 from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List, Optional
+from urllib.parse import quote
 
 import httpx
 import tenacity
@@ -24,6 +25,7 @@ from airweave.platform.utils.file_extensions import (
     get_language_for_extension,
     is_text_file,
 )
+from airweave.platform.utils.repo_archive import ArchiveEntry, DirectoryBreadcrumbs, stream_archive
 from airweave.schemas.source_connection import AuthenticationMethod
 
 
@@ -107,6 +109,8 @@ class GitHubSource(BaseSource):
 
         instance.max_file_size = config.get("max_file_size", 10 * 1024 * 1024)
 
+        instance.archive_mode = bool(config.get("archive_mode", False))
+
         return instance
 
     @tenacity.retry(
@@ -345,6 +349,13 @@ class GitHubSource(BaseSource):
             entity_id=repo_entity.entity_id, name=repo_entity.name, type="repository"
         )
 
+        if getattr(self, "archive_mode", False):
+            async for entity in self._traverse_archive(
+                client, repo_name, [repo_breadcrumb], owner, repo, branch
+            ):
+                yield entity
+            return
+
         # Track processed paths to avoid duplicates
         processed_paths = set()
 
@@ -354,6 +365,93 @@ class GitHubSource(BaseSource):
         ):
             yield entity
 
+    async def _traverse_archive(
+        self,
+        client: httpx.AsyncClient,
+        repo_name: str,
+        breadcrumbs: List[Breadcrumb],
+        owner: str,
+        repo: str,
+        branch: str,
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Traverse repository contents from a single tarball of the branch.
+
+        Args:
+            client: HTTP client
+            repo_name: Repository name (format: "owner/repo")
+            breadcrumbs: Breadcrumbs of the repository root
+            owner: Repository owner
+            repo: Repository name
+            branch: Branch name
+
+        Yields:
+            Directory and file entities
+        """
+        url = f"{self.BASE_URL}/repos/{repo_name}/tarball/{branch}"
+        headers = {
+            "Authorization": f"token {self.personal_access_token}",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        directories = DirectoryBreadcrumbs(breadcrumbs, repo_name)
+
+        async for entry in stream_archive(client, url, self.max_file_size, headers=headers):
+            if entry.is_dir:
+                yield GitHubDirectoryEntity(
+                    entity_id=f"{repo_name}/{entry.path}",
+                    source_name="github",
+                    path=entry.path,
+                    repo_name=repo,
+                    repo_owner=owner,
+                    content=f"Directory: {entry.path}",
+                    breadcrumbs=directories.for_path(entry.path),
+                    url=f"https://github.com/{repo_name}/tree/{branch}/{quote(entry.path)}",
+                )
+            elif entry.data is None:
+                self.logger.debug(f"Skipping large file: {entry.path} ({entry.size} bytes)")
+            elif file_entity := self._create_archive_file_entity(
+                entry, repo_name, directories.for_path(entry.path), owner, repo, branch
+            ):
+                yield file_entity
+
+    def _create_archive_file_entity(
+        self,
+        entry: ArchiveEntry,
+        repo_name: str,
+        breadcrumbs: List[Breadcrumb],
+        owner: str,
+        repo: str,
+        branch: str,
+    ) -> Optional[GitHubCodeFileEntity]:
+        """Create a file entity from an archive entry, like _process_file does from the API.
+
+        Returns:
+            The file entity, or None if the file is not a text file
+        """
+        if not is_text_file(entry.path, entry.size, entry.data):
+            return None
+
+        content_text = entry.data.decode("utf-8", errors="replace") if entry.data else None
+        sha = entry.blob_sha
+        return GitHubCodeFileEntity(
+            entity_id=f"{repo_name}/{entry.path}",
+            source_name="github",
+            file_id=sha,
+            name=Path(entry.path).name,
+            mime_type=mimetypes.guess_type(entry.path)[0] or "text/plain",
+            size=entry.size,
+            path=entry.path,
+            repo_name=repo,
+            repo_owner=owner,
+            sha=sha,
+            breadcrumbs=breadcrumbs,
+            url=f"https://github.com/{repo_name}/blob/{branch}/{quote(entry.path)}",
+            language=self._detect_language_from_extension(entry.path),
+            line_count=content_text.count("\n") + 1 if content_text else 0,
+            path_in_repo=entry.path,
+            content=content_text,
+            last_modified=None,
+        )
+
     async def _traverse_repository_incremental(
         self, client: httpx.AsyncClient, repo_name: str, branch: str, since_timestamp: str
     ) -> AsyncGenerator[ChunkEntity, None]:
@@ -22,9 +22,11 @@ from airweave.platform.entities.gitlab import (
 )
 from airweave.platform.sources._base import BaseSource
 from airweave.platform.utils.file_extensions import (
+    MAX_TEXT_DETECTION_SIZE,
     get_language_for_extension,
     is_text_file,
 )
+from airweave.platform.utils.repo_archive import ArchiveEntry, DirectoryBreadcrumbs, stream_archive
 from airweave.schemas.source_connection import AuthenticationMethod, OAuthType
 
 
@@ -73,9 +75,11 @@ class GitLabSource(BaseSource):
         if config:
             instance.project_id = config.get("project_id")
             instance.branch = config.get("branch", "")
+            instance.archive_mode = bool(config.get("archive_mode", False))
         else:
             instance.project_id = None
             instance.branch = ""
+            instance.archive_mode = False
 
         return instance
 
@@ -428,6 +432,13 @@ class GitLabSource(BaseSource):
         Yields:
             Directory and file entities
         """
+        if getattr(self, "archive_mode", False):
+            async for entity in self._traverse_archive(
+                client, project_id, project_path, branch, project_breadcrumbs
+            ):
+                yield entity
+            return
+
         # Track processed paths to avoid duplicates
         processed_paths = set()
 
@@ -437,6 +448,92 @@ class GitLabSource(BaseSource):
         ):
             yield entity
 
+    async def _traverse_archive(
+        self,
+        client: httpx.AsyncClient,
+        project_id: str,
+        project_path: str,
+        branch: str,
+        project_breadcrumbs: List[Breadcrumb],
+    ) -> AsyncGenerator[ChunkEntity, None]:
+        """Traverse repository contents from a single archive of the branch.
+
+        Args:
+            client: HTTP client
+            project_id: Project ID
+            project_path: Project path with namespace
+            branch: Branch name
+            project_breadcrumbs: Breadcrumbs for the project
+
+        Yields:
+            Directory and file entities
+        """
+        url = f"{self.BASE_URL}/projects/{project_id}/repository/archive.tar.gz"
+        access_token = await self.get_access_token()
+        if not access_token:
+            raise ValueError("No access token available")
+        headers = {"Authorization": f"Bearer {access_token}"}
+        directories = DirectoryBreadcrumbs(project_breadcrumbs, str(project_id))
+
+        async for entry in stream_archive(
+            client, url, MAX_TEXT_DETECTION_SIZE, headers=headers, params={"sha": branch}
+        ):
+            if entry.is_dir:
+                yield GitLabDirectoryEntity(
+                    entity_id=f"{project_id}/{entry.path}",
+                    breadcrumbs=directories.for_path(entry.path),
+                    path=entry.path,
+                    project_id=str(project_id),
+                    project_path=project_path,
+                    url=f"https://gitlab.com/{project_path}/-/tree/{branch}/{entry.path}",
+                )
+            elif entry.data is not None:
+                file_entity = self._create_archive_file_entity(
+                    entry, project_id, project_path, branch, directories.for_path(entry.path)
+                )
+                if file_entity:
+                    yield file_entity
+
+    def _create_archive_file_entity(
+        self,
+        entry: ArchiveEntry,
+        project_id: str,
+        project_path: str,
+        branch: str,
+        breadcrumbs: List[Breadcrumb],
+    ) -> Optional[GitLabCodeFileEntity]:
+        """Create a file entity from an archive entry, like _process_file does from the API.
+
+        Returns:
+            The file entity, or None if the file is not a text file
+        """
+        if not is_text_file(entry.path, entry.size, entry.data[:1024]):
+            return None
+
+        content_text = entry.data.decode("utf-8", errors="replace") if entry.data else None
+        blob_id = entry.blob_sha
+        return GitLabCodeFileEntity(
+            entity_id=f"{project_id}/{entry.path}",
+            source_name="gitlab",
+            file_id=blob_id,
+            name=Path(entry.path).name,
+            mime_type=mimetypes.guess_type(entry.path)[0] or "text/plain",
+            size=entry.size,
+            path=entry.path,
+            project_id=str(project_id),
+            project_path=project_path,
+            blob_id=blob_id,
+            breadcrumbs=breadcrumbs,
+            url=f"https://gitlab.com/{project_path}/-/blob/{branch}/{entry.path}",
+            language=self._detect_language_from_extension(entry.path),
+            line_count=content_text.count("\n") + 1 if content_text else 0,
+            path_in_repo=entry.path,
+            repo_name=project_path.split("/")[-1],
+            repo_owner=project_path.split("/")[0],
+            content=content_text,
+            last_modified=None,
+        )
+
     async def _traverse_directory(
         self,
         client: httpx.AsyncClient,
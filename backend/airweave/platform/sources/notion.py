@@ -6,6 +6,7 @@ responses to entity objects.
 """
 
 import asyncio
+import heapq
 from datetime import datetime, timezone
 from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
@@ -55,6 +56,8 @@ class NotionSource(BaseSource):
     RATE_LIMIT_REQUESTS = 2  # Reduced from 3 to be more conservative
     RATE_LIMIT_PERIOD = 1.0  # Time period in seconds
     MAX_RETRIES = 5  # Increased from 3
+    BLOCK_FETCH_CONCURRENCY = 8  # Block children requests in flight per page
+    BLOCK_PREFETCH_WINDOW = 32  # Blocks fetched ahead of the walk per page, at most
 
     class NotionAccessError(Exception):
         """Non-retryable access/shape error from Notion.
@@ -98,6 +101,11 @@ class NotionSource(BaseSource):
         # Rebuild the gate in case batch_size changed
         instance._materialize_semaphore = asyncio.Semaphore(instance.batch_size)
 
+        # Notion limits per integration token; share the limit with every sync using it
+        instance.configure_rate_limit(
+            requests=cls.RATE_LIMIT_REQUESTS, period=cls.RATE_LIMIT_PERIOD
+        )
+
         return instance
 
     async def validate(self) -> bool:
@@ -108,11 +116,14 @@ class NotionSource(BaseSource):
         )
 
     def __init__(self):
-        """Initialize rate limiting state and tracking."""
+        """Initialize tracking state."""
         super().__init__()
-        self._request_times = []
-        self._lock = asyncio.Lock()
         self._processed_pages: Set[str] = set()
+        # Per-sync ancestor cache for breadcrumbs: page id -> (title, parent) of pages seen,
+        # and page id -> breadcrumbs from the top of the hierarchy down to the page itself
+        self._page_summaries: Dict[str, Tuple[str, dict]] = {}
+        self._page_ancestry: Dict[str, List[Breadcrumb]] = {}
+        self._page_ancestry_inflight: Dict[str, asyncio.Future] = {}
         self._processed_databases: Set[str] = set()
         self._child_databases_to_process: Set[str] = set()
         self._child_database_breadcrumbs: Dict[str, List[Breadcrumb]] = {}
@@ -125,37 +136,11 @@ class NotionSource(BaseSource):
             "total_blocks_processed": 0,
             "total_files_found": 0,
             "max_page_depth": 0,
+            "ancestor_cache_hits": 0,
+            "ancestor_fetches": 0,
         }
         logger.info("Initialized comprehensive Notion source with content aggregation")
 
-    async def _wait_for_rate_limit(self):
-        """Implement rate limiting for Notion API requests."""
-        async with self._lock:
-            current_time = asyncio.get_event_loop().time()
-
-            # Remove old request times
-            self._request_times = [
-                t for t in self._request_times if current_time - t < self.RATE_LIMIT_PERIOD
-            ]
-
-            if len(self._request_times) >= self.RATE_LIMIT_REQUESTS:
-                # Wait until enough time has passed
-                sleep_time = self._request_times[0] + self.RATE_LIMIT_PERIOD - current_time
-                if sleep_time > 0:
-                    self.logger.debug(
-                        f"Rate limit reached. Waiting {sleep_time:.2f}s before next request"
-                    )
-                    self._stats["rate_limit_waits"] += 1
-                    await asyncio.sleep(sleep_time)
-
-                # Clean up old requests again after waiting
-                current_time = asyncio.get_event_loop().time()
-                self._request_times = [
-                    t for t in self._request_times if current_time - t < self.RATE_LIMIT_PERIOD
-                ]
-
-            self._request_times.append(current_time)
-
     def _should_retry_request(self, exception: Exception) -> bool:
         """Determine if a request should be retried based on the exception."""
         if isinstance(exception, (TimeoutException, ReadTimeout)):
@@ -173,7 +158,6 @@ class NotionSource(BaseSource):
     )
     async def _get_with_auth(self, client: httpx.AsyncClient, url: str) -> dict:
         """Make an authenticated GET request to the Notion API."""
-        await self._wait_for_rate_limit()
         self.logger.debug(f"GET request to {url}")
         self._stats["api_calls"] += 1
 
@@ -183,7 +167,9 @@ class NotionSource(BaseSource):
         }
 
         try:
-            response = await client.get(url, headers=headers, timeout=self.TIMEOUT_SECONDS)
+            response = await self.rate_limited(
+                lambda: client.get(url, headers=headers, timeout=self.TIMEOUT_SECONDS)
+            )
             status = response.status_code
             self.logger.debug(f"GET response from {url}: status={status}")
 
@@ -235,7 +221,6 @@ class NotionSource(BaseSource):
     )
     async def _post_with_auth(self, client: httpx.AsyncClient, url: str, json_data: dict) -> dict:
         """Make an authenticated POST request to the Notion API."""
-        await self._wait_for_rate_limit()
         self.logger.debug(f"POST request to {url}")
         self._stats["api_calls"] += 1
 
@@ -245,8 +230,10 @@ class NotionSource(BaseSource):
         }
 
         try:
-            response = await client.post(
-                url, headers=headers, json=json_data, timeout=self.TIMEOUT_SECONDS
+            response = await self.rate_limited(
+                lambda: client.post(
+                    url, headers=headers, json=json_data, timeout=self.TIMEOUT_SECONDS
+                )
             )
             self.logger.debug(f"POST response from {url}: status={response.status_code}")
 
@@ -447,39 +434,84 @@ class NotionSource(BaseSource):
                     self.logger.error(f"Error processing child database {database_id}: {str(e)}")
                     continue
 
+    def _remember_page(self, page: dict) -> None:
+        """Remember a page's title and parent, so breadcrumbs of its descendants need no GET."""
+        page_id = page.get("id")
+        if page_id and "properties" in page:
+            self._page_summaries[page_id] = (self._extract_page_title(page), page.get("parent", {}))
+
     async def _build_page_breadcrumbs(
         self, client: httpx.AsyncClient, page: dict
     ) -> List[Breadcrumb]:
-        """Build breadcrumbs for a page by traversing up the parent hierarchy."""
-        breadcrumbs = []
-        current_page = page
+        """Build breadcrumbs for a page by traversing up the parent hierarchy.
 
-        while True:
-            parent = current_page.get("parent", {})
-            parent_type = parent.get("type", "")
+        Ancestors are resolved once per sync; pages sharing ancestors reuse them.
+        """
+        parent = page.get("parent", {})
+        if parent.get("type") != "page_id":
+            # Database parents don't occur for standalone pages; workspace is the top
+            return []
+        return list(await self._resolve_page_ancestry(client, parent["page_id"]))
 
-            if parent_type == "page_id":
-                parent_id = parent.get("page_id")
-                try:
-                    parent_page = await self._get_with_auth(
-                        client, f"https://api.notion.com/v1/pages/{parent_id}"
-                    )
-                    parent_title = self._extract_page_title(parent_page)
-                    breadcrumbs.insert(
-                        0, Breadcrumb(entity_id=parent_id, name=parent_title, type="page")
-                    )
-                    current_page = parent_page
-                except Exception as e:
-                    self.logger.warning(f"Could not fetch parent page {parent_id}: {str(e)}")
-                    break
-            elif parent_type == "database_id":
-                # This shouldn't happen for standalone pages, but handle it
-                break
-            else:
-                # Reached workspace level
-                break
+    async def _resolve_page_ancestry(
+        self, client: httpx.AsyncClient, page_id: str, path: Tuple[str, ...] = ()
+    ) -> List[Breadcrumb]:
+        """Breadcrumbs from the top of the hierarchy down to and including ``page_id``.
 
-        return breadcrumbs
+        Concurrent resolutions of the same page share one lookup.
+        """
+        if page_id in self._page_ancestry:
+            self._stats["ancestor_cache_hits"] += 1
+            return self._page_ancestry[page_id]
+        if page_id in path:
+            self.logger.warning(f"Cycle in Notion page hierarchy at {page_id}")
+            return []
+        inflight = self._page_ancestry_inflight.get(page_id)
+        if inflight is not None:
+            self._stats["ancestor_cache_hits"] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._page_ancestry_inflight[page_id] = future
+        try:
+            ancestry = await self._fetch_page_ancestry(client, page_id, path + (page_id,))
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn about an unretrieved exception otherwise
+            future.exception()
+            raise
+        else:
+            self._page_ancestry[page_id] = ancestry
+            future.set_result(ancestry)
+            return ancestry
+        finally:
+            del self._page_ancestry_inflight[page_id]
+
+    async def _fetch_page_ancestry(
+        self, client: httpx.AsyncClient, page_id: str, path: Tuple[str, ...]
+    ) -> List[Breadcrumb]:
+        summary = self._page_summaries.get(page_id)
+        if summary is None:
+            try:
+                self._stats["ancestor_fetches"] += 1
+                page = await self._get_with_auth(
+                    client, f"https://api.notion.com/v1/pages/{page_id}"
+                )
+            except Exception as e:
+                # Inaccessible ancestors end the breadcrumbs, as for every descendant
+                self.logger.warning(f"Could not fetch parent page {page_id}: {str(e)}")
+                return []
+            self._remember_page(page)
+            summary = (self._extract_page_title(page), page.get("parent", {}))
+
+        title, parent = summary
+        ancestry: List[Breadcrumb] = []
+        if parent.get("type") == "page_id":
+            ancestry = await self._resolve_page_ancestry(client, parent["page_id"], path)
+        return ancestry + [Breadcrumb(entity_id=page_id, name=title, type="page")]
 
     # Comprehensive Page Entity Creation with Content Aggregation
     async def _create_comprehensive_page_entity(
@@ -595,15 +627,10 @@ class NotionSource(BaseSource):
             "max_depth": max_depth,
         }
 
-    async def _extract_blocks_recursive(
-        self,
-        client: httpx.AsyncClient,
-        block_id: str,
-        depth: int,
-        page_breadcrumbs: List[Breadcrumb],
-    ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Recursively extract and format blocks into markdown content."""
+    async def _get_block_children(self, client: httpx.AsyncClient, block_id: str) -> List[dict]:
+        """Fetch all children of a block, following pagination."""
         url = f"https://api.notion.com/v1/blocks/{block_id}/children"
+        blocks = []
         has_more = True
         start_cursor = None
 
@@ -614,25 +641,6 @@ class NotionSource(BaseSource):
 
             try:
                 response = await self._get_with_auth(client, url_with_params)
-                blocks = response.get("results", [])
-
-                for block in blocks:
-                    # Format this block
-                    block_result = await self._format_block_content(block, depth, page_breadcrumbs)
-
-                    if block_result["content"]:
-                        yield block_result
-
-                    # Process children recursively if they exist
-                    if block.get("has_children", False):
-                        async for child_result in self._extract_blocks_recursive(
-                            client, block["id"], depth + 1, page_breadcrumbs
-                        ):
-                            yield child_result
-
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
-
             except NotionSource.NotionAccessError as e:
                 self.logger.warning(f"Access issue extracting blocks from {block_id}: {str(e)}")
                 raise
@@ -640,6 +648,105 @@ class NotionSource(BaseSource):
                 self.logger.error(f"Error extracting blocks from {block_id}: {str(e)}")
                 raise
 
+            blocks.extend(response.get("results", []))
+            has_more = response.get("has_more", False)
+            start_cursor = response.get("next_cursor")
+
+        return blocks
+
+    async def _extract_blocks_recursive(  # noqa: C901 - fetch workers and ordered walk
+        self,
+        client: httpx.AsyncClient,
+        block_id: str,
+        depth: int,
+        page_breadcrumbs: List[Breadcrumb],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Recursively extract and format blocks into markdown content, in document order.
+
+        Children of nested blocks (toggles, columns, synced blocks, ...) are fetched by up to
+        BLOCK_FETCH_CONCURRENCY workers, earliest in the document first, while the blocks
+        fetched so far are formatted. At most BLOCK_PREFETCH_WINDOW blocks are fetched or in
+        flight ahead of the walk, so a slow walk does not hold a whole page's children nor spend
+        the shared rate limit far ahead of it; the block the walk waits for is always fetched.
+        Every request goes through the shared rate limiter.
+        """
+        loop = asyncio.get_running_loop()
+        # Blocks whose children are not fetched yet, ordered by position in the document
+        frontier: List[Tuple[Tuple[int, ...], str, asyncio.Future]] = []
+        children: Dict[Tuple[int, ...], asyncio.Future] = {}
+        # Blocks fetched or being fetched that the walk has not reached yet
+        ahead: Set[Tuple[int, ...]] = set()
+        # Position of the block the walk waits for, if any
+        awaited: Optional[Tuple[int, ...]] = None
+        frontier_changed = asyncio.Event()
+
+        def may_fetch() -> bool:
+            if not frontier:
+                return False
+            return len(ahead) < self.BLOCK_PREFETCH_WINDOW or frontier[0][0] == awaited
+
+        def expand(blocks: List[dict], position: Tuple[int, ...]) -> None:
+            for index, block in enumerate(blocks):
+                if block.get("has_children", False):
+                    child_position = position + (index,)
+                    future = loop.create_future()
+                    children[child_position] = future
+                    # Positions are unique, so futures are never compared
+                    heapq.heappush(frontier, (child_position, block["id"], future))
+            frontier_changed.set()
+
+        async def fetch_worker() -> None:
+            while True:
+                if not may_fetch():
+                    frontier_changed.clear()
+                    await frontier_changed.wait()
+                    continue
+                position, child_id, future = heapq.heappop(frontier)
+                ahead.add(position)
+                try:
+                    blocks = await self._get_block_children(client, child_id)
+                except Exception as e:
+                    future.set_exception(e)
+                    # Raised when the walk reaches the block; may never happen if it fails earlier
+                    future.exception()
+                    continue
+                expand(blocks, position)
+                future.set_result(blocks)
+
+        async def walk(
+            blocks: List[dict], position: Tuple[int, ...], level: int
+        ) -> AsyncGenerator[Dict[str, Any], None]:
+            nonlocal awaited
+            for index, block in enumerate(blocks):
+                # Format this block
+                block_result = await self._format_block_content(block, level, page_breadcrumbs)
+
+                if block_result["content"]:
+                    yield block_result
+
+                # Process children recursively if they exist
+                if block.get("has_children", False):
+                    child_position = position + (index,)
+                    awaited = child_position
+                    frontier_changed.set()
+                    child_blocks = await children.pop(child_position)
+                    awaited = None
+                    ahead.discard(child_position)
+                    frontier_changed.set()
+                    async for child_result in walk(child_blocks, child_position, level + 1):
+                        yield child_result
+
+        root = await self._get_block_children(client, block_id)
+        expand(root, ())
+        workers = [asyncio.create_task(fetch_worker()) for _ in range(self.BLOCK_FETCH_CONCURRENCY)]
+        try:
+            async for block_result in walk(root, (), depth):
+                yield block_result
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     async def _format_block_content(
         self, block: dict, depth: int, page_breadcrumbs: List[Breadcrumb]
     ) -> Dict[str, Any]:
@@ -1338,6 +1445,8 @@ class NotionSource(BaseSource):
             "total_blocks_processed": 0,
             "total_files_found": 0,
             "max_page_depth": 0,
+            "ancestor_cache_hits": 0,
+            "ancestor_fetches": 0,
         }
 
         try:
@@ -1357,6 +1466,10 @@ class NotionSource(BaseSource):
                 async for entity in self._process_child_databases(client):
                     yield entity
 
+            if self.rate_limiter:
+                limiter_metrics = self.rate_limiter.metrics()
+                self._stats["rate_limit_waits"] = limiter_metrics["waits"]
+                self._stats["rate_limit_penalties"] = limiter_metrics["penalties"]
             self.logger.info(f"Notion sync complete. Final stats: {self._stats}")
 
         except Exception as e:
@@ -1401,6 +1514,7 @@ class NotionSource(BaseSource):
 
             async for page in self._query_database_pages(client, database_id):
                 page_id = page["id"]
+                self._remember_page(page)
                 if page_id in self._processed_pages:
                     continue
                 try:
@@ -1444,6 +1558,7 @@ class NotionSource(BaseSource):
         # Search for pages and process them one by one
         async for page in self._search_objects(client, "page"):
             page_id = page["id"]
+            self._remember_page(page)
             if page_id in self._processed_pages:
                 continue
 
@@ -1463,6 +1578,7 @@ class NotionSource(BaseSource):
                 )
 
                 # Build breadcrumbs for standalone pages
+                self._remember_page(full_page)
                 breadcrumbs = await self._build_page_breadcrumbs(client, full_page)
 
                 # Eagerly build full page entity and files
@@ -65,6 +65,8 @@ class PostgreSQLSource(BaseSource):
         super().__init__()  # Initialize BaseSource to get cursor support
         self.conn: Optional[asyncpg.Connection] = None
         self.entity_classes: Dict[str, Type[PolymorphicEntity]] = {}
+        # Tables streamed completely in this sync, the unit of mid-sync checkpoints
+        self._completed_tables: List[str] = []
 
     @classmethod
     async def create(
@@ -132,6 +134,30 @@ class PostgreSQLSource(BaseSource):
                 raise ValueError(f"Invalid JSON in cursor field mapping: {e}") from e
         # Otherwise accept any string as a column name
 
+    def get_checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        """Get the tables streamed completely so far, with their cursor values.
+
+        A resumed sync skips these tables and streams the interrupted table again.
+        """
+        cursor_data = self._get_cursor_data()
+        return {
+            "completed_tables": list(self._completed_tables),
+            "cursor_values": {
+                table_key: cursor_data[table_key]
+                for table_key in self._completed_tables
+                if table_key in cursor_data
+            },
+        }
+
+    def resume_from_checkpoint(self, state: Dict[str, Any]) -> None:
+        """Skip the tables completed before the checkpoint and keep their cursor values."""
+        self._completed_tables = list(state.get("completed_tables", []))
+        if self.cursor and state.get("cursor_values"):
+            self.cursor.cursor_data = {
+                **(self.cursor.cursor_data or {}),
+                **state["cursor_values"],
+            }
+
     def _get_table_key(self, schema: str, table: str) -> str:
         """Generate consistent table key for identification."""
         return f"{schema}.{table}"
@@ -845,6 +871,12 @@ class PostgreSQLSource(BaseSource):
             # This prevents transaction timeout issues and allows better connection management
             for i, table in enumerate(tables, 1):
                 table_key = self._get_table_key(schema, table)
+                if table_key in self._completed_tables:
+                    self.logger.info(
+                        f"Skipping table {i}/{len(tables)}: {table_key} (completed before the "
+                        f"checkpoint this sync resumed from)"
+                    )
+                    continue
                 self.logger.info(f"Processing table {i}/{len(tables)}: {table_key}")
 
                 # Check connection health before processing each table
@@ -852,6 +884,7 @@ class PostgreSQLSource(BaseSource):
 
                 async for entity in self._process_table(schema, table, cursor_data):
                     yield entity
+                self._completed_tables.append(table_key)
 
             self.logger.info(f"Successfully completed sync for all {len(tables)} table(s)")
 
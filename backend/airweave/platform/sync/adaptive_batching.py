@@ -0,0 +1,347 @@
+"""Adaptive micro-batch sizing and in-flight control for the batched sync pipeline.
+
+A fixed batch size and worker count fit no source well: a batch of 64 small tickets finishes
+in a fraction of a second, a batch of 64 large PDFs can take minutes and hold gigabytes of
+converted text. ``AdaptiveBatchController`` tunes both knobs while a sync runs, backing off
+quickly under pressure and growing gradually otherwise:
+
+- Memory above the high-water mark halves the batch size and the in-flight batch count.
+- Embedding rate limits (429s, or waiting on the local token bucket) halve the in-flight
+  batch count; the batch size is kept because larger embedding requests are cheaper.
+- Waiting on the database connection pool shrinks the in-flight batch count by a quarter.
+- Batches slower than the target latency shrink the batch size by a quarter.
+- Batches well under the target latency, with no pressure signal, grow the batch size by a
+  quarter (at least one step) and allow one more batch in flight.
+
+Decisions are taken once per window of completed batches, or immediately on a rate limit
+(at most once per window, since batches already in flight were sent at the old rate). Every
+decision is logged with its inputs as custom dimensions, and ``metrics()`` summarizes the
+controller at the end of a sync.
+
+Signals are reported from deep inside the pipeline (embedding model, entity processor)
+through module functions. The orchestrator activates its controller in a context variable
+before submitting batches; tasks copy the context when created, so reports reach the
+controller of the sync they belong to, and are no-ops outside a sync.
+"""
+
+import contextvars
+import os
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+from airweave.core.config import settings
+from airweave.core.logging import ContextualLogger
+
+_active_controller: contextvars.ContextVar[Optional["AdaptiveBatchController"]] = (
+    contextvars.ContextVar("adaptive_batch_controller", default=None)
+)
+
+# cgroup v1 reports "no limit" as a huge page-aligned number
+_UNLIMITED_BYTES = 1 << 60
+
+
+@dataclass(frozen=True)
+class ControllerDecision:
+    """One adjustment of the controller and the signals it was based on."""
+
+    batch_size: int
+    max_in_flight: int
+    reason: str
+    batch_latency_s: Optional[float] = None
+    bottleneck_stage: Optional[str] = None
+    db_wait_s: Optional[float] = None
+    rate_limits: int = 0
+    memory_fraction: Optional[float] = None
+
+
+def _read_int(path: str) -> Optional[int]:
+    try:
+        with open(path) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def read_memory_fraction() -> Optional[float]:
+    """Fraction of the memory limit in use by this container or process.
+
+    Uses the cgroup (v2, then v1) limit and usage, falling back to the process RSS against
+    physical memory. Returns None when neither is available.
+    """
+    for limit_path, usage_path in (
+        ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+        (
+            "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+            "/sys/fs/cgroup/memory/memory.usage_in_bytes",
+        ),
+    ):
+        limit = _read_int(limit_path)
+        usage = _read_int(usage_path)
+        if limit and usage is not None and limit < _UNLIMITED_BYTES:
+            return usage / limit
+
+    try:
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        total = os.sysconf("SC_PHYS_PAGES") * page_size
+        with open("/proc/self/statm") as f:
+            rss = int(f.read().split()[1]) * page_size
+        return rss / total
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class AdaptiveBatchController:
+    """Tunes the micro-batch size and the number of batches in flight for one sync."""
+
+    def __init__(
+        self,
+        batch_size: int,
+        max_in_flight: int,
+        *,
+        min_batch_size: int = 1,
+        max_batch_size: int = 512,
+        min_in_flight: int = 1,
+        target_batch_latency_s: float = 10.0,
+        db_wait_threshold_s: float = 0.25,
+        memory_high_water: float = 0.8,
+        window: int = 4,
+        batch_size_step: int = 8,
+        memory_probe: Callable[[], Optional[float]] = read_memory_fraction,
+        clock: Callable[[], float] = time.monotonic,
+        logger: Optional[ContextualLogger] = None,
+    ):
+        """Initialize the controller.
+
+        Args:
+            batch_size: Initial batch size, clamped to the bounds
+            max_in_flight: Initial and maximum number of batches in flight
+            min_batch_size: Lower bound of the batch size
+            max_batch_size: Upper bound of the batch size
+            min_in_flight: Lower bound of the in-flight batch count
+            target_batch_latency_s: Batch latency the controller steers towards
+            db_wait_threshold_s: Mean connection pool wait that counts as DB pressure
+            memory_high_water: Memory fraction above which both knobs are halved
+            window: Completed batches per regular decision
+            batch_size_step: Minimum batch size increase; larger batches grow by a quarter
+            memory_probe: Returns the memory fraction in use, or None if unknown
+            clock: Monotonic clock, injectable for simulations
+            logger: Logger for decisions; decisions are not logged without one
+        """
+        self.min_batch_size = max(1, min_batch_size)
+        self.max_batch_size = max(self.min_batch_size, max_batch_size)
+        self.min_in_flight = max(1, min_in_flight)
+        self.ceiling_in_flight = max(self.min_in_flight, max_in_flight)
+        self.target_batch_latency_s = target_batch_latency_s
+        self.db_wait_threshold_s = db_wait_threshold_s
+        self.memory_high_water = memory_high_water
+        self.window = max(1, window)
+        self.batch_size_step = max(1, batch_size_step)
+        self._memory_probe = memory_probe
+        self._clock = clock
+        self._logger = logger
+
+        self.batch_size = min(max(batch_size, self.min_batch_size), self.max_batch_size)
+        self.max_in_flight = self.ceiling_in_flight
+
+        # Signals of the current window
+        self._batch_latencies: List[float] = []
+        self._stage_seconds: Dict[str, float] = defaultdict(float)
+        self._db_waits: List[float] = []
+        self._rate_limits = 0
+        self._last_backoff_batch: Optional[int] = None
+
+        # Totals for metrics()
+        self._started_at = clock()
+        self._batches = 0
+        self._entities = 0
+        self._decisions_by_reason: Dict[str, int] = defaultdict(int)
+        self._total_rate_limits = 0
+        self._total_stage_seconds: Dict[str, float] = defaultdict(float)
+        self._peak_memory_fraction: Optional[float] = None
+        self._batch_size_range = [self.batch_size, self.batch_size]
+        self._in_flight_range = [self.max_in_flight, self.max_in_flight]
+        self.decisions: List[ControllerDecision] = []
+
+    @classmethod
+    def from_settings(
+        cls, batch_size: int, max_in_flight: int, logger: Optional[ContextualLogger] = None
+    ) -> "AdaptiveBatchController":
+        """Create a controller with the configured bounds and targets."""
+        return cls(
+            batch_size,
+            max_in_flight,
+            min_batch_size=settings.SYNC_ADAPTIVE_MIN_BATCH_SIZE,
+            max_batch_size=settings.SYNC_ADAPTIVE_MAX_BATCH_SIZE,
+            target_batch_latency_s=settings.SYNC_ADAPTIVE_TARGET_BATCH_LATENCY_S,
+            db_wait_threshold_s=settings.SYNC_ADAPTIVE_DB_WAIT_THRESHOLD_S,
+            memory_high_water=settings.SYNC_ADAPTIVE_MEMORY_HIGH_WATER,
+            logger=logger,
+        )
+
+    # ------------------------------------------------------------------ activation
+
+    def activate(self) -> contextvars.Token:
+        """Route signals reported from this context (and tasks created in it) here."""
+        return _active_controller.set(self)
+
+    @staticmethod
+    def deactivate(token: contextvars.Token) -> None:
+        """Undo ``activate``."""
+        _active_controller.reset(token)
+
+    # ------------------------------------------------------------------ signals
+
+    def record_stage(self, stage: str, seconds: float) -> None:
+        """Record the time a batch spent in one pipeline stage."""
+        self._stage_seconds[stage] += seconds
+        self._total_stage_seconds[stage] += seconds
+
+    def record_db_wait(self, seconds: float) -> None:
+        """Record the time spent waiting for a database connection."""
+        self._db_waits.append(seconds)
+
+    def record_rate_limit(self) -> Optional[ControllerDecision]:
+        """Record embedding rate-limit feedback; backs off at once, at most once per window."""
+        self._rate_limits += 1
+        self._total_rate_limits += 1
+        if (
+            self._last_backoff_batch is None
+            or self._batches - self._last_backoff_batch >= self.window
+        ):
+            self._last_backoff_batch = self._batches
+            return self._decide()
+        return None
+
+    def record_batch(self, entities: int, seconds: float) -> Optional[ControllerDecision]:
+        """Record a completed batch; decides once per window of batches."""
+        self._batches += 1
+        self._entities += entities
+        self._batch_latencies.append(seconds)
+        if len(self._batch_latencies) >= self.window:
+            return self._decide()
+        return None
+
+    # ------------------------------------------------------------------ decisions
+
+    def _decide(self) -> ControllerDecision:
+        batch_size, in_flight = self.batch_size, self.max_in_flight
+        latency = (
+            sum(self._batch_latencies) / len(self._batch_latencies)
+            if self._batch_latencies
+            else None
+        )
+        db_wait = sum(self._db_waits) / len(self._db_waits) if self._db_waits else None
+        bottleneck = (
+            max(self._stage_seconds, key=self._stage_seconds.get) if self._stage_seconds else None
+        )
+        memory = self._memory_probe()
+        if memory is not None:
+            self._peak_memory_fraction = max(memory, self._peak_memory_fraction or 0.0)
+
+        if memory is not None and memory >= self.memory_high_water:
+            reason = "memory"
+            batch_size //= 2
+            in_flight //= 2
+        elif self._rate_limits:
+            reason = "rate_limit"
+            in_flight //= 2
+        elif db_wait is not None and db_wait > self.db_wait_threshold_s:
+            reason = "db_pool_wait"
+            in_flight = in_flight * 3 // 4
+        elif latency is not None and latency > self.target_batch_latency_s:
+            reason = "latency"
+            batch_size = batch_size * 3 // 4
+        elif latency is not None and latency < self.target_batch_latency_s / 2:
+            reason = "increase"
+            batch_size += max(self.batch_size_step, batch_size // 4)
+            in_flight += 1
+        else:
+            reason = "hold"
+
+        self.batch_size = min(max(batch_size, self.min_batch_size), self.max_batch_size)
+        self.max_in_flight = min(max(in_flight, self.min_in_flight), self.ceiling_in_flight)
+        self._batch_size_range = [
+            min(self._batch_size_range[0], self.batch_size),
+            max(self._batch_size_range[1], self.batch_size),
+        ]
+        self._in_flight_range = [
+            min(self._in_flight_range[0], self.max_in_flight),
+            max(self._in_flight_range[1], self.max_in_flight),
+        ]
+
+        decision = ControllerDecision(
+            batch_size=self.batch_size,
+            max_in_flight=self.max_in_flight,
+            reason=reason,
+            batch_latency_s=latency,
+            bottleneck_stage=bottleneck,
+            db_wait_s=db_wait,
+            rate_limits=self._rate_limits,
+            memory_fraction=memory,
+        )
+        self.decisions.append(decision)
+        self._decisions_by_reason[reason] += 1
+
+        self._batch_latencies.clear()
+        self._stage_seconds.clear()
+        self._db_waits.clear()
+        self._rate_limits = 0
+
+        if self._logger and reason != "hold":
+            self._logger.info(
+                f"🎛️ ADAPTIVE_BATCHING [{reason}] batch_size={decision.batch_size} "
+                f"max_in_flight={decision.max_in_flight} (bottleneck: {bottleneck})",
+                extra={
+                    "custom_dimensions": {
+                        f"adaptive_{key}": value
+                        for key, value in asdict(decision).items()
+                        if value is not None
+                    }
+                },
+            )
+        return decision
+
+    def metrics(self) -> Dict[str, object]:
+        """Summary of the controller's inputs and decisions so far."""
+        elapsed = self._clock() - self._started_at
+        return {
+            "batch_size": self.batch_size,
+            "max_in_flight": self.max_in_flight,
+            "min_batch_size_used": self._batch_size_range[0],
+            "max_batch_size_used": self._batch_size_range[1],
+            "min_in_flight_used": self._in_flight_range[0],
+            "max_in_flight_used": self._in_flight_range[1],
+            "batches": self._batches,
+            "entities": self._entities,
+            "entities_per_second": self._entities / elapsed if elapsed > 0 else None,
+            "rate_limits": self._total_rate_limits,
+            "peak_memory_fraction": self._peak_memory_fraction,
+            "decisions": dict(self._decisions_by_reason),
+            "stage_seconds": dict(self._total_stage_seconds),
+        }
+
+
+# ---------------------------------------------------------------------- reporting
+
+
+def report_stage_latency(stage: str, seconds: float) -> None:
+    """Report the time a batch spent in a pipeline stage to the active controller."""
+    controller = _active_controller.get()
+    if controller is not None:
+        controller.record_stage(stage, seconds)
+
+
+def report_db_wait(seconds: float) -> None:
+    """Report time spent waiting for a database connection to the active controller."""
+    controller = _active_controller.get()
+    if controller is not None:
+        controller.record_db_wait(seconds)
+
+
+def report_rate_limit() -> None:
+    """Report embedding rate-limit feedback to the active controller."""
+    controller = _active_controller.get()
+    if controller is not None:
+        controller.record_rate_limit()
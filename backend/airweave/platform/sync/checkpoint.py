@@ -0,0 +1,142 @@
+"""Periodic mid-sync checkpoints for sources that can resume an interrupted sync.
+
+Cursor data is saved when a sync completes. If a worker dies, or Temporal retries the sync
+activity after hours of progress, the next run starts the source from the beginning. For
+sources that implement ``BaseSource.get_checkpoint_state`` the orchestrator takes a
+checkpoint every ``SYNC_CHECKPOINT_INTERVAL_S`` seconds, and the next run of the sync resumes
+the source from the last one.
+
+A checkpoint must never cover an entity that is not durably written, so it is committed in
+three steps:
+
+1. Snapshot: between two entities, record the source state together with the number of
+   entities the source has produced so far (the stream position).
+2. Barrier: once the orchestrator has pulled every entity up to that position from the
+   stream and submitted them, remember the batches that are still running.
+3. Commit: when all those batches succeeded, flush the destinations (writes still in flight
+   become durable) and store the checkpoint through ``sync_cursor_service``.
+
+Only one checkpoint is in progress at a time, and the sync keeps streaming while it is.
+"""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from airweave.core.logging import ContextualLogger
+from airweave.platform.sources._base import BaseSource
+from airweave.platform.sync.stream import AsyncSourceStream
+
+CHECKPOINT_VERSION = 1
+
+
+class SyncCheckpointer:
+    """Takes checkpoints of a running sync and commits them once they are durable."""
+
+    def __init__(
+        self,
+        source: BaseSource,
+        stream: AsyncSourceStream,
+        sync_job_id: Any,
+        save: Callable[[Dict[str, Any]], Awaitable[bool]],
+        flush: Callable[[], Awaitable[None]],
+        interval_s: float,
+        logger: ContextualLogger,
+        resumed_from: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the checkpointer.
+
+        Args:
+            source: Source whose state is checkpointed
+            stream: Stream the orchestrator pulls the source's entities from
+            sync_job_id: Job that takes the checkpoints
+            save: Stores a checkpoint, returns whether it was stored
+            flush: Makes all destination writes durable
+            interval_s: Minimum seconds between checkpoints
+            logger: Contextual logger of the sync
+            resumed_from: Checkpoint this run resumed from, if any
+            clock: Monotonic clock, injectable for tests
+        """
+        self.source = source
+        self.stream = stream
+        self.sync_job_id = str(sync_job_id)
+        self._save = save
+        self._flush = flush
+        self.interval_s = interval_s
+        self.logger = logger
+        self._clock = clock
+
+        # Entities the previous runs had durably processed when this run resumed
+        self._base_processed = int((resumed_from or {}).get("entities_processed", 0))
+        self.pulled = 0
+        self.checkpoints = 0
+        self._last_checkpoint_at = clock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._barrier: Optional[Set[asyncio.Task]] = None
+
+    def entity_pulled(self) -> None:
+        """Count an entity taken from the stream."""
+        self.pulled += 1
+
+    def barrier_needed(self) -> bool:
+        """Whether all entities of the pending snapshot are pulled and must be submitted.
+
+        When True the caller submits its partially filled batch before calling ``tick``.
+        """
+        return (
+            self._snapshot is not None
+            and self._barrier is None
+            and self.pulled >= self._snapshot["position"]
+        )
+
+    async def tick(self, pending_tasks: Iterable[asyncio.Task]) -> None:
+        """Advance the checkpoint state machine; called before each entity is handled.
+
+        Args:
+            pending_tasks: Batches (or entities) submitted to the worker pool
+        """
+        if self.barrier_needed():
+            self._barrier = set(pending_tasks)
+
+        if self._barrier is not None and all(task.done() for task in self._barrier):
+            await self._commit()
+        elif self._snapshot is None and self._clock() - self._last_checkpoint_at >= self.interval_s:
+            self._take_snapshot()
+
+    def _take_snapshot(self) -> None:
+        state = self.source.get_checkpoint_state()
+        if state is None:
+            self._last_checkpoint_at = self._clock()
+            return
+        # Copy through JSON: checks the state is storable and detaches it from the source
+        self._snapshot = {
+            "position": self.stream.items_produced,
+            "source_state": json.loads(json.dumps(state)),
+        }
+
+    async def _commit(self) -> None:
+        snapshot, barrier = self._snapshot, self._barrier
+        self._snapshot, self._barrier = None, None
+        self._last_checkpoint_at = self._clock()
+
+        if any(task.cancelled() or task.exception() is not None for task in barrier):
+            # The sync is failing; never checkpoint past entities that were not written
+            return
+
+        await self._flush()
+        checkpoint = {
+            "version": CHECKPOINT_VERSION,
+            "sync_job_id": self.sync_job_id,
+            "source_state": snapshot["source_state"],
+            "entities_processed": self._base_processed + snapshot["position"],
+            "taken_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if await self._save(checkpoint):
+            self.checkpoints += 1
+            self.logger.info(
+                f"💾 Checkpoint {self.checkpoints} saved after "
+                f"{checkpoint['entities_processed']} processed entities"
+            )
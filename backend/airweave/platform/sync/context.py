@@ -38,7 +38,8 @@ class SyncContext:
 
     Concurrency / batching controls:
     - should_batch - if True, use micro-batched pipeline; if False, process per-entity (legacy)
-    - batch_size - max parents per micro-batch (default 64)
+    - batch_size - max parents per micro-batch (default 64); the initial value when
+      SYNC_ADAPTIVE_BATCHING tunes it at runtime
     - max_batch_latency_ms - max time to wait before flushing a non-full batch (default 200ms)
     """
 
@@ -1,8 +1,10 @@
 """Module for entity processing within the sync architecture (TRUE batching + legacy path)."""
 
 import asyncio
+import time
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Optional, Set, Tuple
+from typing import Awaitable, Callable, DefaultDict, Dict, List, Optional, Set, Tuple
+from uuid import UUID
 
 from fastembed import SparseTextEmbedding
 from sqlalchemy.exc import DBAPIError
@@ -11,10 +13,19 @@ from airweave import crud, models, schemas
 from airweave.core.constants.reserved_ids import RESERVED_TABLE_ENTITY_ID
 from airweave.core.exceptions import NotFoundException
 from airweave.core.shared_models import ActionType
+from airweave.core.timestamp_stats_service import timestamp_stats_service
 from airweave.db.session import get_db_context
 from airweave.platform.entities._base import BaseEntity, DestinationAction, PolymorphicEntity
+from airweave.platform.sync.adaptive_batching import report_db_wait, report_stage_latency
 from airweave.platform.sync.async_helpers import compute_entity_hash_async, run_in_thread_pool
 from airweave.platform.sync.context import SyncContext
+from airweave.platform.sync.process_pool import (
+    process_pool_enabled,
+    sparse_embed_in_process_pool,
+)
+
+# Hash of entity rows whose chunks are not written yet; never equal to a computed hash
+PENDING_HASH = ""
 
 
 class EntityProcessor:
@@ -177,6 +188,7 @@ class EntityProcessor:
         if not entities:
             return {}
 
+        stage_started = time.monotonic()
         unique_entities = await self._filter_and_track_entities(entities, sync_context)
         if not unique_entities:
             return {e.entity_id: [] for e in entities}
@@ -188,6 +200,7 @@ class EntityProcessor:
         partitions = await self._partition_by_action(
             enriched, sync_context, inner_concurrency=inner_concurrency
         )
+        stage_started = self._report_stage("lookup", stage_started)
 
         if not any(partitions[k] for k in ("inserts", "updates", "deletes")):
             if partitions["keeps"]:
@@ -198,6 +211,7 @@ class EntityProcessor:
         children_by_parent = await self._transform_parents(
             to_transform, source_node, sync_context, inner_concurrency
         )
+        stage_started = self._report_stage("transform", stage_started)
 
         successful_pids = set(children_by_parent.keys())
         partitions["inserts"] = [e for e in partitions["inserts"] if e.entity_id in successful_pids]
@@ -206,6 +220,7 @@ class EntityProcessor:
         all_children = [child for children in children_by_parent.values() for child in children]
         if all_children:
             await self._compute_vector(all_children, sync_context)
+            stage_started = self._report_stage("embed", stage_started)
 
         results = await self._persist_batch(
             partitions=partitions,
@@ -214,6 +229,7 @@ class EntityProcessor:
             children_by_parent=children_by_parent,
             sync_context=sync_context,
         )
+        self._report_stage("persist", stage_started)
 
         if partitions["keeps"]:
             await sync_context.progress.increment("kept", len(partitions["keeps"]))
@@ -223,6 +239,13 @@ class EntityProcessor:
     # ------------------------------------------------------------------------------------
     # Shared helpers
     # ------------------------------------------------------------------------------------
+    @staticmethod
+    def _report_stage(stage: str, started: float) -> float:
+        """Report a finished batch stage to the adaptive controller; returns the new start."""
+        now = time.monotonic()
+        report_stage_latency(stage, now - started)
+        return now
+
     async def _filter_and_track_entities(
         self, entities: List[BaseEntity], sync_context: SyncContext
     ) -> List[BaseEntity]:
@@ -277,12 +300,17 @@ class EntityProcessor:
             except Exception as e:
                 sync_context.logger.warning(f"💥 BATCH_DB_LOOKUP_ERROR: {e}")
 
+        partitions = defaultdict(list)
+        partitions["keeps"], to_hash = self._split_unchanged_by_metadata(
+            non_deletes, existing_map, sync_context
+        )
+
         hashes, failed_hashes = await self._compute_hashes_concurrently(
-            non_deletes, inner_concurrency=inner_concurrency, sync_context=sync_context
+            to_hash, inner_concurrency=inner_concurrency, sync_context=sync_context
         )
 
-        partitions = defaultdict(list)
-        for e in non_deletes:
+        stale_fingerprints: List[Tuple[UUID, str]] = []
+        for e in to_hash:
             if e.entity_id in failed_hashes:
                 continue
             db_row = existing_map.get(e.entity_id)
@@ -292,6 +320,10 @@ class EntityProcessor:
                 partitions["updates"].append(e)
             else:
                 partitions["keeps"].append(e)
+                fingerprint = self._metadata_fingerprint(e)
+                if fingerprint and fingerprint != db_row.metadata_fingerprint:
+                    stale_fingerprints.append((db_row.id, fingerprint))
+        await self._store_kept_fingerprints(stale_fingerprints, sync_context)
 
         partitions["deletes"] = deletes
         partitions["existing_map"] = existing_map
@@ -328,7 +360,13 @@ class EntityProcessor:
             async with sem:
                 return await _do_transform(p)
 
-        results = await asyncio.gather(*[_wrapped(p) for p in parents])
+        # Plain chunk entities (messages, issues, ...) go through the field chunker as one batch
+        batched = [p for p in parents if sync_context.router.is_field_chunked(p)]
+        batched_ids = {id(p) for p in batched}
+        others = [p for p in parents if id(p) not in batched_ids]
+
+        results = await self._transform_chunk_entities(batched, sync_context, _wrapped)
+        results += await asyncio.gather(*[_wrapped(p) for p in others])
         for pid, kids in results:
             if kids:
                 children_by_parent[pid].extend(kids)
@@ -337,6 +375,30 @@ class EntityProcessor:
 
         return children_by_parent
 
+    async def _transform_chunk_entities(
+        self,
+        entities: List[BaseEntity],
+        sync_context: SyncContext,
+        transform_one: Callable[[BaseEntity], Awaitable[Tuple[str, List[BaseEntity]]]],
+    ) -> List[Tuple[str, List[BaseEntity]]]:
+        """Transform field-chunked entities with one entity chunker call.
+
+        If the batch fails, the entities are transformed one by one, so only the failing
+        entity is skipped.
+        """
+        if not entities:
+            return []
+        try:
+            chunked = await sync_context.router.process_chunk_entities(entities)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            sync_context.logger.warning(
+                f"💥 BATCH_CHUNK_ERROR {type(e).__name__}: {e}, transforming one by one"
+            )
+            return list(await asyncio.gather(*[transform_one(p) for p in entities]))
+        return [(p.entity_id, kids) for p, kids in zip(entities, chunked, strict=True)]
+
     # ------------------------------------------------------------------------------------
     # Existing single-entity helpers
     # ------------------------------------------------------------------------------------
@@ -372,12 +434,72 @@ class EntityProcessor:
 
         return entity
 
+    def _split_unchanged_by_metadata(
+        self,
+        entities: List[BaseEntity],
+        existing_map: Dict[str, models.Entity],
+        sync_context: SyncContext,
+    ) -> Tuple[List[BaseEntity], List[BaseEntity]]:
+        """Split off files the source did not download because their metadata is unchanged.
+
+        Returns:
+            The unchanged entities to keep, and the remaining entities to hash
+        """
+        keeps: List[BaseEntity] = []
+        to_hash: List[BaseEntity] = []
+        for e in entities:
+            if not self._unchanged_by_metadata(e):
+                to_hash.append(e)
+            elif e.entity_id in existing_map:
+                keeps.append(e)
+            else:
+                # Deleted meanwhile; the next sync downloads and inserts it again
+                sync_context.logger.warning(
+                    f"Entity {e.entity_id} was not downloaded as unchanged but is not stored"
+                )
+        return keeps, to_hash
+
+    async def _store_kept_fingerprints(
+        self, rows: List[Tuple[UUID, str]], sync_context: SyncContext
+    ) -> None:
+        """Store the fingerprints of kept entities, so the next sync can skip downloading them.
+
+        Entities stored before fingerprints existed, or whose listing metadata changed without
+        their content changing, are kept by hash and would otherwise be downloaded every sync.
+        """
+        if not rows:
+            return
+        try:
+            async with get_db_context() as db:
+                async with db.begin():
+                    await crud.entity.bulk_update_metadata_fingerprint(db, rows=rows)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Only costs the next sync a download
+            sync_context.logger.warning(
+                f"Storing metadata fingerprints of kept entities failed: {e}"
+            )
+
+    @staticmethod
+    def _unchanged_by_metadata(entity: BaseEntity) -> bool:
+        """Whether the source skipped downloading the file because its metadata is unchanged."""
+        return bool(getattr(entity.airweave_system_metadata, "is_fully_processed", False))
+
+    @staticmethod
+    def _metadata_fingerprint(entity: BaseEntity) -> Optional[str]:
+        return getattr(entity.airweave_system_metadata, "metadata_fingerprint", None)
+
     async def _determine_action(
         self, entity: BaseEntity, sync_context: SyncContext
     ) -> tuple[Optional[models.Entity], DestinationAction]:
         if hasattr(entity, "deletion_status") and entity.deletion_status == "removed":
             return None, DestinationAction.DELETE
 
+        if self._unchanged_by_metadata(entity):
+            # Not downloaded; if the stored entity vanished meanwhile the next sync inserts it
+            return None, DestinationAction.KEEP
+
         async with get_db_context() as db:
             try:
                 db_entity = await crud.entity.get_by_entity_and_sync_id(
@@ -440,6 +562,7 @@ class EntityProcessor:
                     entity_id=parent_entity.entity_id,
                     entity_definition_id=entity_definition_id,
                     hash=parent_hash,
+                    metadata_fingerprint=self._metadata_fingerprint(parent_entity),
                 ),
                 ctx=sync_context.ctx,
             )
@@ -452,6 +575,7 @@ class EntityProcessor:
 
         for destination in sync_context.destinations:
             await destination.bulk_insert(processed_entities)
+        await self._record_timestamp_stats([parent_entity], sync_context)
 
         await sync_context.progress.increment("inserted", 1)
         await sync_context.guard_rail.increment(ActionType.ENTITIES)
@@ -485,7 +609,10 @@ class EntityProcessor:
                 await crud.entity.update(
                     db=db,
                     db_obj=fresh_db_entity,
-                    obj_in=schemas.EntityUpdate(hash=parent_hash),
+                    obj_in=schemas.EntityUpdate(
+                        hash=parent_hash,
+                        metadata_fingerprint=self._metadata_fingerprint(parent_entity),
+                    ),
                     ctx=sync_context.ctx,
                 )
             except NotFoundException:
@@ -508,6 +635,7 @@ class EntityProcessor:
             )
         for destination in sync_context.destinations:
             await destination.bulk_insert(processed_entities)
+        await self._record_timestamp_stats([parent_entity], sync_context)
 
         await sync_context.progress.increment("updated", 1)
         await sync_context.guard_rail.increment(ActionType.ENTITIES)
@@ -707,7 +835,12 @@ class EntityProcessor:
         children_by_parent: Dict[str, List[BaseEntity]],
         sync_context: SyncContext,
     ) -> Dict[str, List[BaseEntity]]:
-        """Internal implementation of batch persistence with retry support."""
+        """Internal implementation of batch persistence with retry support.
+
+        Hashes are committed only after the batch's chunks are written to every destination:
+        rows are inserted with a pending hash and updated rows keep their old one until then,
+        so a batch whose writes fail or are cancelled is updated again by the next sync.
+        """
         inserts, updates, deletes = (
             partitions["inserts"],
             partitions["updates"],
@@ -715,19 +848,24 @@ class EntityProcessor:
         )
 
         # Persist to database in a transaction
+        wait_started = time.monotonic()
         async with get_db_context() as db:
             async with db.begin():
+                # Check out the connection up front so pool wait is measured on its own
+                await db.connection()
+                report_db_wait(time.monotonic() - wait_started)
                 await self._batch_persist_db_inserts(
                     db, inserts, parent_hashes, children_by_parent, sync_context
                 )
                 await self._batch_persist_db_updates(
-                    db, updates, parent_hashes, existing_map, children_by_parent, sync_context
+                    updates, existing_map, children_by_parent, sync_context
                 )
                 await self._batch_persist_db_deletes(db, deletes, sync_context)
 
         await self._batch_update_destinations(
             inserts, updates, deletes, children_by_parent, sync_context
         )
+        await self._commit_entity_hashes(inserts + updates, parent_hashes)
         await self._update_progress_and_guard_rails(partitions, sync_context)
 
         results_by_parent: dict[str, List[BaseEntity]] = dict(children_by_parent)
@@ -803,7 +941,8 @@ class EntityProcessor:
                     sync_id=sync_context.sync.id,
                     entity_id=p.entity_id,
                     entity_definition_id=def_id,
-                    hash=parent_hash,
+                    hash=PENDING_HASH,
+                    metadata_fingerprint=None,
                 )
             )
             valid_parent_ids.add(p.entity_id)
@@ -918,9 +1057,7 @@ class EntityProcessor:
 
     async def _batch_persist_db_updates(
         self,
-        db,
         updates: List[BaseEntity],
-        parent_hashes: Dict[str, str],
         existing_map: Dict[str, models.Entity],
         children_by_parent: Dict[str, List[BaseEntity]],
         sync_context: SyncContext,
@@ -928,24 +1065,29 @@ class EntityProcessor:
         if not updates:
             return
 
-        await self._update_entity_hashes(updates, parent_hashes, existing_map, db)
         await self._assign_metadata_ids_for_updates(updates, existing_map, children_by_parent)
         await self._update_state_tracker_for_updates(updates, existing_map, sync_context)
 
-    async def _update_entity_hashes(
-        self,
-        updates: List[BaseEntity],
-        parent_hashes: Dict[str, str],
-        existing_map: Dict[str, models.Entity],
-        db,
+    async def _commit_entity_hashes(
+        self, parents: List[BaseEntity], parent_hashes: Dict[str, str]
     ) -> None:
-        update_pairs = [
-            (existing_map[p.entity_id].id, parent_hashes[p.entity_id])
-            for p in updates
-            if p.entity_id in existing_map and p.entity_id in parent_hashes
+        """Store the hashes of inserted and updated parents whose chunks are written."""
+        update_rows = [
+            (
+                p.airweave_system_metadata.db_entity_id,
+                parent_hashes[p.entity_id],
+                self._metadata_fingerprint(p),
+            )
+            for p in parents
+            if p.airweave_system_metadata
+            and p.airweave_system_metadata.db_entity_id
+            and p.entity_id in parent_hashes
         ]
-        if update_pairs:
-            await crud.entity.bulk_update_hash(db=db, rows=update_pairs)
+        if not update_rows:
+            return
+        async with get_db_context() as db:
+            async with db.begin():
+                await crud.entity.bulk_update_hash(db=db, rows=update_rows)
 
     async def _assign_metadata_ids_for_updates(
         self,
@@ -1004,6 +1146,23 @@ class EntityProcessor:
         if to_insert:
             for dest in sync_context.destinations:
                 await dest.bulk_insert(to_insert)
+            written_parents = [p for p in inserts + updates if children_by_parent.get(p.entity_id)]
+            await self._record_timestamp_stats(written_parents, sync_context)
+
+    async def _record_timestamp_stats(
+        self, parents: List[BaseEntity], sync_context: SyncContext
+    ) -> None:
+        """Widen the collection's timestamp range stats with entities just written."""
+        timestamps_by_source: DefaultDict[str, list] = defaultdict(list)
+        for parent in parents:
+            metadata = parent.airweave_system_metadata
+            if metadata and metadata.airweave_updated_at and metadata.source_name:
+                timestamps_by_source[metadata.source_name].append(metadata.airweave_updated_at)
+
+        if timestamps_by_source:
+            await timestamp_stats_service.record(
+                sync_context.collection.id, dict(timestamps_by_source)
+            )
 
     async def _batch_persist_db_deletes(
         self,
@@ -1125,7 +1284,12 @@ class EntityProcessor:
         # hitting destinations per batch (avoids Qdrant 408s under load).
         calculate_sparse_embeddings = bool(getattr(sync_context, "has_keyword_index", False))
 
-        if calculate_sparse_embeddings:
+        if calculate_sparse_embeddings and process_pool_enabled():
+            # The keyword indexing model is always local BM25, which workers load themselves
+            sparse_embeddings = await sparse_embed_in_process_pool(
+                texts, sync_context.keyword_indexing_model, sync_context.logger
+            )
+        elif calculate_sparse_embeddings:
             sparse_embedder = sync_context.keyword_indexing_model
             sparse_embeddings = list(await sparse_embedder.embed_many(texts))
         else:
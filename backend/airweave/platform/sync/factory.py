@@ -1,6 +1,5 @@
 """Module for sync factory that creates context and orchestrator instances."""
 
-import importlib
 import time
 from typing import Any, Dict, Optional
 from uuid import UUID
@@ -11,7 +10,6 @@ from airweave import crud, schemas
 from airweave.api.context import ApiContext
 from airweave.core import credentials
 from airweave.core.config import settings
-from airweave.core.constants.reserved_ids import RESERVED_TABLE_ENTITY_ID
 from airweave.core.exceptions import NotFoundException
 from airweave.core.guard_rail_service import GuardRailService
 from airweave.core.logging import ContextualLogger, LoggerConfigurator, logger
@@ -25,15 +23,16 @@ from airweave.platform.embedding_models._base import BaseEmbeddingModel
 from airweave.platform.embedding_models.bm25_text2vec import BM25Text2Vec
 from airweave.platform.embedding_models.local_text2vec import LocalText2Vec
 from airweave.platform.embedding_models.openai_text2vec import OpenAIText2Vec
-from airweave.platform.entities._base import BaseEntity
 from airweave.platform.http_client import PipedreamProxyClient
 from airweave.platform.locator import resource_locator
 from airweave.platform.sources._base import BaseSource
 from airweave.platform.sync.context import SyncContext
 from airweave.platform.sync.cursor import SyncCursor
 from airweave.platform.sync.entity_processor import EntityProcessor
+from airweave.platform.sync.file_change_gate import FileChangeGate
 from airweave.platform.sync.orchestrator import SyncOrchestrator
 from airweave.platform.sync.pubsub import SyncEntityStateTracker, SyncProgress
+from airweave.platform.sync.registry import sync_registry
 from airweave.platform.sync.router import SyncDAGRouter
 from airweave.platform.sync.stream import AsyncSourceStream
 from airweave.platform.sync.token_manager import TokenManager
@@ -101,11 +100,6 @@ class SyncFactory:
         )
         logger.debug(f"Sync context created in {time.time() - context_start:.2f}s")
 
-        # CRITICAL FIX: Initialize transformer cache to eliminate 1.5s database lookups
-        cache_start = time.time()
-        await sync_context.router.initialize_transformer_cache(db)
-        logger.debug(f"Transformer cache initialized in {time.time() - cache_start:.2f}s")
-
         # Create entity processor
         entity_processor = EntityProcessor()
 
@@ -195,8 +189,10 @@ class SyncFactory:
             ctx=ctx,
             logger=logger,
         )
-        transformers = await cls._get_transformer_callables(db=db, sync=sync)
-        entity_map = await cls._get_entity_definition_map(db=db)
+        # Entity definitions and transformers are shared across syncs in this process
+        await sync_registry.refresh(db)
+        transformers = sync_registry.transformers_by_method
+        entity_map = sync_registry.entity_map
 
         progress = SyncProgress(sync_job.id, logger=logger)
 
@@ -293,6 +289,10 @@ class SyncFactory:
         # Set cursor on source so it can access cursor data
         source.set_cursor(cursor)
 
+        # Let the source skip downloading files whose provider metadata did not change
+        if settings.SYNC_METADATA_CHANGE_DETECTION:
+            source.set_file_change_gate(FileChangeGate(sync_id=sync.id, logger=logger))
+
         return sync_context
 
     @classmethod
@@ -1005,6 +1005,7 @@ class SyncFactory:
             collection_id=collection.id,
             organization_id=collection.organization_id,
             logger=ctx.logger,
+            payload_mode=collection.payload_mode,
         )
 
         # Set contextual logger on destination
@@ -1015,37 +1016,3 @@ class SyncFactory:
             )
 
         return [destination]
-
-    @classmethod
-    async def _get_transformer_callables(
-        cls, db: AsyncSession, sync: schemas.Sync
-    ) -> dict[str, callable]:
-        """Get transformers instance."""
-        transformers = {}
-
-        transformer_functions = await crud.transformer.get_all(db)
-        for transformer in transformer_functions:
-            transformers[transformer.method_name] = resource_locator.get_transformer(transformer)
-        return transformers
-
-    @classmethod
-    async def _get_entity_definition_map(cls, db: AsyncSession) -> dict[type[BaseEntity], UUID]:
-        """Get entity definition map.
-
-        Map entity class to entity definition id.
-
-        Example key-value pair:
-            <class 'airweave.platform.entities.trello.TrelloBoard'>: entity_definition_id
-        """
-        entity_definitions = await crud.entity_definition.get_all(db)
-
-        entity_definition_map = {}
-        for entity_definition in entity_definitions:
-            if entity_definition.id == RESERVED_TABLE_ENTITY_ID:
-                continue
-            full_module_name = f"airweave.platform.entities.{entity_definition.module_name}"
-            module = importlib.import_module(full_module_name)
-            entity_class = getattr(module, entity_definition.class_name)
-            entity_definition_map[entity_class] = entity_definition.id
-
-        return entity_definition_map
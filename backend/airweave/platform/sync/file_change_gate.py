@@ -0,0 +1,153 @@
+"""Metadata-first change detection for file entities.
+
+A file's entity hash is computed from its downloaded bytes, so classifying an unchanged file
+as KEEP used to cost a full download, temp file and hash on every sync. Most file providers
+already report a content version with the listing: Google Drive's md5Checksum, the
+OneDrive/SharePoint eTag and cTag, Dropbox's content_hash and rev, Box's sha1 and version.
+The gate folds that version, together with the metadata the entity hash covers (name, size,
+parents, ...), into a fingerprint stored next to the hash. When the fingerprint of a listed
+file equals the stored one, ``BaseSource.process_file_entity`` skips the download and the
+entity processor keeps the entity without hashing it. The stored fingerprints of the sync are
+loaded in one query when the first file is checked.
+
+Files without a version field fall back to size plus modified time; files with neither are
+always downloaded.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from airweave import crud
+from airweave.core.logging import ContextualLogger
+from airweave.db.session import get_db_context
+from airweave.platform.entities._base import FileEntity
+from airweave.platform.sync.async_helpers import stable_serialize
+
+# Bump to invalidate all stored fingerprints when their composition changes
+FINGERPRINT_VERSION = 1
+
+# Provider fields that change whenever the file content changes
+_VERSION_FIELDS = (
+    "md5_checksum",
+    "sha1",
+    "content_hash",
+    "ctag",
+    "etag",
+    "rev",
+    "version_number",
+)
+_MODIFIED_FIELDS = (
+    "modified_time",
+    "server_modified",
+    "content_modified_at",
+    "last_modified_datetime",
+    "modified_at",
+    "updated_at",
+)
+# Metadata covered by the entity hash of files (see compute_entity_hash_async)
+_METADATA_FIELDS = ("file_id", "name", "mime_type", "size", "parents")
+
+
+def _provider_version(entity: FileEntity) -> Dict[str, Any]:
+    version = {field: value for field in _VERSION_FIELDS if (value := getattr(entity, field, None))}
+    # OneDrive and SharePoint report content hashes in the Graph 'file' facet
+    file_facet = getattr(entity, "file", None)
+    if isinstance(file_facet, dict) and file_facet.get("hashes"):
+        version["hashes"] = file_facet["hashes"]
+    return version
+
+
+def compute_metadata_fingerprint(entity: FileEntity) -> Optional[str]:
+    """Fingerprint a file from the metadata the provider listed, before downloading it.
+
+    Returns:
+        The fingerprint, or None if the metadata cannot tell whether the content changed
+    """
+    version = _provider_version(entity)
+    modified = {
+        field: value for field in _MODIFIED_FIELDS if (value := getattr(entity, field, None))
+    }
+    if not version and not (modified and getattr(entity, "size", None) is not None):
+        return None
+
+    composite = {
+        "fingerprint_version": FINGERPRINT_VERSION,
+        "entity_type": entity.__class__.__name__,
+        "version": version,
+        "modified": modified,
+        "metadata": {field: getattr(entity, field, None) for field in _METADATA_FIELDS},
+    }
+    return hashlib.sha256(
+        json.dumps(stable_serialize(composite), sort_keys=True).encode()
+    ).hexdigest()
+
+
+class FileChangeGate:
+    """Decides per listed file whether it is unchanged since the last sync."""
+
+    def __init__(self, sync_id: UUID, logger: ContextualLogger):
+        """Initialize the gate.
+
+        Args:
+            sync_id: Sync whose stored entities the files are compared with
+            logger: Contextual logger of the sync
+        """
+        self.sync_id = sync_id
+        self.logger = logger
+        self.checked = 0
+        self.unchanged = 0
+        self.bytes_skipped = 0
+        self.lookup_errors = 0
+        self._stored: Optional[Dict[str, str]] = None
+        self._load_lock = asyncio.Lock()
+
+    async def _stored_fingerprints(self) -> Dict[str, str]:
+        """The stored fingerprints of the sync's entities, loaded once."""
+        async with self._load_lock:
+            if self._stored is None:
+                async with get_db_context() as db:
+                    self._stored = await crud.entity.get_metadata_fingerprints(
+                        db, sync_id=self.sync_id
+                    )
+                self.logger.debug(f"Loaded {len(self._stored)} stored metadata fingerprints")
+        return self._stored
+
+    async def is_unchanged(self, entity: FileEntity) -> bool:
+        """Check a file before downloading it.
+
+        Records the fingerprint on the entity, so it is stored with the entity's hash. An
+        unchanged file is marked ``is_fully_processed`` and must not be downloaded.
+        """
+        fingerprint = compute_metadata_fingerprint(entity)
+        entity.airweave_system_metadata.metadata_fingerprint = fingerprint
+        if fingerprint is None:
+            return False
+
+        self.checked += 1
+        try:
+            stored = (await self._stored_fingerprints()).get(entity.entity_id)
+        except Exception as e:
+            # Downloading is always correct, only slower
+            self.lookup_errors += 1
+            self.logger.warning(f"Metadata fingerprint lookup failed for {entity.entity_id}: {e}")
+            return False
+
+        if stored != fingerprint:
+            return False
+
+        entity.airweave_system_metadata.is_fully_processed = True
+        self.unchanged += 1
+        self.bytes_skipped += entity.size or 0
+        return True
+
+    def metrics(self) -> Dict[str, Any]:
+        """Files checked, files found unchanged and the download bytes they saved."""
+        return {
+            "checked": self.checked,
+            "unchanged": self.unchanged,
+            "bytes_skipped": self.bytes_skipped,
+            "lookup_errors": self.lookup_errors,
+        }
@@ -0,0 +1,165 @@
+"""Byte-weighted memory budget for entities buffered between sources and the pipeline.
+
+``AsyncSourceStream`` bounds its queue by item count, which says little about memory: ten
+thousand ticket entities are a few megabytes, ten thousand downloaded files are gigabytes of
+content and temp files. Every queued entity is therefore weighed, its estimated in-memory
+size plus the size of its downloaded temp file, and charged against one budget shared by all
+syncs running in the worker process. The bytes stay charged while the entity waits in a
+batch and is processed, and are returned once processing (and temp file cleanup) finished.
+A producer whose entity does not fit pauses until enough bytes were returned.
+
+A stream with nothing charged, no entity queued, taken or in processing, may always queue
+one entity, whatever the budget says. That keeps single entities larger than the budget, and
+syncs starting while others hold the whole budget, from waiting forever; the budget is
+overshot by at most one entity per stream. A consumer that collects entities into batches
+must not wait for more while the producer is paused: the stream tells it, and it hands off
+its partial batch (see ``AsyncSourceStream.get_entities``).
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import BaseModel
+
+from airweave.core.config import settings
+
+# Fixed overhead of an entity object (model instance, metadata, breadcrumbs)
+_ENTITY_OVERHEAD_BYTES = 1024
+# Rough size of scalars and of anything nested deeper than _MAX_ESTIMATE_DEPTH
+_SCALAR_BYTES = 32
+_MAX_ESTIMATE_DEPTH = 4
+
+
+def _estimate_value_bytes(value: Any, depth: int = 0) -> int:
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if depth >= _MAX_ESTIMATE_DEPTH:
+        return _SCALAR_BYTES
+    if isinstance(value, BaseModel):
+        return _estimate_value_bytes(value.__dict__, depth + 1)
+    if isinstance(value, dict):
+        return sum(
+            _estimate_value_bytes(k, depth + 1) + _estimate_value_bytes(v, depth + 1)
+            for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(_estimate_value_bytes(v, depth + 1) for v in value)
+    return _SCALAR_BYTES
+
+
+def estimate_entity_bytes(entity: BaseModel) -> int:
+    """Estimate the bytes an entity holds in memory and in its downloaded temp file.
+
+    Strings and bytes count by length; containers and nested models are walked a few levels
+    deep. The estimate is meant for admission control, not for exact accounting.
+    """
+    size = _ENTITY_OVERHEAD_BYTES + _estimate_value_bytes(entity.__dict__)
+
+    metadata = getattr(entity, "airweave_system_metadata", None)
+    local_path = getattr(metadata, "local_path", None)
+    if local_path:
+        try:
+            size += os.path.getsize(local_path)
+        except OSError:
+            pass
+    return size
+
+
+class StreamMemoryBudget:
+    """Budget of buffered entity bytes, shared by the streams of one worker process."""
+
+    def __init__(self, budget_bytes: int):
+        """Initialize the budget.
+
+        Args:
+            budget_bytes: Bytes that may be buffered across all streams; 0 disables the
+                budget (bytes are still tracked for metrics)
+        """
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.high_water_bytes = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether producers are paused when the budget is exhausted."""
+        return self.budget_bytes > 0
+
+    def _get_condition(self) -> asyncio.Condition:
+        # The budget outlives event loops (tests, scripts); a condition is bound to one
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    def _fits(self, nbytes: int, held: Callable[[], int]) -> bool:
+        return self.used_bytes + nbytes <= self.budget_bytes or held() == 0
+
+    async def acquire(
+        self,
+        nbytes: int,
+        held: Callable[[], int],
+        on_wait: Optional[Callable[[], None]] = None,
+    ) -> float:
+        """Charge ``nbytes`` to the budget, waiting until they fit.
+
+        Args:
+            nbytes: Weight of the entity to buffer
+            held: Bytes currently charged to the calling stream; a stream with nothing
+                charged is always admitted
+            on_wait: Called before waiting, e.g. to have the consumer hand off what it holds
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        if self.enabled:
+            condition = self._get_condition()
+            async with condition:
+                if not self._fits(nbytes, held):
+                    self.waits += 1
+                    if on_wait:
+                        on_wait()
+                    started = time.monotonic()
+                    await condition.wait_for(lambda: self._fits(nbytes, held))
+                    waited = time.monotonic() - started
+                    self.wait_seconds += waited
+                self._charge(nbytes)
+        else:
+            self._charge(nbytes)
+        return waited
+
+    def _charge(self, nbytes: int) -> None:
+        self.used_bytes += nbytes
+        self.high_water_bytes = max(self.high_water_bytes, self.used_bytes)
+
+    async def release(self, nbytes: int) -> None:
+        """Return bytes of entities that were processed or dropped."""
+        self.used_bytes = max(0, self.used_bytes - nbytes)
+        await self.wake()
+
+    async def wake(self) -> None:
+        """Let waiting producers check again, e.g. after a stream released all its bytes."""
+        if self.enabled:
+            condition = self._get_condition()
+            async with condition:
+                condition.notify_all()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current usage, high-water mark and producer waits of the budget."""
+        return {
+            "budget_bytes": self.budget_bytes,
+            "used_bytes": self.used_bytes,
+            "high_water_bytes": self.high_water_bytes,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
+stream_memory_budget = StreamMemoryBudget(settings.SYNC_STREAM_MEMORY_BUDGET_MB * 1024 * 1024)
@@ -1,10 +1,11 @@
 """Module for data synchronization with TRUE batching + toggleable batching."""
 
 import asyncio
-from typing import Optional
+from typing import List, Optional
 
 from airweave import schemas
 from airweave.analytics import business_events
+from airweave.core.config import settings
 from airweave.core.datetime_utils import utc_now_naive
 from airweave.core.exceptions import PaymentRequiredException, UsageLimitExceededException
 from airweave.core.guard_rail_service import ActionType
@@ -12,11 +13,15 @@ from airweave.core.shared_models import SyncJobStatus
 from airweave.core.sync_cursor_service import sync_cursor_service
 from airweave.core.sync_job_service import sync_job_service
 from airweave.db.session import get_db_context
+from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sync.adaptive_batching import AdaptiveBatchController
+from airweave.platform.sync.checkpoint import SyncCheckpointer
 from airweave.platform.sync.context import SyncContext
 from airweave.platform.sync.entity_processor import EntityProcessor
 from airweave.platform.sync.stream import AsyncSourceStream
 from airweave.platform.sync.worker_pool import AsyncWorkerPool
 from airweave.platform.utils.error_utils import get_error_message
+from airweave.search.cache import search_cache
 
 
 class SyncOrchestrator:
@@ -56,6 +61,19 @@ class SyncOrchestrator:
             else 200
         )
 
+        # Tunes batch_size and the in-flight batch count at runtime (batched path only)
+        self.batch_controller: Optional[AdaptiveBatchController] = None
+        if self.should_batch and settings.SYNC_ADAPTIVE_BATCHING:
+            self.batch_controller = AdaptiveBatchController.from_settings(
+                batch_size=self.batch_size,
+                max_in_flight=worker_pool.max_workers,
+                logger=sync_context.logger,
+            )
+
+        # Mid-sync checkpoints, for sources that can resume (created in _start_sync)
+        self.checkpointer: Optional[SyncCheckpointer] = None
+        self.resumed_from_checkpoint = False
+
     async def run(self) -> schemas.Sync:
         """Execute the synchronization process."""
         final_status = SyncJobStatus.FAILED  # Default to failed, will be updated based on outcome
@@ -95,6 +113,9 @@ class SyncOrchestrator:
         """Initialize sync job and start all components."""
         self.sync_context.logger.info("Starting sync job")
 
+        # Resume the source before its generator starts running
+        await self._setup_checkpoints()
+
         # Start the stream (worker pool doesn't need starting)
         await self.stream.start()
 
@@ -115,12 +136,76 @@ class SyncOrchestrator:
             collection_id=self.sync_context.collection.id,
         )
 
+    async def _setup_checkpoints(self) -> None:
+        """Resume from the last checkpoint of an interrupted run and start checkpointing."""
+        source = self.sync_context.source
+        if settings.SYNC_CHECKPOINT_INTERVAL_S <= 0 or not source.supports_checkpoints():
+            return
+
+        async with get_db_context() as db:
+            checkpoint = await sync_cursor_service.get_checkpoint(
+                db=db, sync_id=self.sync_context.sync.id, ctx=self.sync_context.ctx
+            )
+
+        if checkpoint and self.sync_context.force_full_sync:
+            # Orphan cleanup needs every entity, so a full sync starts from the beginning
+            self.sync_context.logger.info("Ignoring checkpoint of interrupted run (full sync)")
+            checkpoint = None
+        if checkpoint:
+            source.resume_from_checkpoint(checkpoint["source_state"])
+            self.resumed_from_checkpoint = True
+            self.sync_context.logger.info(
+                f"⏯️ Resuming interrupted sync from checkpoint of job {checkpoint['sync_job_id']} "
+                f"taken at {checkpoint['taken_at']} "
+                f"({checkpoint['entities_processed']} entities processed)"
+            )
+
+        self.checkpointer = SyncCheckpointer(
+            source=source,
+            stream=self.stream,
+            sync_job_id=self.sync_context.sync_job.id,
+            save=self._save_checkpoint,
+            flush=self._flush_destinations,
+            interval_s=settings.SYNC_CHECKPOINT_INTERVAL_S,
+            logger=self.sync_context.logger,
+            resumed_from=checkpoint,
+        )
+
+    async def _save_checkpoint(self, checkpoint: dict) -> bool:
+        """Store a durable mid-sync checkpoint."""
+        async with get_db_context() as db:
+            return await sync_cursor_service.save_checkpoint(
+                db=db,
+                sync_id=self.sync_context.sync.id,
+                checkpoint_data=checkpoint,
+                ctx=self.sync_context.ctx,
+            )
+
     async def _process_entities(self) -> None:
         """Dispatch to batched or unbatched processing depending on the context flag."""
-        if self.should_batch:
-            await self._process_entities_batched()
-        else:
-            await self._process_entities_unbatched()
+        try:
+            if self.should_batch:
+                await self._process_entities_batched()
+            else:
+                await self._process_entities_unbatched()
+        finally:
+            self._log_file_change_gate_metrics()
+
+    def _log_file_change_gate_metrics(self) -> None:
+        """Export how many file downloads the metadata change detection skipped."""
+        gate = self.sync_context.source.file_change_gate
+        if not gate or not gate.checked:
+            return
+        metrics = gate.metrics()
+        self.sync_context.logger.info(
+            f"📁 FILE_CHANGE_GATE summary: {metrics['unchanged']}/{metrics['checked']} files "
+            f"unchanged, {metrics['bytes_skipped'] / (1024 * 1024):.1f} MB not downloaded",
+            extra={
+                "custom_dimensions": {
+                    f"file_change_gate_{key}": value for key, value in metrics.items()
+                }
+            },
+        )
 
     # ------------------------------ Batched path ------------------------------
     async def _process_entities_batched(self) -> None:  # noqa: C901
@@ -132,8 +217,10 @@ class SyncOrchestrator:
         self.sync_context.logger.info(
             f"Starting pull-based processing from source {self.sync_context.source._name} "
             f"(max workers: {self.worker_pool.max_workers}, "
-            f"batch_size: {self.batch_size}, max_batch_latency_ms: {self.max_batch_latency_ms})"
+            f"batch_size: {self.batch_size}, max_batch_latency_ms: {self.max_batch_latency_ms}, "
+            f"adaptive: {self.batch_controller is not None})"
         )
+        controller_token = self.batch_controller.activate() if self.batch_controller else None
 
         stream_error: Optional[Exception] = None
         pending_tasks: set[asyncio.Task] = set()
@@ -144,7 +231,29 @@ class SyncOrchestrator:
 
         try:
             # Use the pre-created stream (already started in _start_sync)
-            async for entity in self.stream.get_entities():
+            async for entity in self.stream.get_entities(report_stalls=True):
+                if entity is None:
+                    # The producer waits on the memory budget for the bytes of the entities
+                    # buffered here; hand them off instead of waiting for a full batch
+                    if batch_buffer:
+                        pending_tasks = await self._submit_batch_and_trim(
+                            batch_buffer, pending_tasks, source_node
+                        )
+                        batch_buffer = []
+                        flush_deadline = None
+                    continue
+
+                if self.checkpointer:
+                    # A checkpoint waits on the batches holding its entities; submit them
+                    if self.checkpointer.barrier_needed() and batch_buffer:
+                        pending_tasks = await self._submit_batch_and_trim(
+                            batch_buffer, pending_tasks, source_node
+                        )
+                        batch_buffer = []
+                        flush_deadline = None
+                    await self.checkpointer.tick(pending_tasks)
+                    self.checkpointer.entity_pulled()
+
                 try:
                     await self.sync_context.guard_rail.is_allowed(ActionType.ENTITIES)
                 except (UsageLimitExceededException, PaymentRequiredException) as guard_error:
@@ -165,6 +274,7 @@ class SyncOrchestrator:
                 if entity.airweave_system_metadata.should_skip:
                     self.sync_context.logger.debug(f"Skipping entity: {entity.entity_id}")
                     await self.sync_context.progress.increment("skipped", 1)
+                    await self.stream.release([entity])
                     continue
 
                 # Accumulate into batch
@@ -177,7 +287,7 @@ class SyncOrchestrator:
                     )
 
                 # Size-based flush
-                if len(batch_buffer) >= self.batch_size:
+                if len(batch_buffer) >= self._current_batch_size():
                     pending_tasks = await self._submit_batch_and_trim(
                         batch_buffer, pending_tasks, source_node
                     )
@@ -215,10 +325,66 @@ class SyncOrchestrator:
             # Clean up stream and tasks
             await self._finalize_stream_and_tasks(self.stream, stream_error, pending_tasks)
 
+            if controller_token is not None:
+                self.batch_controller.deactivate(controller_token)
+                self._log_batch_controller_metrics()
+
             # Re-raise error if there was one
             if stream_error:
                 raise stream_error
 
+    def _current_batch_size(self) -> int:
+        """Batch size to flush at, as tuned by the adaptive controller if enabled."""
+        if self.batch_controller:
+            return self.batch_controller.batch_size
+        return self.batch_size
+
+    def _max_in_flight(self) -> int:
+        """Maximum number of batches in flight, as tuned by the adaptive controller if enabled."""
+        if self.batch_controller:
+            return self.batch_controller.max_in_flight
+        return self.worker_pool.max_workers
+
+    async def _process_batch(self, entities: list, source_node: schemas.DagNode) -> dict:
+        """Process a micro-batch, then return its bytes to the stream's memory budget."""
+        try:
+            if self.batch_controller:
+                return await self._process_batch_measured(entities, source_node)
+            return await self.entity_processor.process_batch(
+                entities=entities,
+                source_node=source_node,
+                sync_context=self.sync_context,
+            )
+        finally:
+            await self.stream.release(entities)
+
+    async def _process_batch_measured(self, entities: list, source_node: schemas.DagNode) -> dict:
+        """Process a micro-batch and report its latency to the adaptive controller."""
+        started = asyncio.get_running_loop().time()
+        result = await self.entity_processor.process_batch(
+            entities=entities,
+            source_node=source_node,
+            sync_context=self.sync_context,
+        )
+        self.batch_controller.record_batch(
+            len(entities), asyncio.get_running_loop().time() - started
+        )
+        return result
+
+    def _log_batch_controller_metrics(self) -> None:
+        """Export the adaptive controller's summary as log custom dimensions."""
+        metrics = self.batch_controller.metrics()
+        self.sync_context.logger.info(
+            f"🎛️ ADAPTIVE_BATCHING summary: batch_size {metrics['min_batch_size_used']}-"
+            f"{metrics['max_batch_size_used']}, in-flight {metrics['min_in_flight_used']}-"
+            f"{metrics['max_in_flight_used']}, decisions {metrics['decisions']}",
+            extra={
+                "custom_dimensions": {
+                    f"adaptive_{key}": value for key, value in metrics.items() if value is not None
+                }
+            },
+        )
+
     async def _submit_batch_and_trim(
         self,
         batch: list,
@@ -230,14 +396,12 @@ class SyncOrchestrator:
             return pending_tasks
 
         task = await self.worker_pool.submit(
-            self.entity_processor.process_batch,
-            entities=list(batch),
-            source_node=source_node,
-            sync_context=self.sync_context,
+            self._process_batch, entities=list(batch), source_node=source_node
         )
         pending_tasks.add(task)
 
-        if len(pending_tasks) >= self.worker_pool.max_workers:
+        # The adaptive limit can drop below the current number of pending batches
+        while pending_tasks and len(pending_tasks) >= self._max_in_flight():
             pending_tasks = await self._handle_completed_tasks(pending_tasks)
 
         return pending_tasks
@@ -260,6 +424,10 @@ class SyncOrchestrator:
         try:
             # Use the pre-created stream (already started in _start_sync)
             async for entity in self.stream.get_entities():
+                if self.checkpointer:
+                    await self.checkpointer.tick(pending_tasks)
+                    self.checkpointer.entity_pulled()
+
                 try:
                     await self.sync_context.guard_rail.is_allowed(ActionType.ENTITIES)
                 except (UsageLimitExceededException, PaymentRequiredException) as guard_error:
@@ -274,14 +442,12 @@ class SyncOrchestrator:
                 if entity.airweave_system_metadata.should_skip:
                     self.sync_context.logger.debug(f"Skipping entity: {entity.entity_id}")
                     await self.sync_context.progress.increment("skipped", 1)
+                    await self.stream.release([entity])
                     continue
 
                 # Submit per-entity processing
                 task = await self.worker_pool.submit(
-                    self.entity_processor.process,
-                    entity=entity,
-                    source_node=source_node,
-                    sync_context=self.sync_context,
+                    self._process_entity, entity=entity, source_node=source_node
                 )
                 pending_tasks.add(task)
 
@@ -303,6 +469,17 @@ class SyncOrchestrator:
             if stream_error:
                 raise stream_error
 
+    async def _process_entity(
+        self, entity: BaseEntity, source_node: schemas.DagNode
+    ) -> List[BaseEntity]:
+        """Process one entity, then return its bytes to the stream's memory budget."""
+        try:
+            return await self.entity_processor.process(
+                entity=entity, source_node=source_node, sync_context=self.sync_context
+            )
+        finally:
+            await self.stream.release([entity])
+
     # ----------------------------- Shared helpers -----------------------------
     async def _handle_completed_tasks(self, pending_tasks: set[asyncio.Task]) -> set[asyncio.Task]:
         """Handle completed tasks and check for exceptions."""
@@ -351,6 +528,9 @@ class SyncOrchestrator:
         # 3. Wait for all tasks to complete
         await self._wait_for_remaining_tasks(pending_tasks)
 
+        # 4. Return the bytes of entities never processed (unsubmitted or cancelled)
+        await stream.release_all()
+
     async def _cleanup_orphaned_entities_if_needed(self) -> None:
         """Cleanup orphaned entities based on sync type."""
         has_cursor_data = bool(
@@ -360,6 +540,13 @@ class SyncOrchestrator:
         )
         should_cleanup = self.sync_context.force_full_sync or not has_cursor_data
 
+        if should_cleanup and self.resumed_from_checkpoint:
+            # Entities before the checkpoint were not streamed again and would look orphaned
+            self.sync_context.logger.info(
+                "⏩ Skipping orphaned entity cleanup for sync resumed from a checkpoint"
+            )
+            return
+
         if should_cleanup:
             if self.sync_context.force_full_sync:
                 self.sync_context.logger.info(
@@ -397,9 +584,19 @@ class SyncOrchestrator:
         """Mark sync job as completed with final statistics."""
         stats = getattr(self.sync_context.progress, "stats", None)
 
+        # Destination writes must be durable before the cursor moves past them
+        await self._flush_destinations()
+
         # Save cursor data if it exists (for incremental syncs)
         await self._save_cursor_data()
 
+        # The run completed, the next one must not resume from a mid-sync checkpoint
+        if self.checkpointer:
+            async with get_db_context() as db:
+                await sync_cursor_service.clear_checkpoint(
+                    db=db, sync_id=self.sync_context.sync.id, ctx=self.sync_context.ctx
+                )
+
         await sync_job_service.update_status(
             sync_job_id=self.sync_context.sync_job.id,
             status=SyncJobStatus.COMPLETED,
@@ -408,6 +605,9 @@ class SyncOrchestrator:
             stats=stats,
         )
 
+        # New data is searchable now; make cached search responses for this collection stale
+        await search_cache.invalidate_collection(self.sync_context.collection.id)
+
         # Track sync completed
         from airweave.analytics import business_events
 
@@ -440,6 +640,11 @@ class SyncOrchestrator:
             f"Completed sync job {self.sync_context.sync_job.id} successfully. Stats: {stats}"
         )
 
+    async def _flush_destinations(self) -> None:
+        """Wait for all destination writes still in flight to be durable."""
+        for destination in self.sync_context.destinations:
+            await destination.flush()
+
     async def _save_cursor_data(self) -> None:
         """Save cursor data to database if it exists."""
         if not hasattr(self.sync_context, "cursor") or not self.sync_context.cursor.cursor_data:
@@ -492,6 +697,9 @@ class SyncOrchestrator:
             stats=stats,
         )
 
+        # Entities written before the failure are searchable; drop responses cached without them
+        await search_cache.invalidate_collection(self.sync_context.collection.id)
+
         # Calculate duration from start to failure
         if not self.sync_context.sync_job.started_at:
             # This can happen if failure occurs during _start_sync before
@@ -531,6 +739,9 @@ class SyncOrchestrator:
             completed_at=utc_now_naive(),
         )
 
+        # Entities written before the cancellation are searchable as well
+        await search_cache.invalidate_collection(self.sync_context.collection.id)
+
         # 4. Track sync cancelled
         if not self.sync_context.sync_job.started_at:
             # This can happen if cancellation occurs during _start_sync before
@@ -0,0 +1,183 @@
+"""Optional process pool for the CPU-bound stages of a sync.
+
+A sync runs in a single asyncio loop, so markdown conversion, chunking (Chonkie + tiktoken)
+and BM25 sparse embedding all compete for one GIL; extra threads barely help. When
+SYNC_PROCESS_POOL_SIZE is above zero, file transforms and sparse embeddings run in a
+shared pool of worker processes instead:
+
+- Entities are pickled. Pydantic models pickle their field state and are restored without
+  re-validation, so the payload is compact and cheap to rebuild. Chunk classes generated at
+  runtime are created in the parent before dispatch, so chunks produced by a worker can be
+  unpickled by reference.
+- Each transform returns the chunks of one parent entity as soon as it finishes, so results
+  stream back per parent and progress is accounted exactly as for in-process transforms.
+- Sparse embeddings are sharded across workers and returned as fastembed SparseEmbedding
+  objects (two numpy arrays each).
+- Work that cannot be pickled, or that fails because the pool broke, falls back to running
+  in-process. A broken pool is replaced on next use.
+
+Workers use the spawn start method: forking a process that runs an event loop and thread
+pools is unsafe.
+"""
+
+import asyncio
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+
+from airweave.core.config import settings
+from airweave.core.logging import ContextualLogger, logger
+from airweave.platform.entities._base import BaseEntity, CodeFileEntity, FileEntity
+
+if TYPE_CHECKING:
+    from fastembed import SparseEmbedding
+
+    from airweave.platform.embedding_models._base import BaseEmbeddingModel
+
+# Minimum texts per sparse-embedding task; smaller shards cost more in IPC than they save
+MIN_SPARSE_SHARD_SIZE = 64
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def process_pool_enabled() -> bool:
+    """Whether CPU-bound sync stages run in worker processes."""
+    return settings.SYNC_PROCESS_POOL_SIZE > 0
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get or create the shared process pool."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=settings.SYNC_PROCESS_POOL_SIZE,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+    return _pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool, if it was started."""
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _pool
+
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run(func: Callable[..., Any], *args: Any) -> Any:
+    pool = get_process_pool()
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
+
+
+# ---------------------------------------------------------------------------- parent side
+
+
+def _prepare_result_classes(entity: BaseEntity) -> None:
+    """Create the chunk classes a worker may return, so they unpickle in this process."""
+    if isinstance(entity, FileEntity) and not isinstance(entity, CodeFileEntity):
+        type(entity).create_unified_chunk_model()
+
+
+async def transform_in_process_pool(
+    entity: BaseEntity, logger: ContextualLogger
+) -> List[BaseEntity]:
+    """Transform a file entity in a worker process.
+
+    Falls back to an in-process transform if the entity cannot be pickled or the pool broke.
+    Errors raised by the transformer itself propagate unchanged.
+    """
+    from airweave.platform.sync.router import transform_file_entity
+
+    try:
+        _prepare_result_classes(entity)
+        payload = pickle.dumps(entity, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.debug(f"Entity {entity.entity_id} is not picklable ({e}), transforming in-process")
+        return await transform_file_entity(entity, logger)
+
+    try:
+        result = await _run(_transform_in_worker, payload)
+    except BrokenProcessPool:
+        logger.warning(f"Process pool broke, transforming {entity.entity_id} in-process")
+        return await transform_file_entity(entity, logger)
+
+    return pickle.loads(result)
+
+
+async def sparse_embed_in_process_pool(
+    texts: List[str], fallback_model: "BaseEmbeddingModel", logger: ContextualLogger
+) -> List["SparseEmbedding"]:
+    """Compute BM25 sparse embeddings in worker processes, preserving input order.
+
+    Falls back to ``fallback_model`` in-process if the pool broke or a shard could not be
+    pickled.
+    """
+    if not texts:
+        return []
+
+    workers = settings.SYNC_PROCESS_POOL_SIZE
+    shard_size = max(MIN_SPARSE_SHARD_SIZE, -(-len(texts) // workers))
+    shards = [texts[i : i + shard_size] for i in range(0, len(texts), shard_size)]
+
+    try:
+        results = await asyncio.gather(*[_run(_sparse_embed_in_worker, shard) for shard in shards])
+    except (BrokenProcessPool, pickle.PicklingError) as e:
+        logger.warning(f"Process pool failed ({e}), sparse-embedding {len(texts)} texts in-process")
+        return list(await fallback_model.embed_many(texts))
+    return [embedding for shard in results for embedding in shard]
+
+
+# ---------------------------------------------------------------------------- worker side
+
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_sparse_model = None
+
+
+def _init_worker() -> None:
+    """Give each worker one long-lived event loop for the async transformers."""
+    global _worker_loop
+
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+
+def _transform_in_worker(payload: bytes) -> bytes:
+    from airweave.platform.sync.router import transform_file_entity
+
+    entity = pickle.loads(payload)
+    worker_logger = logger.with_context(component="sync_process_pool")
+    children = _worker_loop.run_until_complete(transform_file_entity(entity, worker_logger))
+    return pickle.dumps(children, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _sparse_embed_in_worker(texts: List[str]) -> List["SparseEmbedding"]:
+    global _worker_sparse_model
+
+    if _worker_sparse_model is None:
+        from fastembed import SparseTextEmbedding
+
+        _worker_sparse_model = SparseTextEmbedding("Qdrant/bm25")
+    return list(_worker_sparse_model.embed(texts))
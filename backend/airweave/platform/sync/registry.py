@@ -0,0 +1,260 @@
+"""Process-wide registry of entity definitions, transformers and DAG route tables.
+
+Every sync needs the same lookup tables: entity class to entity definition id, transformer
+id to transformer callable, and the routing table of its DAG. Building them per sync means
+loading every definition row and resolving every class again. The registry builds them once
+per process and shares them between syncs.
+
+The registry is versioned by the row count and latest modification time of the
+``entity_definition`` and ``transformer`` tables (one cheap query). When a platform sync
+changes the definitions, the next ``refresh`` rebuilds the tables; otherwise it is a no-op.
+
+Dynamically generated Parent/Chunk/UnifiedChunk classes of file entities map to the
+definition of the file entity they were generated from. Generated classes that already exist
+are registered on refresh, classes created later are resolved by (module, name) on first
+lookup and cached, so every lookup after the first is a single dictionary access.
+"""
+
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from airweave import crud
+from airweave.core.constants.reserved_ids import RESERVED_TABLE_ENTITY_ID
+from airweave.models.entity_definition import EntityDefinition
+from airweave.models.transformer import Transformer
+from airweave.platform.entities._base import BaseEntity, FileEntity, PolymorphicEntity
+from airweave.platform.locator import resource_locator
+from airweave.schemas.dag import DagNode, NodeType, SyncDag
+
+# Suffixes of classes generated from a FileEntity subclass, longest first so that
+# "UnifiedChunk" is not mistaken for "Chunk"
+_GENERATED_SUFFIXES = ("UnifiedChunk", "Parent", "Chunk")
+
+# DAGs change rarely, but a worker runs syncs for many of them
+_MAX_ROUTE_TABLES = 1024
+
+RouteKey = Tuple[UUID, UUID]
+
+
+@dataclass(frozen=True)
+class RouteTable:
+    """Precompiled routing for one DAG.
+
+    Attributes:
+        routes: (producer node id, entity definition id) to consumer node id, or None when
+            the entity is not routed further
+        nodes: Node id to node
+    """
+
+    routes: Dict[RouteKey, Optional[UUID]]
+    nodes: Dict[UUID, DagNode]
+
+
+def _generated_base_name(class_name: str) -> Optional[str]:
+    """Name of the FileEntity a generated class was created from, if it is a generated class."""
+    for suffix in _GENERATED_SUFFIXES:
+        if class_name.endswith(suffix) and len(class_name) > len(suffix):
+            return f"{class_name[: -len(suffix)]}Entity"
+    return None
+
+
+def compile_route_table(dag: SyncDag) -> RouteTable:
+    """Compile the execution route of a DAG.
+
+    Maps a tuple of a producer node id with an entity definition id to a consumer node id.
+    If the entity is sent to a destination, the route is set to None, this stops the entity
+    from being routed further.
+
+    Raises:
+        ValueError: If an entity node has multiple outbound edges to non-destination nodes
+    """
+    nodes = {node.id: node for node in dag.nodes}
+    edges_from = defaultdict(list)
+    edges_to = defaultdict(list)
+    for edge in dag.edges:
+        edges_from[edge.from_node_id].append(edge)
+        edges_to[edge.to_node_id].append(edge)
+
+    routes: Dict[RouteKey, Optional[UUID]] = {}
+    for node in dag.nodes:
+        if node.type != NodeType.entity:
+            continue
+
+        producer = edges_to[node.id][0].from_node_id
+        edges_outwards = edges_from[node.id]
+
+        if not edges_outwards or all(
+            nodes[edge.to_node_id].type == NodeType.destination for edge in edges_outwards
+        ):
+            # Terminal node, or all outgoing edges go to destinations: stop routing
+            routes[(producer, node.entity_definition_id)] = None
+        elif len(edges_outwards) == 1:
+            routes[(producer, node.entity_definition_id)] = edges_outwards[0].to_node_id
+        else:
+            raise ValueError(
+                f"Entity node {node.id} has multiple outbound edges to non-destination nodes."
+            )
+
+    return RouteTable(routes=routes, nodes=nodes)
+
+
+def _dag_key(dag: SyncDag) -> Hashable:
+    """Structural cache key of a DAG (DAGs carry no modification timestamp)."""
+    return (
+        dag.id,
+        tuple(
+            (node.id, node.type, node.entity_definition_id, node.transformer_id)
+            for node in dag.nodes
+        ),
+        tuple((edge.from_node_id, edge.to_node_id) for edge in dag.edges),
+    )
+
+
+class SyncRegistry:
+    """Versioned, process-wide lookup tables for syncs."""
+
+    def __init__(self) -> None:
+        """Initialize empty tables."""
+        self._lock = threading.Lock()
+        self._version: Optional[Tuple] = None
+        self._entity_map: Dict[type[BaseEntity], UUID] = {}
+        self._entity_ids_by_name: Dict[Tuple[str, str], UUID] = {}
+        self._transformers: Dict[UUID, Callable] = {}
+        self._transformers_by_method: Dict[str, Callable] = {}
+        self._route_tables: "OrderedDict[Hashable, RouteTable]" = OrderedDict()
+
+    @property
+    def version(self) -> Optional[Tuple]:
+        """Version of the loaded definitions, None before the first refresh."""
+        return self._version
+
+    @property
+    def entity_map(self) -> Dict[type[BaseEntity], UUID]:
+        """Entity class to entity definition id, including generated file entity classes."""
+        return self._entity_map
+
+    @property
+    def transformers_by_method(self) -> Dict[str, Callable]:
+        """Transformer method name to transformer callable."""
+        return self._transformers_by_method
+
+    # ------------------------------------------------------------------ loading
+
+    @staticmethod
+    async def _load_version(db: AsyncSession) -> Tuple:
+        entity_stats = select(
+            func.count(EntityDefinition.id), func.max(EntityDefinition.modified_at)
+        ).subquery()
+        transformer_stats = select(
+            func.count(Transformer.id), func.max(Transformer.modified_at)
+        ).subquery()
+        result = await db.execute(select(entity_stats, transformer_stats))
+        return tuple(result.one())
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Rebuild the definition tables if the definitions changed since the last refresh."""
+        version = await self._load_version(db)
+        if version == self._version:
+            return
+
+        entity_map: Dict[type[BaseEntity], UUID] = {}
+        entity_ids_by_name: Dict[Tuple[str, str], UUID] = {}
+        for entity_definition in await crud.entity_definition.get_all(db):
+            if entity_definition.id == RESERVED_TABLE_ENTITY_ID:
+                continue
+            entity_class = resource_locator.get_entity_definition(entity_definition)
+            entity_map[entity_class] = entity_definition.id
+            entity_ids_by_name[(entity_class.__module__, entity_class.__name__)] = (
+                entity_definition.id
+            )
+
+        # Generated classes with a definition of their own keep it
+        for entity_class, definition_id in list(entity_map.items()):
+            if issubclass(entity_class, FileEntity):
+                self._register_generated_classes(entity_class, definition_id, entity_map)
+
+        transformers: Dict[UUID, Callable] = {}
+        transformers_by_method: Dict[str, Callable] = {}
+        for transformer in await crud.transformer.get_all(db):
+            transformer_callable = resource_locator.get_transformer(transformer)
+            transformers[transformer.id] = transformer_callable
+            transformers_by_method[transformer.method_name] = transformer_callable
+
+        with self._lock:
+            self._entity_map = entity_map
+            self._entity_ids_by_name = entity_ids_by_name
+            self._transformers = transformers
+            self._transformers_by_method = transformers_by_method
+            self._version = version
+
+    @staticmethod
+    def _register_generated_classes(
+        entity_class: type[FileEntity],
+        definition_id: UUID,
+        entity_map: Dict[type[BaseEntity], UUID],
+    ) -> None:
+        """Map already generated Parent/Chunk/UnifiedChunk classes of a file entity."""
+        module = sys.modules[entity_class.__module__]
+        prefix = entity_class.__name__.replace("Entity", "")
+        for suffix in _GENERATED_SUFFIXES:
+            generated = getattr(module, f"{prefix}{suffix}", None)
+            if isinstance(generated, type):
+                entity_map.setdefault(generated, definition_id)
+
+    # ------------------------------------------------------------------ lookups
+
+    def get_entity_definition_id(self, entity_type: type) -> UUID:
+        """Get the entity definition id of an entity class.
+
+        Raises:
+            ValueError: If no matching entity definition is found
+        """
+        definition_id = self._entity_map.get(entity_type)
+        if definition_id is not None:
+            return definition_id
+
+        if issubclass(entity_type, PolymorphicEntity):
+            return RESERVED_TABLE_ENTITY_ID
+
+        base_name = _generated_base_name(entity_type.__name__)
+        if base_name:
+            definition_id = self._entity_ids_by_name.get((entity_type.__module__, base_name))
+            if definition_id is not None:
+                self._entity_map[entity_type] = definition_id
+                return definition_id
+
+        raise ValueError(f"No entity definition found for {entity_type}")
+
+    def get_transformer(self, transformer_id: UUID) -> Optional[Callable]:
+        """Get a transformer callable by transformer id."""
+        return self._transformers.get(transformer_id)
+
+    def register_transformer(self, transformer_id: UUID, transformer_callable: Callable) -> None:
+        """Add a transformer that was created after the last refresh."""
+        self._transformers[transformer_id] = transformer_callable
+
+    def get_route_table(self, dag: SyncDag) -> RouteTable:
+        """Get the precompiled route table of a DAG, compiling it on first use."""
+        key = _dag_key(dag)
+        with self._lock:
+            table = self._route_tables.get(key)
+            if table is not None:
+                self._route_tables.move_to_end(key)
+                return table
+
+        table = compile_route_table(dag)
+        with self._lock:
+            self._route_tables[key] = table
+            while len(self._route_tables) > _MAX_ROUTE_TABLES:
+                self._route_tables.popitem(last=False)
+        return table
+
+
+sync_registry = SyncRegistry()
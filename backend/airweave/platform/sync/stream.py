@@ -3,13 +3,21 @@
 import asyncio
 import logging
 from enum import Enum
-from typing import AsyncGenerator, Generic, Optional, TypeVar
+from typing import Any, AsyncGenerator, Dict, Generic, Iterable, Optional, Tuple, TypeVar
 
 from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sync.memory_budget import (
+    StreamMemoryBudget,
+    estimate_entity_bytes,
+    stream_memory_budget,
+)
 from airweave.platform.utils.error_utils import get_error_message
 
 T = TypeVar("T", bound=BaseEntity)
 
+# Returned by _get_next_item when the producer is paused on the memory budget
+_STALLED = object()
+
 
 class StreamState(Enum):
     """State of the async source stream."""
@@ -30,7 +38,12 @@ class AsyncSourceStream(Generic[T]):
     - Consumer: processes entities independently
     - State management: explicit lifecycle states for better control
 
-    Uses async queue to buffer entities and implement backpressure.
+    Uses async queue to buffer entities and implement backpressure. The queue is bounded by
+    item count and, through a memory budget shared with the other streams of the process, by
+    the estimated bytes of the entities. An entity's bytes stay charged after it is taken
+    from the queue, until the consumer has processed it and calls ``release``. A consumer
+    that holds entities back, e.g. to fill a batch, asks ``get_entities`` to report when the
+    producer is paused on the budget, and then hands them off.
     """
 
     def __init__(
@@ -38,6 +51,7 @@ class AsyncSourceStream(Generic[T]):
         source_generator: AsyncGenerator[T, None],
         queue_size: int = 10000,
         logger: Optional[logging.Logger] = None,
+        memory_budget: Optional[StreamMemoryBudget] = None,
     ):
         """Initialize the async source stream.
 
@@ -45,10 +59,25 @@ class AsyncSourceStream(Generic[T]):
             source_generator: The source async generator
             queue_size: Size of the queue connecting producer and consumer
             logger: Optional contextualized logger, falls back to global logger if not provided
+            memory_budget: Byte budget for buffered entities, defaults to the process budget
         """
         self.source_generator = source_generator
-        # Queue is used to buffer entities and implement backpressure
-        self.queue: asyncio.Queue[Optional[T]] = asyncio.Queue(maxsize=queue_size)
+        # Queue is used to buffer entities and implement backpressure; entries carry the
+        # bytes each entity was charged to the memory budget
+        self.queue: asyncio.Queue[Optional[Tuple[T, int]]] = asyncio.Queue(maxsize=queue_size)
+        self.memory_budget = memory_budget or stream_memory_budget
+        # Bytes of the entities in the queue
+        self.buffered_bytes = 0
+        # Bytes charged for entities taken from the queue and not released yet, by id(entity)
+        self._taken_bytes: Dict[int, int] = {}
+        self.taken_bytes = 0
+        # Set while the producer waits on the memory budget and the consumer was not told yet
+        self._budget_stall = asyncio.Event()
+        self.high_water_bytes = 0
+        self.pauses = 0
+        self.paused_seconds = 0.0
+        # Entities received from the source generator so far (the stream position)
+        self.items_produced = 0
         self.producer_task = None
         self.producer_done = asyncio.Event()
         self.producer_exception = None
@@ -81,27 +110,39 @@ class AsyncSourceStream(Generic[T]):
     async def _producer(self):
         """Producer task that fills the queue from the source generator."""
         try:
-            items_produced = 0
             async for item in self.source_generator:
                 # Check if we should stop (cancelled or stopping)
                 if self._state in (StreamState.CANCELLED, StreamState.STOPPING):
                     self.logger.debug(f"Producer stopping early due to state: {self._state}")
                     break
-
-                # Put item in queue, waiting if queue is full.
-                # This is a blocking call, so producer will wait until the queue has space
-                # Effectively, this is a backpressure mechanism.
-                await self.queue.put(item)
-                items_produced += 1
+                self.items_produced += 1
+
+                # Wait until the entity fits the memory budget, then put it in the queue,
+                # waiting if the queue is full. Both block the producer, which is the
+                # backpressure mechanism.
+                weight = estimate_entity_bytes(item)
+                waited = await self.memory_budget.acquire(
+                    weight, lambda: self.held_bytes, on_wait=self._budget_stall.set
+                )
+                self._budget_stall.clear()
+                if waited:
+                    self.pauses += 1
+                    self.paused_seconds += waited
+                self.buffered_bytes += weight
+                self.high_water_bytes = max(self.high_water_bytes, self.buffered_bytes)
+                await self.queue.put((item, weight))
 
                 # Log progress periodically
-                if items_produced % 50 == 0:
+                if self.items_produced % 50 == 0:
                     self.logger.debug(
-                        f"AsyncSourceStream producer progress: {items_produced} items queued, "
-                        f"queue size: {self.queue.qsize()}/{self.queue.maxsize}"
+                        f"AsyncSourceStream producer progress: {self.items_produced} items queued, "
+                        f"queue size: {self.queue.qsize()}/{self.queue.maxsize}, "
+                        f"buffered: {self.buffered_bytes / 1024 / 1024:.1f} MB"
                     )
 
-            self.logger.info(f"Source generator exhausted after producing {items_produced} items")
+            self.logger.info(
+                f"Source generator exhausted after producing {self.items_produced} items"
+            )
         except asyncio.CancelledError:
             self.logger.info("Producer cancelled")
             async with self._state_lock:
@@ -157,6 +198,7 @@ class AsyncSourceStream(Generic[T]):
 
         # Drain queue to prevent deadlock
         await self._drain_queue()
+        self._log_memory_metrics()
 
     async def stop(self):
         """Stop the producer gracefully and clean up resources."""
@@ -187,14 +229,50 @@ class AsyncSourceStream(Generic[T]):
             if self._state == StreamState.STOPPING:
                 self._state = StreamState.FINISHED
 
-    async def get_entities(self) -> AsyncGenerator[T, None]:
-        """Get entities with timeout to prevent cleanup deadlock."""
+        self._log_memory_metrics()
+
+    @property
+    def held_bytes(self) -> int:
+        """Bytes charged to the budget for this stream: queued, taken and not released."""
+        return self.buffered_bytes + self.taken_bytes
+
+    def memory_metrics(self) -> Dict[str, Any]:
+        """High-water mark and producer pauses of this stream and of the shared budget."""
+        return {
+            "stream_high_water_bytes": self.high_water_bytes,
+            "stream_pauses": self.pauses,
+            "stream_paused_seconds": round(self.paused_seconds, 3),
+            **{f"shared_{key}": value for key, value in self.memory_budget.metrics().items()},
+        }
+
+    def _log_memory_metrics(self) -> None:
+        """Export the memory metrics as log custom dimensions."""
+        metrics = self.memory_metrics()
+        self.logger.info(
+            f"AsyncSourceStream buffered at most {self.high_water_bytes / 1024 / 1024:.1f} MB, "
+            f"producer paused {self.pauses} times ({self.paused_seconds:.1f}s) "
+            f"on the memory budget",
+            extra={"custom_dimensions": metrics},
+        )
+
+    async def get_entities(self, report_stalls: bool = False) -> AsyncGenerator[Optional[T], None]:
+        """Get entities with timeout to prevent cleanup deadlock.
+
+        Args:
+            report_stalls: Yield None once whenever the producer pauses on the memory budget
+                with nothing left in the queue. The consumer must then hand off the entities
+                it holds back, whose bytes keep the producer paused until released.
+        """
         if not self.producer_task:
             await self.start()
 
         try:
             while True:
-                item = await self._get_next_item()
+                item = await self._get_next_item(report_stalls)
+
+                if item is _STALLED:
+                    yield None
+                    continue
 
                 if item is None:
                     # End of stream
@@ -212,25 +290,45 @@ class AsyncSourceStream(Generic[T]):
         finally:
             await self._drain_queue()
 
-    async def _get_next_item(self) -> Optional[T]:
+    async def _get_next_item(self, report_stalls: bool = False) -> Any:
         """Get next item from queue with timeout handling.
 
+        Args:
+            report_stalls: Return _STALLED when the producer pauses on the memory budget and
+                the queue is empty
+
         Returns:
-            The next item, or None if stream is complete
+            The next item, _STALLED, or None if stream is complete
         """
         while True:
+            if report_stalls and self._budget_stall.is_set() and self.queue.empty():
+                self._budget_stall.clear()
+                return _STALLED
+
+            get = asyncio.ensure_future(self.queue.get())
+            waiters = {get}
+            if report_stalls:
+                waiters.add(asyncio.ensure_future(self._budget_stall.wait()))
             try:
-                # Try to get with timeout
-                item = await asyncio.wait_for(self.queue.get(), timeout=2)
+                await asyncio.wait(waiters, timeout=2, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+            if get.done() and not get.cancelled():
                 self.queue.task_done()
+                entry = get.result()
+                if entry is None:
+                    return None
+                item, weight = entry
+                self.buffered_bytes -= weight
+                self._taken_bytes[id(item)] = weight
+                self.taken_bytes += weight
                 return item
 
-            except asyncio.TimeoutError:
-                # Check if we should stop waiting
-                if await self._should_stop_waiting():
-                    return None
-                # Otherwise continue waiting
-                continue
+            # Stalled or timed out; check if we should stop waiting
+            if not self._budget_stall.is_set() and await self._should_stop_waiting():
+                return None
 
     async def _should_stop_waiting(self) -> bool:
         """Check if we should stop waiting for items.
@@ -252,6 +350,23 @@ class AsyncSourceStream(Generic[T]):
         except asyncio.QueueEmpty:
             return True  # Queue empty and producer done
 
+    async def release(self, entities: Iterable[T]) -> None:
+        """Return the bytes of entities taken from the stream to the memory budget.
+
+        Call once the entities are processed and their temp files are cleaned up; releasing
+        an entity twice, or one that was never charged, is a no-op.
+        """
+        weight = sum(self._taken_bytes.pop(id(entity), 0) for entity in entities)
+        self.taken_bytes -= weight
+        if weight:
+            await self.memory_budget.release(weight)
+
+    async def release_all(self) -> None:
+        """Return the bytes of every entity taken from the stream and not released yet."""
+        weight, self._taken_bytes, self.taken_bytes = self.taken_bytes, {}, 0
+        if weight:
+            await self.memory_budget.release(weight)
+
     def _check_producer_exception(self) -> None:
         """Check and raise any producer exception."""
         if self.producer_exception:
@@ -262,7 +377,10 @@ class AsyncSourceStream(Generic[T]):
         """Drain any remaining items to prevent producer deadlock."""
         try:
             while not self.queue.empty():
-                self.queue.get_nowait()
+                entry = self.queue.get_nowait()
                 self.queue.task_done()
+                if entry is not None:
+                    self.buffered_bytes -= entry[1]
+                    await self.memory_budget.release(entry[1])
         except Exception:
             pass  # Best effort cleanup
@@ -10,6 +10,7 @@ from temporalio.worker import Worker
 from airweave.core.config import settings
 from airweave.core.logging import logger
 from airweave.platform.entities._base import ensure_file_entity_models
+from airweave.platform.sync.process_pool import shutdown_process_pool
 from airweave.platform.temporal.activities import (
     create_sync_job_activity,
     mark_sync_job_cancelled_activity,
@@ -75,6 +76,7 @@ class TemporalWorker:
 
         # Always close temporal client to prevent resource leaks
         await temporal_client.close()
+        shutdown_process_pool()
 
     def _get_sandbox_config(self):
         """Determine the appropriate sandbox configuration."""
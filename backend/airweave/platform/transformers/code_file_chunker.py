@@ -1,38 +1,39 @@
-"""Code file chunker."""
+"""Code file chunker.
+
+Tokenizing and chunking a large file is CPU-bound and takes seconds, so it runs in the shared
+CPU thread pool instead of on the event loop (with SYNC_PROCESS_POOL_SIZE set, the router
+already runs the whole transform in a worker process). Chunk entities are shallow copies of
+the file: fields are shared with it, except the content and the containers a chunk changes
+or later sync stages mutate.
+"""
 
 import os
-from copy import deepcopy
-from typing import List
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from chonkie import CodeChunker, SemanticChunker
+from chonkie import CodeChunker
 
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import CodeFileEntity
+from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.transformers.semantic_boundaries import get_boundary_chunker
 from airweave.platform.transformers.utils import (
     MAX_CHUNK_SIZE,
     METADATA_SIZE,
     count_tokens,
 )
 
-# Module-level shared chunkers
-_shared_semantic_chunker = None
+# Module-level shared chunkers. A chunker keeps per-call state (the code chunker swaps its
+# parser for the detected language), so each one is used by one thread at a time.
 _shared_code_chunker = None
+_semantic_chunker_lock = threading.Lock()
+_code_chunker_lock = threading.Lock()
 
 
 def get_shared_semantic_chunker(chunk_size_limit: int):
-    """Get or create a shared semantic chunker for text files."""
-    global _shared_semantic_chunker
-    if _shared_semantic_chunker is None or _shared_semantic_chunker.chunk_size != chunk_size_limit:
-        _shared_semantic_chunker = SemanticChunker(
-            tokenizer_or_token_counter=count_tokens,
-            chunk_size=chunk_size_limit,
-            min_sentences=1,
-            threshold=0.5,
-            mode="window",
-            similarity_window=2,
-        )
-    return _shared_semantic_chunker
+    """Get the shared semantic chunker for text files, see semantic_boundaries."""
+    return get_boundary_chunker(chunk_size_limit)
 
 
 def get_shared_code_chunker(chunk_size_limit: int):
@@ -46,6 +47,42 @@ def get_shared_code_chunker(chunk_size_limit: int):
     return _shared_code_chunker
 
 
+def _chunk_content(
+    content: str, is_text_file: bool, chunk_size_limit: int
+) -> Tuple[int, Optional[List[Tuple[str, int, int, int]]]]:
+    """Count the tokens of a file's content and chunk it if it exceeds the limit.
+
+    Runs in a worker thread.
+
+    Returns:
+        The token count, and the chunks as (text, token count, start, end), or None if the
+        content fits in one chunk
+    """
+    content_token_count = count_tokens(content)
+    if content_token_count <= chunk_size_limit:
+        return content_token_count, None
+
+    if is_text_file:
+        with _semantic_chunker_lock:
+            chunks = get_shared_semantic_chunker(chunk_size_limit).chunk(content)
+    else:
+        with _code_chunker_lock:
+            chunks = get_shared_code_chunker(chunk_size_limit).chunk(content)
+    return content_token_count, [
+        (chunk.text, chunk.token_count, chunk.start_index, chunk.end_index) for chunk in chunks
+    ]
+
+
+def _chunk_entity(file: CodeFileEntity, template: CodeFileEntity, **update: Any) -> CodeFileEntity:
+    """Create a chunk of a file from its content-less template."""
+    for name, value in template.__dict__.items():
+        if name not in update and isinstance(value, (list, dict)):
+            update[name] = value.copy()
+    if file.airweave_system_metadata is not None:
+        update["airweave_system_metadata"] = file.airweave_system_metadata.model_copy(deep=True)
+    return template.model_copy(update=update)
+
+
 @transformer(name="Code File Chunker")
 async def code_file_chunker(file: CodeFileEntity, logger: ContextualLogger) -> List[CodeFileEntity]:
     """Chunk a code file.
@@ -69,37 +106,30 @@ async def code_file_chunker(file: CodeFileEntity, logger: ContextualLogger) -> L
         logger.debug(f"File content is None for {file.name}, returning empty list")
         return []
 
-    # Count tokens in just the content (not the entire entity)
-    content_token_count = count_tokens(file.content)
+    # Check if this is a text file by extension
+    file_extension = os.path.splitext(file.name)[1].lower().lstrip(".")
+    is_text_file = file_extension in ["txt", "text", "csv"]
     chunk_size_limit = MAX_CHUNK_SIZE - METADATA_SIZE  # Leave room for metadata
+
+    # Count tokens in just the content (not the entire entity), and chunk if needed
+    content_token_count, chunks = await run_in_thread_pool(
+        _chunk_content, file.content, is_text_file, chunk_size_limit
+    )
     logger.debug(
         f"File {file.name} content has {content_token_count} tokens, "
         f"chunk limit is {chunk_size_limit}"
     )
 
     # If the content is small enough to fit in one chunk, return it as is
-    if content_token_count <= chunk_size_limit:
+    if chunks is None:
         logger.debug(
             f"File {file.name} content is small enough ({content_token_count} tokens), "
             f"no chunking needed"
         )
         return [file]
 
-    # Check if this is a text file by extension
-    file_extension = os.path.splitext(file.name)[1].lower().lstrip(".")
-    is_text_file = file_extension in ["txt", "text", "csv"]
-    logger.debug(f"File {file.name} has extension {file_extension}, is_text_file={is_text_file}")
-
-    if is_text_file:
-        logger.debug(f"Using semantic chunker for text file {file.name}")
-        semantic_chunker = get_shared_semantic_chunker(chunk_size_limit)  # Use shared
-        chunks = semantic_chunker.chunk(file.content)
-        logger.debug(f"Semantic chunker produced {len(chunks)} chunks")
-    else:
-        logger.debug(f"Using code chunker for code file {file.name}")
-        code_chunker = get_shared_code_chunker(chunk_size_limit)  # Use shared
-        chunks = code_chunker.chunk(file.content)
-        logger.debug(f"Code chunker produced {len(chunks)} chunks")
+    chunker_name = "Semantic" if is_text_file else "Code"
+    logger.debug(f"{chunker_name} chunker produced {len(chunks)} chunks for {file.name}")
 
     if not chunks:  # If chunking failed or returned empty, return original
         logger.warning(
@@ -111,37 +141,31 @@ async def code_file_chunker(file: CodeFileEntity, logger: ContextualLogger) -> L
     chunked_files = []
     total_chunks = len(chunks)
     logger.debug(f"Creating {total_chunks} chunked entities for {file.name}")
+    template = file.model_copy(update={"content": None})
+    metadata: Dict[str, Any] = file.metadata or {}
 
-    for idx, chunk in enumerate(chunks):
-        # Create a deep copy of the original file
-        chunked_file = deepcopy(file)
-
-        # Update the content with just this chunk
-        chunked_file.content = chunk.text
-        chunk_token_count = count_tokens(chunked_file.content)
-
+    for idx, (text, chunk_token_count, start_index, end_index) in enumerate(chunks):
         logger.debug(
             f"Chunk {idx + 1}/{total_chunks} for {file.name}: {chunk_token_count} tokens, "
-            f"span: {chunk.start_index}-{chunk.end_index}"
+            f"span: {start_index}-{end_index}"
         )
 
-        # Add chunk metadata to entity metadata
-        if chunked_file.metadata is None:
-            chunked_file.metadata = {}
-
-        chunked_file.metadata.update(
-            {
+        chunked_file = _chunk_entity(
+            file,
+            template,
+            # Just this chunk's content, and a name indicating it's a chunk
+            content=text,
+            name=f"{file.name} (Chunk {idx + 1}/{total_chunks})",
+            # Add chunk metadata to entity metadata
+            metadata={
+                **metadata,
                 "chunk_index": idx + 1,
                 "total_chunks": total_chunks,
                 "original_file_id": file.file_id,
-                "chunk_start_index": chunk.start_index,
-                "chunk_end_index": chunk.end_index,
-            }
+                "chunk_start_index": start_index,
+                "chunk_end_index": end_index,
+            },
         )
-
-        # Update name to indicate it's a chunk
-        chunked_file.name = f"{file.name} (Chunk {idx + 1}/{total_chunks})"
-
         chunked_files.append(chunked_file)
 
     logger.debug(f"Completed chunking {file.name} into {len(chunked_files)} chunks")
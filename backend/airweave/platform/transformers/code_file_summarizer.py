@@ -1,16 +1,12 @@
 """Code file summarizer."""
 
-import logging
-
-from anthropic import AsyncAnthropic
-from openai import AsyncOpenAI
+from typing import List
 
 from airweave.core.config import settings
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import CodeFileEntity
-
-logger = logging.getLogger(__name__)
+from airweave.platform.transformers.code_summary_service import code_summary_service
 
 
 @transformer(name="Code File Summarizer")
@@ -22,59 +18,25 @@ async def code_file_summarizer(file: CodeFileEntity, logger: ContextualLogger) -
         logger.debug("Code summarizer is disabled, skipping summarization")
         return file
 
-    PROMPT = f"""
-    Summarize the following code file in a short and concise manner. Just return the smallest
-    possible summary, do not include any other text:
-    ```
-    {file.content}
-    ```
-
-    """
+    await summarize_code_files([file], logger)
+    logger.debug(f"Completed code file summarization for {file.name}")
 
-    file_summary = None
-    if settings.ANTHROPIC_API_KEY:
-        logger.debug("Using Anthropic API for code summarization")
-        client = AsyncAnthropic(
-            api_key=settings.ANTHROPIC_API_KEY,
-        )
-        # Get the summary
-        try:
-            logger.debug("Sending request to Anthropic API")
-            summary = await client.messages.create(
-                max_tokens=8192,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": PROMPT,
-                    }
-                ],
-                model="claude-3-5-haiku-20241022",
-            )
-            file_summary = summary.content[0].text
-            logger.debug(f"Received summary from Anthropic API, length: {len(file_summary)}")
-        except Exception as e:
-            logger.error(f"Error using Anthropic API: {str(e)}")
-            raise
+    return file
 
-    else:
-        logger.debug("Using OpenAI API for code summarization")
-        client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
-        # Get the summary
-        try:
-            logger.debug("Sending request to OpenAI API")
-            summary = await client.chat.completions.create(
-                model="gpt-5-nano",
-                messages=[{"role": "user", "content": PROMPT}],
-            )
-            file_summary = summary.choices[0].message.content
-            logger.debug(f"Received summary from OpenAI API, length: {len(file_summary)}")
-        except Exception as e:
-            logger.error(f"Error using OpenAI API: {str(e)}")
-            raise
+async def summarize_code_files(files: List[CodeFileEntity], logger: ContextualLogger) -> None:
+    """Set the summary of code files, e.g. the chunks of one file, with cached summaries.
 
-    # Update the file with the summary
-    file.summary = file_summary
-    logger.debug(f"Completed code file summarization for {file.name}")
+    Files are summarized concurrently through the shared summary service, see
+    code_summary_service.
+    """
+    try:
+        summaries = await code_summary_service.summarize_many(
+            [file.content for file in files], logger
+        )
+    except Exception as e:
+        logger.error(f"Error using {code_summary_service.provider} API: {str(e)}")
+        raise
 
-    return file
+    for file, summary in zip(files, summaries, strict=True):
+        file.summary = summary
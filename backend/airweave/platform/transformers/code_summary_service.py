@@ -0,0 +1,355 @@
+"""LLM summaries of code files, shared by all syncs of a worker.
+
+Summaries are cached by a hash of the summarized content, the model and the prompt, in an
+in-process LRU and in Redis, so identical content is summarized once per cache TTL: the
+unchanged chunks of a changed file, forced resyncs and other syncs, forks or branches of the
+same repository. A miss goes to the LLM with one SDK client per provider and event loop, at
+most CODE_SUMMARIZER_MAX_CONCURRENT requests at a time, and within a budget of
+CODE_SUMMARIZER_TOKENS_PER_MINUTE, shared between workers through the rate limiter's Redis
+bucket. Identical contents requested concurrently share one request.
+
+Contents of at most CODE_SUMMARIZER_PACK_MAX_TOKENS tokens are packed: requests arriving
+within PACK_WAIT_S of each other are sent together, up to PACK_MAX_ITEMS per request, and
+the model answers with a JSON object of numbered summaries. Contents the answer misses are
+summarized one by one.
+
+Cache failures are logged and treated as misses; LLM failures are raised.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from airweave.core.config import settings
+from airweave.core.logging import ContextualLogger, logger
+from airweave.core.redis_client import redis_client
+from airweave.platform.rate_limiter import SourceRateLimiter, tenant_key
+from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.transformers.utils import count_tokens_batch
+
+ANTHROPIC_MODEL = "claude-3-5-haiku-20241022"
+OPENAI_MODEL = "gpt-5-nano"
+# Part of the cache key; bump it when the prompts change
+PROMPT_VERSION = 1
+# Tokens a summary is assumed to take, charged to the token budget up front
+SUMMARY_TOKENS = 256
+PACK_MAX_ITEMS = 8
+PACK_WAIT_S = 0.05
+LOCAL_CACHE_MAX_ENTRIES = 10_000
+
+SINGLE_PROMPT = """
+    Summarize the following code file in a short and concise manner. Just return the smallest
+    possible summary, do not include any other text:
+    ```
+    {content}
+    ```
+
+    """
+
+PACK_PROMPT = """
+    Summarize each of the following {count} code files in a short and concise manner. Return
+    only a JSON object that maps the number of each file (as a string) to the smallest
+    possible summary of it, do not include any other text.
+
+{files}
+    """
+
+_JSON_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+@dataclass
+class _PackItem:
+    """A content waiting to be sent in a packed request."""
+
+    content: str
+    tokens: int
+    future: asyncio.Future = field(repr=False)
+
+
+class CodeSummaryService:
+    """Cached, rate-limited and packed code summarization."""
+
+    KEY_PREFIX = "code_summary"
+
+    def __init__(self, count_tokens: Callable[[List[str]], List[int]] = count_tokens_batch):
+        """Initialize the local cache; clients and limits are created on first use.
+
+        Args:
+            count_tokens: Counts the tokens of each of a list of contents, for packing and the
+                token budget
+        """
+        self._count_tokens = count_tokens
+        self._local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._pack: List[_PackItem] = []
+        self._pack_flush: Optional[asyncio.TimerHandle] = None
+        self._pack_tasks: Set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._limiter: Optional[SourceRateLimiter] = None
+        self._redis_failed = False
+
+        self.cache_hits = 0
+        self.requests = 0
+        self.packed_requests = 0
+
+    # ----------------------------------------------------------------- provider
+
+    @property
+    def provider(self) -> str:
+        """The LLM provider: Anthropic when its key is set, OpenAI otherwise."""
+        return "anthropic" if settings.ANTHROPIC_API_KEY else "openai"
+
+    @property
+    def model(self) -> str:
+        """The model summaries are made with."""
+        return ANTHROPIC_MODEL if self.provider == "anthropic" else OPENAI_MODEL
+
+    @property
+    def _api_key(self) -> str:
+        if self.provider == "anthropic":
+            return settings.ANTHROPIC_API_KEY
+        return settings.OPENAI_API_KEY or ""
+
+    def _client(self):
+        from airweave.search.providers.registry import provider_registry
+
+        if self.provider == "anthropic":
+            from anthropic import AsyncAnthropic
+
+            return provider_registry.get_client(
+                "anthropic",
+                self._api_key,
+                self.KEY_PREFIX,
+                lambda: AsyncAnthropic(api_key=self._api_key),
+            )
+
+        from openai import AsyncOpenAI
+
+        return provider_registry.get_client(
+            "openai", self._api_key, self.KEY_PREFIX, lambda: AsyncOpenAI(api_key=self._api_key)
+        )
+
+    async def _complete(self, prompt: str, tokens: int) -> Optional[str]:
+        """One completion request, within the concurrency and token limits."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.CODE_SUMMARIZER_MAX_CONCURRENT)
+        if settings.CODE_SUMMARIZER_TOKENS_PER_MINUTE > 0:
+            if self._limiter is None:
+                self._limiter = SourceRateLimiter(
+                    self.KEY_PREFIX,
+                    tenant_key(self.provider, self._api_key),
+                    requests=settings.CODE_SUMMARIZER_TOKENS_PER_MINUTE,
+                    period=60,
+                    redis=redis_client.client,
+                )
+            await self._limiter.acquire(tokens)
+
+        async with self._semaphore:
+            self.requests += 1
+            if self.provider == "anthropic":
+                response = await self._client().messages.create(
+                    max_tokens=8192,
+                    messages=[{"role": "user", "content": prompt}],
+                    model=ANTHROPIC_MODEL,
+                )
+                return response.content[0].text
+            response = await self._client().chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            return response.choices[0].message.content
+
+    # ------------------------------------------------------------------ summarize
+
+    def cache_key(self, content: str) -> str:
+        """Cache key of a content's summary."""
+        digest = hashlib.sha256(
+            f"{self.model}\0{PROMPT_VERSION}\0{content}".encode("utf-8", "surrogatepass")
+        ).hexdigest()
+        return f"{self.KEY_PREFIX}:{digest}"
+
+    async def summarize(self, content: str, logger: ContextualLogger) -> Optional[str]:
+        """Summarize one code file."""
+        return (await self.summarize_many([content], logger))[0]
+
+    async def summarize_many(
+        self, contents: List[Optional[str]], logger: ContextualLogger
+    ) -> List[Optional[str]]:
+        """Summarize code files, e.g. the chunks of one file, in input order.
+
+        Args:
+            contents: Contents to summarize; empty contents get no summary
+            logger: Contextual logger
+
+        Returns:
+            The summary of each content, None for empty ones
+        """
+        keys = [self.cache_key(content) if content else None for content in contents]
+        cached = await self._cache_get_many([key for key in keys if key])
+        self.cache_hits += len(cached)
+
+        missing = {
+            key: content
+            for key, content in zip(keys, contents, strict=True)
+            if key and key not in cached
+        }
+        if missing:
+            tokens = await run_in_thread_pool(self._count_tokens, list(missing.values()))
+            summaries = await asyncio.gather(
+                *(
+                    self._summarize_shared(key, content, count)
+                    for (key, content), count in zip(missing.items(), tokens, strict=True)
+                )
+            )
+            cached.update(zip(missing, summaries, strict=True))
+
+        logger.debug(
+            f"Summarized {len(contents)} code files, {len(contents) - len(missing)} from cache"
+        )
+        return [cached.get(key) if key else None for key in keys]
+
+    async def _summarize_shared(self, key: str, content: str, tokens: int) -> Optional[str]:
+        """Summarize a content, sharing the request with concurrent callers of the same key."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._summarize_uncached(key, content, tokens))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _summarize_uncached(self, key: str, content: str, tokens: int) -> Optional[str]:
+        if 0 < tokens <= settings.CODE_SUMMARIZER_PACK_MAX_TOKENS:
+            summary = await self._summarize_packed(content, tokens)
+        else:
+            summary = await self._complete(
+                SINGLE_PROMPT.format(content=content), tokens + SUMMARY_TOKENS
+            )
+        if summary:
+            await self._cache_set(key, summary)
+        return summary
+
+    # --------------------------------------------------------------------- packs
+
+    async def _summarize_packed(self, content: str, tokens: int) -> Optional[str]:
+        future = asyncio.get_running_loop().create_future()
+        self._pack.append(_PackItem(content, tokens, future))
+        if len(self._pack) >= PACK_MAX_ITEMS:
+            self._flush_pack()
+        elif self._pack_flush is None:
+            self._pack_flush = asyncio.get_running_loop().call_later(PACK_WAIT_S, self._flush_pack)
+        return await future
+
+    def _flush_pack(self) -> None:
+        if self._pack_flush is not None:
+            self._pack_flush.cancel()
+            self._pack_flush = None
+        items, self._pack = self._pack, []
+        if items:
+            task = asyncio.ensure_future(self._send_pack(items))
+            self._pack_tasks.add(task)
+            task.add_done_callback(self._pack_tasks.discard)
+
+    async def _send_pack(self, items: List[_PackItem]) -> None:
+        """Summarize packed contents in one request, and one by one what it misses."""
+        summaries: Dict[str, str] = {}
+        if len(items) > 1:
+            files = "\n".join(
+                f"    File {i}:\n    ```\n{item.content}\n    ```"
+                for i, item in enumerate(items, 1)
+            )
+            tokens = sum(item.tokens for item in items) + SUMMARY_TOKENS * len(items)
+            try:
+                self.packed_requests += 1
+                answer = await self._complete(
+                    PACK_PROMPT.format(count=len(items), files=files), tokens
+                )
+                summaries = self._parse_pack(answer)
+            except Exception as e:
+                logger.warning(f"Packed code summary request failed, summarizing one by one: {e}")
+
+        for i, item in enumerate(items, 1):
+            summary = summaries.get(str(i))
+            try:
+                if summary is None and not item.future.done():
+                    prompt = SINGLE_PROMPT.format(content=item.content)
+                    summary = await self._complete(prompt, item.tokens + SUMMARY_TOKENS)
+            except Exception as e:
+                if not item.future.done():
+                    item.future.set_exception(e)
+                continue
+            if not item.future.done():
+                item.future.set_result(summary)
+
+    @staticmethod
+    def _parse_pack(answer: Optional[str]) -> Dict[str, str]:
+        """Numbered summaries of a packed answer; empty if it is not the expected JSON."""
+        try:
+            parsed = json.loads(_JSON_FENCE.sub("", (answer or "").strip()))
+        except ValueError:
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+        return {
+            str(number): summary
+            for number, summary in parsed.items()
+            if isinstance(summary, str) and summary.strip()
+        }
+
+    # --------------------------------------------------------------------- cache
+
+    async def _cache_get_many(self, keys: List[str]) -> Dict[str, str]:
+        if settings.CODE_SUMMARIZER_CACHE_TTL_S <= 0:
+            return {}
+        found = {key: raw for key in keys if (raw := self._local_get(key)) is not None}
+        remote = [key for key in dict.fromkeys(keys) if key not in found]
+        if not remote or self._redis_failed:
+            return found
+        try:
+            values = await redis_client.client.mget(remote)
+        except Exception as e:
+            self._redis_failed = True
+            logger.warning(f"Code summary cache unavailable in Redis, using local cache: {e}")
+            return found
+        for key, value in zip(remote, values, strict=True):
+            if value is not None:
+                found[key] = value
+                self._local_set(key, value)
+        return found
+
+    async def _cache_set(self, key: str, summary: str) -> None:
+        ttl = settings.CODE_SUMMARIZER_CACHE_TTL_S
+        if ttl <= 0:
+            return
+        self._local_set(key, summary)
+        if self._redis_failed:
+            return
+        try:
+            await redis_client.client.set(key, summary, ex=ttl)
+        except Exception as e:
+            self._redis_failed = True
+            logger.warning(f"Code summary cache unavailable in Redis, using local cache: {e}")
+
+    def _local_get(self, key: str) -> Optional[str]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, summary = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return summary
+
+    def _local_set(self, key: str, summary: str) -> None:
+        self._local[key] = (time.monotonic() + settings.CODE_SUMMARIZER_CACHE_TTL_S, summary)
+        self._local.move_to_end(key)
+        while len(self._local) > LOCAL_CACHE_MAX_ENTRIES:
+            self._local.popitem(last=False)
+
+
+code_summary_service = CodeSummaryService()
@@ -4,13 +4,14 @@ import asyncio
 import os
 
 import aiofiles
-from chonkie import RecursiveChunker, RecursiveLevel, RecursiveRules, SemanticChunker
+from chonkie import RecursiveChunker, RecursiveLevel, RecursiveRules
 
 from airweave.core.logging import ContextualLogger
 from airweave.platform.decorators import transformer
 from airweave.platform.entities._base import ChunkEntity, FileEntity
 from airweave.platform.file_handling.conversion.factory import document_converter
 from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.transformers.semantic_boundaries import get_boundary_chunker
 from airweave.platform.transformers.utils import (
     MARGIN_OF_ERROR,
     MAX_CHUNK_SIZE,
@@ -78,18 +79,8 @@ async def get_optimized_semantic_chunker(
         if cache_key not in _semantic_chunker_cache:
             logger.debug(f"🧠 CHUNKER_CACHE_MISS [{entity_context}] Creating new semantic chunker")
 
-            def _create_semantic_chunker():
-                return SemanticChunker(
-                    embedding_model="text-embedding-ada-002",
-                    chunk_size=max_chunk_size,
-                    threshold=0.5,
-                    mode="window",
-                    min_sentences=1,
-                    similarity_window=2,
-                )
-
-            # Create in thread pool
-            chunker = await run_in_thread_pool(_create_semantic_chunker)
+            # Create in thread pool, the boundary backend may load a model
+            chunker = await run_in_thread_pool(get_boundary_chunker, max_chunk_size)
             _semantic_chunker_cache[cache_key] = chunker
             logger.debug(f"🧠 CHUNKER_CACHE_ADD [{entity_context}] Added chunker to cache")
         else:
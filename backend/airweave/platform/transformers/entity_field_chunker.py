@@ -1,4 +1,11 @@
-"""Entity chunker for chunking large embeddable text in ChunkEntity instances."""
+"""Entity chunker for chunking large embeddable text in ChunkEntity instances.
+
+Almost all entities (messages, issues, tickets) are far below the token limit. Their size is
+bounded without tokenizing: cl100k tokens are byte-level and cover at least one UTF-8 byte
+each, so a text of at most SAFE_EMBEDDABLE_TOKEN_SIZE bytes cannot exceed the limit. Only the
+remaining borderline texts are counted, and ``entity_chunker_batch`` counts those of a whole
+micro-batch with one ``encode_batch`` call in the CPU thread pool.
+"""
 
 from typing import Any, Dict, List, Optional
 
@@ -10,6 +17,7 @@ from airweave.platform.entities._base import BaseEntity, ChunkEntity
 from airweave.platform.sync.async_helpers import run_in_thread_pool
 from airweave.platform.transformers.utils import (
     count_tokens,
+    count_tokens_batch,
 )
 
 # Cache for chunkers
@@ -86,6 +94,16 @@ def calculate_embeddable_text_size(entity: ChunkEntity) -> int:
     return count_tokens(embeddable_text)
 
 
+def may_exceed_token_limit(text: str) -> bool:
+    """Whether a text may exceed SAFE_EMBEDDABLE_TOKEN_SIZE tokens, without tokenizing it.
+
+    False is certain: every token covers at least one UTF-8 byte. True needs a token count.
+    """
+    if len(text) <= SAFE_EMBEDDABLE_TOKEN_SIZE // 4:
+        return False
+    return len(text.encode("utf-8", "surrogatepass")) > SAFE_EMBEDDABLE_TOKEN_SIZE
+
+
 def get_embeddable_fields(entity: ChunkEntity) -> Dict[str, Any]:
     """Get fields marked as embeddable from the entity.
 
@@ -298,13 +316,71 @@ async def entity_chunker(entity: BaseEntity, logger: ContextualLogger) -> List[B
         )
         return [entity]
 
-    # Check embeddable text size
-    embeddable_size = calculate_embeddable_text_size(entity)
+    # Check embeddable text size, tokenizing only texts that may exceed the limit
+    embeddable_text = entity.build_embeddable_text()
+    if not may_exceed_token_limit(embeddable_text):
+        return [entity]
+    embeddable_size = count_tokens(embeddable_text)
 
     # If within limits, return as-is
     if embeddable_size <= SAFE_EMBEDDABLE_TOKEN_SIZE:
         return [entity]
 
+    return await _chunk_oversized_entity(entity, embeddable_size, logger)
+
+
+def _needs_field_chunking(entity: BaseEntity) -> bool:
+    """Whether the entity is a ChunkEntity that was not chunked yet."""
+    return isinstance(entity, ChunkEntity) and getattr(entity, "chunk_index", None) is None
+
+
+async def entity_chunker_batch(
+    entities: List[BaseEntity], logger: ContextualLogger
+) -> List[List[BaseEntity]]:
+    """Chunk large embeddable text in a batch of entities.
+
+    Same result as calling ``entity_chunker`` on every entity, in input order. Entities
+    below the token limit by their UTF-8 length are returned without tokenizing; the
+    embeddable texts of the others are counted together in the CPU thread pool.
+
+    Args:
+        entities: The BaseEntities to process
+        logger: The logger to use
+
+    Returns:
+        List[List[BaseEntity]]: Per input entity, either the entity or its chunked entities
+    """
+    results: List[List[BaseEntity]] = [[entity] for entity in entities]
+
+    borderline: List[tuple[int, str]] = []
+    for index, entity in enumerate(entities):
+        if not _needs_field_chunking(entity):
+            continue
+        embeddable_text = entity.build_embeddable_text()
+        if may_exceed_token_limit(embeddable_text):
+            borderline.append((index, embeddable_text))
+
+    if not borderline:
+        return results
+
+    sizes = await run_in_thread_pool(count_tokens_batch, [text for _, text in borderline])
+    oversized = 0
+    for (index, _), embeddable_size in zip(borderline, sizes, strict=True):
+        if embeddable_size > SAFE_EMBEDDABLE_TOKEN_SIZE:
+            oversized += 1
+            results[index] = await _chunk_oversized_entity(entities[index], embeddable_size, logger)
+
+    logger.debug(
+        f"Entity chunker batch: {len(entities)} entities, {len(borderline)} tokenized, "
+        f"{oversized} over the limit"
+    )
+    return results
+
+
+async def _chunk_oversized_entity(
+    entity: ChunkEntity, embeddable_size: int, logger: ContextualLogger
+) -> List[BaseEntity]:
+    """Chunk the largest embeddable field of an entity whose embeddable text is too large."""
     # Find the largest embeddable field to chunk
     field_info = find_largest_embeddable_field(entity)
 
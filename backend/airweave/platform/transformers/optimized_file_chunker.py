@@ -270,6 +270,38 @@ async def _try_chunk_size(
     return False, []
 
 
+async def _chunk_with_retries(
+    file: FileEntity,
+    text_content: str,
+    entity_context: str,
+    logger: ContextualLogger,
+    UnifiedChunkClass: type,
+) -> list[ChunkEntity]:
+    """Chunk the whole text, with smaller chunk sizes until every chunk fits."""
+    chunk_size = INITIAL_CHUNK_SIZE
+
+    while chunk_size >= MIN_CHUNK_SIZE:
+        success, entities = await _try_chunk_size(
+            file,
+            text_content,
+            chunk_size,
+            entity_context,
+            logger,
+            UnifiedChunkClass,
+        )
+
+        if success:
+            return entities
+
+        # Need smaller chunks
+        chunk_size = int(chunk_size * 0.7)  # Reduce by 30%
+        logger.debug(
+            f"🔄 CHUNKER_RETRY [{entity_context}] Retrying with smaller chunk size: {chunk_size}"
+        )
+
+    return []
+
+
 @transformer(name="Optimized File Chunker")
 async def optimized_file_chunker(file: FileEntity, logger: ContextualLogger) -> list[ChunkEntity]:
     """Optimized file chunker that ensures chunks fit within OpenAI's token limit.
@@ -279,6 +311,7 @@ async def optimized_file_chunker(file: FileEntity, logger: ContextualLogger) ->
     2. Chunks text with an initial size
     3. Creates entities and checks their ACTUAL serialized size
     4. Re-chunks if any entity exceeds OpenAI's limit
+       (large text files are streamed, see streaming_file_chunker)
     5. Returns parent and chunk entities that are guaranteed to fit
 
     Args:
@@ -303,42 +336,34 @@ async def optimized_file_chunker(file: FileEntity, logger: ContextualLogger) ->
         logger.debug(f"🔍 CHUNKER_PROCESS [{entity_context}] Processing file content")
         start_time = asyncio.get_event_loop().time()
 
-        text_content = await _process_file_content(file, entity_context, logger)
-        process_elapsed = asyncio.get_event_loop().time() - start_time
-
-        if not text_content or not text_content.strip():
-            logger.warning(f"📭 CHUNKER_EMPTY [{entity_context}] No text content found")
-            return []
-
-        content_length = len(text_content)
-        logger.debug(
-            f"📊 CHUNKER_CONTENT [{entity_context}] Processed {content_length} characters "
-            f"in {process_elapsed:.2f}s"
+        from airweave.platform.transformers.streaming_file_chunker import (
+            should_stream_file,
+            stream_file_chunks,
         )
 
-        # Try different chunk sizes until we find one that works
-        chunk_size = INITIAL_CHUNK_SIZE
-        produced_entities: list[ChunkEntity] = []
-
-        while chunk_size >= MIN_CHUNK_SIZE:
-            success, entities = await _try_chunk_size(
-                file,
-                text_content,
-                chunk_size,
-                entity_context,
-                logger,
-                UnifiedChunkClass,
+        if should_stream_file(file):
+            logger.debug(f"🌊 CHUNKER_STREAM [{entity_context}] Chunking large file in windows")
+            produced_entities = await stream_file_chunks(
+                file, UnifiedChunkClass, entity_context, logger
             )
+            if produced_entities == []:
+                logger.warning(f"📭 CHUNKER_EMPTY [{entity_context}] No text content found")
+                return []
+        else:
+            text_content = await _process_file_content(file, entity_context, logger)
+            process_elapsed = asyncio.get_event_loop().time() - start_time
 
-            if success:
-                produced_entities = entities
-                break
+            if not text_content or not text_content.strip():
+                logger.warning(f"📭 CHUNKER_EMPTY [{entity_context}] No text content found")
+                return []
 
-            # Need smaller chunks
-            chunk_size = int(chunk_size * 0.7)  # Reduce by 30%
+            content_length = len(text_content)
             logger.debug(
-                f"🔄 CHUNKER_RETRY [{entity_context}] "
-                f"Retrying with smaller chunk size: {chunk_size}"
+                f"📊 CHUNKER_CONTENT [{entity_context}] Processed {content_length} characters "
+                f"in {process_elapsed:.2f}s"
+            )
+            produced_entities = await _chunk_with_retries(
+                file, text_content, entity_context, logger, UnifiedChunkClass
             )
 
         if not produced_entities:
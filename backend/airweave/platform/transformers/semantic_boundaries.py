@@ -0,0 +1,285 @@
+"""Pluggable boundary detection for semantic chunking.
+
+Semantic chunking splits a text where the topic changes. Chonkie's SemanticChunker finds
+those boundaries by embedding sentence windows; with a remote model that costs an
+embedding API call per window, on top of the embeddings of the final chunks. The backend is
+chosen with SEMANTIC_CHUNKER_BACKEND:
+
+- ``texttiling`` (default): lexical TextTiling (Hearst, 1997), no model. A boundary is a gap
+  between sentences where the word overlap of the windows on either side dips deepest.
+- ``local``: SemanticChunker on a local CPU model run by fastembed (ONNX), set with
+  SEMANTIC_CHUNKER_LOCAL_MODEL. The model is downloaded on first use, so images that enable
+  it should fetch it at build time. Falls back to ``texttiling`` if the model cannot be
+  loaded.
+- ``openai``: SemanticChunker on text-embedding-ada-002, the previous behavior.
+
+Chunkers and models are created once per process and shared. All backends return Chonkie
+chunks that cover the text contiguously, measured in cl100k tokens.
+
+Boundary embeddings are not reused as chunk embeddings: they embed sentence windows, while
+a chunk is embedded with the sync's model over its embeddable text (metadata and content).
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from chonkie import SemanticChunker
+from chonkie.embeddings import BaseEmbeddings
+from chonkie.types import Chunk
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.transformers.utils import count_tokens, count_tokens_batch
+
+BACKENDS = ("local", "texttiling", "openai")
+
+# Shared by all backends, as used by the file and code chunkers so far
+SIMILARITY_THRESHOLD = 0.5
+SIMILARITY_WINDOW = 2
+MIN_SENTENCES = 1
+# Sentences per TextTiling block; word counts of fewer sentences are too sparse to compare
+TEXTTILING_WINDOW = 3
+
+# Sentences end after terminal punctuation followed by spaces, or at line breaks
+_SENTENCE_END = re.compile(r"(?<=[.!?])[ \t]+|\n+")
+_WORD = re.compile(r"[a-z0-9]{3,}")
+_STOPWORDS = frozenset(
+    "the and for are but not you all any can had her was one our out has have him his how its "
+    "may new now see two way who did get let put say she too use that with this from they will "
+    "would there their what about which when your been were more into than them then these "
+    "some could other also only such".split()
+)
+
+_chunkers: Dict[Tuple[str, int], Any] = {}
+_local_models: Dict[str, "FastEmbedEmbeddings"] = {}
+_lock = threading.Lock()
+
+
+class FastEmbedEmbeddings(BaseEmbeddings):
+    """Chonkie embeddings on a local fastembed model, token counts in cl100k."""
+
+    def __init__(self, model_name: str):
+        """Load the model, downloading it on first use.
+
+        Args:
+            model_name: fastembed dense model, e.g. "BAAI/bge-small-en-v1.5"
+        """
+        super().__init__()
+        from fastembed import TextEmbedding
+
+        self.model_name = model_name
+        self._model = TextEmbedding(model_name)
+
+    def embed(self, text: str):
+        """Embed one text."""
+        return next(iter(self._model.embed([text])))
+
+    def embed_batch(self, texts: List[str]) -> List[Any]:
+        """Embed texts in batches."""
+        return list(self._model.embed(texts)) if texts else []
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the model's vectors."""
+        return self._model.embedding_size
+
+    def get_tokenizer_or_token_counter(self):
+        """Count chunk sizes in the tokens of the final embedding models."""
+        return count_tokens
+
+    def __repr__(self) -> str:
+        """Representation with the model name."""
+        return f"FastEmbedEmbeddings(model_name={self.model_name})"
+
+
+class TextTilingChunker:
+    """Chunks text at lexical topic shifts, with at most ``chunk_size`` tokens per chunk.
+
+    Each gap between sentences is scored by the cosine similarity of the word counts of the
+    ``window`` sentences before and after it, smoothed over neighbouring gaps. A gap at the
+    bottom of a valley is a boundary when its depth (how far the score dips below the
+    nearest peaks on both sides) is above the mean depth minus half its standard deviation.
+    Chunks close at boundaries, and before a sentence that would make them exceed
+    ``chunk_size``.
+    """
+
+    def __init__(self, chunk_size: int, window: int = TEXTTILING_WINDOW):
+        """Initialize the chunker.
+
+        Args:
+            chunk_size: Maximum tokens per chunk; longer sentences are cut into pieces
+            window: Sentences compared on either side of a gap
+        """
+        self.chunk_size = chunk_size
+        self.window = max(1, window)
+
+    @staticmethod
+    def split_sentences(text: str) -> List[Tuple[int, int]]:
+        """Spans of the sentences of a text, delimiters included, covering it entirely."""
+        spans = []
+        start = 0
+        for match in _SENTENCE_END.finditer(text):
+            if match.end() > start:
+                spans.append((start, match.end()))
+                start = match.end()
+        if start < len(text):
+            spans.append((start, len(text)))
+        return spans
+
+    def gap_scores(self, words: List[Counter]) -> List[float]:
+        """Lexical similarity across each gap; gap ``i`` precedes sentence ``i + 1``."""
+        scores = []
+        for gap in range(1, len(words)):
+            left = sum(words[max(0, gap - self.window) : gap], Counter())
+            right = sum(words[gap : gap + self.window], Counter())
+            dot = sum(count * right[word] for word, count in left.items())
+            norm = math.sqrt(sum(c * c for c in left.values()) * sum(c * c for c in right.values()))
+            scores.append(dot / norm if norm else 0.0)
+        return scores
+
+    @staticmethod
+    def depth_scores(scores: List[float]) -> List[float]:
+        """How deep each gap's score dips below the peaks to its left and right."""
+        depths = []
+        for i, score in enumerate(scores):
+            left = i
+            while left > 0 and scores[left - 1] >= scores[left]:
+                left -= 1
+            right = i
+            while right < len(scores) - 1 and scores[right + 1] >= scores[right]:
+                right += 1
+            depths.append((scores[left] - score) + (scores[right] - score))
+        return depths
+
+    @staticmethod
+    def smooth(scores: List[float]) -> List[float]:
+        """Average each gap score with its neighbours."""
+        return [
+            sum(scores[max(0, i - 1) : i + 2]) / len(scores[max(0, i - 1) : i + 2])
+            for i in range(len(scores))
+        ]
+
+    def boundaries(self, words: List[Counter]) -> List[bool]:
+        """Whether each gap is a topic boundary: a valley deeper than the cutoff."""
+        scores = self.smooth(self.gap_scores(words))
+        depths = self.depth_scores(scores)
+        if not depths:
+            return []
+        mean = sum(depths) / len(depths)
+        std = math.sqrt(sum((d - mean) ** 2 for d in depths) / len(depths))
+        cutoff = mean - std / 2
+        last = len(scores) - 1
+        return [
+            depth > 0
+            and depth > cutoff
+            and (i == 0 or scores[i] <= scores[i - 1])
+            and (i == last or scores[i] <= scores[i + 1])
+            for i, depth in enumerate(depths)
+        ]
+
+    def chunk(self, text: str) -> List[Chunk]:
+        """Split a text into chunks."""
+        spans = self.split_sentences(text)
+        if not spans:
+            return []
+        spans, tokens = self._split_long_sentences(text, spans)
+        sentences = [text[start:end] for start, end in spans]
+        words = [
+            Counter(w for w in _WORD.findall(sentence.lower()) if w not in _STOPWORDS)
+            for sentence in sentences
+        ]
+        is_boundary = self.boundaries(words)
+
+        chunks: List[Chunk] = []
+        first, size = 0, 0
+        for i in range(len(spans)):
+            at_boundary = i > 0 and is_boundary[i - 1] and i - first >= MIN_SENTENCES
+            if i > first and (at_boundary or size + tokens[i] > self.chunk_size):
+                chunks.append(self._make_chunk(text, spans[first][0], spans[i - 1][1], size))
+                first, size = i, 0
+            size += tokens[i]
+        chunks.append(self._make_chunk(text, spans[first][0], spans[-1][1], size))
+        return chunks
+
+    def _split_long_sentences(
+        self, text: str, spans: List[Tuple[int, int]]
+    ) -> Tuple[List[Tuple[int, int]], List[int]]:
+        """Cut sentences longer than ``chunk_size`` tokens into pieces that fit.
+
+        Returns:
+            The sentence spans and their token counts
+        """
+        tokens = count_tokens_batch([text[start:end] for start, end in spans])
+        while any(count > self.chunk_size for count in tokens):
+            fitted: List[Tuple[int, int]] = []
+            for (start, end), count in zip(spans, tokens, strict=True):
+                if count <= self.chunk_size or end - start < 2:
+                    fitted.append((start, end))
+                    continue
+                pieces = math.ceil(count / self.chunk_size) + 1
+                step = math.ceil((end - start) / pieces)
+                fitted.extend((s, min(s + step, end)) for s in range(start, end, step))
+            if len(fitted) == len(spans):
+                break
+            spans = fitted
+            tokens = count_tokens_batch([text[start:end] for start, end in spans])
+        return spans, tokens
+
+    @staticmethod
+    def _make_chunk(text: str, start: int, end: int, token_count: int) -> Chunk:
+        return Chunk(
+            text=text[start:end], start_index=start, end_index=end, token_count=token_count
+        )
+
+
+def _local_model(model_name: str) -> FastEmbedEmbeddings:
+    if model_name not in _local_models:
+        _local_models[model_name] = FastEmbedEmbeddings(model_name)
+    return _local_models[model_name]
+
+
+def _create_chunker(backend: str, chunk_size: int) -> Any:
+    semantic_options = {
+        "chunk_size": chunk_size,
+        "threshold": SIMILARITY_THRESHOLD,
+        "mode": "window",
+        "min_sentences": MIN_SENTENCES,
+        "similarity_window": SIMILARITY_WINDOW,
+    }
+    if backend == "texttiling":
+        return TextTilingChunker(chunk_size)
+    if backend == "openai":
+        return SemanticChunker(embedding_model="text-embedding-ada-002", **semantic_options)
+    if backend == "local":
+        model_name = settings.SEMANTIC_CHUNKER_LOCAL_MODEL
+        try:
+            return SemanticChunker(embedding_model=_local_model(model_name), **semantic_options)
+        except Exception as e:
+            logger.warning(
+                f"Could not load semantic chunker model {model_name}, using TextTiling: {e}"
+            )
+            return TextTilingChunker(chunk_size)
+    raise ValueError(f"Unknown semantic chunker backend {backend!r}, expected one of {BACKENDS}")
+
+
+def get_boundary_chunker(chunk_size: int, backend: Optional[str] = None) -> Any:
+    """Get the process-wide semantic chunker of a backend and chunk size.
+
+    Creating it may load a model, so call this from a worker thread.
+
+    Args:
+        chunk_size: Maximum tokens per chunk
+        backend: One of BACKENDS (default: SEMANTIC_CHUNKER_BACKEND)
+
+    Returns:
+        A chunker whose ``chunk(text)`` returns Chonkie chunks
+    """
+    backend = backend or settings.SEMANTIC_CHUNKER_BACKEND
+    key = (backend, chunk_size)
+    with _lock:
+        if key not in _chunkers:
+            _chunkers[key] = _create_chunker(backend, chunk_size)
+        return _chunkers[key]
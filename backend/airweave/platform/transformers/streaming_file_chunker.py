@@ -0,0 +1,264 @@
+"""Streaming chunking of very large text files.
+
+The file chunkers read a whole file into one string and chunk it at once, and the optimized
+chunker chunks the whole document again with 30% smaller chunks whenever a single chunk is
+too large. For exports of hundreds of MB that means several copies of the document in memory
+and a full re-chunk per retry.
+
+Text files at least STREAMING_CHUNKER_MIN_SIZE_MB large are instead read in windows of
+WINDOW_CHARS characters. Each window is chunked with the rules of the optimized chunker; all
+chunks but the last are emitted, and the last one, which may have been cut at the window's
+end, is carried over and chunked again with the next window. Only the window and the carried
+chunk are held besides the chunks made so far. When a chunk is too large once serialized, the
+chunk size is lowered by 30% for the rest of the file and the text from that chunk on is
+chunked again; the chunks before it are kept.
+
+Markdown, TXT, JSON and XML are chunked as the raw text; JSON and XML are not pretty-printed,
+which would mean parsing the whole document. CSV rows become the markdown table rows the
+text converter makes of them.
+"""
+
+import csv
+import math
+import os
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from airweave.core.config import settings
+from airweave.core.logging import ContextualLogger
+from airweave.platform.entities._base import ChunkEntity, FileEntity
+from airweave.platform.sync.async_helpers import run_in_thread_pool
+from airweave.platform.transformers.optimized_file_chunker import (
+    INITIAL_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
+    OPENAI_TOKEN_LIMIT,
+    _clean_problematic_content,
+    _create_chunk_metadata,
+    calculate_entity_token_size,
+    get_recursive_chunker,
+)
+from airweave.platform.transformers.utils import count_tokens
+
+STREAMABLE_EXTENSIONS = {".md", ".txt", ".csv", ".json", ".xml"}
+WINDOW_CHARS = 1024 * 1024
+SHRINK_FACTOR = 0.7
+# Stands in for the chunk count until it is known; no smaller than the real count once
+# serialized, so the size check never passes a chunk that ends up too large
+_TOTAL_CHUNKS_PLACEHOLDER = 10**9
+
+
+class ChunkTooLargeError(Exception):
+    """A chunk does not fit the token limit even at the minimum chunk size."""
+
+
+def should_stream_file(file: FileEntity) -> bool:
+    """Whether a file is a text file large enough to be chunked in windows."""
+    path = file.airweave_system_metadata.local_path
+    if not path or settings.STREAMING_CHUNKER_MIN_SIZE_MB <= 0:
+        return False
+    if os.path.splitext(path)[1].lower() not in STREAMABLE_EXTENSIONS:
+        return False
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return False
+    return size >= settings.STREAMING_CHUNKER_MIN_SIZE_MB * 1024 * 1024
+
+
+def iter_text_windows(path: str, window_chars: int = WINDOW_CHARS) -> Iterator[str]:
+    """Read a text file in windows of about ``window_chars`` characters.
+
+    Args:
+        path: Path of the file
+        window_chars: Characters per window
+
+    Yields:
+        Consecutive parts of the file's text
+    """
+    if os.path.splitext(path)[1].lower() == ".csv":
+        yield from _iter_csv_windows(path, window_chars)
+        return
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        while window := f.read(window_chars):
+            yield window
+
+
+def _iter_csv_windows(path: str, window_chars: int) -> Iterator[str]:
+    """The markdown table TextConverter makes of a CSV file, in windows."""
+    with open(path, "r", encoding="utf-8", errors="replace", newline="") as f:
+        rows = csv.reader(f)
+        header = next(rows, None)
+        if header is None:
+            return
+        lines = ["| " + " | ".join(header) + " |\n", "|" + "|".join("---" for _ in header) + "|\n"]
+        size = 0
+        for row in rows:
+            line = "| " + " | ".join(row) + " |\n"
+            lines.append(line)
+            size += len(line)
+            if size >= window_chars:
+                yield "".join(lines)
+                lines, size = [], 0
+        if lines:
+            yield "".join(lines)
+
+
+def _cut(text: str, token_count: int, chunk_size: int) -> List[Tuple[int, str]]:
+    """Cut a text without delimiters into even pieces of about ``chunk_size`` tokens."""
+    step = math.ceil(len(text) / max(1, math.ceil(token_count / chunk_size)))
+    return [(start, text[start : start + step]) for start in range(0, len(text), step)]
+
+
+class StreamingChunker:
+    """Chunks a text fed in windows into entities that fit the token limit.
+
+    Not thread-safe; feed the windows one after the other.
+    """
+
+    def __init__(
+        self,
+        make_entity: Callable[[str, int], ChunkEntity],
+        chunk_size: int = INITIAL_CHUNK_SIZE,
+    ):
+        """Initialize the chunker.
+
+        Args:
+            make_entity: Builds the chunk entity of a chunk text and chunk index
+            chunk_size: Target tokens per chunk, lowered when chunks turn out too large
+        """
+        self._make_entity = make_entity
+        self.chunk_size = chunk_size
+        self._carry = ""
+        self.chunk_count = 0
+
+    def feed(self, window: str) -> List[ChunkEntity]:
+        """Chunk the next window; returns the entities of the chunks completed so far."""
+        self._carry += window
+        return self._drain(final=False)
+
+    def close(self) -> List[ChunkEntity]:
+        """Chunk what is left after the last window."""
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> List[ChunkEntity]:
+        """Entities of the carried text's chunks, but its last one unless ``final``.
+
+        When a chunk is too large the chunk size is lowered, and the text from that chunk on
+        is chunked again.
+        """
+        entities: List[ChunkEntity] = []
+        text = self._carry
+        while True:
+            chunks = _chunk(text, self.chunk_size)
+            for start, chunk_text in chunks if final else chunks[:-1]:
+                if not chunk_text.strip():
+                    continue
+                entity = self._make_entity(chunk_text, self.chunk_count)
+                if calculate_entity_token_size(entity) > OPENAI_TOKEN_LIMIT:
+                    self._shrink()
+                    text = text[start:]
+                    break
+                entities.append(entity)
+                self.chunk_count += 1
+            else:
+                self._carry = text[chunks[-1][0] :] if chunks and not final else ""
+                return entities
+
+    def _shrink(self) -> None:
+        smaller = int(self.chunk_size * SHRINK_FACTOR)
+        if smaller < MIN_CHUNK_SIZE:
+            raise ChunkTooLargeError(
+                f"chunk {self.chunk_count + 1} does not fit within {OPENAI_TOKEN_LIMIT} tokens "
+                f"even at chunk size {self.chunk_size}"
+            )
+        self.chunk_size = smaller
+
+
+def _chunk(text: str, chunk_size: int) -> List[Tuple[int, str]]:
+    """Recursive chunks of a text as (start, text).
+
+    Chunks the rules cannot split, which have no delimiters, are cut by ``_cut``; that also
+    keeps the text carried over to the next window small.
+    """
+    try:
+        chunks = [
+            (chunk.start_index, chunk.text, chunk.token_count)
+            for chunk in get_recursive_chunker(chunk_size).chunk(text)
+        ]
+    except Exception:
+        chunks = [(0, text, count_tokens(text))]
+    spans: List[Tuple[int, str]] = []
+    for start, chunk_text, token_count in chunks:
+        if token_count <= chunk_size:
+            spans.append((start, chunk_text))
+        else:
+            spans.extend(
+                (start + offset, piece)
+                for offset, piece in _cut(chunk_text, token_count, chunk_size)
+            )
+    return spans
+
+
+async def stream_file_chunks(
+    file: FileEntity,
+    UnifiedChunkClass: type,
+    entity_context: str,
+    logger: ContextualLogger,
+) -> Optional[List[ChunkEntity]]:
+    """Chunk a large text file window by window.
+
+    Args:
+        file: File with a local path, see ``should_stream_file``
+        UnifiedChunkClass: Unified chunk model of the file's class
+        entity_context: Entity description for log messages
+        logger: Contextual logger
+
+    Returns:
+        The chunk entities, or None if a chunk cannot be made to fit the token limit
+    """
+    base_data = file.model_dump()
+    md_parent_url = getattr(file, "original_url", None)
+
+    def make_entity(text: str, index: int) -> ChunkEntity:
+        return UnifiedChunkClass(
+            **{
+                **base_data,
+                "entity_id": file.entity_id,
+                "parent_entity_id": file.entity_id,
+                "md_content": text,
+                "md_type": "text",
+                "md_position": index,
+                "md_parent_title": file.name,
+                "md_parent_url": md_parent_url,
+                "metadata": _create_chunk_metadata(file, index, _TOTAL_CHUNKS_PLACEHOLDER),
+                "parent_file_type": file.file_type,
+            }
+        )
+
+    def next_window(windows: Iterator[str]) -> Optional[str]:
+        window = next(windows, None)
+        if window is None:
+            return None
+        return _clean_problematic_content(window, entity_context, logger)
+
+    chunker = StreamingChunker(make_entity)
+    windows = iter_text_windows(file.airweave_system_metadata.local_path)
+    entities: List[ChunkEntity] = []
+    window_count = 0
+    try:
+        while (window := await run_in_thread_pool(next_window, windows)) is not None:
+            window_count += 1
+            entities.extend(await run_in_thread_pool(chunker.feed, window))
+        entities.extend(await run_in_thread_pool(chunker.close))
+    except ChunkTooLargeError as e:
+        logger.error(f"💥 CHUNKER_STREAM_FAILED [{entity_context}] {e}")
+        return None
+    finally:
+        windows.close()
+
+    for entity in entities:
+        entity.metadata["total_chunks"] = len(entities)
+    logger.debug(
+        f"🌊 CHUNKER_STREAM_DONE [{entity_context}] Chunked {window_count} windows into "
+        f"{len(entities)} chunks of at most {chunker.chunk_size} tokens"
+    )
+    return entities
@@ -1,5 +1,7 @@
 """Utils for transformers."""
 
+from typing import List
+
 import tiktoken
 
 # Max chunk size for embedding models (e.g. OpenAI's text-embedding-ada-002)
@@ -14,3 +16,12 @@ def count_tokens(text: str) -> int:
     """Count tokens using the cl100k_base tokenizer (used by OpenAI's text-embedding models)."""
     encoding = tiktoken.get_encoding("cl100k_base")
     return len(encoding.encode(text))
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """Count tokens of many texts in one cl100k_base ``encode_batch`` call.
+
+    Special-token strings in the texts are counted as plain text instead of raising.
+    """
+    encoding = tiktoken.get_encoding("cl100k_base")
+    return [len(tokens) for tokens in encoding.encode_batch(texts, disallowed_special=())]
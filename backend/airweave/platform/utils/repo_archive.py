@@ -0,0 +1,174 @@
+"""Archive-based ingestion of git repositories for the code sources.
+
+Traversing a repository through the contents APIs costs one request per directory and one
+per file, so a 20k-file monorepo costs over 20k requests and runs into rate limits. In
+archive mode a source downloads the branch as a single tarball instead and reads the
+directories and files from it as it goes. The archive is spooled to a temporary file and read
+in stream mode, so only one file is held in memory at a time.
+
+Files are identified by their git blob SHA, computed from the archive bytes. It is the same
+SHA the tree and contents APIs report, so file entities are identical to those built from
+the APIs, and an unchanged file keeps its entity hash and skips chunking and embedding.
+"""
+
+import asyncio
+import hashlib
+import os
+import tarfile
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional
+
+import httpx
+
+from airweave.platform.entities._base import Breadcrumb
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Entries handed from the extraction thread to the event loop at once
+BATCH_MAX_ENTRIES = 64
+BATCH_MAX_BYTES = 8 * 1024 * 1024
+
+
+def git_blob_sha(data: bytes) -> str:
+    """SHA-1 git assigns to a blob with this content."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(b"blob %d\0" % len(data))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+@dataclass
+class ArchiveEntry:
+    """A directory or file read from a repository archive."""
+
+    path: str
+    is_dir: bool
+    size: int
+    mtime: int
+    # Commit the archive was made from, if the archive records it
+    commit_id: Optional[str] = None
+    # Content of files no larger than the size limit
+    data: Optional[bytes] = None
+
+    @property
+    def blob_sha(self) -> Optional[str]:
+        """Git blob SHA of the file, if its content was read."""
+        return git_blob_sha(self.data) if self.data is not None else None
+
+    @property
+    def modified_at(self) -> datetime:
+        """Commit time, which git archive records as the mtime of every entry."""
+        return datetime.fromtimestamp(self.mtime, tz=timezone.utc)
+
+
+def iter_archive(path: str, max_file_size: int) -> Iterator[ArchiveEntry]:
+    """Read the directories and regular files of a gzipped repository tarball in order.
+
+    The top-level directory the hosting services wrap the tree in is stripped. Symlinks are
+    skipped, like the contents traversals skip them.
+
+    Args:
+        path: Path of the tarball
+        max_file_size: Files larger than this are listed without their content
+    """
+    with tarfile.open(path, mode="r|gz") as tar:
+        for member in tar:
+            _, _, relative = member.name.partition("/")
+            relative = relative.strip("/")
+            if not relative:
+                continue
+            # git archive stores the commit id in the pax global header
+            commit_id = tar.pax_headers.get("comment")
+            if member.isdir():
+                yield ArchiveEntry(relative, True, 0, int(member.mtime), commit_id)
+            elif member.isfile():
+                data = None
+                if member.size <= max_file_size:
+                    data = tar.extractfile(member).read()
+                yield ArchiveEntry(relative, False, member.size, int(member.mtime), commit_id, data)
+
+
+def _next_batch(entries: Iterator[ArchiveEntry]) -> List[ArchiveEntry]:
+    batch: List[ArchiveEntry] = []
+    size = 0
+    for entry in entries:
+        batch.append(entry)
+        size += entry.size if entry.data is not None else 0
+        if len(batch) >= BATCH_MAX_ENTRIES or size >= BATCH_MAX_BYTES:
+            break
+    return batch
+
+
+async def download_archive(client: httpx.AsyncClient, url: str, **request_kwargs: Any) -> str:
+    """Download an archive to a temporary file; the caller removes it.
+
+    Args:
+        client: HTTP client
+        url: Archive URL; redirects to the download host are followed
+        **request_kwargs: Headers, auth and params of the request
+
+    Returns:
+        Path of the downloaded archive
+    """
+    fd, path = tempfile.mkstemp(prefix="airweave-repo-", suffix=".tar.gz")
+    try:
+        with os.fdopen(fd, "wb") as archive:
+            async with client.stream(
+                "GET", url, follow_redirects=True, **request_kwargs
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    archive.write(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    return path
+
+
+async def stream_archive(
+    client: httpx.AsyncClient, url: str, max_file_size: int, **request_kwargs: Any
+) -> AsyncGenerator[ArchiveEntry, None]:
+    """Download a repository tarball and yield its entries in archive order.
+
+    Decompression runs in a worker thread, a batch of entries at a time.
+
+    Args:
+        client: HTTP client
+        url: Archive URL
+        max_file_size: Files larger than this are yielded without their content
+        **request_kwargs: Headers, auth and params of the request
+    """
+    path = await download_archive(client, url, **request_kwargs)
+    entries = iter_archive(path, max_file_size)
+    try:
+        while batch := await asyncio.to_thread(_next_batch, entries):
+            for entry in batch:
+                yield entry
+    finally:
+        entries.close()
+        os.unlink(path)
+
+
+class DirectoryBreadcrumbs:
+    """Breadcrumb chains of the directories of a repository, built as the archive is read."""
+
+    def __init__(self, root: List[Breadcrumb], entity_id_prefix: str):
+        """Initialize with the breadcrumbs of the repository root.
+
+        Args:
+            root: Breadcrumbs of entities at the repository root
+            entity_id_prefix: Prefix of directory entity ids, e.g. "owner/repo"
+        """
+        self._chains: Dict[str, List[Breadcrumb]] = {"": list(root)}
+        self._prefix = entity_id_prefix
+
+    def for_path(self, path: str) -> List[Breadcrumb]:
+        """Breadcrumbs of an entity at ``path``: the root and every parent directory."""
+        parent, _, _ = path.rpartition("/")
+        if parent not in self._chains:
+            grandparent, _, name = parent.rpartition("/")
+            self._chains[parent] = self.for_path(parent) + [
+                Breadcrumb(entity_id=f"{self._prefix}/{parent}", name=name, type="directory")
+            ]
+        return list(self._chains[parent])
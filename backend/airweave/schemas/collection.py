@@ -12,7 +12,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
-from airweave.core.shared_models import CollectionStatus
+from airweave.core.shared_models import CollectionStatus, PayloadMode
 
 
 def generate_readable_id(name: str) -> str:
@@ -71,6 +71,15 @@ class CollectionBase(BaseModel):
         pattern="^[a-z0-9]+(-[a-z0-9]+)*$",
         examples=["finance-data-ab123", "customer-support-xy789", "marketing-analytics-cd456"],
     )
+    payload_mode: PayloadMode = Field(
+        PayloadMode.FULL,
+        description=(
+            "How entities are stored for search. **full** keeps complete documents in the "
+            "vector index. **lean** indexes only the fields search needs and loads complete "
+            "documents for the returned results, which greatly reduces index size. "
+            "Cannot be changed after creation."
+        ),
+    )
 
     @model_validator(mode="after")
     def generate_readable_id_if_none(self) -> "CollectionBase":
@@ -0,0 +1,215 @@
+"""Tiered cache for search responses and intermediate search artifacts.
+
+Two kinds of entries are cached:
+
+- Responses: the final SearchResponse for (collection, normalized query, request options).
+  These are collection-scoped and keyed by the collection's *generation*, a counter stored
+  in Redis that is bumped whenever a sync into the collection completes. Bumping the
+  generation makes every older entry unreachable, so no explicit key deletion is needed.
+- Artifacts: collection-independent intermediate results such as query expansions and
+  query embeddings, keyed by the model that produced them.
+
+Entries live in an in-process LRU and, when SEARCH_CACHE_REDIS_ENABLED is set, in Redis so
+they are shared between API replicas. Cache failures never fail a search: every error is
+logged and treated as a miss.
+"""
+
+import hashlib
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+from airweave.schemas.search import SearchRequest, SearchResponse
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache keying (case-folded, collapsed whitespace)."""
+    return _WHITESPACE_RE.sub(" ", query).strip().casefold()
+
+
+def _digest(parts: Dict[str, Any]) -> str:
+    """Stable digest of a JSON-serializable key description."""
+    raw = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """In-process LRU with an optional Redis tier."""
+
+    KEY_PREFIX = "search_cache"
+
+    def __init__(self) -> None:
+        """Initialize the local tier."""
+        self._local: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    # ------------------------------------------------------------------ config
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled."""
+        return settings.SEARCH_CACHE_ENABLED
+
+    @property
+    def ttl_seconds(self) -> int:
+        """Time-to-live for cached entries."""
+        return settings.SEARCH_CACHE_TTL_SECONDS
+
+    @property
+    def redis_enabled(self) -> bool:
+        """Whether the shared Redis tier is enabled."""
+        return settings.SEARCH_CACHE_REDIS_ENABLED
+
+    # -------------------------------------------------------------- generations
+
+    def _generation_key(self, collection_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}:generation:{collection_id}"
+
+    async def get_generation(self, collection_id: UUID) -> Optional[int]:
+        """Get the current cache generation of a collection.
+
+        Returns None if the generation cannot be read, in which case collection-scoped
+        entries must not be served or stored.
+        """
+        try:
+            value = await redis_client.client.get(self._generation_key(collection_id))
+        except Exception as e:
+            logger.warning(f"[SearchCache] Failed to read generation for {collection_id}: {e}")
+            return None
+        return int(value) if value is not None else 0
+
+    async def invalidate_collection(self, collection_id: UUID) -> None:
+        """Bump the collection's generation so all cached responses for it become stale."""
+        if not self.enabled:
+            return
+        try:
+            await redis_client.client.incr(self._generation_key(collection_id))
+        except Exception as e:
+            logger.warning(f"[SearchCache] Failed to bump generation for {collection_id}: {e}")
+
+    # ---------------------------------------------------------------- responses
+
+    def response_key(
+        self, collection_id: UUID, generation: int, search_request: SearchRequest
+    ) -> str:
+        """Build the cache key of a search response."""
+        options = search_request.model_dump(mode="json", exclude={"query"})
+        digest = _digest(
+            {
+                "collection_id": str(collection_id),
+                "generation": generation,
+                "query": normalize_query(search_request.query),
+                "options": options,
+            }
+        )
+        return f"{self.KEY_PREFIX}:response:{digest}"
+
+    async def get_response(self, key: str) -> Optional[SearchResponse]:
+        """Get a cached search response."""
+        raw = await self._get(key)
+        if raw is None:
+            return None
+        try:
+            return SearchResponse.model_validate_json(raw)
+        except Exception as e:
+            logger.warning(f"[SearchCache] Discarding undecodable response entry: {e}")
+            return None
+
+    async def set_response(self, key: str, response: SearchResponse) -> None:
+        """Cache a search response."""
+        try:
+            raw = response.model_dump_json()
+        except Exception as e:
+            logger.warning(f"[SearchCache] Response not cacheable: {e}")
+            return
+        await self._set(key, raw)
+
+    # ---------------------------------------------------------------- artifacts
+
+    def artifact_key(self, kind: str, **parts: Any) -> str:
+        """Build the cache key of an intermediate artifact (e.g. "expansion", "embedding")."""
+        return f"{self.KEY_PREFIX}:{kind}:{_digest(parts)}"
+
+    async def get_artifact(self, key: str) -> Optional[Any]:
+        """Get a cached JSON-serializable artifact."""
+        raw = await self._get(key)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    async def set_artifact(self, key: str, value: Any) -> None:
+        """Cache a JSON-serializable artifact."""
+        try:
+            raw = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"[SearchCache] Artifact not cacheable: {e}")
+            return
+        await self._set(key, raw)
+
+    # -------------------------------------------------------------------- tiers
+
+    async def _get(self, key: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+
+        raw = self._local_get(key)
+        if raw is not None or not self.redis_enabled:
+            return raw
+
+        try:
+            raw = await redis_client.client.get(key)
+        except Exception as e:
+            logger.warning(f"[SearchCache] Redis get failed: {e}")
+            return None
+
+        if raw is not None:
+            # Promote to the local tier for subsequent hits on this replica
+            self._local_set(key, raw)
+        return raw
+
+    async def _set(self, key: str, raw: str) -> None:
+        if not self.enabled:
+            return
+
+        self._local_set(key, raw)
+        if not self.redis_enabled:
+            return
+
+        try:
+            await redis_client.client.set(key, raw, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"[SearchCache] Redis set failed: {e}")
+
+    def _local_get(self, key: str) -> Optional[str]:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, raw = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return raw
+
+    def _local_set(self, key: str, raw: str) -> None:
+        self._local[key] = (time.monotonic() + self.ttl_seconds, raw)
+        self._local.move_to_end(key)
+        while len(self._local) > settings.SEARCH_CACHE_MAX_ENTRIES:
+            self._local.popitem(last=False)
+
+    def clear_local(self) -> None:
+        """Drop all entries from the in-process tier."""
+        self._local.clear()
+
+
+search_cache = SearchCache()
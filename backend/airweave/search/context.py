@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from airweave.search.operations import (
         EmbedQuery,
         GenerateAnswer,
+        HydrateDocuments,
         QueryExpansion,
         QueryInterpretation,
         Reranking,
@@ -43,4 +44,5 @@ class SearchContext(BaseModel):
     temporal_relevance: Optional[TemporalRelevance] = Field()
     retrieval: Retrieval = Field()
     reranking: Optional[Reranking] = Field()
+    hydrate_documents: Optional[HydrateDocuments] = Field(default=None)
     generate_answer: Optional[GenerateAnswer] = Field()
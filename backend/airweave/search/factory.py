@@ -7,6 +7,7 @@ from fastapi import HTTPException
 
 from airweave.api.context import ApiContext
 from airweave.core.config import settings
+from airweave.core.shared_models import PayloadMode
 from airweave.schemas.search import SearchDefaults, SearchRequest
 from airweave.search.context import SearchContext
 from airweave.search.emitter import EventEmitter
@@ -14,6 +15,7 @@ from airweave.search.helpers import search_helpers
 from airweave.search.operations import (
     EmbedQuery,
     GenerateAnswer,
+    HydrateDocuments,
     QueryExpansion,
     QueryInterpretation,
     Reranking,
@@ -31,6 +33,7 @@ from airweave.search.providers.schemas import (
     ProviderModelSpec,
     RerankModelConfig,
 )
+from airweave.search.token_budget import TokenBudgeter
 
 # Rebuild SearchContext model now that all operation classes are imported
 SearchContext.model_rebuild()
@@ -52,6 +55,7 @@ class SearchFactory:
         search_request: SearchRequest,
         stream: bool,
         ctx: ApiContext,
+        payload_mode: PayloadMode | str = PayloadMode.FULL,
     ) -> SearchContext:
         """Build SearchContext from request with validated YAML defaults."""
         if not search_request.query or not search_request.query.strip():
@@ -109,7 +113,7 @@ class SearchFactory:
         # Select providers for LLM-based operations
         api_keys = self._get_available_api_keys()
         providers = self._create_provider_for_each_operation(
-            api_keys, expand_query, interpret_filters, rerank, generate_answer, ctx
+            api_keys, expand_query, interpret_filters, rerank, generate_answer, ctx, TokenBudgeter()
         )
 
         # Create event emitter for this search
@@ -142,6 +146,9 @@ class SearchFactory:
             user_filter=UserFilter(filter=search_request.filter) if search_request.filter else None,
             retrieval=Retrieval(strategy=retrieval_strategy, offset=offset, limit=limit),
             reranking=Reranking(provider=providers["rerank"]) if rerank else None,
+            hydrate_documents=(
+                HydrateDocuments() if PayloadMode(payload_mode) == PayloadMode.LEAN else None
+            ),
             generate_answer=(
                 GenerateAnswer(provider=providers["answer"]) if generate_answer else None
             ),
@@ -182,19 +189,26 @@ class SearchFactory:
         rerank: bool,
         generate_answer: bool,
         ctx: ApiContext,
+        token_budgeter: TokenBudgeter,
     ) -> Dict[str, BaseProvider]:
-        """Select and validate all required providers."""
+        """Select and validate all required providers.
+
+        All providers share the request's token budgeter so token counts are reused
+        between the reranking and answer generation stages.
+        """
         providers = {}
 
         # Embedding provider (always required)
-        providers["embed"] = self._init_provider_with_model_spec("embed_query", api_keys, ctx)
+        providers["embed"] = self._init_provider_with_model_spec(
+            "embed_query", api_keys, ctx, token_budgeter
+        )
         if not providers["embed"]:
             raise ValueError("Embedding provider required. Configure OPENAI_API_KEY")
 
         # Query expansion provider (required if enabled)
         if expand_query:
             providers["expansion"] = self._init_provider_with_model_spec(
-                "query_expansion", api_keys, ctx
+                "query_expansion", api_keys, ctx, token_budgeter
             )
             if not providers["expansion"]:
                 raise ValueError(
@@ -205,7 +219,7 @@ class SearchFactory:
         # Query interpretation provider (required if enabled)
         if interpret_filters:
             providers["interpretation"] = self._init_provider_with_model_spec(
-                "query_interpretation", api_keys, ctx
+                "query_interpretation", api_keys, ctx, token_budgeter
             )
             if not providers["interpretation"]:
                 raise ValueError(
@@ -215,7 +229,9 @@ class SearchFactory:
 
         # Reranking provider (required if enabled)
         if rerank:
-            providers["rerank"] = self._init_provider_with_model_spec("reranking", api_keys, ctx)
+            providers["rerank"] = self._init_provider_with_model_spec(
+                "reranking", api_keys, ctx, token_budgeter
+            )
             if not providers["rerank"]:
                 raise ValueError(
                     "Reranking enabled but no provider available. "
@@ -225,7 +241,7 @@ class SearchFactory:
         # Answer generation provider (required if enabled)
         if generate_answer:
             providers["answer"] = self._init_provider_with_model_spec(
-                "generate_answer", api_keys, ctx
+                "generate_answer", api_keys, ctx, token_budgeter
             )
             if not providers["answer"]:
                 raise ValueError(
@@ -237,7 +253,11 @@ class SearchFactory:
         return providers
 
     def _init_provider_with_model_spec(
-        self, operation_name: str, api_keys: Dict[str, Optional[str]], ctx: ApiContext
+        self,
+        operation_name: str,
+        api_keys: Dict[str, Optional[str]],
+        ctx: ApiContext,
+        token_budgeter: TokenBudgeter,
     ) -> Optional[BaseProvider]:
         """Select and initialize provider for an operation."""
         preferences = operation_preferences.get(operation_name, {})
@@ -275,17 +295,32 @@ class SearchFactory:
                     ctx.logger.debug(
                         f"[Factory] Attempting to initialize GroqProvider for {operation_name}"
                     )
-                    return GroqProvider(api_key=api_key, model_spec=model_spec, ctx=ctx)
+                    return GroqProvider(
+                        api_key=api_key,
+                        model_spec=model_spec,
+                        ctx=ctx,
+                        token_budgeter=token_budgeter,
+                    )
                 elif provider_name == "openai":
                     ctx.logger.debug(
                         f"[Factory] Attempting to initialize OpenAIProvider for {operation_name}"
                     )
-                    return OpenAIProvider(api_key=api_key, model_spec=model_spec, ctx=ctx)
+                    return OpenAIProvider(
+                        api_key=api_key,
+                        model_spec=model_spec,
+                        ctx=ctx,
+                        token_budgeter=token_budgeter,
+                    )
                 elif provider_name == "cohere":
                     ctx.logger.debug(
                         f"[Factory] Attempting to initialize CohereProvider for {operation_name}"
                     )
-                    return CohereProvider(api_key=api_key, model_spec=model_spec, ctx=ctx)
+                    return CohereProvider(
+                        api_key=api_key,
+                        model_spec=model_spec,
+                        ctx=ctx,
+                        token_budgeter=token_budgeter,
+                    )
             except Exception as e:
                 # Provider initialization failed (bad API key, missing tokenizer, etc.)
                 # Try next provider in fallback order
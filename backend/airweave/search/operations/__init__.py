@@ -1,5 +1,6 @@
 from .embed_query import EmbedQuery
 from .generate_answer import GenerateAnswer
+from .hydrate_documents import HydrateDocuments
 from .query_expansion import QueryExpansion
 from .query_interpretation import QueryInterpretation
 from .reranking import Reranking
@@ -10,6 +11,7 @@ from .user_filter import UserFilter
 __all__ = [
     "EmbedQuery",
     "GenerateAnswer",
+    "HydrateDocuments",
     "QueryExpansion",
     "QueryInterpretation",
     "Reranking",
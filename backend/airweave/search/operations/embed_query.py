@@ -10,6 +10,7 @@ from typing import Any, List, Optional
 from airweave.api.context import ApiContext
 from airweave.platform.embedding_models.bm25_text2vec import BM25Text2Vec
 from airweave.schemas.search import RetrievalStrategy
+from airweave.search.cache import search_cache
 from airweave.search.context import SearchContext
 from airweave.search.providers._base import BaseProvider
 
@@ -90,8 +91,25 @@ class EmbedQuery(SearchOperation):
     async def _generate_dense_embeddings(
         self, queries: List[str], ctx: ApiContext
     ) -> List[List[float]]:
-        """Generate dense neural embeddings using provider."""
-        dense_embeddings = await self.provider.embed(queries)
+        """Generate dense neural embeddings using provider, reusing cached query vectors."""
+        model = self.provider.model_spec.embedding_model.name
+        cache_keys = [
+            search_cache.artifact_key("embedding", model=model, text=query) for query in queries
+        ]
+        cached = [await search_cache.get_artifact(key) for key in cache_keys]
+
+        missing = [i for i, vector in enumerate(cached) if vector is None]
+        if missing:
+            fresh = await self.provider.embed([queries[i] for i in missing])
+            if len(fresh) != len(missing):
+                raise RuntimeError(
+                    f"Embedding count mismatch: got {len(fresh)} for {len(missing)} queries"
+                )
+            for i, vector in zip(missing, fresh, strict=True):
+                cached[i] = vector
+                await search_cache.set_artifact(cache_keys[i], vector)
+
+        dense_embeddings = cached
 
         # Validate we got embeddings for all queries
         if len(dense_embeddings) != len(queries):
@@ -27,7 +27,7 @@ class GenerateAnswer(SearchOperation):
 
     def depends_on(self) -> List[str]:
         """Depends on retrieval and reranking to have results."""
-        return ["Retrieval", "Reranking"]
+        return ["Retrieval", "HydrateDocuments", "Reranking"]
 
     async def execute(
         self,
@@ -57,7 +57,9 @@ class GenerateAnswer(SearchOperation):
             op_name=self.__class__.__name__,
         )
 
-        formatted_context, chosen_count = self._budget_and_format_results(results, context.query)
+        formatted_context, chosen_count = await self._budget_and_format_results(
+            results, context.query
+        )
         ctx.logger.debug(
             f"[GenerateAnswer] number of results that fit in context window: {chosen_count}"
         )
@@ -97,7 +99,7 @@ class GenerateAnswer(SearchOperation):
             op_name=self.__class__.__name__,
         )
 
-    def _budget_and_format_results(self, results: List[Dict], query: str) -> tuple[str, int]:
+    async def _budget_and_format_results(self, results: List[Dict], query: str) -> tuple[str, int]:
         """Format results while respecting token budget."""
         tokenizer = getattr(self.provider, "llm_tokenizer", None)
         if not tokenizer:
@@ -110,8 +112,10 @@ class GenerateAnswer(SearchOperation):
         if not context_window:
             raise RuntimeError("Context window not configured for LLM model")
 
+        budgeter = self.provider.token_budgeter
+
         static_text = GENERATE_ANSWER_SYSTEM_PROMPT.format(context="") + query
-        static_tokens = self.provider.count_tokens(static_text, tokenizer)
+        static_tokens = await budgeter.count(static_text, tokenizer)
 
         budget = context_window - static_tokens - self.MAX_COMPLETION_TOKENS - self.SAFETY_TOKENS
 
@@ -123,36 +127,20 @@ class GenerateAnswer(SearchOperation):
 
         # Fit as many results as possible within budget
         separator = "\n\n---\n\n"
-        chosen_parts: List[str] = []
-        chosen_count = 0
-        running_tokens = 0
-
-        for i, result in enumerate(results):
-            formatted_result = self._format_single_result(i + 1, result)
-            result_tokens = self.provider.count_tokens(formatted_result, tokenizer)
-            separator_tokens = self.provider.count_tokens(separator, tokenizer) if i > 0 else 0
-
-            if running_tokens + result_tokens + separator_tokens <= budget:
-                if i > 0:
-                    chosen_parts.append(separator)
-                chosen_parts.append(formatted_result)
-                running_tokens += result_tokens + separator_tokens
-                chosen_count += 1
-            else:
-                break
-
-        # Ensure at least one result if possible
-        if not chosen_parts and results:
-            first_result = self._format_single_result(1, results[0])
-            first_tokens = self.provider.count_tokens(first_result, tokenizer)
-            if first_tokens <= budget:
-                return first_result, 1
+        formatted_results = [
+            self._format_single_result(i + 1, result) for i, result in enumerate(results)
+        ]
+        chosen_count, _, result_tokens = await budgeter.fit(
+            formatted_results, tokenizer, budget, separator=separator
+        )
+
+        if not chosen_count and results:
             raise RuntimeError(
-                f"First result ({first_tokens} tokens) exceeds token budget ({budget} tokens). "
+                f"First result ({result_tokens[0]} tokens) exceeds token budget ({budget} tokens). "
                 "Results may be too large or context window too small."
             )
 
-        return "".join(chosen_parts), chosen_count
+        return separator.join(formatted_results[:chosen_count]), chosen_count
 
     def _format_single_result(self, index: int, result: Dict) -> str:
         """Format a single search result for LLM context.
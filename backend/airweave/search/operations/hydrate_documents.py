@@ -0,0 +1,44 @@
+"""Document hydration operation.
+
+Collections in lean payload mode only store search fields in Qdrant. This operation
+replaces the lean payloads of the retrieved results with the full entity documents from
+the side store, so reranking, answer generation and API consumers see complete results.
+"""
+
+from typing import Any, List
+
+from airweave.api.context import ApiContext
+from airweave.core.entity_document_service import entity_document_service
+from airweave.search.context import SearchContext
+
+from ._base import SearchOperation
+
+
+class HydrateDocuments(SearchOperation):
+    """Load full documents for the results of a lean payload collection."""
+
+    def depends_on(self) -> List[str]:
+        """Depends on retrieval to have results."""
+        return ["Retrieval"]
+
+    async def execute(
+        self,
+        context: SearchContext,
+        state: dict[str, Any],
+        ctx: ApiContext,
+    ) -> None:
+        """Swap lean payloads for full documents."""
+        results = state.get("results") or []
+        point_ids = [r["id"] for r in results if isinstance(r, dict) and r.get("id") is not None]
+        if not point_ids:
+            return
+
+        documents = await entity_document_service.get_documents(context.collection_id, point_ids)
+        ctx.logger.debug(f"[HydrateDocuments] Hydrated {len(documents)}/{len(point_ids)} results")
+
+        for result in results:
+            if not isinstance(result, dict):
+                continue
+            document = documents.get(str(result.get("id")))
+            if document is not None:
+                result["payload"] = document
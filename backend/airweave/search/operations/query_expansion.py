@@ -10,6 +10,7 @@ from typing import Any, List
 from pydantic import BaseModel, Field
 
 from airweave.api.context import ApiContext
+from airweave.search.cache import normalize_query, search_cache
 from airweave.search.context import SearchContext
 from airweave.search.prompts import QUERY_EXPANSION_SYSTEM_PROMPT
 from airweave.search.providers._base import BaseProvider
@@ -64,6 +65,18 @@ class QueryExpansion(SearchOperation):
 
         query = context.query
 
+        cache_key = search_cache.artifact_key(
+            "expansion",
+            query=normalize_query(query),
+            model=self.provider.model_spec.llm_model.name,
+            n=self.NUMBER_OF_EXPANSIONS,
+        )
+        cached = await search_cache.get_artifact(cache_key)
+        if cached:
+            ctx.logger.debug("[QueryExpansion] Using cached alternatives")
+            await self._finish(cached, context, state)
+            return
+
         # Validate query length before sending to LLM
         self._validate_query_length(query, ctx)
 
@@ -95,13 +108,20 @@ class QueryExpansion(SearchOperation):
                 f"LLM returned wrong number of valid alternatives."
             )
 
+        await search_cache.set_artifact(cache_key, valid_alternatives)
+        await self._finish(valid_alternatives, context, state)
+
+    async def _finish(
+        self, alternatives: List[str], context: SearchContext, state: dict[str, Any]
+    ) -> None:
+        """Write alternatives to state and emit the expansion_done event."""
         # Write alternatives to state (original query remains in context.query)
-        state["expanded_queries"] = valid_alternatives
+        state["expanded_queries"] = alternatives
 
         # Emit expansion done with alternatives
         await context.emitter.emit(
             "expansion_done",
-            {"alternatives": valid_alternatives},
+            {"alternatives": alternatives},
             op_name=self.__class__.__name__,
         )
 
@@ -32,8 +32,8 @@ class Reranking(SearchOperation):
         self.provider = provider
 
     def depends_on(self) -> List[str]:
-        """Depends on retrieval to have results to rerank."""
-        return ["Retrieval"]
+        """Depends on retrieval (and hydration of lean payloads) to have results to rerank."""
+        return ["Retrieval", "HydrateDocuments"]
 
     async def execute(
         self,
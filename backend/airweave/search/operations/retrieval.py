@@ -19,6 +19,7 @@ class Retrieval(SearchOperation):
     """Execute vector similarity search in Qdrant."""
 
     RERANK_PREFETCH_MULTIPLIER = 2.0  # Fetch 2x more candidates for reranking
+    FUSION = "rrf"  # Fusion across query expansions ("rrf" or "dbsf")
 
     def __init__(self, strategy: RetrievalStrategy, offset: int, limit: int) -> None:
         """Initialize with retrieval configuration."""
@@ -196,73 +197,29 @@ class Retrieval(SearchOperation):
         has_reranking: bool,
         ctx: ApiContext,
     ) -> List[Dict]:
-        """Execute bulk search - returns deduplicated results."""
-        # Calculate limit (include offset since we apply it after deduplication)
+        """Execute multi-query search with rank fusion and deduplication done in Qdrant."""
+        # Calculate limit (include offset since pagination is applied after fusion)
         fetch_limit = self._calculate_fetch_limit(has_reranking, include_offset=True)
         ctx.logger.debug(f"[Retrieval] Fetch limit: {fetch_limit}")
 
-        num_queries = len(dense_embeddings or sparse_embeddings)
-        filter_conditions = [filter_dict] * num_queries if filter_dict else None
+        # Reranking needs payloads of every candidate; otherwise only the final page
+        hydrate_limit = None if has_reranking else self.offset + self.limit
 
-        results = await destination.bulk_search(
+        results = await destination.fused_search(
             query_vectors=dense_embeddings or [],
             limit=fetch_limit,
-            with_payload=True,
-            filter_conditions=filter_conditions,
+            hydrate_limit=hydrate_limit,
+            filter=filter_dict,
             sparse_vectors=sparse_embeddings,
             search_method=search_method,
             decay_config=decay_config,
+            fusion=self.FUSION,
         )
 
         if not isinstance(results, list):
             raise RuntimeError(f"Expected list of results, got {type(results)}")
 
-        # Deduplicate results (bulk search returns overlapping results from multiple queries)
-        deduplicated = self._deduplicate_results(results)
-
-        return deduplicated
-
-    def _deduplicate_results(self, results: List[Dict]) -> List[Dict]:
-        """Deduplicate results keeping highest scores."""
-        if not results:
-            return []
-
-        best_results = {}
-
-        for result in results:
-            if not isinstance(result, dict):
-                raise ValueError(f"Invalid result type in search results: {type(result)}")
-
-            # Extract document ID
-            doc_id = result.get("id") or result.get("_id")
-
-            if not doc_id and "payload" in result:
-                payload = result.get("payload", {})
-                if isinstance(payload, dict):
-                    doc_id = (
-                        payload.get("entity_id")
-                        or payload.get("id")
-                        or payload.get("_id")
-                        or payload.get("db_entity_id")
-                    )
-
-            if not doc_id:
-                raise ValueError(
-                    "Search result missing document ID. Cannot deduplicate. "
-                    f"Result: {result.keys() if isinstance(result, dict) else result}"
-                )
-
-            score = result.get("score", 0)
-
-            # Keep result with highest score
-            if doc_id not in best_results or score > best_results[doc_id].get("score", 0):
-                best_results[doc_id] = result
-
-        # Convert to list and sort by score
-        merged = list(best_results.values())
-        merged.sort(key=lambda x: x.get("score", 0), reverse=True)
-
-        return merged
+        return results
 
     def _apply_pagination(self, results: List[Dict]) -> List[Dict]:
         """Apply offset and limit (for bulk search after deduplication)."""
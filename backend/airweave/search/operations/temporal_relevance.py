@@ -3,6 +3,10 @@
 Computes dynamic time-based decay configuration by analyzing the actual
 time range of the (optionally filtered) collection. This enables recency-aware
 ranking that respects the dataset's time distribution.
+
+The range is read from per-collection (and per-source) timestamp statistics maintained
+during sync. Qdrant is only scrolled when a filter narrows the search space beyond a
+single source, or when the statistics have not been seeded yet.
 """
 
 from datetime import datetime, timezone
@@ -12,6 +16,7 @@ from pydantic import BaseModel
 from qdrant_client.http import models as rest
 
 from airweave.api.context import ApiContext
+from airweave.core.timestamp_stats_service import timestamp_stats_service
 from airweave.search.context import SearchContext
 
 from ._base import SearchOperation
@@ -70,30 +75,27 @@ class TemporalRelevance(SearchOperation):
 
         # Get filter from state if available (respects filtered timespan)
         filter_dict = state.get("filter")
-        qdrant_filter = self._convert_to_qdrant_filter(filter_dict)
-
-        # Connect to Qdrant (runtime import to avoid circular dependency)
-        from airweave.platform.destinations.qdrant import QdrantDestination
 
-        destination = await QdrantDestination.create(
-            collection_id=context.collection_id, vector_size=context.vector_size, logger=None
-        )
+        # Statistics cover the whole collection or a single source; any other filter
+        # narrows the space and needs a scan
+        stats_scope_applies, source = self._stats_scope(filter_dict)
+        stats_range = None
+        if stats_scope_applies:
+            stats_range = await timestamp_stats_service.get_range(context.collection_id, source)
+
+        if stats_range:
+            oldest, newest = stats_range
+            ctx.logger.debug("[TemporalRelevance] Using collection timestamp statistics")
+        else:
+            qdrant_filter = self._convert_to_qdrant_filter(filter_dict)
+            scan_result = await self._scan_timestamps(context, qdrant_filter, ctx)
+            if scan_result is None:
+                return
+            oldest, newest = scan_result
+
+            if stats_scope_applies and oldest and newest:
+                await timestamp_stats_service.seed(context.collection_id, oldest, newest, source)
 
-        # First, check if the filtered search space has any documents
-        document_count = await self._count_filtered_documents(destination, qdrant_filter)
-        ctx.logger.debug(f"[TemporalRelevance] Filtered document count: {document_count}")
-
-        if document_count == 0:
-            await context.emitter.emit(
-                "recency_skipped",
-                {"reason": "no_documents_in_filtered_space"},
-                op_name=self.__class__.__name__,
-            )
-            ctx.logger.warning("[TemporalRelevance] No documents found in filtered search space. ")
-            return
-
-        # Get oldest and newest timestamps
-        oldest, newest = await self._get_min_max_timestamps(destination, qdrant_filter)
         ctx.logger.debug(f"[TemporalRelevance] Oldest timestamp: {oldest}")
         ctx.logger.debug(f"[TemporalRelevance] Newest timestamp: {newest}")
 
@@ -104,8 +106,8 @@ class TemporalRelevance(SearchOperation):
                 op_name=self.__class__.__name__,
             )
             ctx.logger.warning(
-                f"[TemporalRelevance] Could not find valid timestamps in "
-                f"{document_count} documents. Skipping temporal relevance calculation."
+                "[TemporalRelevance] Could not find valid timestamps. "
+                "Skipping temporal relevance calculation."
             )
             # Don't fail - just skip temporal relevance
             return
@@ -158,6 +160,87 @@ class TemporalRelevance(SearchOperation):
         # Write to state
         state["decay_config"] = decay_config
 
+    async def _scan_timestamps(
+        self,
+        context: SearchContext,
+        qdrant_filter: Optional[rest.Filter],
+        ctx: ApiContext,
+    ) -> Optional[tuple[Optional[datetime], Optional[datetime]]]:
+        """Find the timestamp range by scrolling Qdrant; None if the space is empty."""
+        # Connect to Qdrant (runtime import to avoid circular dependency)
+        from airweave.platform.destinations.qdrant import QdrantDestination
+
+        destination = await QdrantDestination.create(
+            collection_id=context.collection_id, vector_size=context.vector_size, logger=None
+        )
+        scoped_filter = self._with_tenant_filter(qdrant_filter, context)
+
+        # First, check if the filtered search space has any documents
+        document_count = await self._count_filtered_documents(destination, scoped_filter)
+        ctx.logger.debug(f"[TemporalRelevance] Filtered document count: {document_count}")
+
+        if document_count == 0:
+            await context.emitter.emit(
+                "recency_skipped",
+                {"reason": "no_documents_in_filtered_space"},
+                op_name=self.__class__.__name__,
+            )
+            ctx.logger.warning("[TemporalRelevance] No documents found in filtered search space. ")
+            return None
+
+        # Get oldest and newest timestamps
+        return await self._get_min_max_timestamps(destination, scoped_filter)
+
+    def _stats_scope(self, filter_dict: Optional[dict]) -> tuple[bool, Optional[str]]:
+        """Decide whether timestamp statistics can answer for this filter.
+
+        Returns:
+            (applies, source): applies is False when the filter narrows the space beyond
+            a single source; source is the source short name for source-scoped statistics.
+        """
+        if not filter_dict:
+            return True, None
+
+        if (
+            filter_dict.get("should")
+            or filter_dict.get("must_not")
+            or filter_dict.get("min_should")
+        ):
+            return False, None
+
+        must = filter_dict.get("must") or []
+        if not must:
+            return True, None
+        if len(must) != 1 or not isinstance(must[0], dict):
+            return False, None
+
+        condition = must[0]
+        match = condition.get("match") or {}
+        if condition.get("key") in ("source_name", "airweave_system_metadata.source_name") and (
+            isinstance(match, dict) and isinstance(match.get("value"), str)
+        ):
+            return True, match["value"]
+
+        return False, None
+
+    def _with_tenant_filter(
+        self, qdrant_filter: Optional[rest.Filter], context: SearchContext
+    ) -> rest.Filter:
+        """Restrict scans to the collection's points in the shared Qdrant collection."""
+        tenant_condition = rest.FieldCondition(
+            key="airweave_collection_id",
+            match=rest.MatchValue(value=str(context.collection_id)),
+        )
+        if qdrant_filter is None:
+            return rest.Filter(must=[tenant_condition])
+
+        return rest.Filter(
+            must=[tenant_condition] + list(qdrant_filter.must or []),
+            should=qdrant_filter.should,
+            must_not=qdrant_filter.must_not,
+            min_should=qdrant_filter.min_should,
+        )
+
     def _convert_to_qdrant_filter(self, filter_dict: Optional[dict]) -> Optional[rest.Filter]:
         """Convert filter dict to Qdrant Filter object."""
         if not filter_dict:
@@ -72,6 +72,26 @@ class SearchOrchestrator:
 
         return SearchResponse(results=state.get("results"), completion=state.get("completion"))
 
+    async def replay(self, context: SearchContext, response: SearchResponse) -> None:
+        """Emit the terminal events of a search served from the cache."""
+        emitter = context.emitter
+
+        await emitter.emit(
+            "start",
+            {
+                "request_id": context.request_id,
+                "query": context.query,
+                "collection_id": str(context.collection_id),
+                "cached": True,
+            },
+        )
+        if response.completion is not None:
+            await emitter.emit(
+                "completion_done", {"text": response.completion}, op_name="GenerateAnswer"
+            )
+        await emitter.emit("results", {"results": response.results})
+        await emitter.emit("done", {"request_id": context.request_id})
+
     def _resolve_execution_order(
         self, context: SearchContext, ctx: ApiContext
     ) -> List[SearchOperation]:
@@ -132,6 +152,7 @@ class SearchOrchestrator:
                 context.user_filter,
                 context.temporal_relevance,
                 context.retrieval,
+                context.hydrate_documents,
                 context.reranking,
                 context.generate_answer,
             ]
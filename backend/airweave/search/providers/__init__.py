@@ -4,6 +4,7 @@ from ._base import BaseProvider
 from .cohere import CohereProvider
 from .groq import GroqProvider
 from .openai import OpenAIProvider
+from .registry import ProviderRegistry, provider_registry
 from .schemas import (
     EmbeddingModelConfig,
     LLMModelConfig,
@@ -20,4 +21,6 @@ __all__ = [
     "CohereProvider",
     "GroqProvider",
     "OpenAIProvider",
+    "ProviderRegistry",
+    "provider_registry",
 ]
@@ -1,29 +1,48 @@
 """Base provider for LLM operations."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel
-from tiktoken import Encoding, get_encoding
+from tiktoken import Encoding
 
 from airweave.api.context import ApiContext
+from airweave.search.token_budget import TokenBudgeter
 
+from .registry import provider_registry
 from .schemas import ProviderModelSpec
 
 
 class BaseProvider(ABC):
     """Base class for LLM providers."""
 
-    def __init__(self, api_key: str, model_spec: ProviderModelSpec, ctx: ApiContext) -> None:
-        """Initialize provider with API key and model specifications."""
+    def __init__(
+        self,
+        api_key: str,
+        model_spec: ProviderModelSpec,
+        ctx: ApiContext,
+        token_budgeter: Optional[TokenBudgeter] = None,
+    ) -> None:
+        """Initialize provider with API key and model specifications.
+
+        The token budgeter is request-scoped; providers of the same search share one so
+        token counts computed by one stage are reused by the next.
+        """
         self.api_key = api_key
         self.model_spec = model_spec
         self.ctx = ctx
+        self.token_budgeter = token_budgeter or TokenBudgeter()
+
+    def _get_shared_client(self, provider_name: str, factory: Callable[[], Any]) -> Any:
+        """Get a process-wide SDK client so HTTP connection pools are reused across requests."""
+        return provider_registry.get_client(
+            provider_name, self.api_key, self.model_spec.model_dump_json(), factory
+        )
 
     def _load_tokenizer(self, tokenizer_name: str, model_type: str) -> Optional[Encoding]:
         """Load a tokenizer by name with consistent error handling."""
         try:
-            return get_encoding(tokenizer_name)
+            return provider_registry.get_tokenizer(tokenizer_name)
         except Exception as e:
             raise RuntimeError(
                 f"Failed to load {model_type} tokenizer '{tokenizer_name}': {e}"
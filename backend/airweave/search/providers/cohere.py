@@ -15,6 +15,7 @@ from pydantic import BaseModel
 from tiktoken import Encoding
 
 from airweave.api.context import ApiContext
+from airweave.search.token_budget import TokenBudgeter
 
 from ._base import BaseProvider
 from .schemas import ProviderModelSpec
@@ -23,15 +24,23 @@ from .schemas import ProviderModelSpec
 class CohereProvider(BaseProvider):
     """Cohere LLM provider."""
 
-    def __init__(self, api_key: str, model_spec: ProviderModelSpec, ctx: ApiContext) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model_spec: ProviderModelSpec,
+        ctx: ApiContext,
+        token_budgeter: Optional[TokenBudgeter] = None,
+    ) -> None:
         """Initialize Cohere provider with model specs from defaults.yml."""
-        super().__init__(api_key, model_spec, ctx)
+        super().__init__(api_key, model_spec, ctx, token_budgeter)
 
         if cohere is None:
             raise ImportError("Cohere package not installed. Install with: pip install cohere")
 
         try:
-            self.client = cohere.AsyncClientV2(api_key=api_key)
+            self.client = self._get_shared_client(
+                "cohere", lambda: cohere.AsyncClientV2(api_key=api_key)
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Cohere client: {e}") from e
 
@@ -79,12 +88,14 @@ class CohereProvider(BaseProvider):
         max_tokens_per_doc = self.model_spec.rerank_model.max_tokens_per_doc
         max_documents = self.model_spec.rerank_model.max_documents
 
-        # Validate document token counts before sending
-        for i, doc in enumerate(documents):
-            token_count = self.count_tokens(doc, self.rerank_tokenizer)
+        # Validate document token counts before sending; exact, since this is an API limit
+        if self.rerank_tokenizer is None:
+            raise RuntimeError("Tokenizer not initialized for token counting")
+        token_counts = await self.token_budgeter.count_exact(documents, self.rerank_tokenizer)
+        for i, token_count in enumerate(token_counts):
             if token_count > max_tokens_per_doc:
                 raise ValueError(
-                    f"Document at index {i} has ~{token_count} tokens, "
+                    f"Document at index {i} has {token_count} tokens, "
                     f"exceeds Cohere limit of {max_tokens_per_doc}. "
                     f"Operation must truncate documents before calling rerank."
                 )
@@ -12,6 +12,7 @@ from pydantic import BaseModel
 from tiktoken import Encoding
 
 from airweave.api.context import ApiContext
+from airweave.search.token_budget import TokenBudgeter
 
 from ._base import BaseProvider
 from .schemas import ProviderModelSpec
@@ -24,12 +25,18 @@ class GroqProvider(BaseProvider):
     MAX_STRUCTURED_OUTPUT_TOKENS = 2000
     RERANK_SAFETY_TOKENS = 1500
 
-    def __init__(self, api_key: str, model_spec: ProviderModelSpec, ctx: ApiContext) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model_spec: ProviderModelSpec,
+        ctx: ApiContext,
+        token_budgeter: Optional[TokenBudgeter] = None,
+    ) -> None:
         """Initialize Groq provider with model specs from defaults.yml."""
-        super().__init__(api_key, model_spec, ctx)
+        super().__init__(api_key, model_spec, ctx, token_budgeter)
 
         try:
-            self.client = AsyncGroq(api_key=api_key)
+            self.client = self._get_shared_client("groq", lambda: AsyncGroq(api_key=api_key))
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Groq client: {e}") from e
 
@@ -137,7 +144,7 @@ class GroqProvider(BaseProvider):
             rankings: List[RankedResult]
 
         # Budget documents to fit in context window
-        chosen, user_prompt = self._budget_documents_for_reranking(query, documents)
+        chosen, user_prompt = await self._budget_documents_for_reranking(query, documents)
 
         # Call LLM with structured output
         rerank_result = await self.structured_output(
@@ -160,7 +167,7 @@ class GroqProvider(BaseProvider):
 
         return mapped[:top_n]
 
-    def _budget_documents_for_reranking(
+    async def _budget_documents_for_reranking(
         self, query: str, documents: List[str]
     ) -> tuple[List[int], str]:
         """Select maximum documents that fit in context window and build prompt."""
@@ -183,11 +190,9 @@ class GroqProvider(BaseProvider):
 
         # Calculate static token costs
         static_tokens = sum(
-            [
-                self.count_tokens(system_prompt, self.rerank_tokenizer),
-                self.count_tokens(header, self.rerank_tokenizer),
-                self.count_tokens(footer, self.rerank_tokenizer),
-            ]
+            await self.token_budgeter.count_many(
+                [system_prompt, header, footer], self.rerank_tokenizer
+            )
         )
 
         budget = (
@@ -201,26 +206,15 @@ class GroqProvider(BaseProvider):
             raise RuntimeError("Insufficient token budget for reranking prompts")
 
         # Fit as many documents as possible within budget
-        chosen: List[int] = []
-        running = 0
-        for i, doc in enumerate(documents):
-            piece = f"[{i}] {doc}"
-            piece_tokens = self.count_tokens(piece, self.rerank_tokenizer)
-            separator_tokens = 2 if i > 0 else 0  # "\n\n" between documents
-
-            if running + piece_tokens + separator_tokens <= budget:
-                chosen.append(i)
-                running += piece_tokens + separator_tokens
-            else:
-                break
+        pieces = [f"[{i}] {doc}" for i, doc in enumerate(documents)]
+        fitted, _, piece_tokens = await self.token_budgeter.fit(
+            pieces, self.rerank_tokenizer, budget, separator="\n\n"
+        )
+        chosen: List[int] = list(range(fitted))
 
         # If no documents fit, we can't proceed
         if not chosen:
-            first_doc_tokens = (
-                self.count_tokens(f"[0] {documents[0]}", self.rerank_tokenizer)
-                if documents
-                else "N/A"
-            )
+            first_doc_tokens = piece_tokens[0] if piece_tokens else "N/A"
             raise RuntimeError(
                 f"No documents fit within token budget of {budget}. "
                 f"Context window: {context_window}, static tokens: {static_tokens}, "
@@ -0,0 +1,101 @@
+"""Process-level registry for provider SDK clients and tokenizers.
+
+Providers are constructed per search request (they carry the request-scoped ApiContext),
+but the expensive pieces behind them are long-lived: SDK clients own HTTP connection pools,
+and tiktoken encodings are costly to build. The registry hands out shared instances of both
+so a provider instance is a thin, cheap wrapper around process-wide resources.
+"""
+
+import asyncio
+import hashlib
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from tiktoken import Encoding, get_encoding
+
+
+class ProviderRegistry:
+    """Cache SDK clients per (provider, api key, model spec) and tokenizers per name.
+
+    Async SDK clients bind their connection pools to the event loop they are first used on,
+    so clients are scoped to the running loop. Entries for a loop are dropped automatically
+    when the loop is garbage collected.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty client and tokenizer caches."""
+        self._lock = threading.Lock()
+        self._clients: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, str, str], Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loopless_clients: Dict[Tuple[str, str, str], Any] = {}
+        self._tokenizers: Dict[str, Encoding] = {}
+
+    @staticmethod
+    def _client_key(provider: str, api_key: str, model_spec_key: str) -> Tuple[str, str, str]:
+        """Build a cache key without keeping the raw API key around as a dict key."""
+        key_digest = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        return provider, key_digest, model_spec_key
+
+    def _clients_for_current_loop(self) -> Dict[Tuple[str, str, str], Any]:
+        """Return the client map for the running event loop (or a loop-less fallback)."""
+        try:
+            loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None:
+            return self._loopless_clients
+
+        clients = self._clients.get(loop)
+        if clients is None:
+            clients = {}
+            self._clients[loop] = clients
+        return clients
+
+    def get_client(
+        self,
+        provider: str,
+        api_key: str,
+        model_spec_key: str,
+        factory: Callable[[], Any],
+    ) -> Any:
+        """Return a shared SDK client, creating it with ``factory`` on first use.
+
+        Args:
+            provider: Provider name (e.g. "openai", "groq", "cohere")
+            api_key: API key the client authenticates with
+            model_spec_key: Stable serialization of the provider's model spec
+            factory: Zero-argument callable that builds the client
+
+        Returns:
+            The cached (or freshly created) client instance
+        """
+        key = self._client_key(provider, api_key, model_spec_key)
+        with self._lock:
+            clients = self._clients_for_current_loop()
+            client = clients.get(key)
+            if client is None:
+                client = factory()
+                clients[key] = client
+            return client
+
+    def get_tokenizer(self, tokenizer_name: str) -> Encoding:
+        """Return a shared tiktoken encoding by name."""
+        with self._lock:
+            tokenizer = self._tokenizers.get(tokenizer_name)
+            if tokenizer is None:
+                tokenizer = get_encoding(tokenizer_name)
+                self._tokenizers[tokenizer_name] = tokenizer
+            return tokenizer
+
+    def clear(self) -> None:
+        """Drop all cached clients and tokenizers."""
+        with self._lock:
+            self._clients = weakref.WeakKeyDictionary()
+            self._loopless_clients = {}
+            self._tokenizers = {}
+
+
+provider_registry = ProviderRegistry()
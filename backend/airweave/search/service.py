@@ -13,6 +13,7 @@ from airweave import crud
 from airweave.api.context import ApiContext
 from airweave.core.exceptions import NotFoundException
 from airweave.schemas.search import SearchRequest, SearchResponse
+from airweave.search.cache import search_cache
 from airweave.search.factory import factory
 from airweave.search.helpers import search_helpers
 from airweave.search.orchestrator import orchestrator
@@ -41,11 +42,32 @@ class SearchService:
 
         ctx.logger.debug("Building search context")
         search_context = factory.build(
-            request_id, collection.id, readable_collection_id, search_request, stream, ctx
+            request_id,
+            collection.id,
+            readable_collection_id,
+            search_request,
+            stream,
+            ctx,
+            payload_mode=collection.payload_mode,
         )
 
-        ctx.logger.debug("Executing search")
-        response = await orchestrator.run(ctx, search_context)
+        # Serve repeated queries against an unchanged collection from the cache
+        cache_key = None
+        response = None
+        if search_cache.enabled:
+            generation = await search_cache.get_generation(collection.id)
+            if generation is not None:
+                cache_key = search_cache.response_key(collection.id, generation, search_request)
+                response = await search_cache.get_response(cache_key)
+
+        if response is not None:
+            ctx.logger.debug("Serving search from cache")
+            await orchestrator.replay(search_context, response)
+        else:
+            ctx.logger.debug("Executing search")
+            response = await orchestrator.run(ctx, search_context)
+            if cache_key:
+                await search_cache.set_response(cache_key, response)
 
         duration_ms = (time.monotonic() - start_time) * 1000
         ctx.logger.debug(f"Search completed in {duration_ms:.2f}ms")
@@ -0,0 +1,119 @@
+"""Token budgeting shared by the reranking and answer generation stages.
+
+Both stages have to fit as many candidate documents as possible into an LLM context window.
+The budgeter batch-encodes candidates with ``encode_batch`` in a worker thread and finds the
+cutoff with a prefix sum instead of tokenizing documents one by one on the event loop.
+
+Token counts are cached per line for the lifetime of a search request. Reranking and answer
+generation wrap the same result content in different headers, so counting line by line lets
+the answer stage reuse the counts of document bodies the rerank stage already tokenized.
+The count of a multi-line text is the sum of its line counts plus one token per newline,
+which matches tiktoken's pre-tokenization (it never merges across a newline boundary) up to
+runs of blank lines, where it slightly over-estimates. That is good enough to fit a budget
+with a safety margin, but not to enforce a hard API limit; ``count_exact`` encodes whole
+texts for that.
+
+``fit`` counts candidates in batches of growing size and stops at the first batch that
+overflows the budget, so a budget filled by the first few documents does not tokenize all
+of them.
+"""
+
+import asyncio
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, Sequence, Tuple
+
+from tiktoken import Encoding
+
+
+class TokenBudgeter:
+    """Request-scoped token counter with a per-line count cache."""
+
+    # Pieces counted in the first batch of ``fit``; every further batch is twice as large
+    FIT_BATCH_SIZE = 16
+
+    def __init__(self) -> None:
+        """Initialize an empty count cache."""
+        self._line_counts: Dict[Tuple[str, str], int] = {}
+
+    async def count_many(self, texts: Sequence[str], tokenizer: Encoding) -> List[int]:
+        """Count tokens for many texts, encoding uncached lines in one batch off the loop."""
+        split_texts = [text.split("\n") if text else [] for text in texts]
+
+        missing: List[str] = []
+        seen = set()
+        for lines in split_texts:
+            for line in lines:
+                key = (tokenizer.name, line)
+                if line and key not in self._line_counts and line not in seen:
+                    seen.add(line)
+                    missing.append(line)
+
+        if missing:
+            encoded = await asyncio.to_thread(
+                tokenizer.encode_batch, missing, disallowed_special=()
+            )
+            for line, tokens in zip(missing, encoded, strict=True):
+                self._line_counts[(tokenizer.name, line)] = len(tokens)
+
+        counts: List[int] = []
+        for lines in split_texts:
+            line_tokens = sum(self._line_counts.get((tokenizer.name, line), 0) for line in lines)
+            newline_tokens = max(len(lines) - 1, 0)
+            counts.append(line_tokens + newline_tokens)
+        return counts
+
+    async def count(self, text: str, tokenizer: Encoding) -> int:
+        """Count tokens for a single text."""
+        return (await self.count_many([text], tokenizer))[0]
+
+    async def count_exact(self, texts: Sequence[str], tokenizer: Encoding) -> List[int]:
+        """Count tokens for many texts exactly, encoding each whole text in one batch off the loop.
+
+        Use this for hard limits of an API; the per-line counts of ``count_many`` may be off.
+        """
+        if not texts:
+            return []
+        encoded = await asyncio.to_thread(
+            tokenizer.encode_batch, list(texts), disallowed_special=()
+        )
+        return [len(tokens) for tokens in encoded]
+
+    async def fit(
+        self,
+        pieces: Sequence[str],
+        tokenizer: Encoding,
+        budget: int,
+        separator: str = "",
+    ) -> Tuple[int, int, List[int]]:
+        """Find how many leading pieces fit in a budget when joined by a separator.
+
+        Args:
+            pieces: Candidate texts in priority order
+            tokenizer: Tokenizer of the target model
+            budget: Maximum number of tokens available for the joined pieces
+            separator: String placed between consecutive pieces
+
+        Returns:
+            Tuple of (number of pieces that fit, tokens used by them, token counts of the
+            pieces counted, at least the fitted ones and the first one)
+        """
+        if not pieces:
+            return 0, 0, []
+
+        separator_tokens = await self.count(separator, tokenizer) if separator else 0
+
+        counts: List[int] = []
+        batch_size = self.FIT_BATCH_SIZE
+        while len(counts) < len(pieces):
+            batch = pieces[len(counts) : len(counts) + batch_size]
+            counts.extend(await self.count_many(batch, tokenizer))
+            # Cumulative cost of the pieces so far: their tokens plus a separator between each
+            cumulative = list(accumulate(count + separator_tokens for count in counts))
+            fitted = bisect_right(cumulative, budget + separator_tokens)
+            if fitted < len(counts):
+                break
+            batch_size *= 2
+
+        used = cumulative[fitted - 1] - separator_tokens if fitted else 0
+        return fitted, used, counts
@@ -0,0 +1,26 @@
+"""add checkpoint columns to sync_cursor
+
+Revision ID: 3f6a9c2e8b51
+Revises: 8c1d4e7a2f93
+Create Date: 2026-10-19 14:12:05.318774
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f6a9c2e8b51'
+down_revision = '8c1d4e7a2f93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('sync_cursor', sa.Column('checkpoint_data', sa.JSON(), nullable=True))
+    op.add_column('sync_cursor', sa.Column('checkpointed_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade():
+    op.drop_column('sync_cursor', 'checkpointed_at')
+    op.drop_column('sync_cursor', 'checkpoint_data')
@@ -0,0 +1,53 @@
+"""add payload_mode to collection and entity_document table
+
+Revision ID: 5b8e2f1c7d40
+Revises: dea941855acd
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '5b8e2f1c7d40'
+down_revision = 'dea941855acd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        'collection',
+        sa.Column('payload_mode', sa.String(length=20), nullable=False, server_default='full'),
+    )
+
+    op.create_table('entity_document',
+    sa.Column('collection_id', sa.UUID(), nullable=False),
+    sa.Column('sync_id', sa.UUID(), nullable=False),
+    sa.Column('point_id', sa.UUID(), nullable=False),
+    sa.Column('db_entity_id', sa.UUID(), nullable=False),
+    sa.Column('entity_id', sa.String(), nullable=False),
+    sa.Column('parent_entity_id', sa.String(), nullable=True),
+    sa.Column('document', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('modified_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['collection_id'], ['collection.id'], name='fk_entity_document_collection_id', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['sync_id'], ['sync.id'], name='fk_entity_document_sync_id', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('collection_id', 'point_id', name='uq_entity_document_collection_point')
+    )
+    op.create_index('idx_entity_document_sync_id', 'entity_document', ['sync_id'], unique=False)
+    op.create_index('idx_entity_document_db_entity_id', 'entity_document', ['db_entity_id'], unique=False)
+    op.create_index('idx_entity_document_sync_id_parent_entity_id', 'entity_document', ['sync_id', 'parent_entity_id'], unique=False)
+    op.create_index('idx_entity_document_sync_id_entity_id', 'entity_document', ['sync_id', 'entity_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('idx_entity_document_sync_id_entity_id', table_name='entity_document')
+    op.drop_index('idx_entity_document_sync_id_parent_entity_id', table_name='entity_document')
+    op.drop_index('idx_entity_document_db_entity_id', table_name='entity_document')
+    op.drop_index('idx_entity_document_sync_id', table_name='entity_document')
+    op.drop_table('entity_document')
+    op.drop_column('collection', 'payload_mode')
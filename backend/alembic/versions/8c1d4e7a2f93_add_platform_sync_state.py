@@ -0,0 +1,32 @@
+"""add platform_sync_state table
+
+Revision ID: 8c1d4e7a2f93
+Revises: 5b8e2f1c7d40
+Create Date: 2026-10-19 11:03:27.551902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c1d4e7a2f93'
+down_revision = '5b8e2f1c7d40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('platform_sync_state',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('fingerprint', sa.String(length=64), nullable=False),
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('modified_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('platform_sync_state')
@@ -0,0 +1,24 @@
+"""add metadata_fingerprint to entity
+
+Revision ID: a7d2c5e9f014
+Revises: 3f6a9c2e8b51
+Create Date: 2026-10-19 16:40:27.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d2c5e9f014'
+down_revision = '3f6a9c2e8b51'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('entity', sa.Column('metadata_fingerprint', sa.String(), nullable=True, comment='Fingerprint of the provider metadata (checksum, eTag, revision, size and modified time) of a file entity'))
+
+
+def downgrade():
+    op.drop_column('entity', 'metadata_fingerprint')
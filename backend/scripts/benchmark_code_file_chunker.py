@@ -0,0 +1,171 @@
+"""Benchmark the code file chunker on large source files.
+
+Chunks generated source files of increasing size twice: the way the chunker used to
+(chunking and a deep copy per chunk on the event loop) and with ``code_file_chunker``. A
+heartbeat task ticks every 5 ms meanwhile; its longest gap is how long the event loop was
+blocked. The chunks of both runs are compared, and the chunk entities are checked to be
+independent of each other.
+
+tiktoken releases the GIL while it encodes, tree-sitter does not while it parses, so the
+remaining stall is the parse. Only the sync process pool (SYNC_PROCESS_POOL_SIZE, see
+benchmark_sync_process_pool.py) takes that off the loop's interpreter.
+
+    cd backend
+    python scripts/benchmark_code_file_chunker.py --sizes 0.5,2,5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from copy import deepcopy
+from typing import Awaitable, Callable, List, Tuple
+
+from airweave.core.logging import logger
+from airweave.platform.entities._base import AirweaveSystemMetadata, Breadcrumb, CodeFileEntity
+from airweave.platform.transformers import code_file_chunker as chunker_module
+from airweave.platform.transformers.utils import MAX_CHUNK_SIZE, METADATA_SIZE, count_tokens
+
+HEARTBEAT_S = 0.005
+
+
+def make_file(megabytes: float) -> CodeFileEntity:
+    """A generated Python module of about ``megabytes`` MB."""
+    functions = []
+    size = 0
+    while size < megabytes * 1e6:
+        j = len(functions)
+        function = (
+            f"def handler_{j}(payload, *, retries={j % 5}):\n"
+            f'    """Handle generated payload variant {j}."""\n'
+            f"    total = sum(item * {j} for item in payload if item % {j % 11 + 2})\n"
+            f"    for _ in range(retries):\n"
+            f"        total = (total * 31 + {j}) % 1_000_003\n"
+            f"    return {{'variant': {j}, 'total': total}}\n"
+        )
+        functions.append(function)
+        size += len(function) + 2
+    content = "\n\n".join(functions)
+    return CodeFileEntity(
+        entity_id="bench/generated.py",
+        breadcrumbs=[Breadcrumb(entity_id="bench", name="bench", type="repository")],
+        source_name="benchmark",
+        name="generated.py",
+        file_id="generated",
+        size=len(content),
+        path_in_repo="src/generated.py",
+        repo_name="bench",
+        repo_owner="airweave",
+        url="https://example.com/generated.py",
+        content=content,
+        language="python",
+        metadata={"generator": "benchmark"},
+        airweave_system_metadata=AirweaveSystemMetadata(source_name="benchmark"),
+    )
+
+
+async def legacy_chunker(file: CodeFileEntity, bench_logger) -> List[CodeFileEntity]:
+    """The previous implementation: everything on the loop, a deep copy per chunk."""
+    limit = MAX_CHUNK_SIZE - METADATA_SIZE
+    if count_tokens(file.content) <= limit:
+        return [file]
+    chunks = chunker_module.get_shared_code_chunker(limit).chunk(file.content)
+    chunked_files = []
+    for idx, chunk in enumerate(chunks):
+        chunked_file = deepcopy(file)
+        chunked_file.content = chunk.text
+        count_tokens(chunked_file.content)
+        chunked_file.metadata.update(
+            {
+                "chunk_index": idx + 1,
+                "total_chunks": len(chunks),
+                "original_file_id": file.file_id,
+                "chunk_start_index": chunk.start_index,
+                "chunk_end_index": chunk.end_index,
+            }
+        )
+        chunked_file.name = f"{file.name} (Chunk {idx + 1}/{len(chunks)})"
+        chunked_files.append(chunked_file)
+    return chunked_files
+
+
+async def timed(
+    chunker: Callable[..., Awaitable[List[CodeFileEntity]]], file: CodeFileEntity
+) -> Tuple[List[CodeFileEntity], float, float]:
+    """Run a chunker next to a heartbeat; returns chunks, seconds and the longest stall."""
+    stalls = [0.0]
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(HEARTBEAT_S)
+            now = time.perf_counter()
+            stalls[0] = max(stalls[0], now - last - HEARTBEAT_S)
+            last = now
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    chunks = await chunker(file, logger.with_context(component="benchmark"))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await beat
+    return chunks, elapsed, stalls[0]
+
+
+def compare(before: List[CodeFileEntity], after: List[CodeFileEntity]) -> List[str]:
+    """Differences between the chunks of both implementations, and shared state."""
+    problems = []
+    if [c.model_dump() for c in before] != [c.model_dump() for c in after]:
+        problems.append("chunks differ from the previous implementation")
+    if len(after) > 1:
+        first, second = after[0], after[1]
+        first.metadata["touched"] = True
+        first.breadcrumbs.append(Breadcrumb(entity_id="x", name="x", type="x"))
+        first.airweave_system_metadata.hash = "touched"
+        if (
+            "touched" in second.metadata
+            or len(second.breadcrumbs) != len(first.breadcrumbs) - 1
+            or second.airweave_system_metadata.hash
+        ):
+            problems.append("chunk entities share mutable state")
+    return problems
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Benchmark every file size."""
+    # Warm up tiktoken and tree-sitter
+    await chunker_module.code_file_chunker(make_file(0.05), logger)
+
+    problems = []
+    print(f"{'MB':>5} {'chunks':>7} {'before s':>9} {'stall s':>8} {'after s':>8} {'stall s':>8}")
+    for megabytes in args.sizes:
+        file = make_file(megabytes)
+        before, before_s, before_stall = await timed(legacy_chunker, make_file(megabytes))
+        after, after_s, after_stall = await timed(chunker_module.code_file_chunker, file)
+        print(
+            f"{megabytes:>5} {len(after):>7} {before_s:>9.2f} {before_stall:>8.3f} "
+            f"{after_s:>8.2f} {after_stall:>8.3f}"
+        )
+        problems += [f"{megabytes} MB: {problem}" for problem in compare(before, after)]
+        if file.content is None or file.metadata != {"generator": "benchmark"}:
+            problems.append(f"{megabytes} MB: original file was modified")
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=lambda s: [float(p) for p in s.split(",")], default=[0.5, 2, 5]
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
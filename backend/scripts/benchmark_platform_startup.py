@@ -0,0 +1,106 @@
+"""Startup-time benchmark for platform component discovery.
+
+Compares the cost of the pieces involved in starting an API replica:
+
+- computing the platform fingerprint (done on every start)
+- building the registry manifest from source (skipped when it was precomputed)
+- importing every platform module, which the full platform sync does
+- resolving a single source through ``ResourceLocator`` (the lazy path)
+
+With ``--db`` it also times ``sync_platform_components`` against the configured database,
+once forced and once with the fingerprint check, so the skip path can be compared with a
+full sync. Each import measurement runs in a fresh interpreter so module caches do not hide
+import costs:
+
+    cd backend
+    python scripts/benchmark_platform_startup.py --source github
+    python scripts/benchmark_platform_startup.py --db
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+STEPS = {
+    "fingerprint": (
+        "from airweave.platform.manifest import compute_platform_fingerprint\n"
+        "compute_platform_fingerprint()"
+    ),
+    "manifest_build": ("from airweave.platform.manifest import build_manifest\nbuild_manifest()"),
+    "import_all_platform_modules": (
+        "from airweave.platform.db_sync import _get_decorated_classes\n"
+        "_get_decorated_classes('airweave/platform')"
+    ),
+    "locator_single_source": (
+        "from airweave.platform.locator import resource_locator\n"
+        "from types import SimpleNamespace\n"
+        "resource_locator.get_source(SimpleNamespace(short_name={source!r}, "
+        "class_name={class_name!r}))"
+    ),
+}
+
+TIMER = """
+import time
+started = time.perf_counter()
+{body}
+print(time.perf_counter() - started)
+"""
+
+
+def time_in_subprocess(body: str) -> float:
+    """Run a snippet in a fresh interpreter and return its wall time in seconds."""
+    output = subprocess.run(
+        [sys.executable, "-c", TIMER.format(body=body)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+async def time_db_sync(runs: int) -> None:
+    """Time a forced platform sync against one that can be skipped by fingerprint."""
+    from airweave.db.session import AsyncSessionLocal
+    from airweave.platform.db_sync import sync_platform_components
+
+    for label, force in (("db_sync_forced", True), ("db_sync_unchanged", False)):
+        timings = []
+        for _ in range(runs):
+            async with AsyncSessionLocal() as db:
+                started = time.perf_counter()
+                await sync_platform_components("airweave/platform", db, force=force)
+                timings.append(time.perf_counter() - started)
+        print(f"{label:<30} {statistics.median(timings) * 1000:>10.1f} ms")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--source", default="github", help="Source short name to resolve")
+    parser.add_argument("--source-class", default=None, help="Class name of --source")
+    parser.add_argument("--db", action="store_true", help="Also time the DB platform sync")
+    args = parser.parse_args()
+
+    from airweave.platform.manifest import get_manifest_entry
+
+    entry = get_manifest_entry("sources", args.source)
+    if entry is None and args.source_class is None:
+        parser.error(f"Unknown source '{args.source}', pass --source-class")
+    class_name = args.source_class or entry["attribute"]
+
+    print(f"{'step':<30} {'median':>10}")
+    for label, body in STEPS.items():
+        body = body.format(source=args.source, class_name=class_name)
+        timings = [time_in_subprocess(body) for _ in range(args.runs)]
+        print(f"{label:<30} {statistics.median(timings) * 1000:>10.1f} ms")
+
+    if args.db:
+        asyncio.run(time_db_sync(args.runs))
+
+
+if __name__ == "__main__":
+    main()
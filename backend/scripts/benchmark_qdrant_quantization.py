@@ -0,0 +1,217 @@
+r"""Recall/latency benchmark for Qdrant vector storage options.
+
+Builds a synthetic clustered corpus, loads it into one collection per storage variant
+(full float32, scalar int8, binary; in RAM or with originals on disk) using the same
+collection layout as the shared airweave collections, and compares:
+
+- recall@k against exact (brute force) search on the float32 baseline
+- p50 / p95 query latency
+
+Requires a running Qdrant (e.g. `docker compose up qdrant`):
+
+    cd backend
+    python scripts/benchmark_qdrant_quantization.py --url http://localhost:6333 \
+        --points 50000 --dim 1536 --queries 200
+
+`--url :memory:` runs against the embedded local Qdrant for a quick smoke run (it ignores
+quantization and on-disk settings, so its numbers are not meaningful).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from dataclasses import dataclass
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models as rest
+
+from airweave.platform.destinations.collection_strategy import get_quantization_config
+
+VECTOR_NAME = "dense"
+TENANT_FIELD = "airweave_collection_id"
+
+
+@dataclass
+class Variant:
+    """A storage configuration under test."""
+
+    quantization: str
+    on_disk: bool
+
+    @property
+    def name(self) -> str:
+        """Collection suffix of the variant."""
+        return f"{self.quantization}{'_on_disk' if self.on_disk else ''}"
+
+
+VARIANTS = [
+    Variant("none", False),
+    Variant("none", True),
+    Variant("scalar", False),
+    Variant("scalar", True),
+    Variant("binary", False),
+    Variant("binary", True),
+]
+
+
+def make_corpus(points: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    """Unit-normalized vectors drawn around random cluster centers."""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim)).astype(np.float32)
+    assignment = rng.integers(0, clusters, size=points)
+    vectors = centers[assignment] + 0.35 * rng.normal(size=(points, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+async def create_collection(
+    client: AsyncQdrantClient, name: str, dim: int, variant: Variant
+) -> None:
+    """(Re)create a benchmark collection with the shared-collection layout."""
+    if await client.collection_exists(name):
+        await client.delete_collection(name)
+    await client.create_collection(
+        collection_name=name,
+        vectors_config={
+            VECTOR_NAME: rest.VectorParams(
+                size=dim, distance=rest.Distance.COSINE, on_disk=variant.on_disk
+            )
+        },
+        hnsw_config=rest.HnswConfigDiff(payload_m=16, m=0, ef_construct=100),
+        quantization_config=get_quantization_config(variant.quantization),
+        on_disk_payload=True,
+    )
+    await client.create_payload_index(
+        collection_name=name,
+        field_name=TENANT_FIELD,
+        field_schema=rest.KeywordIndexParams(type=rest.PayloadSchemaType.KEYWORD, is_tenant=True),
+    )
+
+
+async def load(
+    client: AsyncQdrantClient, name: str, vectors: np.ndarray, tenant: str, batch: int
+) -> None:
+    """Upsert the corpus for one tenant and wait until the collection is optimized."""
+    for start in range(0, len(vectors), batch):
+        chunk = vectors[start : start + batch]
+        await client.upsert(
+            collection_name=name,
+            points=[
+                rest.PointStruct(
+                    id=start + i,
+                    vector={VECTOR_NAME: v.tolist()},
+                    payload={TENANT_FIELD: tenant},
+                )
+                for i, v in enumerate(chunk)
+            ],
+            wait=False,
+        )
+    # Wait for indexing (and quantization) to finish before measuring
+    while True:
+        info = await client.get_collection(name)
+        if info.status == rest.CollectionStatus.GREEN:
+            return
+        await asyncio.sleep(1.0)
+
+
+async def query(
+    client: AsyncQdrantClient,
+    name: str,
+    vector: np.ndarray,
+    tenant: str,
+    limit: int,
+    params: rest.SearchParams | None,
+) -> tuple[list[int], float]:
+    """Run one tenant-filtered query and return (point ids, latency in ms)."""
+    started = time.perf_counter()
+    response = await client.query_points(
+        collection_name=name,
+        query=vector.tolist(),
+        using=VECTOR_NAME,
+        limit=limit,
+        query_filter=rest.Filter(
+            must=[rest.FieldCondition(key=TENANT_FIELD, match=rest.MatchValue(value=tenant))]
+        ),
+        search_params=params,
+        with_payload=False,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return [int(p.id) for p in response.points], elapsed_ms
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run all variants and print a recall/latency table."""
+    client = AsyncQdrantClient(location=args.url, api_key=args.api_key, timeout=300)
+    corpus = make_corpus(args.points, args.dim, args.clusters, args.seed)
+    queries = make_corpus(args.queries, args.dim, args.clusters, args.seed + 1)
+    tenant = str(uuid.uuid4())
+    prefix = f"bench_quantization_{args.dim}"
+
+    baseline_name = f"{prefix}_{VARIANTS[0].name}"
+    truth: list[set[int]] = []
+
+    print(f"{'variant':<18} {'recall@k':>9} {'p50 ms':>8} {'p95 ms':>8}  storage")
+    for variant in VARIANTS:
+        name = f"{prefix}_{variant.name}"
+        await create_collection(client, name, args.dim, variant)
+        await load(client, name, corpus, tenant, args.batch)
+
+        if not truth:
+            exact = rest.SearchParams(exact=True)
+            for q in queries:
+                ids, _ = await query(client, baseline_name, q, tenant, args.limit, exact)
+                truth.append(set(ids))
+
+        params = None
+        if variant.quantization != "none":
+            params = rest.SearchParams(
+                quantization=rest.QuantizationSearchParams(
+                    rescore=not args.no_rescore, oversampling=args.oversampling
+                )
+            )
+
+        recalls, latencies = [], []
+        for q, expected in zip(queries, truth, strict=True):
+            ids, elapsed_ms = await query(client, name, q, tenant, args.limit, params)
+            recalls.append(len(expected.intersection(ids)) / max(len(expected), 1))
+            latencies.append(elapsed_ms)
+
+        latencies.sort()
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        storage = "originals on disk" if variant.on_disk else "originals in RAM"
+        print(
+            f"{variant.name:<18} {statistics.mean(recalls):>9.3f} "
+            f"{statistics.median(latencies):>8.2f} {p95:>8.2f}  {storage}"
+        )
+
+        if not args.keep and variant is not VARIANTS[0]:
+            await client.delete_collection(name)
+
+    if not args.keep:
+        await client.delete_collection(baseline_name)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:6333")
+    parser.add_argument("--api-key", default=None)
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--clusters", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--oversampling", type=float, default=2.0)
+    parser.add_argument("--no-rescore", action="store_true")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="Keep benchmark collections")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
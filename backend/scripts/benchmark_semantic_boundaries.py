@@ -0,0 +1,183 @@
+"""Quality and speed benchmark of the semantic chunker boundary backends.
+
+Builds documents from runs of consecutive prose sentences of different pages of the docs
+(fern/docs/pages), joined without any markup, so a topic boundary is where one page's run
+ends and the next one starts. Each backend chunks every document; the chunk starts are
+compared with the true boundaries, at sentence granularity:
+
+- Pk (Beeferman et al.): probability that two sentences half a segment apart are wrongly
+  put in the same or in different chunks. Lower is better.
+- F1 of the boundaries, a predicted boundary within one sentence of a true one counting as
+  a hit.
+
+A fixed-length baseline (a boundary every mean-segment-length sentences) and a random one
+put the scores in perspective. The ``openai`` backend runs only with OPENAI_API_KEY set;
+``local`` downloads its model on first use.
+
+    cd backend
+    python scripts/benchmark_semantic_boundaries.py --documents 40 --backends texttiling,local
+"""
+
+import argparse
+import random
+import re
+import time
+from bisect import bisect_right
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from airweave.core.config import settings
+from airweave.platform.transformers.semantic_boundaries import (
+    TextTilingChunker,
+    get_boundary_chunker,
+)
+
+DOCS = Path(__file__).resolve().parents[2] / "fern" / "docs" / "pages"
+CHUNK_SIZE = 6050
+
+Document = Tuple[str, List[int], List[int]]
+
+
+def prose_sentences(path: Path) -> List[str]:
+    """Prose sentences of an MDX page, without front matter, code, tables and components."""
+    text = path.read_text(encoding="utf-8")
+    text = re.sub(r"\A---.*?---", "", text, flags=re.S)
+    text = re.sub(r"```.*?```", "", text, flags=re.S)
+    sentences = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = " ".join(paragraph.split())
+        if not paragraph or paragraph[0] in "<|#!-*>{[":
+            continue
+        paragraph = re.sub(r"\[([^\]]+)\]\([^)]*\)", r"\1", paragraph).replace("`", "")
+        for sentence in re.split(r"(?<=[.!?])\s+", paragraph):
+            if 40 <= len(sentence) <= 400 and sentence[-1] in ".!?":
+                sentences.append(sentence)
+    return sentences
+
+
+def make_documents(count: int, seed: int) -> Tuple[List[Document], int]:
+    """Documents of 4-8 runs of 4-10 sentences from different pages.
+
+    Returns:
+        Per document the text, the start offset of each sentence and the indices of the
+        sentences starting a new run; and the number of pages used
+    """
+    pages = [s for p in sorted(DOCS.rglob("*.mdx")) if len(s := prose_sentences(p)) >= 10]
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        sentences: List[str] = []
+        boundaries = []
+        for page in rng.sample(pages, rng.randint(4, 8)):
+            length = rng.randint(4, 10)
+            start = rng.randrange(0, len(page) - length + 1)
+            if sentences:
+                boundaries.append(len(sentences))
+            sentences.extend(page[start : start + length])
+        offsets, position = [], 0
+        for sentence in sentences:
+            offsets.append(position)
+            position += len(sentence) + 1
+        documents.append((" ".join(sentences), offsets, boundaries))
+    return documents, len(pages)
+
+
+def pk(reference: List[int], hypothesis: List[int], sentences: int) -> float:
+    """Pk error of boundary sentence indices."""
+
+    def segment_ids(boundaries: List[int]) -> List[int]:
+        return [bisect_right(sorted(boundaries), i) for i in range(sentences)]
+
+    ref, hyp = segment_ids(reference), segment_ids(hypothesis)
+    k = max(1, round(sentences / (len(reference) + 1) / 2))
+    pairs = range(sentences - k)
+    errors = sum((ref[i] == ref[i + k]) != (hyp[i] == hyp[i + k]) for i in pairs)
+    return errors / max(1, len(pairs))
+
+
+def hits(reference: List[int], hypothesis: List[int]) -> Tuple[int, int, int]:
+    """Matched, predicted and true boundaries, with a tolerance of one sentence."""
+    unmatched = set(reference)
+    matched = 0
+    for boundary in hypothesis:
+        near = [r for r in unmatched if abs(r - boundary) <= 1]
+        if near:
+            unmatched.remove(min(near, key=lambda r: abs(r - boundary)))
+            matched += 1
+    return matched, len(hypothesis), len(reference)
+
+
+def score(name: str, documents: List[Document], predict: Callable[[Document], List[int]]):
+    """Run one method over all documents and print its scores."""
+    pks, matched, predicted, true = [], 0, 0, 0
+    started = time.perf_counter()
+    for document in documents:
+        _, offsets, reference = document
+        hypothesis = predict(document)
+        pks.append(pk(reference, hypothesis, len(offsets)))
+        m, p, t = hits(reference, hypothesis)
+        matched, predicted, true = matched + m, predicted + p, true + t
+    elapsed = time.perf_counter() - started
+    precision = matched / predicted if predicted else 0.0
+    recall = matched / true if true else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if matched else 0.0
+    print(
+        f"{name:<12} {sum(pks) / len(pks):>6.3f} {f1:>6.3f} {precision:>6.3f} {recall:>6.3f} "
+        f"{predicted / len(documents):>7.1f} {1000 * elapsed / len(documents):>9.1f}"
+    )
+
+
+def backend_predictor(backend: str) -> Callable[[Document], List[int]]:
+    """Boundary sentence indices found by a backend: where its chunks start."""
+    chunker = get_boundary_chunker(CHUNK_SIZE, backend)
+    if backend == "local" and isinstance(chunker, TextTilingChunker):
+        raise RuntimeError("local model could not be loaded")
+
+    def predict(document: Document) -> List[int]:
+        text, offsets, _ = document
+        starts = [chunk.start_index for chunk in chunker.chunk(text)][1:]
+        return sorted({bisect_right(offsets, start) - 1 for start in starts} - {0})
+
+    return predict
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--backends", default="texttiling,local,openai")
+    args = parser.parse_args()
+
+    documents, pages = make_documents(args.documents, args.seed)
+    sentences = sum(len(offsets) for _, offsets, _ in documents)
+    segments = sum(len(boundaries) + 1 for _, _, boundaries in documents)
+    print(
+        f"{len(documents)} documents from {pages} pages, "
+        f"{sentences / segments:.1f} sentences per segment\n"
+    )
+    header = ("method", "Pk", "F1", "prec", "recall", "bounds", "ms/doc")
+    print("{:<12} {:>6} {:>6} {:>6} {:>6} {:>7} {:>9}".format(*header))
+
+    mean_segment = max(1, round(sentences / segments))
+    rng = random.Random(args.seed)
+    score("fixed", documents, lambda d: list(range(mean_segment, len(d[1]), mean_segment)))
+    score(
+        "random",
+        documents,
+        lambda d: sorted(rng.sample(range(1, len(d[1])), len(d[2]))),
+    )
+    for backend in args.backends.split(","):
+        if backend == "openai" and not settings.OPENAI_API_KEY:
+            print(f"{backend:<12} skipped, OPENAI_API_KEY is not set")
+            continue
+        try:
+            predict = backend_predictor(backend)
+        except Exception as e:
+            print(f"{backend:<12} skipped, {e}")
+            continue
+        score(backend, documents, predict)
+
+
+if __name__ == "__main__":
+    main()
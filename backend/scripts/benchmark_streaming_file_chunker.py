@@ -0,0 +1,188 @@
+"""Benchmark the streaming file chunker on large text files.
+
+Generates a text file of each kind (an application log as TXT, a CSV export and a minified
+JSON document) and chunks it twice: in memory, as ``optimized_file_chunker`` does for files
+below STREAMING_CHUNKER_MIN_SIZE_MB (convert the file, then chunk the whole text again with
+smaller chunk sizes until every chunk fits), and with ``stream_file_chunks``. Each run is
+timed, then repeated under tracemalloc for its peak memory. The streamed chunks are checked
+to fit the token limit and to reproduce the text (whitespace aside), in order.
+
+The log has a few long lines without delimiters, such as dumped payloads. The recursive rules
+cannot split those, so in memory every retry fails and the file yields no chunks; streaming
+cuts them on their own.
+
+    cd backend
+    python scripts/benchmark_streaming_file_chunker.py --megabytes 5,20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from airweave.core.logging import logger
+from airweave.platform.entities._base import Breadcrumb, FileEntity, FileSystemMetadata
+from airweave.platform.transformers.optimized_file_chunker import (
+    OPENAI_TOKEN_LIMIT,
+    _chunk_with_retries,
+    _process_file_content,
+    calculate_entity_token_size,
+)
+from airweave.platform.transformers.streaming_file_chunker import (
+    iter_text_windows,
+    stream_file_chunks,
+)
+
+WORDS = (
+    "sync entity chunk vector source worker request timeout retry cursor batch index "
+    "token embed payload queue shard lease commit schema"
+).split()
+LONG_LINE_EVERY = 5000
+
+
+def write_log(path: str, size: int, rng: random.Random) -> None:
+    """Log lines, and every LONG_LINE_EVERY lines a 60 kB payload dump on one line."""
+    with open(path, "w", encoding="utf-8") as f:
+        written, line_no = 0, 0
+        while written < size:
+            line_no += 1
+            if line_no % LONG_LINE_EVERY == 0:
+                line = "DEBUG payload=" + "".join(rng.choices("abcdef0123456789", k=60_000))
+            else:
+                words = " ".join(rng.choices(WORDS, k=rng.randint(6, 24)))
+                line = f"2025-06-01T12:{line_no % 60:02d}:00Z INFO worker-{line_no % 8} {words}"
+            written += f.write(line + "\n")
+
+
+def write_csv(path: str, size: int, rng: random.Random) -> None:
+    """An export with an id, a name, a status and a free-text column."""
+    with open(path, "w", encoding="utf-8") as f:
+        written = f.write("id,name,status,notes\n")
+        row = 0
+        while written < size:
+            row += 1
+            notes = " ".join(rng.choices(WORDS, k=rng.randint(3, 15)))
+            written += f.write(f"{row},item-{row},{rng.choice(['open', 'closed'])},{notes}\n")
+
+
+def write_json(path: str, size: int, rng: random.Random) -> None:
+    """A minified JSON array of records, on a single line."""
+    records, written = [], 2
+    while written < size:
+        record = {
+            "id": len(records),
+            "tags": rng.choices(WORDS, k=4),
+            "text": " ".join(rng.choices(WORDS, k=rng.randint(5, 30))),
+        }
+        records.append(record)
+        written += len(json.dumps(record, separators=(",", ":"))) + 1
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, separators=(",", ":"))
+
+
+KINDS = {".txt": write_log, ".csv": write_csv, ".json": write_json}
+
+
+def make_file(path: str) -> Tuple[FileEntity, type]:
+    """A file entity of a local file, and its unified chunk model."""
+    file = FileEntity(
+        entity_id=f"bench/{os.path.basename(path)}",
+        breadcrumbs=[Breadcrumb(entity_id="bench", name="bench", type="folder")],
+        file_id=os.path.basename(path),
+        name=os.path.basename(path),
+        download_url="https://example.com/" + os.path.basename(path),
+        airweave_system_metadata=FileSystemMetadata(local_path=path),
+    )
+    return file, FileEntity.create_unified_chunk_model()
+
+
+async def in_memory(file: FileEntity, chunk_class: type) -> Optional[list]:
+    """Convert the whole file, then chunk the whole text until every chunk fits."""
+    context = f"Entity({file.entity_id})"
+    text = await _process_file_content(file, context, logger)
+    return await _chunk_with_retries(file, text, context, logger, chunk_class)
+
+
+async def streaming(file: FileEntity, chunk_class: type) -> Optional[list]:
+    """Chunk the file window by window."""
+    return await stream_file_chunks(file, chunk_class, f"Entity({file.entity_id})", logger)
+
+
+async def measure(
+    method: Callable[[FileEntity, type], Awaitable[Optional[list]]], path: str
+) -> Tuple[Optional[list], float, float]:
+    """Run a method; returns its chunks, seconds and peak traced MB."""
+    started = time.perf_counter()
+    chunks = await method(*make_file(path))
+    elapsed = time.perf_counter() - started
+    del chunks
+
+    tracemalloc.start()
+    chunks = await method(*make_file(path))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return chunks, elapsed, peak / 1e6
+
+
+def check(path: str, chunks: Optional[list]) -> List[str]:
+    """Problems of the streamed chunks: failure, chunks too large, lost or repeated text."""
+    if not chunks:
+        return ["no chunks"]
+    problems = []
+    too_large = [c for c in chunks if calculate_entity_token_size(c) > OPENAI_TOKEN_LIMIT]
+    if too_large:
+        problems.append(f"{len(too_large)} chunks exceed {OPENAI_TOKEN_LIMIT} tokens")
+    if [c.md_position for c in chunks] != list(range(len(chunks))) or any(
+        c.metadata["total_chunks"] != len(chunks) for c in chunks
+    ):
+        problems.append("chunk positions or totals are wrong")
+    expected = re.sub(r"\s+", "", "".join(iter_text_windows(path)))
+    if re.sub(r"\s+", "", "".join(c.md_content for c in chunks)) != expected:
+        problems.append("chunks do not reproduce the text")
+    return problems
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Benchmark every kind and size."""
+    rng = random.Random(args.seed)
+    problems = []
+    header = ("file", "MB", "memory s", "MB peak", "chunks", "stream s", "MB peak", "chunks")
+    print("{:<6} {:>5} {:>9} {:>8} {:>7} {:>9} {:>8} {:>7}".format(*header))
+    with tempfile.TemporaryDirectory() as directory:
+        for megabytes in args.megabytes:
+            for extension, write in KINDS.items():
+                path = os.path.join(directory, f"export-{megabytes}{extension}")
+                write(path, int(megabytes * 1e6), rng)
+                before, before_s, before_mb = await measure(in_memory, path)
+                after, after_s, after_mb = await measure(streaming, path)
+                print(
+                    f"{extension:<6} {megabytes:>5} {before_s:>9.2f} {before_mb:>8.1f} "
+                    f"{len(before or []):>7} {after_s:>9.2f} {after_mb:>8.1f} {len(after or []):>7}"
+                )
+                problems += [f"{path}: {problem}" for problem in check(path, after)]
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--megabytes", type=lambda s: [float(p) for p in s.split(",")], default=[5, 20]
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Throughput benchmark for the sync process pool.
+
+Runs the CPU-bound sync stages over a synthetic corpus, first in the event loop
+(SYNC_PROCESS_POOL_SIZE=0) and then with process pools of increasing size:
+
+- transform: code file chunking (tiktoken + Chonkie) for a corpus of large source files,
+  scheduled with the same bounded concurrency the entity processor uses
+- sparse: BM25 sparse embeddings for the resulting chunk texts
+
+Run it on a multi-core machine; on a single core the pool only adds overhead:
+
+    cd backend
+    python scripts/benchmark_sync_process_pool.py --files 64 --functions 1500 --pools 1,2,4,8
+"""
+
+import argparse
+import asyncio
+import time
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.platform.embedding_models.bm25_text2vec import BM25Text2Vec
+from airweave.platform.entities._base import CodeFileEntity
+from airweave.platform.sync import process_pool
+from airweave.platform.sync.router import transform_file_entity
+
+
+def make_corpus(files: int, functions: int) -> list[CodeFileEntity]:
+    """Synthetic Python files large enough to need chunking."""
+    corpus = []
+    for i in range(files):
+        content = "\n\n".join(
+            f"def handler_{i}_{j}(payload):\n"
+            f'    """Handle payload variant {j}."""\n'
+            f"    total = sum(item * {j} for item in payload)\n"
+            f"    return total % {j + 7}\n"
+            for j in range(functions)
+        )
+        corpus.append(
+            CodeFileEntity(
+                entity_id=f"bench-{i}",
+                breadcrumbs=[],
+                source_name="benchmark",
+                name=f"module_{i}.py",
+                file_id=str(i),
+                size=len(content),
+                path_in_repo=f"src/module_{i}.py",
+                repo_name="benchmark",
+                repo_owner="airweave",
+                url=f"https://example.com/module_{i}.py",
+                content=content,
+                language="python",
+            )
+        )
+    return corpus
+
+
+async def run_transforms(corpus: list[CodeFileEntity], concurrency: int) -> list[list]:
+    """Transform all files with bounded concurrency, like EntityProcessor.process_batch."""
+    sem = asyncio.Semaphore(concurrency)
+    bench_logger = logger.with_context(component="benchmark")
+
+    async def _one(entity: CodeFileEntity) -> list:
+        async with sem:
+            if process_pool.process_pool_enabled():
+                return await process_pool.transform_in_process_pool(entity, bench_logger)
+            return await transform_file_entity(entity, bench_logger)
+
+    return await asyncio.gather(*[_one(entity) for entity in corpus])
+
+
+async def run_sparse(texts: list[str], model: BM25Text2Vec) -> int:
+    """Sparse-embed texts in the loop or in the pool (with the model as fallback)."""
+    if process_pool.process_pool_enabled():
+        return len(await process_pool.sparse_embed_in_process_pool(texts, model, logger))
+    return len(await model.embed_many(texts))
+
+
+async def measure(pool_size: int, corpus: list[CodeFileEntity], args: argparse.Namespace):
+    """Measure both stages for one pool size."""
+    settings.SYNC_PROCESS_POOL_SIZE = pool_size
+    if pool_size:
+        # Warm up the workers so process start-up is not counted
+        await asyncio.gather(
+            *[process_pool.transform_in_process_pool(corpus[0], logger) for _ in range(pool_size)]
+        )
+
+    started = time.perf_counter()
+    chunks = await run_transforms(corpus, args.concurrency)
+    transform_s = time.perf_counter() - started
+
+    texts = [chunk.content for children in chunks for chunk in children]
+    sparse_s = None
+    if not args.skip_sparse:
+        model = BM25Text2Vec()
+        started = time.perf_counter()
+        await run_sparse(texts, model)
+        sparse_s = time.perf_counter() - started
+
+    process_pool.shutdown_process_pool()
+    return len(texts), transform_s, sparse_s
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """Run the benchmark for every pool size."""
+    corpus = make_corpus(args.files, args.functions)
+    mb = sum(entity.size for entity in corpus) / 1e6
+    print(f"corpus: {len(corpus)} files, {mb:.1f} MB\n")
+    print(f"{'pool':>5} {'chunks':>7} {'transform s':>12} {'speedup':>8} {'sparse s':>9}")
+
+    baseline = None
+    for pool_size in [0, *args.pools]:
+        n_chunks, transform_s, sparse_s = await measure(pool_size, corpus, args)
+        baseline = baseline or transform_s
+        sparse = f"{sparse_s:>9.2f}" if sparse_s is not None else f"{'-':>9}"
+        print(
+            f"{pool_size:>5} {n_chunks:>7} {transform_s:>12.2f} "
+            f"{baseline / transform_s:>7.2f}x {sparse}"
+        )
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=32)
+    parser.add_argument("--functions", type=int, default=1500, help="Functions per file")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--pools", type=lambda s: [int(p) for p in s.split(",")], default=[1, 2, 4, 8]
+    )
+    parser.add_argument("--skip-sparse", action="store_true")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
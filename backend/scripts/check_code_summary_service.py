@@ -0,0 +1,220 @@
+"""Check the code summary service against a mock OpenAI API and fakeredis.
+
+A mock transport answers chat completions, with a summary naming the marker of each code
+file it was sent; packed requests get a JSON object of numbered summaries, except for one
+file the answer leaves out. Checks:
+
+- every file gets its own summary, in order, also when several files are summarized
+  concurrently
+- small files are packed several per request, large ones get a request each, and a file a
+  packed answer misses is summarized on its own
+- identical contents requested concurrently make a single request
+- summarizing the same contents again makes no request, also in a new worker process (a
+  fresh service on the same Redis)
+- at most CODE_SUMMARIZER_MAX_CONCURRENT requests are in flight
+- the token budget paces requests: spending about 1.5 s of budget beyond the burst takes at
+  least that long
+
+Tokens are counted by a word and punctuation counter instead of the cl100k tokenizer, so the
+script runs offline. It needs fakeredis, which is not a project dependency, and exits with
+status 1 if any check fails:
+
+    cd backend
+    pip install fakeredis
+    python scripts/check_code_summary_service.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import sys
+import time
+from typing import Any, Dict, List
+
+import fakeredis
+import httpx
+from openai import AsyncOpenAI
+
+from airweave.core.config import settings
+from airweave.core.logging import logger
+from airweave.core.redis_client import redis_client
+from airweave.platform.transformers.code_summary_service import (
+    SUMMARY_TOKENS,
+    CodeSummaryService,
+)
+from airweave.search.providers.registry import provider_registry
+
+API_KEY = "sk-check"
+MAX_CONCURRENT = 3
+# A packed answer leaves this file out
+DROPPED_MARKER = "FILE-0003"
+
+_MARKER = re.compile(r"FILE-\d{4}")
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+_PACKED_FILE = re.compile(r"File (\d+):\n    ```\n(.*?)\n    ```", re.S)
+
+
+class MockOpenAI:
+    """Chat completions answered from the markers in the prompt."""
+
+    def __init__(self) -> None:
+        """Initialize the request log."""
+        self.prompts: List[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer a chat completion request."""
+        prompt = json.loads(request.content)["messages"][0]["content"]
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+
+        files = _PACKED_FILE.findall(prompt)
+        if files:
+            answer = json.dumps(
+                {
+                    number: f"summary of {_MARKER.search(content).group()}"
+                    for number, content in files
+                    if DROPPED_MARKER not in content
+                }
+            )
+        else:
+            answer = f"summary of {_MARKER.search(prompt).group()}"
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-check",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-5-nano",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": answer},
+                        "finish_reason": "stop",
+                    }
+                ],
+            },
+        )
+
+    @property
+    def packed(self) -> int:
+        """Packed requests made."""
+        return sum(1 for prompt in self.prompts if _PACKED_FILE.search(prompt))
+
+
+def count_tokens(texts: List[str]) -> List[int]:
+    """Words and punctuation marks of each text, about its cl100k token count for code."""
+    return [len(_TOKEN.findall(text)) for text in texts]
+
+
+def code_file(index: int, lines: int) -> str:
+    """A code file with a marker, ``lines`` functions long."""
+    body = "".join(
+        f"def handler_{index}_{i}(payload):\n    return payload * {i}\n\n" for i in range(lines)
+    )
+    return f"# FILE-{index:04d}\n{body}"
+
+
+def install(api: MockOpenAI) -> None:
+    """Make the service's shared OpenAI client talk to the mock on this event loop."""
+    client = AsyncOpenAI(
+        api_key=API_KEY,
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(api.handle)),
+    )
+    provider_registry.get_client("openai", API_KEY, CodeSummaryService.KEY_PREFIX, lambda: client)
+
+
+def expected(contents: List[str]) -> List[str]:
+    """The summary the mock gives each content."""
+    return [f"summary of {_MARKER.search(content).group()}" for content in contents]
+
+
+async def summaries_and_packing(problems: List[str], server: fakeredis.FakeServer) -> None:
+    """Packing, fallback, dedup and the cache, across files summarized concurrently."""
+    api = MockOpenAI()
+    install(api)
+    service = CodeSummaryService(count_tokens)
+    # Three repositories' worth of files: 20 small ones, 3 large ones, one shared file
+    small = [code_file(i, 3) for i in range(20)]
+    large = [code_file(100 + i, 200) for i in range(3)]
+    files = [small[:8] + large[:1] + [small[0]], small[8:] + large[1:], [small[0]]]
+
+    results = await asyncio.gather(*(service.summarize_many(f, logger) for f in files))
+    if results != [expected(f) for f in files]:
+        problems.append("summaries: wrong or out of order")
+    singles = len(api.prompts) - api.packed
+    # 20 small files fit in 3 packs; the large ones and the dropped file go one by one
+    if api.packed != 3 or singles != 4:
+        problems.append(f"packing: {api.packed} packed and {singles} single requests")
+    if sum(prompt.count("FILE-0000") for prompt in api.prompts) != 1:
+        problems.append("dedup: the shared file was summarized more than once")
+    if api.max_in_flight > MAX_CONCURRENT:
+        problems.append(f"concurrency: {api.max_in_flight} requests in flight")
+    print(
+        f"  first sync: {len(api.prompts)} requests ({api.packed} packed) for "
+        f"{sum(len(f) for f in files)} files, at most {api.max_in_flight} in flight"
+    )
+
+    made = len(api.prompts)
+    again = await service.summarize_many(small + large, logger)
+    fresh = await CodeSummaryService(count_tokens).summarize_many(small + large, logger)
+    if again != expected(small + large) or fresh != expected(small + large):
+        problems.append("cache: wrong summaries")
+    if len(api.prompts) != made:
+        problems.append(f"cache: {len(api.prompts) - made} requests for cached contents")
+    keys = await fakeredis.aioredis.FakeRedis(server=server).keys("code_summary:*")
+    print(f"  resync: {len(api.prompts) - made} requests, {len(keys)} summaries in Redis")
+
+
+async def token_budget(problems: List[str]) -> None:
+    """Requests beyond the burst wait for the budget."""
+    api = MockOpenAI()
+    install(api)
+    contents = [code_file(200 + i, 120) for i in range(6)]
+    cost = sum(tokens + SUMMARY_TOKENS for tokens in count_tokens(contents))
+    # The burst is a minute's budget; what is left over takes 1.5 s at the budget's rate
+    settings.CODE_SUMMARIZER_TOKENS_PER_MINUTE = int(cost * 40 / 41)
+    settings.CODE_SUMMARIZER_CACHE_TTL_S = 0
+    started = time.monotonic()
+    await CodeSummaryService(count_tokens).summarize_many(contents, logger)
+    elapsed = time.monotonic() - started
+    if elapsed < 1.4:
+        problems.append(f"token budget: {cost} tokens over the burst in {elapsed:.2f}s")
+    print(f"  token budget: {cost} tokens, 1.5 s over the burst, took {elapsed:.2f}s")
+
+
+async def main() -> None:
+    """Run all checks."""
+    server = fakeredis.FakeServer()
+    redis_client._client = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    overrides: Dict[str, Any] = {
+        "ANTHROPIC_API_KEY": None,
+        "OPENAI_API_KEY": API_KEY,
+        "CODE_SUMMARIZER_MAX_CONCURRENT": MAX_CONCURRENT,
+        "CODE_SUMMARIZER_TOKENS_PER_MINUTE": 0,
+        "CODE_SUMMARIZER_CACHE_TTL_S": 3600,
+        "CODE_SUMMARIZER_PACK_MAX_TOKENS": 1000,
+    }
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+
+    problems: List[str] = []
+    await summaries_and_packing(problems, server)
+    await token_budget(problems)
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
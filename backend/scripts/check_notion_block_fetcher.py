@@ -0,0 +1,249 @@
+"""Check that the concurrent Notion block fetcher produces the same page content.
+
+Replays recorded ``/v1/blocks/{id}/children`` responses of one page (toggles, toggleable
+headings, columns, synced blocks, callouts, tables, nested lists, images, child databases,
+paginated children) from ``fixtures/notion_block_tree.json``. The fixture also holds the
+content the serial depth-first extractor produced for the page. Checks:
+
+- the markdown, block count, max depth, files and child databases equal the recorded ones,
+  with random response latencies so fetches complete out of order
+- every request went through the source's rate limiter, and no more than
+  ``BLOCK_FETCH_CONCURRENCY`` requests were in flight
+- with slow formatting, no more than ``BLOCK_PREFETCH_WINDOW`` blocks are fetched ahead of
+  the walk
+- the time to extract the page with concurrent fetches compared to one fetch at a time, with
+  latencies above the rate limit's interval; below it the rate limit alone paces the page
+- a failing subtree fails the page, like the serial extractor did
+
+Requests are paced by Notion's own rate limit (``RATE_LIMIT_REQUESTS`` per
+``RATE_LIMIT_PERIOD``). The script runs on an event loop with a virtual clock, which jumps to
+the next timer whenever every task waits on one, so rate limit waits, latencies and slow
+formatting take simulated time and the checks finish in seconds; reported times are
+simulated. The script exits with status 1 if any check fails:
+
+    cd backend
+    python scripts/check_notion_block_fetcher.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import selectors
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+from airweave.core.config import settings
+from airweave.platform.rate_limiter import SourceRateLimiter, tenant_key
+from airweave.platform.sources.notion import NotionSource
+
+FIXTURE = Path(__file__).parent / "fixtures" / "notion_block_tree.json"
+# Simulated Notion API latency per request, in seconds
+LATENCY = (0.005, 0.03)
+# Latency of slow responses, one to two rate limit intervals
+SLOW_LATENCY = (
+    NotionSource.RATE_LIMIT_PERIOD / NotionSource.RATE_LIMIT_REQUESTS,
+    2 * NotionSource.RATE_LIMIT_PERIOD / NotionSource.RATE_LIMIT_REQUESTS,
+)
+
+
+class VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock advances to the next timer instead of sleeping until it."""
+
+    def __init__(self) -> None:
+        """Initialize the loop at time 0."""
+        super().__init__(selectors.DefaultSelector())
+        self._now = 0.0
+        select = self._selector.select
+
+        def select_without_waiting(timeout: Optional[float] = None) -> list:
+            events = select(0 if timeout is not None else None)
+            if not events and timeout:
+                self._now += timeout
+            return events
+
+        self._selector.select = select_without_waiting
+
+    def time(self) -> float:
+        """Simulated seconds since the loop was created."""
+        return self._now
+
+
+class RecordedNotion:
+    """Serves recorded responses with random latency and tracks requests in flight."""
+
+    def __init__(
+        self,
+        responses: Dict[str, Any],
+        fail_path: Optional[str] = None,
+        latency: Tuple[float, float] = LATENCY,
+    ) -> None:
+        """Serve ``responses`` by request path; ``fail_path`` answers with a 500."""
+        self.responses = responses
+        self.latency = latency
+        self.fail_path = fail_path
+        self.requests = 0
+        self.block_ids: Set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Answer one request."""
+        self.requests += 1
+        self.block_ids.add(request.url.path.split("/")[3])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(random.uniform(*self.latency))
+        finally:
+            self.in_flight -= 1
+        path = request.url.raw_path.decode()
+        if path == self.fail_path:
+            return httpx.Response(500, json={"message": "boom"}, request=request)
+        return httpx.Response(200, json=self.responses[path], request=request)
+
+
+def make_source(concurrency: int) -> NotionSource:
+    """A Notion source with the rate limit ``NotionSource.create`` configures, on loop time."""
+    source = NotionSource()
+    source.access_token = "fixture-token"
+    source.BLOCK_FETCH_CONCURRENCY = concurrency
+    source._rate_limiter = SourceRateLimiter(
+        provider="notion",
+        tenant=tenant_key(source.access_token),
+        requests=NotionSource.RATE_LIMIT_REQUESTS,
+        period=NotionSource.RATE_LIMIT_PERIOD,
+        clock=asyncio.get_running_loop().time,
+    )
+    return source
+
+
+async def extract(fixture: Dict[str, Any], server: RecordedNotion, concurrency: int):
+    """Aggregate the fixture page's content; returns the source and the result."""
+    source = make_source(concurrency)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        result = await source._aggregate_page_content(client, fixture["page_id"], [])
+    return source, result
+
+
+async def same_content(fixture: Dict[str, Any], problems: List[str]) -> None:
+    """Concurrent extraction reproduces the recorded serial output."""
+    expected = fixture["expected"]
+    for run in range(3):
+        server = RecordedNotion(fixture["responses"])
+        source, result = await extract(fixture, server, NotionSource.BLOCK_FETCH_CONCURRENCY)
+        actual = {
+            "content": result["content"],
+            "blocks_count": result["blocks_count"],
+            "max_depth": result["max_depth"],
+            "files": [f.name for f in result["files"]],
+            "child_databases": sorted(source._child_databases_to_process),
+        }
+        for field, value in expected.items():
+            if actual[field] != value:
+                problems.append(f"same content: run {run} differs in {field}")
+        if server.requests != len(fixture["responses"]):
+            problems.append(
+                f"same content: {server.requests} requests for {len(fixture['responses'])}"
+            )
+        if source.rate_limiter.acquired != server.requests:
+            problems.append(
+                f"same content: {source.rate_limiter.acquired} rate limiter slots "
+                f"for {server.requests} requests"
+            )
+        if server.max_in_flight > NotionSource.BLOCK_FETCH_CONCURRENCY + 1:
+            problems.append(f"same content: {server.max_in_flight} requests in flight")
+    print(
+        f"  same content: {expected['blocks_count']} blocks, {server.requests} requests, "
+        f"at most {server.max_in_flight} in flight"
+    )
+
+
+async def prefetch_window(fixture: Dict[str, Any], problems: List[str]) -> None:
+    """A walk slower than the fetches does not fall more than the window behind."""
+    server = RecordedNotion(fixture["responses"])
+    source = make_source(NotionSource.BLOCK_FETCH_CONCURRENCY)
+    format_block = source._format_block_content
+    reached = 0
+    max_ahead = 0
+
+    async def slow_format(block: dict, depth: int, page_breadcrumbs: list) -> Dict[str, Any]:
+        nonlocal reached, max_ahead
+        # Blocks requested, but the page itself, that the walk has not reached yet
+        max_ahead = max(max_ahead, len(server.block_ids) - 1 - reached)
+        if block.get("has_children", False):
+            reached += 1
+            # Reach blocks with children at half the rate they can be fetched
+            await asyncio.sleep(
+                2 * NotionSource.RATE_LIMIT_PERIOD / NotionSource.RATE_LIMIT_REQUESTS
+            )
+        return await format_block(block, depth, page_breadcrumbs)
+
+    source._format_block_content = slow_format
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        await source._aggregate_page_content(client, fixture["page_id"], [])
+    # The block the walk waits for is fetched even when the window is full
+    if max_ahead > NotionSource.BLOCK_PREFETCH_WINDOW + 1:
+        problems.append(f"prefetch window: {max_ahead} blocks fetched ahead of the walk")
+    print(f"  prefetch window: at most {max_ahead} blocks fetched ahead of a slow walk")
+
+
+async def failing_subtree(fixture: Dict[str, Any], problems: List[str]) -> None:
+    """A subtree that cannot be fetched fails the page."""
+    nested = sorted(path for path in fixture["responses"] if fixture["page_id"] not in path)
+    server = RecordedNotion(fixture["responses"], fail_path=nested[len(nested) // 2])
+    source = make_source(NotionSource.BLOCK_FETCH_CONCURRENCY)
+    # Fail fast instead of retrying with the production backoff
+    source._get_with_auth.retry.stop = lambda retry_state: True
+    try:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+            await source._aggregate_page_content(client, fixture["page_id"], [])
+    except httpx.HTTPStatusError:
+        print("  failing subtree: page failed")
+    else:
+        problems.append("failing subtree: page extracted despite a failed fetch")
+
+
+async def speedup(fixture: Dict[str, Any], problems: List[str]) -> None:
+    """Concurrent fetches hide API latency above the rate limit's interval."""
+    loop = asyncio.get_running_loop()
+    timings = {}
+    for concurrency in (1, NotionSource.BLOCK_FETCH_CONCURRENCY):
+        started = loop.time()
+        await extract(
+            fixture, RecordedNotion(fixture["responses"], latency=SLOW_LATENCY), concurrency
+        )
+        timings[concurrency] = loop.time() - started
+    serial, concurrent = timings[1], timings[NotionSource.BLOCK_FETCH_CONCURRENCY]
+    if concurrent >= serial:
+        problems.append(f"speedup: {concurrent:.2f}s concurrent vs {serial:.2f}s serial")
+    print(f"  speedup: {serial:.2f}s with 1 fetch in flight, {concurrent:.2f}s concurrent")
+
+
+async def main() -> None:
+    """Run all checks."""
+    random.seed(44)
+    # Keep the replay's rate limiter process-local
+    settings.SOURCE_RATE_LIMIT_REDIS_ENABLED = False
+    fixture = json.loads(FIXTURE.read_text())
+    problems: List[str] = []
+    for check in (same_content, prefetch_window, speedup, failing_subtree):
+        await check(fixture, problems)
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    loop = VirtualTimeLoop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
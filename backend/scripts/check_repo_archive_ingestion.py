@@ -0,0 +1,346 @@
+"""Check archive mode of the GitHub, GitLab and Bitbucket sources against the contents APIs.
+
+Builds a small git repository (nested directories, code, docs, an empty file, a binary file,
+a file over the contents API's 1 MB inline limit, a name with a space) and a local tarball of
+it with ``git archive``, like the hosting services serve. A mock transport answers the
+contents APIs and the archive downloads from that repository. Checks:
+
+- blob SHAs computed from the archive equal the ones ``git ls-tree`` reports
+- GitHub and GitLab archive mode yield the same directories and files as the contents
+  traversal, with identical entity hashes, so switching mode does not re-embed anything
+  (files over 1 MB now get their content on GitHub, whose contents API does not inline it)
+- archive mode makes one archive request instead of one request per directory and file,
+  and the GitHub token is not sent on to the download host
+- Bitbucket archive mode applies the extension filter and records the archive's commit
+
+Needs git. The script exits with status 1 if any check fails:
+
+    cd backend
+    python scripts/check_repo_archive_ingestion.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import unquote
+
+import httpx
+
+from airweave.platform.sources.bitbucket import BitbucketSource
+from airweave.platform.sources.github import GitHubSource
+from airweave.platform.sources.gitlab import GitLabSource
+from airweave.platform.sync.async_helpers import compute_entity_hash_async
+from airweave.platform.utils.repo_archive import iter_archive
+
+BRANCH = "main"
+INLINE_LIMIT = 1024 * 1024
+
+FILES = {
+    "README.md": "# Widgets\n\nA repository of widgets.\n",
+    "setup.py": "from setuptools import setup\n\nsetup(name='widgets')\n",
+    "widgets/__init__.py": "",
+    "widgets/core.py": "def spin(widget):\n    return widget[::-1]\n" * 40,
+    "widgets/gears/teeth.py": "TEETH = 42\n",
+    "widgets/gears/ratios.json": '{"low": 1.5, "high": 3.25}\n',
+    "docs/guide with spaces.md": "Héllo wörld — ünïcode in docs.\n",
+    "docs/big.txt": "x" * 80 + "\n",
+    "assets/logo.png": None,
+}
+
+
+def build_repository(root: Path) -> Tuple[str, Dict[str, Dict[str, Any]], bytes]:
+    """Create the repository and archive it.
+
+    Returns:
+        The commit id, ``git ls-tree`` entries by path, and the gzipped tarball
+    """
+    for path, text in FILES.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if path == "assets/logo.png":
+            target.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 8)
+        elif path == "docs/big.txt":
+            target.write_text(text * (2 * INLINE_LIMIT // len(text)))
+        else:
+            target.write_text(text)
+
+    def git(*args: str) -> bytes:
+        return subprocess.run(
+            ["git", "-c", "user.name=ci", "-c", "user.email=ci@example.com", *args],
+            cwd=root,
+            check=True,
+            capture_output=True,
+        ).stdout
+
+    git("init", "-q", "-b", BRANCH)
+    git("add", ".")
+    git("commit", "-q", "-m", "widgets")
+    commit = git("rev-parse", "HEAD").decode().strip()
+    tree = {}
+    for line in git("ls-tree", "-r", "-t", "-l", "HEAD").decode().splitlines():
+        meta, path = line.split("\t", 1)
+        _, kind, sha, size = meta.split()
+        tree[path] = {"type": kind, "sha": sha, "size": 0 if size == "-" else int(size)}
+    archive = git("archive", "--format=tar.gz", f"--prefix=acme-widgets-{commit[:7]}/", "HEAD")
+    return commit, tree, archive
+
+
+class MockHost:
+    """Answers the hosting APIs from the local repository and counts requests."""
+
+    def __init__(self, root: Path, tree: Dict[str, Dict[str, Any]], archive: bytes) -> None:
+        """Serve ``root`` with its ``tree`` listing and ``archive``."""
+        self.root = root
+        self.tree = tree
+        self.archive = archive
+        self.requests: Counter = Counter()
+        self.download_headers: List[httpx.Headers] = []
+
+    def children(self, path: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Entries directly inside a directory."""
+        return sorted(
+            (p, e) for p, e in self.tree.items() if p.rpartition("/")[0] == path.strip("/")
+        )
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Route a request."""
+        path = unquote(request.url.raw_path.decode().split("?")[0])
+        for prefix, handler in self.routes():
+            if request.url.host + path == prefix or (request.url.host + path).startswith(prefix):
+                self.requests[handler.__name__] += 1
+                return handler(request, (request.url.host + path)[len(prefix) :])
+        return httpx.Response(404, json={"message": f"no route for {request.url}"})
+
+    def routes(self) -> List[Tuple[str, Callable[[httpx.Request, str], httpx.Response]]]:
+        """URL prefixes and their handlers."""
+        return [
+            ("api.github.com/repos/acme/widgets/tarball/", self.github_tarball),
+            ("codeload.github.com/", self.download),
+            ("api.github.com/repos/acme/widgets/contents/", self.github_contents),
+            ("api.github.com/repos/acme/widgets", self.github_repo),
+            ("gitlab.com/api/v4/projects/42/repository/archive.tar.gz", self.download),
+            ("gitlab.com/api/v4/projects/42/repository/tree", self.gitlab_tree),
+            ("gitlab.com/api/v4/projects/42/repository/files/", self.gitlab_file),
+            ("bitbucket.org/acme/widgets/get/", self.download),
+        ]
+
+    def download(self, request: httpx.Request, rest: str) -> httpx.Response:
+        """Serve the tarball."""
+        self.download_headers.append(request.headers)
+        return httpx.Response(200, content=self.archive)
+
+    def github_tarball(self, request: httpx.Request, rest: str) -> httpx.Response:
+        """Redirect to the download host, like the API does."""
+        url = f"https://codeload.github.com/acme/widgets/legacy.tar.gz/refs/heads/{rest}"
+        return httpx.Response(302, headers={"Location": url})
+
+    def github_repo(self, request: httpx.Request, rest: str) -> httpx.Response:
+        """Repository metadata."""
+        stamp = "2024-01-01T00:00:00Z"
+        return httpx.Response(
+            200,
+            json={
+                "id": 7,
+                "name": "widgets",
+                "full_name": "acme/widgets",
+                "default_branch": BRANCH,
+                "created_at": stamp,
+                "updated_at": stamp,
+                "pushed_at": stamp,
+                "fork": False,
+                "size": 1,
+                "html_url": "https://github.com/acme/widgets",
+            },
+        )
+
+    def github_contents(self, request: httpx.Request, rest: str) -> httpx.Response:
+        """Directory listings and files of the contents API."""
+        path = rest.strip("/")
+        entry = self.tree.get(path)
+        if path and entry is None:
+            return httpx.Response(404, json={"message": "Not Found"})
+        if not path or entry["type"] == "tree":
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        "path": p,
+                        "type": "dir" if e["type"] == "tree" else "file",
+                        "html_url": f"https://github.com/acme/widgets/"
+                        f"{'tree' if e['type'] == 'tree' else 'blob'}/{BRANCH}/"
+                        + httpx.URL("https://x/" + p).raw_path.decode()[1:],
+                    }
+                    for p, e in self.children(path)
+                ],
+            )
+        data = (self.root / path).read_bytes()
+        inline = len(data) <= INLINE_LIMIT
+        return httpx.Response(
+            200,
+            json={
+                "path": path,
+                "sha": entry["sha"],
+                "size": entry["size"],
+                "encoding": "base64" if inline else "none",
+                "content": base64.b64encode(data).decode() if inline else "",
+                "html_url": f"https://github.com/acme/widgets/blob/{BRANCH}/"
+                + httpx.URL("https://x/" + path).raw_path.decode()[1:],
+            },
+        )
+
+    def gitlab_tree(self, request: httpx.Request, rest: str) -> httpx.Response:
+        """Directory listings of the repository tree API."""
+        items = [
+            {"path": p, "type": e["type"], "id": e["sha"]}
+            for p, e in self.children(request.url.params.get("path", ""))
+        ]
+        return httpx.Response(200, json=items)
+
+    def gitlab_file(self, request: httpx.Request, rest: str) -> httpx.Response:
+        """Files of the repository files API."""
+        entry = self.tree[rest]
+        data = (self.root / rest).read_bytes()
+        return httpx.Response(
+            200,
+            json={
+                "size": entry["size"],
+                "encoding": "base64",
+                "content": base64.b64encode(data).decode(),
+                "blob_id": entry["sha"],
+            },
+        )
+
+
+async def collect(traverse: Callable[[httpx.AsyncClient], Any], host: MockHost):
+    """Run a traversal against the mock host; returns the entities by id."""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(host.handle)) as client:
+        return {entity.entity_id: entity async for entity in traverse(client)}
+
+
+async def compare_modes(name: str, make_source, traverse, host: MockHost, problems: List[str]):
+    """Traverse in contents and archive mode and compare the entities."""
+    results, requests = {}, {}
+    for archive_mode in (False, True):
+        source = make_source(archive_mode)
+        host.requests.clear()
+        results[archive_mode] = await collect(partial(traverse, source), host)
+        requests[archive_mode] = sum(host.requests.values())
+
+    contents, archive = results[False], results[True]
+    if contents.keys() != archive.keys():
+        problems.append(f"{name}: entities differ: {sorted(contents.keys() ^ archive.keys())}")
+    same = 0
+    for entity_id in contents.keys() & archive.keys():
+        before, after = contents[entity_id], archive[entity_id]
+        if getattr(before, "size", 0) > INLINE_LIMIT and not before.content:
+            if not after.content:
+                problems.append(f"{name}: large file content not taken from the archive")
+            continue
+        if await compute_entity_hash_async(before) == await compute_entity_hash_async(after):
+            same += 1
+        else:
+            diff = {
+                field: (value, getattr(after, field))
+                for field, value in before.__dict__.items()
+                if getattr(after, field) != value
+            }
+            problems.append(f"{name}: {entity_id} hashes differ: {diff}")
+    print(
+        f"  {name}: {len(archive)} entities, {same} identical hashes, "
+        f"{requests[False]} requests in contents mode, {requests[True]} in archive mode"
+    )
+    return archive
+
+
+def check_blob_shas(archive: bytes, tree: Dict[str, Dict[str, Any]], problems: List[str]) -> None:
+    """Blob SHAs of the archive entries equal git's."""
+    with tempfile.NamedTemporaryFile(suffix=".tar.gz") as file:
+        file.write(archive)
+        file.flush()
+        entries = [e for e in iter_archive(file.name, 10 * INLINE_LIMIT) if not e.is_dir]
+    wrong = [e.path for e in entries if e.blob_sha != tree[e.path]["sha"]]
+    if wrong or len(entries) != len(FILES):
+        problems.append(f"blob shas: {len(entries)} files, mismatches {wrong}")
+    print(f"  blob shas: {len(entries)} files match git ls-tree")
+
+
+async def main() -> None:
+    """Run all checks."""
+    problems: List[str] = []
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        commit, tree, archive = build_repository(root)
+        host = MockHost(root, tree, archive)
+        check_blob_shas(archive, tree, problems)
+
+        def github(archive_mode: bool) -> GitHubSource:
+            source = GitHubSource()
+            source.personal_access_token = "ghp_secret"
+            source.repo_name = "acme/widgets"
+            source.max_file_size = 10 * 1024 * 1024
+            source.archive_mode = archive_mode
+            return source
+
+        await compare_modes(
+            "github",
+            github,
+            lambda source, client: source._traverse_repository(client, "acme/widgets", BRANCH),
+            host,
+            problems,
+        )
+        leaked = [h for h in host.download_headers if "ghp_secret" in str(h.get("authorization"))]
+        if leaked:
+            problems.append("github: token sent to the download host")
+
+        def gitlab(archive_mode: bool) -> GitLabSource:
+            source = GitLabSource()
+            source.access_token = "glpat"
+            source.archive_mode = archive_mode
+            return source
+
+        await compare_modes(
+            "gitlab",
+            gitlab,
+            lambda source, client: source._traverse_repository(
+                client, "42", "acme/widgets", BRANCH, []
+            ),
+            host,
+            problems,
+        )
+
+        source = BitbucketSource()
+        source.access_token, source.email = "token", "ci@example.com"
+        source.file_extensions = [".py"]
+        source.archive_mode = True
+        host.download_headers.clear()
+        entities = await collect(
+            lambda client: source._traverse_archive(client, "acme", "widgets", [], BRANCH),
+            host,
+        )
+        files = [e for e in entities.values() if hasattr(e, "commit_hash")]
+        expected = sorted(p for p in FILES if p.endswith(".py"))
+        if sorted(f.path for f in files) != expected:
+            problems.append(f"bitbucket: files {sorted(f.path for f in files)}")
+        if any(f.commit_hash != commit or f.file_id != tree[f.path]["sha"] for f in files):
+            problems.append("bitbucket: commit or blob SHA not recorded")
+        if not all("basic" in str(h.get("authorization")).lower() for h in host.download_headers):
+            problems.append("bitbucket: archive downloaded without credentials")
+        print(f"  bitbucket: {len(files)} files of {len(entities)} entities, commit {commit[:7]}")
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
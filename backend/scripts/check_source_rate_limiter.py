@@ -0,0 +1,226 @@
+"""Check the shared source rate limiter against fakeredis.
+
+Two Redis clients on one fake server stand in for two workers syncing the same provider
+account. Checks:
+
+- two workers sharing a key together stay within the rate, after the initial burst
+- different tenants have independent buckets
+- a request costing several slots (e.g. LLM tokens) takes them all
+- a 429 with ``Retry-After`` seen by one worker pauses the other one
+- ``Retry-After`` parsing (seconds, HTTP date, missing)
+- without Redis the limiter falls back to process-local state and keeps limiting
+- ``BaseSource.rate_limited`` applies the limiter and the 429 feedback around a request
+
+The script needs fakeredis, which is not a project dependency, and exits with status 1 if
+any check fails:
+
+    cd backend
+    pip install fakeredis
+    python scripts/check_source_rate_limiter.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from email.utils import formatdate
+from typing import List
+
+import fakeredis
+import httpx
+
+from airweave.platform.rate_limiter import SourceRateLimiter, parse_retry_after, tenant_key
+from airweave.platform.sources._base import BaseSource
+
+# 40 requests per second: one slot every 25 ms
+REQUESTS = 20
+PERIOD = 0.5
+INTERVAL = PERIOD / REQUESTS
+# Scheduling jitter tolerated on measured times
+SLACK = 0.02
+
+
+def worker_clients(count: int) -> List[fakeredis.aioredis.FakeRedis]:
+    """Redis clients of ``count`` workers connected to one server."""
+    server = fakeredis.FakeServer()
+    return [
+        fakeredis.aioredis.FakeRedis(server=server, decode_responses=True) for _ in range(count)
+    ]
+
+
+def limiter(client, tenant: str = "workspace-a", burst: int = 1) -> SourceRateLimiter:
+    """A Notion-like limiter on one worker's client."""
+    return SourceRateLimiter("notion", tenant, REQUESTS, PERIOD, burst=burst, redis=client)
+
+
+async def timed_acquires(rate_limiter: SourceRateLimiter, count: int) -> List[float]:
+    """Acquire ``count`` slots, returning when each was granted."""
+    granted = []
+    for _ in range(count):
+        await rate_limiter.acquire()
+        granted.append(time.monotonic())
+    return granted
+
+
+async def shared_rate(problems: List[str]) -> None:
+    """Two workers on one key share the rate."""
+    a, b = (limiter(client, burst=4) for client in worker_clients(2))
+    started = time.monotonic()
+    results = await asyncio.gather(timed_acquires(a, 20), timed_acquires(b, 20))
+    granted = sorted(t - started for t in results[0] + results[1])
+
+    # 40 requests with a burst of 4: the last one is granted after 36 intervals
+    expected = (40 - 4) * INTERVAL
+    if granted[-1] < expected - SLACK:
+        problems.append(f"shared rate: 40 requests in {granted[-1]:.3f}s, expected {expected}s")
+    # No window of one period may admit more than its requests plus the burst
+    worst = max(sum(1 for t in granted if s <= t < s + PERIOD) for s in granted)
+    if worst > REQUESTS + 4:
+        problems.append(f"shared rate: {worst} requests in one period")
+    if not (a.waits and b.waits):
+        problems.append("shared rate: a worker never waited")
+    print(f"  shared rate: 40 requests in {granted[-1]:.3f}s, at most {worst} per period")
+
+
+async def independent_tenants(problems: List[str]) -> None:
+    """Different tenants do not slow each other down."""
+    client = worker_clients(1)[0]
+    limiters = [limiter(client, tenant=tenant_key(f"token-{i}"), burst=5) for i in range(4)]
+    waited = await asyncio.gather(*(rl.acquire() for rl in limiters for _ in range(5)))
+    if any(waited):
+        problems.append(f"independent tenants: waited {sum(waited):.3f}s")
+    print("  independent tenants: no waits")
+
+
+async def weighted_cost(problems: List[str]) -> None:
+    """A request costing several slots waits until all of them are free."""
+    rate_limiter = limiter(worker_clients(1)[0], burst=4)
+    first = await rate_limiter.acquire(4)
+    started = time.monotonic()
+    second = await rate_limiter.acquire(4)
+    waited = time.monotonic() - started
+    if first > 0 or waited < 4 * INTERVAL - SLACK:
+        problems.append(f"weighted cost: waited {first:.3f}s, then {waited:.3f}s")
+    print(f"  weighted cost: second request of 4 slots waited {second:.3f}s")
+
+
+async def retry_after_feedback(problems: List[str]) -> None:
+    """A 429 on one worker pauses the other."""
+    a, b = (limiter(client) for client in worker_clients(2))
+    await a.acquire()
+    response = httpx.Response(429, headers={"Retry-After": "0.3"})
+    await a.feedback(response)
+    started = time.monotonic()
+    await b.acquire()
+    waited = time.monotonic() - started
+    if waited < 0.3 - SLACK:
+        problems.append(f"retry-after: other worker waited only {waited:.3f}s")
+    if a.penalties != 1:
+        problems.append("retry-after: penalty not counted")
+    print(f"  retry-after: other worker waited {waited:.3f}s")
+
+
+async def retry_after_parsing(problems: List[str]) -> None:
+    """Numeric and HTTP-date headers are understood, missing ones are None."""
+    seconds = parse_retry_after(httpx.Response(429, headers={"Retry-After": "7"}))
+    in_ten = parse_retry_after(
+        httpx.Response(429, headers={"Retry-After": formatdate(time.time() + 10, usegmt=True)})
+    )
+    missing = parse_retry_after(httpx.Response(429))
+    if seconds != 7.0 or in_ten is None or not 8 <= in_ten <= 10 or missing is not None:
+        problems.append(f"retry-after parsing: {seconds}, {in_ten}, {missing}")
+    print(f"  retry-after parsing: {seconds}, {in_ten:.1f}, {missing}")
+
+
+class BrokenRedis:
+    """Redis client whose every command fails."""
+
+    def pipeline(self, transaction: bool = True):
+        """Fail like a lost connection."""
+        raise ConnectionError("redis down")
+
+
+async def local_fallback(problems: List[str]) -> None:
+    """Without Redis the limiter still limits, with process-local state."""
+    rate_limiter = SourceRateLimiter(
+        "notion", "fallback", REQUESTS, PERIOD, burst=1, redis=BrokenRedis()
+    )
+    started = time.monotonic()
+    await timed_acquires(rate_limiter, 10)
+    elapsed = time.monotonic() - started
+    if elapsed < 9 * INTERVAL - SLACK:
+        problems.append(f"local fallback: 10 requests in {elapsed:.3f}s")
+    if rate_limiter.metrics()["shared"]:
+        problems.append("local fallback: still reported as shared")
+    print(f"  local fallback: 10 requests in {elapsed:.3f}s")
+
+
+class StubSource(BaseSource):
+    """Source calling a local transport through ``rate_limited``."""
+
+    @classmethod
+    async def create(cls, credentials=None, config=None) -> "StubSource":
+        """Create the source."""
+        return cls()
+
+    async def generate_entities(self):
+        """No entities."""
+        if False:
+            yield
+
+    async def validate(self) -> bool:
+        """Always valid."""
+        return True
+
+
+async def base_source_helper(problems: List[str]) -> None:
+    """The BaseSource helper acquires a slot and feeds 429s back."""
+    responses = iter(
+        [httpx.Response(429, headers={"Retry-After": "0.2"}), httpx.Response(200, json={})]
+    )
+    transport = httpx.MockTransport(lambda request: next(responses))
+
+    source = StubSource()
+    source.access_token = "secret-token"
+    source.configure_rate_limit(requests=REQUESTS, period=PERIOD)
+    source._rate_limiter._redis = worker_clients(1)[0]
+    if "secret-token" in source.rate_limiter.key:
+        problems.append("helper: access token leaked into the Redis key")
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        first = await source.rate_limited(lambda: client.get("https://api.example.com/x"))
+        started = time.monotonic()
+        second = await source.rate_limited(lambda: client.get("https://api.example.com/x"))
+        waited = time.monotonic() - started
+
+    if first.status_code != 429 or second.status_code != 200:
+        problems.append("helper: responses not passed through")
+    if waited < 0.2 - SLACK:
+        problems.append(f"helper: retry after 429 waited only {waited:.3f}s")
+    print(f"  helper: {source.rate_limiter.metrics()}")
+
+
+async def main() -> None:
+    """Run all checks."""
+    problems: List[str] = []
+    for check in (
+        shared_rate,
+        independent_tenants,
+        weighted_cost,
+        retry_after_feedback,
+        retry_after_parsing,
+        local_fallback,
+        base_source_helper,
+    ):
+        await check(problems)
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
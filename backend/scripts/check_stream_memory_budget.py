@@ -0,0 +1,211 @@
+"""Stream synthetic large entities through AsyncSourceStream under a fixed memory budget.
+
+Runs the real stream with a consumer that works like the sync orchestrator: it collects
+batches, hands off a partial batch when the stream reports the producer paused on the
+budget, processes up to WORKERS batches concurrently (slowly, deleting temp files at the
+end) and releases a batch's entities after processing it. Checks that byte-weighted
+backpressure holds, for the queued entities and for those being processed:
+
+- one stream of large in-memory entities stays within the budget
+- two streams sharing one budget, with entities backed by temp files, stay within the
+  budget plus one entity (the one a stream with nothing charged may always queue) and both
+  finish
+- an entity larger than the whole budget is still delivered, one at a time, instead of
+  waiting forever
+
+Entities must arrive complete and in order, and all bytes must be returned to the budget at
+the end. The script exits with status 1 if any check fails:
+
+    cd backend
+    python scripts/check_stream_memory_budget.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+from typing import AsyncGenerator, List, Optional, Set
+
+from airweave.core.logging import logger
+from airweave.platform.entities._base import BaseEntity, FileSystemMetadata
+from airweave.platform.sync.memory_budget import StreamMemoryBudget, estimate_entity_bytes
+from airweave.platform.sync.stream import AsyncSourceStream
+
+MB = 1024 * 1024
+BATCH_SIZE = 2
+WORKERS = 2
+
+
+class SyntheticEntity(BaseEntity):
+    """Entity with a large text body."""
+
+    content: str = ""
+
+
+async def generate(
+    prefix: str, count: int, content_bytes: int, temp_dir: Optional[str] = None
+) -> AsyncGenerator[SyntheticEntity, None]:
+    """Yield entities with ``content_bytes`` of text, or of temp file when ``temp_dir`` is set."""
+    for i in range(count):
+        entity = SyntheticEntity(entity_id=f"{prefix}-{i}", breadcrumbs=[])
+        if temp_dir:
+            path = os.path.join(temp_dir, f"{prefix}-{i}.bin")
+            with open(path, "wb") as f:
+                f.write(b"\0" * content_bytes)
+            entity.airweave_system_metadata = FileSystemMetadata(local_path=path)
+        else:
+            entity.content = "x" * content_bytes
+        yield entity
+
+
+class Consumer:
+    """Processes a stream in batches, tracking the bytes of entities taken and not released."""
+
+    def __init__(self, stream: AsyncSourceStream, delay_s: float) -> None:
+        """Initialize the consumer of a stream, taking ``delay_s`` per batch."""
+        self.stream = stream
+        self.delay_s = delay_s
+        self.received: List[str] = []
+        self.held_bytes = 0
+        self.peak_held_bytes = 0
+
+    async def run(self) -> List[str]:
+        """Drain the stream, returning the entity ids in arrival order."""
+        tasks: Set[asyncio.Task] = set()
+        batch: List[SyntheticEntity] = []
+        await self.stream.start()
+        async for entity in self.stream.get_entities(report_stalls=True):
+            if entity is None:
+                # The producer waits for the bytes of the partial batch
+                if batch:
+                    tasks.add(asyncio.create_task(self._process(batch)))
+                    batch = []
+                continue
+            self.received.append(entity.entity_id)
+            self.held_bytes += estimate_entity_bytes(entity)
+            self.peak_held_bytes = max(self.peak_held_bytes, self.held_bytes)
+            batch.append(entity)
+            if len(batch) == BATCH_SIZE:
+                tasks.add(asyncio.create_task(self._process(batch)))
+                batch = []
+                while len(tasks) >= WORKERS:
+                    _, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        if batch:
+            tasks.add(asyncio.create_task(self._process(batch)))
+        if tasks:
+            await asyncio.wait(tasks)
+        await self.stream.stop()
+        return self.received
+
+    async def _process(self, batch: List[SyntheticEntity]) -> None:
+        try:
+            await asyncio.sleep(self.delay_s)
+            for entity in batch:
+                self.held_bytes -= estimate_entity_bytes(entity)
+                path = getattr(entity.airweave_system_metadata, "local_path", None)
+                if path:
+                    os.remove(path)
+        finally:
+            await self.stream.release(batch)
+
+
+async def consume(stream: AsyncSourceStream, delay_s: float) -> Consumer:
+    """Drain a stream slowly, returning the consumer."""
+    consumer = Consumer(stream, delay_s)
+    await consumer.run()
+    return consumer
+
+
+async def single_stream(problems: List[str]) -> None:
+    """Large in-memory entities through one stream."""
+    budget = StreamMemoryBudget(16 * MB)
+    stream = AsyncSourceStream(
+        generate("mem", 40, 4 * MB), queue_size=10000, logger=logger, memory_budget=budget
+    )
+    consumer = await asyncio.wait_for(consume(stream, 0.01), timeout=60)
+
+    limit = 16 * MB
+    if consumer.received != [f"mem-{i}" for i in range(40)]:
+        problems.append("single stream: entities missing or out of order")
+    if budget.high_water_bytes > limit:
+        problems.append(f"single stream: high water {budget.high_water_bytes / MB:.1f} MB")
+    if consumer.peak_held_bytes > limit:
+        problems.append(f"single stream: {consumer.peak_held_bytes / MB:.1f} MB in processing")
+    if not stream.pauses:
+        problems.append("single stream: producer never paused")
+    if budget.used_bytes:
+        problems.append(f"single stream: {budget.used_bytes} bytes not released")
+    print(
+        f"  single stream: {consumer.peak_held_bytes / MB:.1f} MB in processing at most, "
+        f"{stream.memory_metrics()}"
+    )
+
+
+async def shared_budget(problems: List[str]) -> None:
+    """Two streams of temp-file backed entities sharing one budget."""
+    budget = StreamMemoryBudget(16 * MB)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        streams = [
+            AsyncSourceStream(
+                generate(name, 20, 3 * MB, temp_dir),
+                queue_size=10000,
+                logger=logger,
+                memory_budget=budget,
+            )
+            for name in ("a", "b")
+        ]
+        consumers = await asyncio.wait_for(
+            asyncio.gather(consume(streams[0], 0.01), consume(streams[1], 0.02)), timeout=60
+        )
+
+    # One stream with nothing charged may queue an entity while the other holds the budget
+    limit = 16 * MB + 4 * MB
+    for name, consumer in zip(("a", "b"), consumers, strict=True):
+        if consumer.received != [f"{name}-{i}" for i in range(20)]:
+            problems.append(f"shared budget: stream {name} entities missing or out of order")
+    if budget.high_water_bytes > limit:
+        problems.append(f"shared budget: high water {budget.high_water_bytes / MB:.1f} MB")
+    if not budget.waits:
+        problems.append("shared budget: producers never waited on the temp file bytes")
+    if budget.used_bytes:
+        problems.append(f"shared budget: {budget.used_bytes} bytes not released")
+    print(f"  shared budget: {budget.metrics()}")
+
+
+async def oversized_entity(problems: List[str]) -> None:
+    """An entity larger than the whole budget is still delivered."""
+    budget = StreamMemoryBudget(1 * MB)
+    stream = AsyncSourceStream(
+        generate("big", 3, 8 * MB), queue_size=10000, logger=logger, memory_budget=budget
+    )
+    try:
+        consumer = await asyncio.wait_for(consume(stream, 0.0), timeout=30)
+    except asyncio.TimeoutError:
+        problems.append("oversized entity: stream stalled")
+        return
+    if len(consumer.received) != 3:
+        problems.append("oversized entity: entities missing")
+    if budget.high_water_bytes > 9 * MB:
+        problems.append(f"oversized entity: high water {budget.high_water_bytes / MB:.1f} MB")
+    if budget.used_bytes:
+        problems.append(f"oversized entity: {budget.used_bytes} bytes not released")
+    print(f"  oversized entity: {stream.memory_metrics()}")
+
+
+async def main() -> None:
+    """Run all checks."""
+    problems: List[str] = []
+    for check in (single_stream, shared_budget, oversized_entity):
+        await check(problems)
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
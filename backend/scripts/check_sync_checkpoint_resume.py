@@ -0,0 +1,344 @@
+"""Kill syncs mid-run and check that mid-sync checkpoints make them resumable.
+
+Runs the real ``AsyncSourceStream`` and ``SyncCheckpointer`` with a consumer loop shaped like
+the orchestrator's batched path, against local stand-ins:
+
+- a paged source that opts in to checkpoints (its state is the number of completed pages)
+- a checkpoint store standing in for the ``sync_cursor`` row in Postgres; checkpoints are
+  round-tripped through JSON like the ``checkpoint_data`` column
+- a destination that writes asynchronously, so its writes only become durable when the
+  sync flushes it, so a kill loses everything written since the last flush
+
+Checks:
+
+- kill mid-run: every entity before the saved checkpoint is durable in the destination, and
+  the resumed run ends with all entities durable, reprocessing at most the entities of one
+  checkpoint interval
+- failed batch: a checkpoint waiting on a failed batch is never saved
+- repeated kills: a sync killed several times still completes
+
+The script exits with status 1 if any check fails:
+
+    cd backend
+    python scripts/check_sync_checkpoint_resume.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import sys
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set
+
+from airweave.core.logging import logger
+from airweave.platform.entities._base import BaseEntity
+from airweave.platform.sources._base import BaseSource
+from airweave.platform.sync.checkpoint import SyncCheckpointer
+from airweave.platform.sync.stream import AsyncSourceStream
+
+PAGES = 40
+PAGE_SIZE = 25
+TOTAL = PAGES * PAGE_SIZE
+BATCH_SIZE = 16
+MAX_IN_FLIGHT = 4
+# Checkpoint every this many simulated seconds; each pulled entity advances the clock by 1
+INTERVAL = 100
+
+
+class SyntheticEntity(BaseEntity):
+    """Entity of a synthetic page."""
+
+    page: int = 0
+
+
+class PagedSource(BaseSource):
+    """Source that lists entities page by page and resumes at the first incomplete page."""
+
+    def __init__(self) -> None:
+        """Start at the first page."""
+        super().__init__()
+        self.completed_pages = 0
+
+    @classmethod
+    async def create(cls, credentials: Any = None, config: Any = None) -> "PagedSource":
+        """Create the source."""
+        return cls()
+
+    async def validate(self) -> bool:
+        """Always reachable."""
+        return True
+
+    async def generate_entities(self) -> AsyncGenerator[SyntheticEntity, None]:
+        """Yield every entity of the remaining pages."""
+        for page in range(self.completed_pages, PAGES):
+            for i in range(PAGE_SIZE):
+                await asyncio.sleep(0)
+                yield SyntheticEntity(
+                    entity_id=f"e-{page * PAGE_SIZE + i}", breadcrumbs=[], page=page
+                )
+            self.completed_pages = page + 1
+
+    def get_checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        """Pages listed completely."""
+        return {"completed_pages": self.completed_pages}
+
+    def resume_from_checkpoint(self, state: Dict[str, Any]) -> None:
+        """Skip the completed pages."""
+        self.completed_pages = state["completed_pages"]
+
+
+class CheckpointStore:
+    """Stand-in for the checkpoint columns of the sync cursor row."""
+
+    def __init__(self) -> None:
+        """Start without a checkpoint."""
+        self.row: Optional[str] = None
+        self.saves = 0
+
+    async def save(self, checkpoint: Dict[str, Any]) -> bool:
+        """Store a checkpoint."""
+        self.row = json.dumps(checkpoint)
+        self.saves += 1
+        return True
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load the stored checkpoint."""
+        return json.loads(self.row) if self.row else None
+
+
+class PipelinedDestination:
+    """Stand-in for a destination that writes asynchronously; writes are durable after flush."""
+
+    def __init__(self) -> None:
+        """Start empty."""
+        self.durable: Set[str] = set()
+        self.pending: List[str] = []
+        self.writes = 0
+
+    async def write(self, entity_ids: List[str]) -> None:
+        """Queue a batch of upserts."""
+        await asyncio.sleep(0.0005)
+        self.pending.extend(entity_ids)
+        self.writes += len(entity_ids)
+
+    async def flush(self) -> None:
+        """Make queued upserts durable."""
+        await asyncio.sleep(0.001)
+        self.durable.update(self.pending)
+        self.pending.clear()
+
+    def crash(self) -> None:
+        """Lose the queued upserts."""
+        self.pending.clear()
+
+
+class Clock:
+    """Simulated clock advanced by the consumer, so checkpoint timing is deterministic."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Current simulated time."""
+        return self.now
+
+
+async def run_sync(  # noqa: C901
+    store: CheckpointStore,
+    destination: PipelinedDestination,
+    kill_after: Optional[int] = None,
+    fail_batch: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run one sync job, killing it after ``kill_after`` pulled entities.
+
+    Returns:
+        The job's outcome and the checkpoint it resumed from
+    """
+    source = PagedSource()
+    resumed_from = store.load()
+    if resumed_from:
+        source.resume_from_checkpoint(resumed_from["source_state"])
+
+    stream = AsyncSourceStream(source.generate_entities(), queue_size=50, logger=logger)
+    clock = Clock()
+    checkpointer = SyncCheckpointer(
+        source=source,
+        stream=stream,
+        sync_job_id=f"job-{store.saves}",
+        save=store.save,
+        flush=destination.flush,
+        interval_s=INTERVAL,
+        logger=logger,
+        resumed_from=resumed_from,
+        clock=clock,
+    )
+    batches = 0
+
+    async def process(batch: List[SyntheticEntity], index: int) -> None:
+        try:
+            await asyncio.sleep(random.uniform(0, 0.003))
+            if index == fail_batch:
+                raise RuntimeError("injected batch failure")
+            await destination.write([entity.entity_id for entity in batch])
+        finally:
+            await stream.release(batch)
+
+    async def submit(batch: List[SyntheticEntity], pending: Set[asyncio.Task]) -> None:
+        nonlocal batches
+        pending.add(asyncio.create_task(process(batch, batches)))
+        batches += 1
+        while len(pending) >= MAX_IN_FLIGHT:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.difference_update(done)
+            for task in done:
+                task.result()
+
+    async def consume() -> None:
+        pending: Set[asyncio.Task] = set()
+        buffer: List[SyntheticEntity] = []
+        try:
+            async for entity in stream.get_entities():
+                if checkpointer.barrier_needed() and buffer:
+                    await submit(buffer, pending)
+                    buffer = []
+                await checkpointer.tick(pending)
+                checkpointer.entity_pulled()
+                clock.now += 1
+                await asyncio.sleep(0)
+
+                buffer.append(entity)
+                if len(buffer) >= BATCH_SIZE:
+                    await submit(buffer, pending)
+                    buffer = []
+            if buffer:
+                await submit(buffer, pending)
+            await asyncio.gather(*pending)
+            await destination.flush()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await stream.stop()
+            await stream.release_all()
+
+    await stream.start()
+    job = asyncio.create_task(consume())
+    outcome = "completed"
+    if kill_after is not None:
+        while checkpointer.pulled < kill_after and not job.done():
+            await asyncio.sleep(0)
+    if not job.done() and kill_after is not None:
+        # The worker dies: the job is gone and so are the destination's unflushed writes
+        job.cancel()
+        outcome = "killed"
+    try:
+        await job
+    except asyncio.CancelledError:
+        destination.crash()
+    except RuntimeError:
+        destination.crash()
+        outcome = "failed"
+    if outcome == "completed":
+        store.row = None
+    return {"outcome": outcome, "resumed_from": resumed_from}
+
+
+def durable_before_checkpoint(store: CheckpointStore, destination: PipelinedDestination) -> int:
+    """Count entities covered by the stored checkpoint that are missing from the destination."""
+    checkpoint = store.load()
+    if not checkpoint:
+        return 0
+    covered = checkpoint["source_state"]["completed_pages"] * PAGE_SIZE
+    return sum(1 for i in range(covered) if f"e-{i}" not in destination.durable)
+
+
+async def kill_mid_run(problems: List[str]) -> None:
+    """Kill a sync halfway, then resume it."""
+    store, destination = CheckpointStore(), PipelinedDestination()
+    first = await run_sync(store, destination, kill_after=TOTAL // 2)
+    if first["outcome"] != "killed":
+        problems.append("kill mid-run: the sync was not killed")
+    if not store.load():
+        problems.append("kill mid-run: no checkpoint saved before the kill")
+        return
+    if missing := durable_before_checkpoint(store, destination):
+        problems.append(f"kill mid-run: {missing} checkpointed entities not durable")
+
+    checkpoint = store.load()
+    writes_before = destination.writes
+    second = await run_sync(store, destination)
+    if second["resumed_from"] != checkpoint:
+        problems.append("kill mid-run: the second run did not resume from the checkpoint")
+    if len(destination.durable) != TOTAL:
+        problems.append(f"kill mid-run: {TOTAL - len(destination.durable)} entities missing")
+    resumed_writes = destination.writes - writes_before
+    expected = TOTAL - checkpoint["source_state"]["completed_pages"] * PAGE_SIZE
+    if resumed_writes != expected:
+        problems.append(f"kill mid-run: resumed run wrote {resumed_writes}, expected {expected}")
+    reprocessed = destination.writes - TOTAL
+    if reprocessed > INTERVAL + MAX_IN_FLIGHT * BATCH_SIZE + PAGE_SIZE:
+        problems.append(f"kill mid-run: {reprocessed} entities reprocessed")
+    if store.load() is not None:
+        problems.append("kill mid-run: checkpoint not cleared after the sync completed")
+    print(
+        f"  kill mid-run: checkpoint at {checkpoint['entities_processed']} entities, "
+        f"{reprocessed} reprocessed after resume"
+    )
+
+
+async def failed_batch(problems: List[str]) -> None:
+    """A failed batch blocks the checkpoint waiting on it, earlier checkpoints are kept."""
+    # Batch 8 holds entities 128-143, inside the first snapshot (100 pulled + read-ahead);
+    # batch 40 holds entities 640-655, after several checkpoints
+    for fail_batch, expect_checkpoint in ((8, False), (40, True)):
+        store, destination = CheckpointStore(), PipelinedDestination()
+        result = await run_sync(store, destination, fail_batch=fail_batch)
+        if result["outcome"] != "failed":
+            problems.append(f"failed batch {fail_batch}: the sync did not fail")
+        checkpoint = store.load()
+        if bool(checkpoint) != expect_checkpoint:
+            problems.append(f"failed batch {fail_batch}: unexpected checkpoint {checkpoint}")
+        if missing := durable_before_checkpoint(store, destination):
+            problems.append(f"failed batch {fail_batch}: checkpoint over {missing} lost entities")
+        if checkpoint and checkpoint["entities_processed"] > fail_batch * BATCH_SIZE:
+            problems.append(f"failed batch {fail_batch}: checkpoint past the failed batch")
+        print(
+            f"  failed batch {fail_batch}: "
+            + (f"checkpoint at {checkpoint['entities_processed']}" if checkpoint else "none")
+        )
+
+
+async def repeated_kills(problems: List[str]) -> None:
+    """A sync killed at several points still completes, never losing checkpointed data."""
+    store, destination = CheckpointStore(), PipelinedDestination()
+    runs = 0
+    for kill_after in (150, 230, 90, 310, 170, None):
+        runs += 1
+        result = await run_sync(store, destination, kill_after=kill_after)
+        if missing := durable_before_checkpoint(store, destination):
+            problems.append(f"repeated kills: run {runs} left {missing} checkpointed entities lost")
+        if result["outcome"] == "completed":
+            break
+    if len(destination.durable) != TOTAL:
+        problems.append(f"repeated kills: {TOTAL - len(destination.durable)} entities missing")
+    print(f"  repeated kills: completed after {runs} runs, {destination.writes} entity writes")
+
+
+async def main() -> None:
+    """Run all checks."""
+    random.seed(7)
+    problems: List[str] = []
+    for check in (kill_mid_run, failed_batch, repeated_kills):
+        await check(problems)
+
+    for problem in problems:
+        print(f"FAIL: {problem}")
+    if problems:
+        sys.exit(1)
+    print("All checks passed")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
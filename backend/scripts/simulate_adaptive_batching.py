@@ -0,0 +1,206 @@
+"""Deterministic simulation of the adaptive sync batch controller.
+
+Drives ``AdaptiveBatchController`` with a simulated clock and a simple cost model of the
+batched pipeline (no database, embedding API or source needed) and checks that it reacts to
+each signal the way it should:
+
+- small entities: the batch size grows towards its upper bound
+- large files: the batch size shrinks towards its lower bound
+- embedding rate limits: the in-flight batch count backs off, then recovers
+- database pool wait: the in-flight batch count backs off
+- memory pressure: batch size and in-flight count are both halved
+
+Every scenario is deterministic, so the decision trace is identical on every run. The
+script exits with status 1 if any expectation fails:
+
+    cd backend
+    python scripts/simulate_adaptive_batching.py [--verbose]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from airweave.platform.sync.adaptive_batching import AdaptiveBatchController
+
+
+class SimulatedClock:
+    """Monotonic clock that only advances when told to."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Current simulated time."""
+        return self.now
+
+
+@dataclass
+class Scenario:
+    """A workload and the expectations on the controller after running it."""
+
+    name: str
+    # Seconds one entity spends in the pipeline
+    entity_cost_s: float
+    batches: int = 60
+    initial_batch_size: int = 64
+    max_in_flight: int = 16
+    # Per batch index: rate limits reported, DB wait seconds, memory fraction
+    rate_limits: Callable[[int], int] = lambda i: 0
+    db_wait_s: Callable[[int], float] = lambda i: 0.01
+    memory: Callable[[int], Optional[float]] = lambda i: 0.3
+    checks: List[Callable[[AdaptiveBatchController], Optional[str]]] = field(default_factory=list)
+
+
+def run_scenario(scenario: Scenario, verbose: bool) -> AdaptiveBatchController:
+    """Feed one scenario through a fresh controller."""
+    clock = SimulatedClock()
+    batch_index = 0
+    controller = AdaptiveBatchController(
+        scenario.initial_batch_size,
+        scenario.max_in_flight,
+        min_batch_size=4,
+        max_batch_size=512,
+        target_batch_latency_s=10.0,
+        db_wait_threshold_s=0.25,
+        memory_high_water=0.8,
+        memory_probe=lambda: scenario.memory(batch_index),
+        clock=clock,
+    )
+
+    for batch_index in range(scenario.batches):
+        batch_size = controller.batch_size
+        # Fixed per-batch overhead plus per-entity work; more batches in flight share the
+        # embedding API and database, so each one gets a little slower
+        contention = 1.0 + 0.02 * controller.max_in_flight
+        latency = 0.2 + batch_size * scenario.entity_cost_s * contention
+
+        for _ in range(scenario.rate_limits(batch_index)):
+            controller.record_rate_limit()
+        controller.record_db_wait(scenario.db_wait_s(batch_index))
+        controller.record_stage("transform", latency * 0.6)
+        controller.record_stage("embed", latency * 0.3)
+        controller.record_stage("persist", latency * 0.1)
+
+        clock.now += latency / controller.max_in_flight
+        decision = controller.record_batch(batch_size, latency)
+        if verbose and decision and decision.reason != "hold":
+            print(
+                f"  batch {batch_index:3d}: {decision.reason:<12} "
+                f"batch_size={decision.batch_size:<4} in_flight={decision.max_in_flight}"
+            )
+    return controller
+
+
+def expect(description: str, predicate: Callable[[AdaptiveBatchController], bool]):
+    """Build a check that reports ``description`` when ``predicate`` fails."""
+
+    def check(controller: AdaptiveBatchController) -> Optional[str]:
+        return None if predicate(controller) else description
+
+    return check
+
+
+def reasons(controller: AdaptiveBatchController) -> List[str]:
+    """Decision reasons in order."""
+    return [d.reason for d in controller.decisions]
+
+
+SCENARIOS = [
+    Scenario(
+        name="small entities",
+        entity_cost_s=0.005,
+        checks=[
+            expect("batch size grows to the maximum", lambda c: c.batch_size == 512),
+            expect("in-flight stays at the ceiling", lambda c: c.max_in_flight == 16),
+        ],
+    ),
+    Scenario(
+        name="large files",
+        entity_cost_s=2.0,
+        checks=[
+            expect("batch size shrinks to the minimum", lambda c: c.batch_size == 4),
+            expect("only latency decisions", lambda c: set(reasons(c)) == {"latency"}),
+        ],
+    ),
+    Scenario(
+        name="embedding rate limits",
+        entity_cost_s=0.05,
+        rate_limits=lambda i: 5 if 8 <= i < 16 else 0,
+        checks=[
+            expect(
+                "backs off to a single batch in flight",
+                lambda c: min(d.max_in_flight for d in c.decisions) == 1,
+            ),
+            expect(
+                "one decision per rate-limit burst, not per 429",
+                lambda c: reasons(c).count("rate_limit") <= 8,
+            ),
+            expect("recovers after the limits stop", lambda c: c.max_in_flight > 1),
+            expect("batch size is kept", lambda c: c.batch_size >= 64),
+        ],
+    ),
+    Scenario(
+        name="database pool wait",
+        entity_cost_s=0.05,
+        db_wait_s=lambda i: 1.0 if i >= 20 else 0.01,
+        checks=[
+            expect("in-flight drops to the minimum", lambda c: c.max_in_flight == 1),
+            expect("reason is db_pool_wait", lambda c: reasons(c)[-1] == "db_pool_wait"),
+        ],
+    ),
+    Scenario(
+        name="memory pressure",
+        entity_cost_s=0.05,
+        memory=lambda i: 0.95 if 20 <= i < 28 else 0.3,
+        checks=[
+            expect("memory decisions taken", lambda c: "memory" in reasons(c)),
+            expect(
+                "both knobs halved under pressure",
+                lambda c: any(
+                    d.reason == "memory" and d.batch_size <= 32 and d.max_in_flight <= 8
+                    for d in c.decisions
+                ),
+            ),
+        ],
+    ),
+]
+
+
+def main() -> None:
+    """Run all scenarios twice, check expectations and determinism."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verbose", action="store_true", help="Print every decision")
+    args = parser.parse_args()
+
+    failures = 0
+    for scenario in SCENARIOS:
+        print(f"{scenario.name}:")
+        controller = run_scenario(scenario, args.verbose)
+        replay = run_scenario(scenario, verbose=False)
+
+        problems = [problem for check in scenario.checks if (problem := check(controller))]
+        if controller.decisions != replay.decisions:
+            problems.append("decision trace differs between runs")
+
+        metrics = controller.metrics()
+        print(
+            f"  final batch_size={metrics['batch_size']} in_flight={metrics['max_in_flight']} "
+            f"decisions={metrics['decisions']}"
+        )
+        for problem in problems:
+            print(f"  FAIL: {problem}")
+        failures += len(problems)
+
+    if failures:
+        print(f"{failures} expectation(s) failed")
+        sys.exit(1)
+    print("All scenarios passed")
+
+
+if __name__ == "__main__":
+    main()